@@ -2,7 +2,9 @@
 """
 backtest.py — Systematic backtesting framework for NCAA baseball predictions.
 
-Compares model predictions against actual outcomes from games.csv to compute:
+Compares stored model predictions (predictions_*.csv) against actual outcomes
+from games.csv to compute (scoring shared with ncaa_baseball.backtest, which
+backtest_fast.py / backtest_posterior.py use to re-simulate past games):
   - Win probability calibration (binned reliability diagram)
   - Total scoring accuracy (MAE, bias, correlation)
   - Log-loss and Brier score
@@ -28,6 +30,9 @@ from pathlib import Path
 import numpy as np
 import pandas as pd
 
+import _bootstrap  # noqa: F401
+from ncaa_baseball.backtest import calibration_table, score_predictions
+
 
 def load_actual_results(games_csv: Path) -> pd.DataFrame:
     """Load actual game results from games.csv."""
@@ -115,80 +120,42 @@ def match_predictions_to_outcomes(
 
 
 def compute_calibration_metrics(matched: pd.DataFrame) -> dict:
-    """Compute comprehensive calibration metrics."""
+    """Compute comprehensive calibration metrics (shared scoring in ncaa_baseball.backtest)."""
     n = len(matched)
     if n == 0:
         return {"n_games": 0}
 
-    hw_prob = matched["home_win_prob"].values
-    hw_actual = matched["home_win"].values
-    exp_total = matched["exp_total"].values
-    act_total = matched["actual_total"].values
-
-    # ── Win probability metrics ──
-    # Brier score
-    brier = float(np.mean((hw_prob - hw_actual) ** 2))
-    # Log loss
-    eps = 1e-8
-    logloss = -float(np.mean(
-        hw_actual * np.log(np.clip(hw_prob, eps, 1 - eps)) +
-        (1 - hw_actual) * np.log(np.clip(1 - hw_prob, eps, 1 - eps))
-    ))
-    # AUC (simple ranking-based)
-    from itertools import combinations
-    concordant = 0
-    discordant = 0
-    for i, j in zip(range(n), range(n)):
-        pass  # skip full AUC for speed
-
-    # Calibration bins
-    bins = [0.0, 0.30, 0.40, 0.50, 0.60, 0.70, 1.01]
-    bin_labels = ["<30%", "30-40%", "40-50%", "50-60%", "60-70%", "70%+"]
-    cal_bins = []
-    for lo, hi, label in zip(bins[:-1], bins[1:], bin_labels):
-        mask = (hw_prob >= lo) & (hw_prob < hi)
-        if mask.sum() > 0:
-            cal_bins.append({
-                "bin": label,
-                "n": int(mask.sum()),
-                "pred_mean": float(hw_prob[mask].mean()),
-                "actual_pct": float(hw_actual[mask].mean()),
-                "gap": float(hw_actual[mask].mean() - hw_prob[mask].mean()),
-            })
-
-    # ── Total scoring metrics ──
-    total_mae = float(np.mean(np.abs(exp_total - act_total)))
-    total_bias = float(np.mean(exp_total - act_total))
-    total_corr = float(np.corrcoef(exp_total, act_total)[0, 1]) if n > 2 else 0.0
-    total_rmse = float(np.sqrt(np.mean((exp_total - act_total) ** 2)))
-
-    # ── Home advantage realized ──
-    actual_home_pct = float(hw_actual.mean())
-    pred_home_pct = float(hw_prob.mean())
+    hw_prob = matched["home_win_prob"].to_numpy(dtype=float)
+    hw_actual = matched["home_win"].to_numpy(dtype=float)
+    exp_total = matched["exp_total"].to_numpy(dtype=float)
+    act_total = matched["actual_total"].to_numpy(dtype=float)
+
+    scores = score_predictions(hw_prob, hw_actual, exp_total, act_total)
+    cal_bins = calibration_table(hw_prob, hw_actual)[
+        ["bin", "n", "pred_mean", "actual_pct", "gap"]
+    ].to_dict("records")
 
     # ── Over/under accuracy ──
     # For common totals
-    over_under = {}
-    for line in [8.5, 9.5, 10.5, 11.5, 12.5]:
-        actual_over = (act_total > line).mean()
-        pred_over = (exp_total > line).mean()
-        over_under[f"ou_{line}"] = {
-            "actual_over_pct": float(actual_over),
-            "pred_over_pct": float(pred_over),
-            "n": n,
-        }
+    lines = np.array([8.5, 9.5, 10.5, 11.5, 12.5])
+    actual_over = (act_total[:, None] > lines).mean(axis=0)
+    pred_over = (exp_total[:, None] > lines).mean(axis=0)
+    over_under = {
+        f"ou_{line}": {"actual_over_pct": float(a), "pred_over_pct": float(p), "n": n}
+        for line, a, p in zip(lines, actual_over, pred_over)
+    }
 
     return {
         "n_games": n,
-        "brier_score": brier,
-        "log_loss": logloss,
-        "win_cal_bins": cal_bins,
-        "total_mae": total_mae,
-        "total_bias": total_bias,
-        "total_corr": total_corr,
-        "total_rmse": total_rmse,
-        "actual_home_pct": actual_home_pct,
-        "pred_home_pct": pred_home_pct,
+        "brier_score": scores["brier_score"],
+        "log_loss": scores["log_loss"],
+        "win_cal_bins": [{**b, "n": int(b["n"])} for b in cal_bins],
+        "total_mae": scores["total_mae"],
+        "total_bias": scores["total_bias"],
+        "total_corr": scores["total_corr"],
+        "total_rmse": scores["total_rmse"],
+        "actual_home_pct": scores["actual_home_pct"],
+        "pred_home_pct": scores["pred_home_pct"],
         "over_under": over_under,
     }
 
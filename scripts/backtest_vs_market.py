@@ -16,7 +16,6 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import json
 import sys
 from pathlib import Path
 
@@ -24,6 +23,7 @@ import numpy as np
 import pandas as pd
 
 import _bootstrap  # noqa: F401
+from ncaa_baseball.odds_store import open_odds_store
 
 # US books we'd actually bet at (in preference order for best price)
 US_BOOKS = {
@@ -86,13 +86,9 @@ def parse_odds_log(odds_log: Path, canonical_csv: Path) -> dict:
 
     game_odds = {}
 
-    with open(odds_log) as f:
-        for line in f:
-            try:
-                row = json.loads(line)
-            except Exception:
-                continue
-
+    # 2026 snapshots with both teams resolved, in log order (odds store index)
+    with open_odds_store(odds_log, canonical_csv=canonical_csv) as store:
+        for row in store.records(date_prefix="2026", resolved=True):
             commence = row.get("commence_time", "")
             if not commence or not commence.startswith("2026"):
                 continue
@@ -21,14 +21,17 @@ import json
 import os
 import re
 import sys
-import time
 from datetime import datetime, timezone, date, timedelta
 from pathlib import Path
 
-import requests
+
+import _bootstrap  # noqa: F401
+from ncaa_baseball.http_fetch import shared_fetcher
 
 # ── Config ────────────────────────────────────────────────────────
 BASE_URL = "https://www.mo.betmgm.com"
+# Requests/s to this host (shared across threads; replaces per-call sleeps)
+RATE_PER_S = 2.0
 ACCESS_ID = "Y2U3MWQ4YTItNjM2Ni00ZjYyLTg2ZjYtYmI3YzY0ZmIzYWU4"
 
 HEADERS = {
@@ -83,7 +86,8 @@ def _fetch(path: str, params: dict = None) -> dict | None:
     url = f"{BASE_URL}{path}"
     p = {**COMMON_PARAMS, **(params or {})}
     try:
-        r = requests.get(url, params=p, headers=HEADERS, timeout=20)
+        r = shared_fetcher().get(url, params=p, headers=HEADERS, timeout=20,
+                                 rate_per_s=RATE_PER_S)
         if r.status_code == 200:
             return r.json()
         else:
@@ -286,20 +290,26 @@ def scrape_sport(sport_name: str, include_all_markets: bool = False) -> list:
         fixtures = scrape_fixtures(sport_id, comp_id)
         print(f"  Found {len(fixtures)} fixtures")
 
-        for fix in fixtures:
+        # If we want all markets, fetch the detailed fixture views concurrently
+        # (paced by the shared fetcher's BetMGM rate limit)
+        if include_all_markets:
+            details = shared_fetcher().map(
+                lambda fix: scrape_fixture_detail(str(fix["id"])) if fix.get("id") else None,
+                fixtures,
+            )
+        else:
+            details = [None] * len(fixtures)
+
+        for fix, detail in zip(fixtures, details):
             fname = _safe_name(fix.get("name", {}))
             fid = fix.get("id")
-            start = fix.get("startDate", "")
 
             # Quick odds from fixtures list (ML/Spread/Totals already included)
             rows = parse_fixture_odds(fix)
             print(f"  {fname} (id={fid}): {len(rows)} odds from grid")
             all_rows.extend(rows)
 
-            # If we want all markets, fetch the detailed fixture view
             if include_all_markets and fid:
-                time.sleep(0.5)  # Be polite
-                detail = scrape_fixture_detail(str(fid))
                 if detail:
                     detail_rows = parse_fixture_odds(detail)
                     # Only add markets we don't already have
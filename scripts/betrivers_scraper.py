@@ -23,15 +23,18 @@ import json
 import os
 import re
 import sys
-import time
 from datetime import datetime, timezone, date
 from pathlib import Path
 
-import requests
+
+import _bootstrap  # noqa: F401
+from ncaa_baseball.http_fetch import shared_fetcher
 
 # ── Config ────────────────────────────────────────────────────────
 # Kambi API is public — no auth needed
 BASE_URL = "https://eu1.offering-api.kambicdn.com/offering/v2018/rsiusil"
+# Requests/s to this host (shared across threads; replaces per-call sleeps)
+RATE_PER_S = 3.0
 
 COMMON_PARAMS = {
     "lang": "en_US",
@@ -80,7 +83,8 @@ def _fetch(path: str, params: dict = None) -> dict | None:
     url = f"{BASE_URL}{path}"
     p = {**COMMON_PARAMS, **(params or {})}
     try:
-        r = requests.get(url, params=p, headers=HEADERS, timeout=20)
+        r = shared_fetcher().get(url, params=p, headers=HEADERS, timeout=20,
+                                 rate_per_s=RATE_PER_S)
         if r.status_code == 200:
             return r.json()
         else:
@@ -246,18 +250,15 @@ def scrape_sport(sport_name: str) -> list:
     events = list_events(sport_path, league_path)
     print(f"  Found {len(events)} events")
 
+    # Fetch full odds for every event concurrently (paced by the shared
+    # fetcher's Kambi rate limit)
+    listed = [ev_wrap.get("event", {}) for ev_wrap in events]
+    listed = [event for event in listed if event.get("id")]
+    event_odds = shared_fetcher().map(lambda event: get_event_odds(str(event["id"])), listed)
+
     all_rows = []
-    for ev_wrap in events:
-        event = ev_wrap.get("event", {})
-        eid = event.get("id")
+    for event, event_data in zip(listed, event_odds):
         ename = event.get("name", "")
-
-        if not eid:
-            continue
-
-        # Fetch full odds for this event
-        time.sleep(0.3)  # Be polite
-        event_data = get_event_odds(str(eid))
         if not event_data:
             print(f"    {ename}: no data")
             continue
@@ -26,9 +26,9 @@ import pandas as pd
 
 import _bootstrap  # noqa: F401  -- puts src/ on sys.path
 from ncaa_baseball.phase1 import (
+    TeamResolver,
     build_odds_name_to_canonical,
     load_canonical_teams,
-    resolve_odds_teams,
 )
 
 # ---------------------------------------------------------------------------
@@ -493,9 +493,10 @@ def main() -> int:
     canonical = load_canonical_teams(args.canonical)
     name_to_canonical = build_odds_name_to_canonical(canonical)
 
+    resolver = TeamResolver(canonical, name_to_canonical)
+
     def resolve_team(team_name: str) -> str | None:
-        t = resolve_odds_teams(team_name, team_name, canonical, name_to_canonical)[0]
-        return t[0] if t else None
+        return resolver.canonical_id(team_name) or None
 
     seasons = [s.strip() for s in args.seasons.split(",") if s.strip()]
 
@@ -27,9 +27,9 @@ import pandas as pd
 
 import _bootstrap  # noqa: F401
 from ncaa_baseball.phase1 import (
+    TeamResolver,
     build_odds_name_to_canonical,
     load_canonical_teams,
-    resolve_odds_teams,
 )
 
 RUN_EVENT_KEYS = ("run_1", "run_2", "run_3", "run_4")
@@ -278,13 +278,13 @@ def resolve_home_teams(
     home_ids = []
     home_names = []
     n_resolved = 0
+    resolver = TeamResolver(canonical, name_to_canonical)
     for ht_name in df["_home_team_name"]:
         if not ht_name:
             home_ids.append("")
             home_names.append("")
             continue
-        # resolve_odds_teams expects a pair; use the same name for both and take home
-        ht, _ = resolve_odds_teams(ht_name, ht_name, canonical, name_to_canonical)
+        ht = resolver.resolve(ht_name)
         if ht:
             home_ids.append(ht[0])
             home_names.append(cid_to_display.get(ht[0], ht_name))
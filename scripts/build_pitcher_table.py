@@ -29,6 +29,9 @@ from pathlib import Path
 import pandas as pd
 import numpy as np
 
+import _bootstrap  # noqa: F401
+from ncaa_baseball.datastore import write_table
+
 
 # ── Constants ──────────────────────────────────────────────────────────────────
 
@@ -797,7 +800,7 @@ def build_pitcher_table(
         "n_appearances", "last_appearance",
     ]
     df = df[col_order]
-    df.to_csv(out_csv, index=False)
+    write_table(df, out_csv)
     print(f"\nWrote {len(df)} rows to {out_csv}", file=sys.stderr)
 
     return df
@@ -29,6 +29,9 @@ from pathlib import Path
 import numpy as np
 import pandas as pd
 
+import _bootstrap  # noqa: F401
+from ncaa_baseball.datastore import write_table
+
 
 def _norm_name(name: str) -> str:
     """Normalize a player name for matching."""
@@ -296,7 +299,7 @@ def build_player_registry(
 
     # Write
     out_csv.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(out_csv, index=False)
+    write_table(df, out_csv)
 
     # Summary
     print(f"\n{'='*60}", file=sys.stderr)
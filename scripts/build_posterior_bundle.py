@@ -0,0 +1,43 @@
+"""
+Convert a posterior draws CSV into its binary bundle (.npy blocks + meta.json).
+
+simulate.py converts automatically on first load, but running this right after
+``make model`` means the first daily prediction already starts from the
+memory-mapped bundle instead of parsing the wide CSV.
+
+Usage:
+  python3 scripts/build_posterior_bundle.py
+  python3 scripts/build_posterior_bundle.py --posterior data/processed/run_event_posterior.csv
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+import _bootstrap  # noqa: F401
+from ncaa_baseball.posterior import convert_posterior_csv
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Convert posterior CSV to binary bundle.")
+    parser.add_argument("--posterior", type=Path,
+                        default=Path("data/processed/run_event_posterior_2k.csv"))
+    parser.add_argument("--meta", type=Path,
+                        default=Path("data/processed/run_event_fit_meta.json"))
+    parser.add_argument("--out", type=Path, default=None,
+                        help="Bundle directory (default: <posterior>.bundle next to the CSV)")
+    args = parser.parse_args()
+
+    for label, p in [("posterior", args.posterior), ("meta", args.meta)]:
+        if not p.exists():
+            print(f"Missing {label}: {p}", file=sys.stderr)
+            return 1
+
+    bundle = convert_posterior_csv(args.posterior, args.meta, bundle_dir=args.out)
+    print(f"Posterior bundle -> {bundle}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
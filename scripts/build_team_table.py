@@ -15,6 +15,9 @@ from pathlib import Path
 import numpy as np
 import pandas as pd
 
+import _bootstrap  # noqa: F401
+from ncaa_baseball.datastore import write_table
+
 
 # ── Constants ────────────────────────────────────────────────────────────────
 ATT_STD_EST = 0.109   # from posterior att_run_1 team mean std
@@ -463,7 +466,7 @@ def main() -> None:
     )
 
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    tt.to_csv(out_path, index=False)
+    write_table(tt, out_path)
 
     print(f"\nWrote {len(tt)} rows to {out_path}", file=sys.stderr)
     print(f"  With team_idx > 0:    {(tt['team_idx'] > 0).sum()}", file=sys.stderr)
@@ -24,6 +24,10 @@ from pathlib import Path
 import numpy as np
 import pandas as pd
 
+import _bootstrap  # noqa: F401
+from ncaa_baseball.datastore import read_table
+from ncaa_baseball.pipeline_context import PipelineContext
+
 
 # ── Constants ────────────────────────────────────────────────────────────────
 
@@ -40,6 +44,7 @@ def compute_bullpen_fatigue(
     game_date: str,
     window_days: int = 3,
     required_team_ids: set[str] | list[str] | None = None,
+    ctx: PipelineContext | None = None,
 ) -> pd.DataFrame:
     """
     Compute rolling bullpen workload for each team.
@@ -49,6 +54,8 @@ def compute_bullpen_fatigue(
         game_date: Target date (YYYY-MM-DD) — computes workload in the
                    window_days BEFORE this date
         window_days: Number of days to look back (default 3)
+        ctx: the run's PipelineContext; appearances then come from it
+             instead of appearances_csv
 
     Returns:
         DataFrame with one row per team:
@@ -60,7 +67,7 @@ def compute_bullpen_fatigue(
         for t in (required_team_ids or [])
         if str(t).strip()
     }
-    app = pd.read_csv(appearances_csv, dtype=str)
+    app = ctx.table("pitcher_appearances") if ctx is not None else read_table(appearances_csv)
     app["game_date"] = pd.to_datetime(app["game_date"], errors="coerce")
 
     # Parse IP (innings pitched) — handle "5.1" = 5⅓, "5.2" = 5⅔ format
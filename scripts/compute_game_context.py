@@ -22,7 +22,6 @@ from __future__ import annotations
 
 import argparse
 import csv
-import json
 import math
 import sys
 from datetime import datetime, timedelta
@@ -32,6 +31,9 @@ import numpy as np
 import pandas as pd
 
 import _bootstrap  # noqa: F401
+from ncaa_baseball.datastore import read_table
+from ncaa_baseball.odds_store import open_odds_store
+from ncaa_baseball.pipeline_context import PipelineContext
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -98,9 +100,11 @@ def compute_rest_fatigue(
     games_csv: Path,
     game_date: str,
     team_ids: list[str],
+    ctx: PipelineContext | None = None,
 ) -> dict[str, dict]:
     """Compute rest/schedule density for each team."""
-    games = pd.read_csv(games_csv, dtype=str)
+    cols = ["game_date", "home_canonical_id", "away_canonical_id"]
+    games = ctx.table("games", cols) if ctx is not None else read_table(games_csv, cols)
     games["game_date"] = pd.to_datetime(games["game_date"], errors="coerce")
 
     target = pd.Timestamp(game_date)
@@ -324,12 +328,14 @@ def compute_recent_form(
     games_csv: Path,
     game_date: str,
     team_ids: list[str],
+    ctx: PipelineContext | None = None,
 ) -> dict[str, dict]:
     """Compute 7-day scoring form relative to season average."""
-    games = pd.read_csv(games_csv, dtype=str)
+    cols = ["game_date", "home_canonical_id", "away_canonical_id", "home_score", "away_score"]
+    games = ctx.table("games", cols) if ctx is not None else read_table(games_csv, cols)
     games["game_date"] = pd.to_datetime(games["game_date"], errors="coerce")
-    games["home_score"] = pd.to_numeric(games["home_score"], errors="coerce")
-    games["away_score"] = pd.to_numeric(games["away_score"], errors="coerce")
+    games["home_score"] = pd.to_numeric(games["home_score"], errors="coerce").astype(float)
+    games["away_score"] = pd.to_numeric(games["away_score"], errors="coerce").astype(float)
     games = games[games["home_score"].notna()].copy()
 
     target = pd.Timestamp(game_date)
@@ -400,8 +406,13 @@ def compute_game_context(
     catcher_csv: Path = Path("data/registries/catcher_quality.csv"),
     odds_log: Path = Path("data/raw/odds/odds_pull_log.jsonl"),
     out_csv: Path | None = None,
+    ctx: PipelineContext | None = None,
 ) -> pd.DataFrame:
-    """Compute all contextual adjustments for each game on a date."""
+    """Compute all contextual adjustments for each game on a date.
+
+    With *ctx* (the run's PipelineContext) games, stadiums, team table and
+    canonical teams come from it instead of the paths.
+    """
 
     schedule = pd.read_csv(schedule_csv, dtype=str)
     print(f"Computing game context for {len(schedule)} games on {date}...", file=sys.stderr)
@@ -417,8 +428,10 @@ def compute_game_context(
     # Stadium lat/lon for travel distance
     stadium_locs: dict[str, tuple[float, float]] = {}
     tz_by_cid: dict[str, str] = {}
+    if ctx is not None:
+        stadium_csv = ctx.paths["stadiums"]
     if stadium_csv.exists():
-        stads = pd.read_csv(stadium_csv, dtype=str)
+        stads = ctx.stadiums() if ctx is not None else pd.read_csv(stadium_csv, dtype=str)
         for _, r in stads.iterrows():
             cid = str(r.get("canonical_id", "")).strip()
             try:
@@ -439,48 +452,28 @@ def compute_game_context(
 
     # Conference for each team
     conf_by_cid: dict[str, str] = {}
-    if team_table_csv.exists():
-        tt = pd.read_csv(team_table_csv, dtype=str)
+    if (ctx.has("team_table") if ctx is not None else team_table_csv.exists()):
+        tt = ctx.table("team_table") if ctx is not None else read_table(team_table_csv)
         for _, r in tt.iterrows():
             cid = str(r.get("canonical_id", "")).strip()
             conf = str(r.get("conference", "")).strip()
             if cid and conf and conf != "nan":
                 conf_by_cid[cid] = conf
 
-    # Build odds_name → canonical_id lookup from canonical teams registry
-    canon_csv = Path("data/registries/canonical_teams_2026.csv")
-    odds_name_to_cid: dict[str, str] = {}
-    if canon_csv.exists():
-        canon_df = pd.read_csv(canon_csv, dtype=str)
-        for _, r in canon_df.iterrows():
-            cid = str(r.get("canonical_id", "")).strip()
-            for col in ("odds_api_name", "espn_name", "team_name"):
-                n = str(r.get(col, "")).strip()
-                if n and n != "nan":
-                    odds_name_to_cid[n] = cid
+    # Canonical teams registry: the odds store resolves odds team names with it
+    canon_csv = ctx.paths["canonical"] if ctx is not None else Path("data/registries/canonical_teams_2026.csv")
 
     # Game times from odds data — keyed by (home_cid, away_cid) for reliable matching
+    # (latest logged snapshot per game, an indexed lookup in the odds store)
     game_times: dict[tuple[str, str], str] = {}
     if odds_log.exists():
-        with open(odds_log) as f:
-            for line in f:
-                try:
-                    row = json.loads(line)
-                    ct = row.get("commence_time", "")
-                    if not ct.startswith(date):
-                        continue
-                    home = row.get("home_team", "")
-                    away = row.get("away_team", "")
-                    h_cid_odds = odds_name_to_cid.get(home, "")
-                    a_cid_odds = odds_name_to_cid.get(away, "")
-                    if h_cid_odds and a_cid_odds and ct:
-                        game_times[(h_cid_odds, a_cid_odds)] = ct
-                except:
-                    pass
+        with open_odds_store(odds_log, canonical_csv=canon_csv) as store:
+            for pair, row in store.latest_records(date).items():
+                game_times[pair] = row["commence_time"]
 
     # ── Compute batch layers ─────────────────────────────────────────────
-    rest_data = compute_rest_fatigue(games_csv, date, all_team_ids)
-    form_data = compute_recent_form(games_csv, date, all_team_ids)
+    rest_data = compute_rest_fatigue(games_csv, date, all_team_ids, ctx=ctx)
+    form_data = compute_recent_form(games_csv, date, all_team_ids, ctx=ctx)
 
     # ── Per-game context ─────────────────────────────────────────────────
     rows = []
@@ -29,14 +29,17 @@ import json
 import os
 import re
 import sys
-import time
 from datetime import datetime, timezone, date
 from pathlib import Path
 
-import requests
+
+import _bootstrap  # noqa: F401
+from ncaa_baseball.http_fetch import shared_fetcher
 
 # ── Config ────────────────────────────────────────────────────────
 BASE_URL = "https://sportsbook-nash.draftkings.com"
+# Requests/s to this host (shared across threads; replaces per-call sleeps)
+RATE_PER_S = 1.0
 
 HEADERS = {
     "User-Agent": "dksb/5.40.2 (iOS; iPhone15,4; iOS26.3.1)",
@@ -86,7 +89,8 @@ def _fetch(path: str, params: dict = None) -> dict | None:
     """Make DraftKings API request."""
     url = f"{BASE_URL}{path}"
     try:
-        r = requests.get(url, params=params, headers=HEADERS, timeout=20)
+        r = shared_fetcher().get(url, params=params, headers=HEADERS, timeout=20,
+                                 rate_per_s=RATE_PER_S)
         if r.status_code == 200:
             return r.json()
         else:
@@ -530,10 +534,8 @@ def main():
     all_rows = []
 
     for sport in sports_to_scrape:
-        rows = scrape_sport(sport)
+        rows = scrape_sport(sport)  # paced by the shared fetcher's DraftKings rate limit
         all_rows.extend(rows)
-        if sport != sports_to_scrape[-1]:
-            time.sleep(1)  # Be polite between sports
 
     print(f"\n{'=' * 60}")
     print(f"  TOTAL: {len(all_rows)} odds rows")
@@ -20,6 +20,9 @@ from pathlib import Path
 
 import pandas as pd
 
+import _bootstrap  # noqa: F401
+from ncaa_baseball.odds_store import open_odds_store
+
 
 KEEP_COLS = [
     "game_num", "away", "home", "home_cid", "away_cid",
@@ -65,21 +68,9 @@ def load_opening_lines(odds_log: Path, game_date: str) -> dict[tuple[str, str],
     if not odds_log.exists():
         return openers
 
-    with open(odds_log) as f:
-        for line in f:
-            rec = json.loads(line)
-            # Only consider records from the same day or day before
-            ct = rec.get("commence_time", "")
-            if not ct:
-                continue
-            ct_date = ct[:10]
-            if ct_date != game_date:
-                continue
-
-            key = (rec.get("home_team", ""), rec.get("away_team", ""))
-            if key in openers:
-                continue  # Keep the first (earliest) snapshot
-
+    with open_odds_store(odds_log) as store:
+        # First (earliest) snapshot per (home, away) for games on game_date
+        for key, rec in store.opening_records(game_date).items():
             # Extract opening ML and total
             best_h_ml = None
             best_a_ml = None
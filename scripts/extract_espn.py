@@ -9,29 +9,44 @@ Replaces 6 separate build_* scripts that each independently parse the same raw d
   build_park_factors.py          → park_factors.csv
   build_bullpen_fatigue.py       → bullpen_quality.csv
 
-This script does ONE pass through each JSONL file and outputs 4 CSVs + a manifest.
+This script does ONE pass through each JSONL file and outputs 4 CSVs + a manifest
+(games, run_events and pitcher_appearances also as typed Parquet when pyarrow
+is installed; see ncaa_baseball.datastore).
+
+Incremental by default: extract_manifest.json records, per season file, the
+byte offset parsed so far and the SHA-256 of that prefix, and the parsed rows
+of each season are cached under <out-dir>/extract_cache/. A rerun verifies the
+prefix hash and parses only the appended tail (a file that was rewritten, or a
+changed canonical teams CSV, triggers a reparse of that season). Seasons that
+need parsing run in parallel worker processes. Games are merged by event_id
+(the last line for an event wins, so a re-scraped game replaces the earlier
+one), and the outputs are byte-identical to a --full rebuild.
 
 Usage:
   python3 scripts/extract_espn.py
+  python3 scripts/extract_espn.py --full
   python3 scripts/extract_espn.py --espn-dir data/raw/espn --out-dir data/processed --seasons 2024,2025,2026
   python3 scripts/extract_espn.py --out-dir data/processed/extracted_test
 """
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
-import sys
-from collections import Counter, defaultdict
+import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 import _bootstrap  # noqa: F401  (adds src/ to sys.path)
+from ncaa_baseball.datastore import RUN_EVENT_KEYS, SCHEMAS, write_table
 from ncaa_baseball.phase1 import (
+    TeamResolver,
     build_odds_name_to_canonical,
     load_canonical_teams,
-    resolve_odds_teams,
 )
 
 
@@ -97,322 +112,487 @@ def _parse_pc(stats: dict) -> float | None:
 
 def build_resolver(canonical: pd.DataFrame, name_to_canonical: dict):
     """Return a closure that maps a full ESPN team name to canonical_id or ''."""
+    resolver = TeamResolver(canonical, name_to_canonical)
+
     def resolve(name: str) -> str:
         if not name:
             return ""
-        t, _ = resolve_odds_teams(name, name, canonical, name_to_canonical)
-        return t[0] if t else ""
+        return resolver.canonical_id(name)
     return resolve
 
 
 # ---------------------------------------------------------------------------
-# Venue accumulator (for venue_stats)
+# Output schemas
 # ---------------------------------------------------------------------------
+#
+# Every column has a fixed dtype (the table schemas declared in
+# ncaa_baseball.datastore) so a row is written the same way whichever other
+# rows share its file (an int column does not turn into "5.0" because one
+# game somewhere lacks a score). That is what lets the incremental merge
+# reproduce a full rebuild byte for byte.
+
+GAMES_SCHEMA = SCHEMAS["games"]
+RUN_EVENTS_SCHEMA = SCHEMAS["run_events"]  # schema must be identical to existing file
+PITCHER_SCHEMA = SCHEMAS["pitcher_appearances"]
+
+VENUE_COLUMNS = [
+    "venue_name", "venue_city", "venue_state", "home_canonical_id",
+    "n_games", "total_home_runs", "total_away_runs", "rpg",
+    "home_run_1_avg", "home_run_2_avg", "home_run_3_avg", "home_run_4_avg",
+    "away_run_1_avg", "away_run_2_avg", "away_run_3_avg", "away_run_4_avg",
+]
+
+TABLES = {"games": GAMES_SCHEMA, "run_events": RUN_EVENTS_SCHEMA, "pitchers": PITCHER_SCHEMA}
+
+# Bump when parsing changes so cached season frames are rebuilt.
+EXTRACT_VERSION = 2
+CACHE_DIR = "extract_cache"
+HASH_CHUNK = 1 << 20
+
+
+def _get_count(d: dict, key: str) -> int:
+    v = d.get(key)
+    if v is None:
+        return 0
+    try:
+        return int(v)
+    except (TypeError, ValueError):
+        return 0
 
-RUN_EVENT_KEYS = ("run_1", "run_2", "run_3", "run_4")
 
+# ---------------------------------------------------------------------------
+# Per-game parsing
+# ---------------------------------------------------------------------------
 
-class VenueAccum:
-    """Accumulates per-venue totals for the venue_stats output."""
+def parse_game(g: dict, season: str, resolve) -> tuple[dict, dict | None, list[dict]]:
+    """One JSONL game -> (games row, run_events row or None, pitcher rows)."""
+    # ── Core identifiers ──────────────────────────────────────────────────
+    event_id = str(g.get("event_id") or g.get("id") or "")
+    game_date = (g.get("date") or "")[:10]
+    try:
+        yr = int(g.get("season") or season)
+    except (TypeError, ValueError):
+        yr = int(season) if season.isdigit() else 0
+
+    home = g.get("home_team") or {}
+    away = g.get("away_team") or {}
+    home_name = (home.get("name") or "").strip()
+    away_name = (away.get("name") or "").strip()
+
+    # Resolve team names once per game
+    home_canonical = resolve(home_name)
+    away_canonical = resolve(away_name)
+
+    # Scores
+    home_score = _safe_int(g.get("home_score"))
+    away_score = _safe_int(g.get("away_score"))
+
+    # Venue
+    venue = g.get("venue") or {}
+    venue_name = (venue.get("name") or "").strip()
+    venue_city = (venue.get("city") or "").strip()
+    venue_state = (venue.get("state") or "").strip()
+
+    neutral_site = bool(g.get("neutral_site"))
+
+    # Starters
+    starters = g.get("starters") or {}
+    hp = starters.get("home_pitcher") or {}
+    ap = starters.get("away_pitcher") or {}
+    home_pitcher_espn_id = str(hp.get("espn_id") or hp.get("id") or "") or None
+    away_pitcher_espn_id = str(ap.get("espn_id") or ap.get("id") or "") or None
+    home_pitcher_name = (hp.get("name") or "").strip() or None
+    away_pitcher_name = (ap.get("name") or "").strip() or None
+
+    # Run events
+    re = g.get("run_events")
+    has_run_events = bool(re and isinstance(re, dict))
+    home_re = (re.get("home") or {}) if has_run_events else {}
+    away_re = (re.get("away") or {}) if has_run_events else {}
+    if not (home_re and away_re):
+        has_run_events = False
+
+    # Boxscore pitching
+    box = g.get("boxscore") or {}
+    has_boxscore = bool(box)
+
+    # ── 1. games row ──────────────────────────────────────────────────────
+    game_row = {
+        "event_id": event_id,
+        "game_date": game_date,
+        "season": yr,
+        "home_name": home_name,
+        "away_name": away_name,
+        "home_canonical_id": home_canonical,
+        "away_canonical_id": away_canonical,
+        "home_score": home_score,
+        "away_score": away_score,
+        "winner_home": (
+            home_score > away_score
+            if (home_score is not None and away_score is not None) else None
+        ),
+        "venue_name": venue_name,
+        "venue_city": venue_city,
+        "venue_state": venue_state,
+        "neutral_site": neutral_site,
+        "home_pitcher_espn_id": home_pitcher_espn_id,
+        "away_pitcher_espn_id": away_pitcher_espn_id,
+        "home_pitcher_name": home_pitcher_name,
+        "away_pitcher_name": away_pitcher_name,
+        "has_run_events": has_run_events,
+        "has_boxscore": has_boxscore,
+    }
 
-    __slots__ = (
-        "games", "total_home_runs", "total_away_runs",
-        "re_games",
-        "home_re_totals", "away_re_totals",
-        "home_teams",   # Counter of home_canonical_id
-    )
+    # ── 2. run_events row (only when PBP available) ───────────────────────
+    run_event_row = None
+    if has_run_events:
+        run_event_row = {
+            "event_id": event_id,
+            "game_date": game_date,
+            "season": yr,
+            "home_canonical_id": home_canonical,
+            "away_canonical_id": away_canonical,
+            "home_pitcher_espn_id": home_pitcher_espn_id or "",
+            "away_pitcher_espn_id": away_pitcher_espn_id or "",
+            **{f"home_{k}": _get_count(home_re, k) for k in RUN_EVENT_KEYS},
+            **{f"away_{k}": _get_count(away_re, k) for k in RUN_EVENT_KEYS},
+            "home_score": home_score,
+            "away_score": away_score,
+        }
+
+    # ── 3. pitcher_appearances rows (from boxscore pitching) ──────────────
+    # The boxscore is keyed by team abbreviation (or id).
+    # We try both abbreviations.
+    home_abbr = (home.get("abbreviation") or "").strip()
+    away_abbr = (away.get("abbreviation") or "").strip()
+    home_id_str = str(home.get("id") or "")
+    away_id_str = str(away.get("id") or "")
+
+    pitcher_rows: list[dict] = []
+    team_side_map = [
+        (home_abbr, home_id_str, home_name, home_canonical, "home"),
+        (away_abbr, away_id_str, away_name, away_canonical, "away"),
+    ]
+    for abbr, team_id_str, team_name, team_canonical_id, side in team_side_map:
+        section = box.get(abbr) or box.get(team_id_str) or {}
+        for athlete in section.get("pitching", []):
+            stats = athlete.get("stats") or {}
+            espn_id = athlete.get("espn_id")
+            if espn_id is not None:
+                try:
+                    espn_id = str(int(espn_id))
+                except (TypeError, ValueError):
+                    espn_id = str(espn_id)
+            starter = bool(athlete.get("starter"))
+            pitcher_rows.append({
+                "event_id": event_id,
+                "game_date": game_date,
+                "season": yr,
+                "pitcher_espn_id": espn_id or "",
+                "pitcher_id": f"ESPN_{espn_id}" if espn_id else "",
+                "pitcher_name": (athlete.get("name") or "").strip(),
+                "team_canonical_id": team_canonical_id,
+                "team_name": team_name,
+                "side": side,
+                "starter": starter,
+                "role": "starter" if starter else "reliever",
+                "ip": parse_ip(stats.get("IP")),
+                "h": _safe_int(stats.get("H")),
+                "r": _safe_int(stats.get("R")),
+                "er": _safe_int(stats.get("ER")),
+                "bb": _safe_int(stats.get("BB")),
+                "k": _safe_int(stats.get("K")),
+                "hr": _safe_int(stats.get("HR")),
+                "pc": _parse_pc(stats),
+            })
+
+    return game_row, run_event_row, pitcher_rows
+
+
+class _Columns:
+    """Column-wise row buffer for one table (values appended per column)."""
+
+    def __init__(self, schema: dict[str, str]):
+        self.schema = schema
+        self.cols: dict[str, list] = {c: [] for c in schema}
+        self.lines: list[int] = []
+
+    def add(self, row: dict, line: int) -> None:
+        for c, values in self.cols.items():
+            values.append(row[c])
+        self.lines.append(line)
+
+    def frame(self) -> pd.DataFrame:
+        df = typed_frame(self.cols, self.schema)
+        df["_line"] = np.asarray(self.lines, dtype=np.int64)
+        return df
+
+
+def typed_frame(data, schema: dict[str, str]) -> pd.DataFrame:
+    """DataFrame with exactly the schema's columns and dtypes."""
+    df = pd.DataFrame(data, columns=list(schema))
+    for c, dtype in schema.items():
+        if dtype == "object":
+            df[c] = df[c].astype(object).where(df[c].notna(), None)
+        else:
+            df[c] = df[c].astype(dtype)
+    return df
+
+
+# ---------------------------------------------------------------------------
+# Season scanning (byte offsets + prefix hashes)
+# ---------------------------------------------------------------------------
+
+def prefix_sha256(path: Path, length: int) -> hashlib._Hash:
+    """Running SHA-256 of the first ``length`` bytes of ``path``."""
+    h = hashlib.sha256()
+    remaining = length
+    with path.open("rb") as f:
+        while remaining > 0:
+            chunk = f.read(min(HASH_CHUNK, remaining))
+            if not chunk:
+                break
+            h.update(chunk)
+            remaining -= len(chunk)
+    return h
+
+
+def scan_season(
+    path: Path,
+    season: str,
+    resolve,
+    offset: int = 0,
+    first_line: int = 0,
+    expected_sha256: str | None = None,
+) -> dict:
+    """Parse ``path`` from byte ``offset`` (line ``first_line``) to its last complete line.
+
+    The prefix before ``offset`` must hash to ``expected_sha256``; otherwise
+    the file was rewritten, not appended to, and the whole file is parsed
+    (``full`` is True in the result). A trailing line without a newline is
+    left for the next run. Rows carry their physical line number in ``_line``.
+    """
+    size = path.stat().st_size
+    h = None
+    if offset > 0 and size >= offset:
+        h = prefix_sha256(path, offset)
+        if h.hexdigest() != expected_sha256:
+            h = None
+    full = h is None
+    if full:
+        h, offset, first_line = hashlib.sha256(), 0, 0
+
+    tables = {name: _Columns(schema) for name, schema in TABLES.items()}
+    line_no = first_line
+    parsed = parse_errors = 0
+    with path.open("rb") as f:
+        f.seek(offset)
+        for raw in f:
+            if not raw.endswith(b"\n"):
+                break
+            h.update(raw)
+            offset += len(raw)
+            line_no += 1
+            line = raw.decode("utf-8").strip()
+            if not line:
+                continue
+            parsed += 1
+            try:
+                g = json.loads(line)
+            except json.JSONDecodeError:
+                parse_errors += 1
+                continue
+            game_row, run_event_row, pitcher_rows = parse_game(g, season, resolve)
+            tables["games"].add(game_row, line_no)
+            if run_event_row is not None:
+                tables["run_events"].add(run_event_row, line_no)
+            for row in pitcher_rows:
+                tables["pitchers"].add(row, line_no)
+
+    return {
+        "season": season,
+        "full": full,
+        "frames": {name: cols.frame() for name, cols in tables.items()},
+        "offset": offset,
+        "lines": line_no,
+        "sha256": h.hexdigest(),
+        "parsed_lines": parsed,
+        "parse_errors": parse_errors,
+    }
 
-    def __init__(self):
-        self.games: int = 0
-        self.total_home_runs: int = 0
-        self.total_away_runs: int = 0
-        self.re_games: int = 0
-        self.home_re_totals: dict[str, int] = {k: 0 for k in RUN_EVENT_KEYS}
-        self.away_re_totals: dict[str, int] = {k: 0 for k in RUN_EVENT_KEYS}
-        self.home_teams: Counter = Counter()
+
+_WORKER: dict[str, object] = {}
+
+
+def _init_worker(canonical: pd.DataFrame, name_to_canonical: dict) -> None:
+    _WORKER["resolve"] = build_resolver(canonical, name_to_canonical)
+
+
+def _scan_task(task: tuple) -> dict:
+    path, season, offset, first_line, expected = task
+    return scan_season(path, season, _WORKER["resolve"], offset, first_line, expected)
 
 
 # ---------------------------------------------------------------------------
-# Main extractor
+# Extractor
 # ---------------------------------------------------------------------------
 
+def _cache_path(cache_dir: Path, season: str) -> Path:
+    return cache_dir / f"season_{season}.pkl"
+
+
+def _file_sha256(path: Path) -> str:
+    return prefix_sha256(path, path.stat().st_size).hexdigest()
+
+
+def _dedupe_events(frames: dict[str, pd.DataFrame]) -> dict[str, pd.DataFrame]:
+    """Keep the last line per event_id; drop rows that came from superseded lines."""
+    games = frames["games"]
+    superseded = games["event_id"].ne("") & games.duplicated("event_id", keep="last")
+    if not superseded.any():
+        return frames
+    dropped = games.loc[superseded, "_key"]
+    return {name: df[~df["_key"].isin(dropped)].reset_index(drop=True) for name, df in frames.items()}
+
+
 def extract(
     espn_dir: Path,
     seasons: list[str],
     canonical: pd.DataFrame,
     name_to_canonical: dict,
-) -> tuple[list[dict], list[dict], list[dict], dict[tuple, VenueAccum]]:
-    """Single pass through all JSONL files.
-
-    Returns:
-      games_rows       — one row per game
-      run_events_rows  — one row per game with run_events data
-      pitcher_rows     — one row per pitcher per game (from boxscore pitching)
-      venue_accums     — per-venue accumulator dicts (keyed by (name, city, state))
+    cache_dir: Path | None = None,
+    previous: dict | None = None,
+    workers: int = 1,
+) -> tuple[dict[str, pd.DataFrame], dict[str, dict]]:
+    """Parse new JSONL lines per season and merge with the cached season frames.
+
+    ``previous`` is the ``inputs`` section of the last extract_manifest.json
+    (None, or no ``cache_dir``, parses every file in full). Returns the merged
+    {games, run_events, pitchers} frames, deduplicated by event_id, and the
+    new per-season ``inputs`` entries. Each frame keeps a ``_key`` column
+    (season position and source line) linking rows of the same game.
     """
-    resolve = build_resolver(canonical, name_to_canonical)
-
-    games_rows: list[dict] = []
-    run_events_rows: list[dict] = []
-    pitcher_rows: list[dict] = []
-    venue_accums: dict[tuple, VenueAccum] = defaultdict(VenueAccum)
-
-    total_lines = 0
-    parse_errors = 0
-
+    previous = previous or {}
+    tasks, present = [], []
     for season in seasons:
         path = espn_dir / f"games_{season}.jsonl"
         if not path.exists():
             print(f"  skip (not found): {path}")
             continue
-
-        with path.open(encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                total_lines += 1
-
-                try:
-                    g = json.loads(line)
-                except json.JSONDecodeError:
-                    parse_errors += 1
-                    continue
-
-                # ── Core identifiers ──────────────────────────────────────────
-                event_id = str(g.get("event_id") or g.get("id") or "")
-                game_date = (g.get("date") or "")[:10]
-                try:
-                    yr = int(g.get("season") or season)
-                except (TypeError, ValueError):
-                    yr = int(season) if season.isdigit() else 0
-
-                home = g.get("home_team") or {}
-                away = g.get("away_team") or {}
-                home_name = (home.get("name") or "").strip()
-                away_name = (away.get("name") or "").strip()
-
-                # Resolve team names once per game
-                home_canonical = resolve(home_name)
-                away_canonical = resolve(away_name)
-
-                # Scores
-                home_score = _safe_int(g.get("home_score"))
-                away_score = _safe_int(g.get("away_score"))
-
-                # Venue
-                venue = g.get("venue") or {}
-                venue_name = (venue.get("name") or "").strip()
-                venue_city = (venue.get("city") or "").strip()
-                venue_state = (venue.get("state") or "").strip()
-
-                neutral_site = bool(g.get("neutral_site"))
-
-                # Starters
-                starters = g.get("starters") or {}
-                hp = starters.get("home_pitcher") or {}
-                ap = starters.get("away_pitcher") or {}
-                home_pitcher_espn_id = str(hp.get("espn_id") or hp.get("id") or "") or None
-                away_pitcher_espn_id = str(ap.get("espn_id") or ap.get("id") or "") or None
-                home_pitcher_name = (hp.get("name") or "").strip() or None
-                away_pitcher_name = (ap.get("name") or "").strip() or None
-
-                # Run events
-                re = g.get("run_events")
-                has_run_events = bool(re and isinstance(re, dict))
-                home_re = (re.get("home") or {}) if has_run_events else {}
-                away_re = (re.get("away") or {}) if has_run_events else {}
-                if not (home_re and away_re):
-                    has_run_events = False
-
-                # Boxscore pitching
-                box = g.get("boxscore") or {}
-                has_boxscore = bool(box)
-
-                # ── 1. games row ──────────────────────────────────────────────
-                games_rows.append({
-                    "event_id": event_id,
-                    "game_date": game_date,
-                    "season": yr,
-                    "home_name": home_name,
-                    "away_name": away_name,
-                    "home_canonical_id": home_canonical,
-                    "away_canonical_id": away_canonical,
-                    "home_score": home_score,
-                    "away_score": away_score,
-                    "winner_home": (
-                        bool(home_score is not None and away_score is not None
-                             and home_score > away_score)
-                        if (home_score is not None and away_score is not None) else None
-                    ),
-                    "venue_name": venue_name,
-                    "venue_city": venue_city,
-                    "venue_state": venue_state,
-                    "neutral_site": neutral_site,
-                    "home_pitcher_espn_id": home_pitcher_espn_id,
-                    "away_pitcher_espn_id": away_pitcher_espn_id,
-                    "home_pitcher_name": home_pitcher_name,
-                    "away_pitcher_name": away_pitcher_name,
-                    "has_run_events": has_run_events,
-                    "has_boxscore": has_boxscore,
-                })
-
-                # ── 2. run_events row (only when PBP available) ───────────────
-                if has_run_events:
-                    def get_count(d: dict, key: str) -> int:
-                        v = d.get(key)
-                        if v is None:
-                            return 0
-                        try:
-                            return int(v)
-                        except (TypeError, ValueError):
-                            return 0
-
-                    run_events_rows.append({
-                        "event_id": event_id,
-                        "game_date": game_date,
-                        "season": yr,
-                        "home_canonical_id": home_canonical,
-                        "away_canonical_id": away_canonical,
-                        "home_pitcher_espn_id": home_pitcher_espn_id or "",
-                        "away_pitcher_espn_id": away_pitcher_espn_id or "",
-                        "home_run_1": get_count(home_re, "run_1"),
-                        "home_run_2": get_count(home_re, "run_2"),
-                        "home_run_3": get_count(home_re, "run_3"),
-                        "home_run_4": get_count(home_re, "run_4"),
-                        "away_run_1": get_count(away_re, "run_1"),
-                        "away_run_2": get_count(away_re, "run_2"),
-                        "away_run_3": get_count(away_re, "run_3"),
-                        "away_run_4": get_count(away_re, "run_4"),
-                        "home_score": home_score,
-                        "away_score": away_score,
-                    })
-
-                # ── 3. pitcher_appearances rows (from boxscore pitching) ───────
-                # The boxscore is keyed by team abbreviation (or id).
-                # We try both abbreviations.
-                home_abbr = (home.get("abbreviation") or "").strip()
-                away_abbr = (away.get("abbreviation") or "").strip()
-                home_id_str = str(home.get("id") or "")
-                away_id_str = str(away.get("id") or "")
-
-                team_side_map = [
-                    (home_abbr, home_id_str, home_name, home_canonical, "home"),
-                    (away_abbr, away_id_str, away_name, away_canonical, "away"),
-                ]
-                for abbr, team_id_str, team_name, team_canonical_id, side in team_side_map:
-                    section = box.get(abbr) or box.get(team_id_str) or {}
-                    for athlete in section.get("pitching", []):
-                        stats = athlete.get("stats") or {}
-                        espn_id = athlete.get("espn_id")
-                        if espn_id is not None:
-                            try:
-                                espn_id = str(int(espn_id))
-                            except (TypeError, ValueError):
-                                espn_id = str(espn_id)
-                        pitcher_name = (athlete.get("name") or "").strip()
-                        starter = bool(athlete.get("starter"))
-                        role = "starter" if starter else "reliever"
-                        ip_raw = stats.get("IP")
-                        ip = parse_ip(ip_raw)
-                        h = _safe_int(stats.get("H"))
-                        r = _safe_int(stats.get("R"))
-                        er = _safe_int(stats.get("ER"))
-                        bb = _safe_int(stats.get("BB"))
-                        k = _safe_int(stats.get("K"))
-                        hr = _safe_int(stats.get("HR"))
-                        pc = _parse_pc(stats)
-
-                        pitcher_rows.append({
-                            "event_id": event_id,
-                            "game_date": game_date,
-                            "season": yr,
-                            "pitcher_espn_id": espn_id or "",
-                            "pitcher_id": f"ESPN_{espn_id}" if espn_id else "",
-                            "pitcher_name": pitcher_name,
-                            "team_canonical_id": team_canonical_id,
-                            "team_name": team_name,
-                            "side": side,
-                            "starter": starter,
-                            "role": role,
-                            "ip": ip,
-                            "h": h,
-                            "r": r,
-                            "er": er,
-                            "bb": bb,
-                            "k": k,
-                            "hr": hr,
-                            "pc": pc,
-                        })
-
-                # ── 4. venue accumulation (non-neutral, scored games only) ─────
-                if (
-                    not neutral_site
-                    and venue_name
-                    and home_score is not None
-                    and away_score is not None
-                ):
-                    vkey = (venue_name, venue_city, venue_state)
-                    acc = venue_accums[vkey]
-                    acc.games += 1
-                    acc.total_home_runs += home_score
-                    acc.total_away_runs += away_score
-                    if home_canonical:
-                        acc.home_teams[home_canonical] += 1
-                    if has_run_events:
-                        acc.re_games += 1
-                        for rk in RUN_EVENT_KEYS:
-                            acc.home_re_totals[rk] += get_count(home_re, rk)
-                            acc.away_re_totals[rk] += get_count(away_re, rk)
+        present.append(season)
+        prev = previous.get(season) or {}
+        resume = cache_dir is not None and _cache_path(cache_dir, season).exists() and prev
+        tasks.append((path, season,
+                      int(prev.get("offset", 0)) if resume else 0,
+                      int(prev.get("lines", 0)) if resume else 0,
+                      prev.get("sha256") if resume else None))
+
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks)), initializer=_init_worker,
+                                 initargs=(canonical, name_to_canonical)) as pool:
+            results = list(pool.map(_scan_task, tasks))
+    else:
+        _init_worker(canonical, name_to_canonical)
+        results = [_scan_task(t) for t in tasks]
+
+    season_frames: list[dict[str, pd.DataFrame]] = []
+    inputs: dict[str, dict] = {}
+    total_lines = parse_errors = 0
+    for (path, season, offset, _, _), res in zip(tasks, results):
+        frames = res["frames"]
+        if not res["full"]:
+            cached = pd.read_pickle(_cache_path(cache_dir, season))
+            first_line = int(previous[season]["lines"])
+            frames = {
+                name: pd.concat([cached[name][cached[name]["_line"] <= first_line], df],
+                                ignore_index=True)
+                for name, df in frames.items()
+            }
+        mode = "full" if res["full"] else f"tail from byte {offset}"
+        print(f"  {season}: {res['parsed_lines']} lines parsed ({mode})")
+        total_lines += res["parsed_lines"]
+        parse_errors += res["parse_errors"]
+        if cache_dir is not None:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp = _cache_path(cache_dir, season).with_suffix(".tmp")
+            pd.to_pickle(frames, tmp)
+            os.replace(tmp, _cache_path(cache_dir, season))
+        inputs[season] = {
+            "path": str(path),
+            "offset": res["offset"],
+            "lines": res["lines"],
+            "sha256": res["sha256"],
+        }
+        season_frames.append(frames)
 
     print(f"  total lines parsed: {total_lines}")
     print(f"  parse errors:       {parse_errors}")
-    return games_rows, run_events_rows, pitcher_rows, venue_accums
+
+    merged = {}
+    for name, schema in TABLES.items():
+        parts = [
+            f[name].assign(_key=(pos << 32) + f[name]["_line"])
+            for pos, f in enumerate(season_frames)
+        ]
+        merged[name] = (pd.concat(parts, ignore_index=True) if parts
+                        else typed_frame([], schema).assign(_line=0, _key=0).iloc[:0])
+    merged = _dedupe_events(merged)
+    merged = {name: df.drop(columns="_line") for name, df in merged.items()}
+    return merged, inputs
 
 
 # ---------------------------------------------------------------------------
 # venue_stats builder (aggregation step, runs after the pass)
 # ---------------------------------------------------------------------------
 
-def build_venue_stats(venue_accums: dict[tuple, VenueAccum]) -> list[dict]:
-    rows = []
-    for (vname, vcity, vstate), acc in venue_accums.items():
-        if acc.games == 0:
-            continue
-        total_runs = acc.total_home_runs + acc.total_away_runs
-        rpg = total_runs / acc.games
-
-        row: dict = {
-            "venue_name": vname,
-            "venue_city": vcity,
-            "venue_state": vstate,
-            "home_canonical_id": (
-                acc.home_teams.most_common(1)[0][0] if acc.home_teams else ""
-            ),
-            "n_games": acc.games,
-            "total_home_runs": acc.total_home_runs,
-            "total_away_runs": acc.total_away_runs,
-            "rpg": round(rpg, 4),
-        }
+def build_venue_stats(games: pd.DataFrame, run_events: pd.DataFrame) -> pd.DataFrame:
+    """Per-venue run environment from non-neutral, scored games (``extract`` frames).
 
-        # Per-run-type averages (only for games with PBP)
-        for rk in RUN_EVENT_KEYS:
-            if acc.re_games > 0:
-                row[f"home_{rk}_avg"] = round(acc.home_re_totals[rk] / acc.re_games, 4)
-                row[f"away_{rk}_avg"] = round(acc.away_re_totals[rk] / acc.re_games, 4)
-            else:
-                row[f"home_{rk}_avg"] = None
-                row[f"away_{rk}_avg"] = None
+    Venues keep first-appearance order before the final sort; a venue's
+    home_canonical_id is its most frequent home team (first seen wins ties).
+    Run-type averages use only the games with run events.
+    """
+    vkey = ["venue_name", "venue_city", "venue_state"]
+    scored = (~games["neutral_site"] & games["venue_name"].ne("")
+              & games["home_score"].notna() & games["away_score"].notna())
+    g = games.loc[scored.to_numpy(dtype=bool)]
+    if g.empty:
+        return pd.DataFrame(columns=VENUE_COLUMNS)
+
+    grouped = g.groupby(vkey, sort=False)
+    out = pd.DataFrame({
+        "n_games": grouped.size(),
+        "total_home_runs": grouped["home_score"].sum().astype(int),
+        "total_away_runs": grouped["away_score"].sum().astype(int),
+    })
+
+    with_home = g[g["home_canonical_id"].ne("")]
+    counts = with_home.groupby(vkey + ["home_canonical_id"], sort=False).size().rename("n").reset_index()
+    top = counts.loc[counts.groupby(vkey, sort=False)["n"].idxmax()].set_index(vkey)["home_canonical_id"]
+    out["home_canonical_id"] = top.reindex(out.index).fillna("")
+    out["rpg"] = [round((h + a) / n, 4) for h, a, n in
+                  zip(out["total_home_runs"], out["total_away_runs"], out["n_games"])]
+
+    re_cols = [f"{side}_{k}" for side in ("home", "away") for k in RUN_EVENT_KEYS]
+    with_re = g.loc[g["has_run_events"], ["_key"] + vkey].merge(
+        run_events[["_key"] + re_cols], on="_key", how="left",
+    )
+    re_grouped = with_re.groupby(vkey, sort=False)
+    re_games = re_grouped.size().reindex(out.index)
+    re_sums = re_grouped[re_cols].sum().reindex(out.index)
+    for c in re_cols:
+        out[f"{c}_avg"] = [round(int(s) / int(n), 4) if pd.notna(n) and n > 0 else None
+                           for s, n in zip(re_sums[c], re_games)]
 
-        rows.append(row)
-    return rows
+    out = out.reset_index()[VENUE_COLUMNS]
+    return out.sort_values("n_games", ascending=False).reset_index(drop=True)
 
 
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(
         description="Single-pass ESPN JSONL extractor. Produces games, run_events, "
                     "pitcher_appearances, and venue_stats CSVs.",
@@ -441,75 +621,66 @@ def main() -> int:
         default="2024,2025,2026",
         help="Comma-separated seasons to include",
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Ignore the manifest and season cache; reparse every file",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=min(3, os.cpu_count() or 1),
+        help="Parse seasons in this many processes",
+    )
+    args = parser.parse_args(argv)
 
     seasons = [s.strip() for s in args.seasons.split(",") if s.strip()]
     print(f"Loading canonical teams from {args.canonical}")
     canonical = load_canonical_teams(args.canonical)
     name_to_canonical = build_odds_name_to_canonical(canonical)
 
-    print(f"Extracting ESPN JSONL from {args.espn_dir} (seasons: {', '.join(seasons)})")
-
-    # ── Single pass ──────────────────────────────────────────────────────────
-    games_rows, run_events_rows, pitcher_rows, venue_accums = extract(
+    # ── Resume point: per-season offsets, valid only for the same parser + teams ──
+    manifest_path = args.out_dir / "extract_manifest.json"
+    cache_dir = args.out_dir / CACHE_DIR
+    canonical_sha256 = _file_sha256(args.canonical)
+    previous = None
+    if not args.full and manifest_path.exists():
+        try:
+            old = json.loads(manifest_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            old = {}
+        if (old.get("extract_version") == EXTRACT_VERSION
+                and old.get("canonical_sha256") == canonical_sha256):
+            previous = old.get("inputs")
+    mode = "incremental" if previous else "full"
+    print(f"Extracting ESPN JSONL from {args.espn_dir} (seasons: {', '.join(seasons)}; {mode})")
+
+    frames, inputs = extract(
         args.espn_dir, seasons, canonical, name_to_canonical,
+        cache_dir=cache_dir, previous=previous, workers=args.workers,
+    )
+    # ── Build venue_stats from the merged games ──────────────────────────────
+    venue_df = build_venue_stats(frames["games"], frames["run_events"])
+    games_df, run_events_df, pitcher_df = (
+        frames[name].drop(columns="_key") for name in ("games", "run_events", "pitchers")
     )
-
-    # ── Build venue_stats from accumulators ──────────────────────────────────
-    venue_rows = build_venue_stats(venue_accums)
 
     # ── Write outputs ─────────────────────────────────────────────────────────
     args.out_dir.mkdir(parents=True, exist_ok=True)
 
-    # games.csv
     games_path = args.out_dir / "games.csv"
-    games_df = pd.DataFrame(games_rows, columns=[
-        "event_id", "game_date", "season",
-        "home_name", "away_name",
-        "home_canonical_id", "away_canonical_id",
-        "home_score", "away_score", "winner_home",
-        "venue_name", "venue_city", "venue_state", "neutral_site",
-        "home_pitcher_espn_id", "away_pitcher_espn_id",
-        "home_pitcher_name", "away_pitcher_name",
-        "has_run_events", "has_boxscore",
-    ])
-    games_df.to_csv(games_path, index=False)
+    write_table(games_df, games_path)
     print(f"  games.csv:               {len(games_df):>6d} rows  →  {games_path}")
 
-    # run_events.csv — schema must be identical to existing file
     run_events_path = args.out_dir / "run_events.csv"
-    run_events_df = pd.DataFrame(run_events_rows, columns=[
-        "event_id", "game_date", "season",
-        "home_canonical_id", "away_canonical_id",
-        "home_pitcher_espn_id", "away_pitcher_espn_id",
-        "home_run_1", "home_run_2", "home_run_3", "home_run_4",
-        "away_run_1", "away_run_2", "away_run_3", "away_run_4",
-        "home_score", "away_score",
-    ])
-    run_events_df.to_csv(run_events_path, index=False)
+    write_table(run_events_df, run_events_path)
     print(f"  run_events.csv:          {len(run_events_df):>6d} rows  →  {run_events_path}")
 
-    # pitcher_appearances.csv
     pitcher_path = args.out_dir / "pitcher_appearances.csv"
-    pitcher_df = pd.DataFrame(pitcher_rows, columns=[
-        "event_id", "game_date", "season",
-        "pitcher_espn_id", "pitcher_id", "pitcher_name",
-        "team_canonical_id", "team_name", "side", "starter", "role",
-        "ip", "h", "r", "er", "bb", "k", "hr", "pc",
-    ])
-    pitcher_df.to_csv(pitcher_path, index=False)
+    write_table(pitcher_df, pitcher_path)
     print(f"  pitcher_appearances.csv: {len(pitcher_df):>6d} rows  →  {pitcher_path}")
 
-    # venue_stats.csv
     venue_path = args.out_dir / "venue_stats.csv"
-    venue_cols = [
-        "venue_name", "venue_city", "venue_state", "home_canonical_id",
-        "n_games", "total_home_runs", "total_away_runs", "rpg",
-        "home_run_1_avg", "home_run_2_avg", "home_run_3_avg", "home_run_4_avg",
-        "away_run_1_avg", "away_run_2_avg", "away_run_3_avg", "away_run_4_avg",
-    ]
-    venue_df = pd.DataFrame(venue_rows, columns=venue_cols)
-    venue_df = venue_df.sort_values("n_games", ascending=False).reset_index(drop=True)
     venue_df.to_csv(venue_path, index=False)
     print(f"  venue_stats.csv:         {len(venue_df):>6d} rows  →  {venue_path}")
 
@@ -526,12 +697,15 @@ def main() -> int:
     print(f"  run_events with both teams resolved: {re_resolved}/{len(run_events_df)}")
     print(f"  unique venues:                       {len(venue_df)}")
 
-    # ── Manifest ─────────────────────────────────────────────────────────────
+    # ── Manifest (written last: it is the resume point for the next run) ──────
     manifest = {
         "generated_at": datetime.now(timezone.utc).isoformat(),
         "seasons": seasons,
         "espn_dir": str(args.espn_dir),
         "canonical": str(args.canonical),
+        "canonical_sha256": canonical_sha256,
+        "extract_version": EXTRACT_VERSION,
+        "inputs": inputs,
         "outputs": {
             "games": str(games_path),
             "run_events": str(run_events_path),
@@ -547,9 +721,10 @@ def main() -> int:
             "run_events_both_resolved": int(re_resolved),
         },
     }
-    manifest_path = args.out_dir / "extract_manifest.json"
-    with manifest_path.open("w", encoding="utf-8") as fh:
+    tmp = manifest_path.with_name(f".{manifest_path.name}.tmp")
+    with tmp.open("w", encoding="utf-8") as fh:
         json.dump(manifest, fh, indent=2)
+    os.replace(tmp, manifest_path)
     print(f"  extract_manifest.json             →  {manifest_path}")
 
     return 0
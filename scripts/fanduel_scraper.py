@@ -21,14 +21,17 @@ import json
 import os
 import re
 import sys
-import time
 from datetime import datetime, timezone, date, timedelta
 from pathlib import Path
 
-import requests
+
+import _bootstrap  # noqa: F401
+from ncaa_baseball.http_fetch import shared_fetcher
 
 # ── Config ────────────────────────────────────────────────────────
 BASE_URL = "https://api.sportsbook.fanduel.com"
+# Requests/s to this host (shared across threads; replaces per-call sleeps)
+RATE_PER_S = 2.0
 API_KEY = "oN2groXWNuItc4hZ"  # Static app key from FanDuel iOS
 PX_AUTH = None  # Set from captures if needed; currently not required for competition-page
 
@@ -77,7 +80,8 @@ def _fetch(path: str, params: dict = None) -> dict | None:
     p = {"_ak": API_KEY, **(params or {})}
     hdrs = {**HEADERS, **PX_HEADERS}
     try:
-        r = requests.get(url, params=p, headers=hdrs, timeout=15)
+        r = shared_fetcher().get(url, params=p, headers=hdrs, timeout=15,
+                                 rate_per_s=RATE_PER_S)
         if r.status_code == 200:
             return r.json()
         else:
@@ -245,6 +249,23 @@ def scrape_competition(competition_id: str, sport_key: str) -> list:
     return rows
 
 
+def scrape_sport(sport_name: str) -> list:
+    """Scrape every configured competition of a sport, concurrently
+    (paced by the shared fetcher's FanDuel rate limit)."""
+    cfg = SPORTS.get(sport_name)
+    if not cfg:
+        print(f"Unknown sport: {sport_name}")
+        return []
+
+    comps = list(cfg["competitions"].items())
+    results = shared_fetcher().map(lambda comp: scrape_competition(comp[0], cfg["sport_key"]), comps)
+    all_rows = []
+    for (comp_id, comp_name), rows in zip(comps, results):
+        print(f"  [{sport_name}] {comp_name} (competition {comp_id}): {len(rows)} odds rows")
+        all_rows.extend(rows)
+    return all_rows
+
+
 def scrape_event(event_id: str, sport_key: str) -> list:
     """Scrape ALL markets for a single event (includes props, alternates, etc.)."""
     data = _fetch("/sbapi/event-page", {
@@ -439,13 +460,7 @@ def main():
         return
 
     for sport in sports:
-        cfg = SPORTS[sport]
-        for comp_id, comp_name in cfg["competitions"].items():
-            print(f"\n  [{sport}] {comp_name} (competition {comp_id})...")
-            rows = scrape_competition(comp_id, cfg["sport_key"])
-            all_rows.extend(rows)
-            print(f"  [{sport}] Extracted {len(rows)} odds rows")
-            time.sleep(0.5)
+        all_rows.extend(scrape_sport(sport))
 
     # Summary
     from collections import Counter
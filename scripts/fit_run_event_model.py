@@ -3,33 +3,137 @@ Fit Stan run-event model (Path A step 6.3).
 
 Loads run_events.csv and team/pitcher index CSVs, filters to games with both teams
 resolved, builds Stan data, runs CmdStanPy sample(), saves posterior draws and
-meta so simulate_run_event_game.py can use them.
+meta so simulate_run_event_game.py can use them, plus a binary posterior bundle
+(run_event_posterior.bundle/) that simulate.py memory-maps.
 
 Stan model: Mack Ch 18 architecture — sum-to-zero centering, NegBin for run_1/run_2,
 Poisson for run_3/run_4, single pitcher_ability scalar, single home_advantage,
-park factors, and bullpen quality adjustments.
+park factors, and bullpen quality adjustments. The default is the vectorized
+reduce_sum variant (stan/ncaa_baseball_run_events_reduce_sum.stan), which has the
+same posterior as the scalar model but evaluates the likelihood in vectorized
+slices that --threads-per-chain spreads over several threads per chain.
 
 Usage:
   pip install cmdstanpy  # and install CmdStan: python -m cmdstanpy.install_cmdstan
   python3 scripts/fit_run_event_model.py --run-events data/processed/run_events.csv
   python3 scripts/fit_run_event_model.py --chains 2 --iter 500  # smaller for testing
+  python3 scripts/fit_run_event_model.py --threads-per-chain 4   # 4 chains x 4 threads
+  python3 scripts/fit_run_event_model.py --full                  # force a cold refit
+  python3 scripts/fit_run_event_model.py --method pathfinder --holdout-days 1  # intraday
+
+Refits warm-start from the previous fit (run_event_warmstart.json in --out-dir:
+step size, inverse metric and last draw per chain) with a --warm-warmup
+iteration warmup, as long as the team/pitcher indices only grew. New teams and
+pitchers start at their prior means. Meta records the fit it warmed from.
+
+--method pathfinder|laplace|advi swaps NUTS for one of CmdStan's fast
+approximations (same posterior CSV columns, meta and bundle, so simulate.py is
+unchanged) and writes run_event_compare_<method>.json/_params.csv/_games.csv:
+parameter mean/SD deltas and exact win-prob deltas against the last NUTS fit
+(run_event_nuts_reference.bundle/, a thinned copy saved by every NUTS fit) on
+the --holdout-days games (or the latest --compare-games games).
 """
 from __future__ import annotations
 
 import argparse
 import json
-import math
+import time
+from datetime import datetime, timezone
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
 
+import _bootstrap  # noqa: F401
+from ncaa_baseball.fit_compare import REFERENCE_DRAWS, compare_fits
+from ncaa_baseball.posterior import (
+    bundle_path,
+    draws_to_arrays,
+    posterior_from_arrays,
+    read_bundle,
+    write_bundle,
+)
+from ncaa_baseball.run_event_data import (
+    bullpen_columns,
+    index_games,
+    index_sizes,
+    load_run_events,
+    park_factor_column,
+)
+from ncaa_baseball.simulation import GameOffsets
+from ncaa_baseball.warmstart import (
+    inits_from_draw,
+    load_warmstart,
+    ordered_ids,
+    param_layout,
+    plan_warmstart,
+    save_warmstart,
+)
+
 try:
     from cmdstanpy import CmdStanModel
 except ImportError:
     CmdStanModel = None
 
 
+FIT_METHODS = ("nuts", "pathfinder", "laplace", "advi")
+NUTS_REFERENCE = "run_event_nuts_reference.bundle"
+
+
+def _fit_approx(model, method: str, stan_data: dict, args) -> pd.DataFrame:
+    """Draws from one of CmdStan's fast approximations, as a wide DataFrame."""
+    out_dir = str(args.out_dir)
+    if method == "pathfinder":
+        fit = model.pathfinder(data=stan_data, draws=args.approx_draws,
+                               num_paths=args.chains, output_dir=out_dir)
+        return fit.draws_pd()
+    if method == "laplace":
+        mode = model.optimize(data=stan_data, jacobian=True, output_dir=out_dir)
+        fit = model.laplace_sample(data=stan_data, mode=mode, draws=args.approx_draws,
+                                   jacobian=True, output_dir=out_dir)
+        return fit.draws_pd()
+    fit = model.variational(data=stan_data, algorithm="meanfield",
+                            output_samples=args.approx_draws, output_dir=out_dir,
+                            require_converged=False)
+    return fit.variational_sample_pd
+
+
+def _compare_slate(fit_df: pd.DataFrame, park: list[float], home_bp: list[float],
+                   away_bp: list[float], rows: np.ndarray) -> tuple[list[GameOffsets], np.ndarray | None]:
+    """GameOffsets (model terms only) and home-won outcomes for the given fit_df rows."""
+    games = [
+        GameOffsets(
+            h_idx=int(fit_df["home_team_idx"].iat[i]),
+            a_idx=int(fit_df["away_team_idx"].iat[i]),
+            hp_idx=int(fit_df["home_pitcher_idx"].iat[i]),
+            ap_idx=int(fit_df["away_pitcher_idx"].iat[i]),
+            park_factor=park[i],
+            home_bp=home_bp[i],
+            away_bp=away_bp[i],
+        )
+        for i in rows
+    ]
+    if {"home_score", "away_score"} <= set(fit_df.columns):
+        hs = pd.to_numeric(fit_df["home_score"].iloc[rows], errors="coerce")
+        as_ = pd.to_numeric(fit_df["away_score"].iloc[rows], errors="coerce")
+        if hs.notna().all() and as_.notna().all():
+            return games, (hs.to_numpy() > as_.to_numpy()).astype(float)
+    return games, None
+
+
+def _min_bulk_ess(fit) -> float | None:
+    """Smallest bulk ESS over all sampled quantities (column name varies by CmdStan version)."""
+    try:
+        summary = fit.summary()
+    except Exception:
+        return None
+    for col in ("ESS_bulk", "N_Eff"):
+        if col in summary.columns:
+            ess = pd.to_numeric(summary[col], errors="coerce").drop(index="lp__", errors="ignore")
+            return round(float(ess.min()), 1)
+    return None
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(
         description="Fit Stan run-event model; save posterior and meta.",
@@ -37,7 +141,8 @@ def main() -> int:
     parser.add_argument("--run-events", type=Path, default=Path("data/processed/run_events.csv"))
     parser.add_argument("--team-index", type=Path, default=Path("data/processed/run_event_team_index.csv"))
     parser.add_argument("--pitcher-index", type=Path, default=Path("data/processed/run_event_pitcher_index.csv"))
-    parser.add_argument("--stan-file", type=Path, default=Path("stan/ncaa_baseball_run_events.stan"))
+    parser.add_argument("--stan-file", type=Path, default=Path("stan/ncaa_baseball_run_events_reduce_sum.stan"),
+                        help="Stan model (stan/ncaa_baseball_run_events.stan is the scalar reference)")
     parser.add_argument("--park-factors", type=Path, default=Path("data/processed/park_factors.csv"))
     parser.add_argument("--bullpen-quality", type=Path, default=Path("data/processed/bullpen_quality.csv"))
     parser.add_argument("--out-dir", type=Path, default=Path("data/processed"))
@@ -45,6 +150,23 @@ def main() -> int:
     parser.add_argument("--iter", type=int, default=10000, help="Total iterations per chain (including warmup)")
     parser.add_argument("--warmup", type=int, default=None, help="Warmup iterations per chain (default: iter//5)")
     parser.add_argument("--subsample", type=int, default=None, help="Use at most this many games (for quick test runs)")
+    parser.add_argument("--threads-per-chain", type=int, default=1,
+                        help="reduce_sum threads per chain (model is compiled with STAN_THREADS)")
+    parser.add_argument("--grainsize", type=int, default=1,
+                        help="Games per reduce_sum work unit (1 lets the scheduler choose)")
+    parser.add_argument("--full", action="store_true",
+                        help="Cold refit: ignore the previous fit's warm-start state")
+    parser.add_argument("--warm-warmup", type=int, default=150,
+                        help="Warmup iterations per chain when warm-starting")
+    parser.add_argument("--method", choices=FIT_METHODS, default="nuts",
+                        help="nuts (full sampler) or a fast approximation for intraday refits")
+    parser.add_argument("--approx-draws", type=int, default=4000,
+                        help="Draws to emit for pathfinder/laplace/advi")
+    parser.add_argument("--holdout-days", type=int, default=0,
+                        help="Leave the last N days of games out of the fit and use them "
+                             "as the comparison slate")
+    parser.add_argument("--compare-games", type=int, default=200,
+                        help="Comparison slate size when no games are held out (latest games)")
     args = parser.parse_args()
 
     if CmdStanModel is None:
@@ -57,52 +179,11 @@ def main() -> int:
             return 1
 
     # Load tables
-    re_df = pd.read_csv(args.run_events, dtype=str)
+    re_df = load_run_events(args.run_events)
     team_df = pd.read_csv(args.team_index)
     pitcher_df = pd.read_csv(args.pitcher_index)
 
-    # Coerce run counts to int
-    run_cols = [f"home_run_{k}" for k in range(1, 5)] + [f"away_run_{k}" for k in range(1, 5)]
-    for c in run_cols:
-        if c in re_df.columns:
-            re_df[c] = pd.to_numeric(re_df[c], errors="coerce").fillna(0).astype(int)
-
-    # Map canonical_id -> team_idx, pitcher_id -> pitcher_idx
-    team_map = dict(zip(team_df["canonical_id"], team_df["team_idx"]))
-    pitcher_map: dict[str, int] = {"unknown": 0, "": 0}
-    for _, r in pitcher_df.iterrows():
-        pid = str(r["pitcher_espn_id"]).strip()
-        if pid and pid.lower() != "unknown":
-            pitcher_map[pid] = int(r["pitcher_idx"])
-            # Also index without .0 suffix for float-formatted IDs
-            if pid.endswith(".0"):
-                pitcher_map[pid[:-2]] = int(r["pitcher_idx"])
-
-    def team_idx(cid) -> int | None:
-        if cid is None or (isinstance(cid, float) and pd.isna(cid)):
-            return None
-        cid = str(cid).strip()
-        return team_map.get(cid) if cid else None
-
-    def pitcher_idx(pid_val) -> int:
-        if pid_val is None or (isinstance(pid_val, float) and pd.isna(pid_val)):
-            return 0
-        pid = str(pid_val).strip() or "unknown"
-        return pitcher_map.get(pid, 0)
-
-    re_df["home_team_idx"] = re_df["home_canonical_id"].map(team_idx)
-    re_df["away_team_idx"] = re_df["away_canonical_id"].map(team_idx)
-    # Always prefer home_pitcher_espn_id (ESPN data has actual IDs; linescore home_pitcher_id is empty)
-    hp_col = "home_pitcher_espn_id" if "home_pitcher_espn_id" in re_df.columns else "home_pitcher_id"
-    ap_col = "away_pitcher_espn_id" if "away_pitcher_espn_id" in re_df.columns else "away_pitcher_id"
-    re_df["home_pitcher_idx"] = re_df[hp_col].map(pitcher_idx)
-    re_df["away_pitcher_idx"] = re_df[ap_col].map(pitcher_idx)
-
-    # Keep only games with both teams in index
-    mask = re_df["home_team_idx"].notna() & re_df["away_team_idx"].notna()
-    fit_df = re_df.loc[mask].copy()
-    fit_df["home_team_idx"] = fit_df["home_team_idx"].astype(int)
-    fit_df["away_team_idx"] = fit_df["away_team_idx"].astype(int)
+    fit_df = index_games(re_df, team_df, pitcher_df)
     if fit_df.empty:
         print("No games with both teams in index; check run_events and team index.")
         return 1
@@ -111,79 +192,11 @@ def main() -> int:
         fit_df = fit_df.sample(n=args.subsample, random_state=42).reset_index(drop=True)
         print(f"Subsampled to {len(fit_df)} games for quick run.")
     N_games = len(fit_df)
-    N_teams = int(team_df["team_idx"].max())
-    N_pitchers = int(pitcher_df.loc[pitcher_df["pitcher_espn_id"] != "unknown", "pitcher_idx"].max())
-
-    # ── Park factors: map venue → log(adjusted_pf), default 0 (neutral) ──────
-    park_factor_vec = [0.0] * N_games
-    n_park_matched = 0
-    if args.park_factors.exists():
-        pf_df = pd.read_csv(args.park_factors)
-        # Build lookup by home_team_id -> adjusted_pf (log scale)
-        pf_map: dict[str, float] = {}
-        for _, r in pf_df.iterrows():
-            htid = str(r.get("home_team_id", "")).strip()
-            adj = r.get("adjusted_pf")
-            if htid and adj is not None and not (isinstance(adj, float) and math.isnan(adj)):
-                pf_map[htid] = math.log(float(adj))
-        # Also build venue-name lookup as fallback
-        pf_venue_map: dict[str, float] = {}
-        for _, r in pf_df.iterrows():
-            vname = str(r.get("venue_name", "")).strip()
-            adj = r.get("adjusted_pf")
-            if vname and adj is not None and not (isinstance(adj, float) and math.isnan(adj)):
-                pf_venue_map[vname] = math.log(float(adj))
-
-        # Map each game: use home_canonical_id to look up park factor
-        for i, row in fit_df.iterrows():
-            home_cid = str(row.get("home_canonical_id", "")).strip()
-            venue = str(row.get("venue_name", "")).strip()
-            pf = pf_map.get(home_cid)
-            if pf is None and venue:
-                pf = pf_venue_map.get(venue)
-            if pf is not None:
-                idx = fit_df.index.get_loc(i)
-                park_factor_vec[idx] = pf
-                n_park_matched += 1
-        print(f"Park factors: {n_park_matched}/{N_games} games matched ({n_park_matched/N_games*100:.1f}%)")
-    else:
-        print(f"Park factors: {args.park_factors} not found, using 0 (neutral) for all games.")
-
-    # ── Bullpen quality: map team+season → bullpen_depth_score ────────────────
-    home_bullpen_vec = [0.0] * N_games
-    away_bullpen_vec = [0.0] * N_games
-    n_bp_matched = 0
-    if args.bullpen_quality.exists():
-        bq_df = pd.read_csv(args.bullpen_quality)
-        # Build (canonical_id, season) -> bullpen_depth_score
-        # Then convert to z-score-based log-scale adjustment
-        # Positive score = better bullpen; we want: better bullpen -> negative adj
-        # (opponent scores less), so bullpen_adj = -depth_score * scale
-        bp_map: dict[tuple[str, int], float] = {}
-        for _, r in bq_df.iterrows():
-            cid = str(r.get("team_canonical_id", "")).strip()
-            season = int(r.get("season", 0))
-            score = r.get("bullpen_depth_score")
-            if cid and season and score is not None and not (isinstance(score, float) and math.isnan(score)):
-                # depth_score is already z-score composite; negate and scale
-                # so positive adj = worse bullpen = opponent scores more
-                bp_map[(cid, season)] = -float(score) * 0.1  # scale to log-rate magnitude
-        for i, row in fit_df.iterrows():
-            home_cid = str(row.get("home_canonical_id", "")).strip()
-            away_cid = str(row.get("away_canonical_id", "")).strip()
-            season = int(row.get("season", 0)) if "season" in row.index else 0
-            idx = fit_df.index.get_loc(i)
-            h_bp = bp_map.get((home_cid, season))
-            a_bp = bp_map.get((away_cid, season))
-            if h_bp is not None:
-                home_bullpen_vec[idx] = h_bp
-            if a_bp is not None:
-                away_bullpen_vec[idx] = a_bp
-            if h_bp is not None or a_bp is not None:
-                n_bp_matched += 1
-        print(f"Bullpen quality: {n_bp_matched}/{N_games} games with at least one team matched")
-    else:
-        print(f"Bullpen quality: {args.bullpen_quality} not found, using 0 for all games.")
+    N_teams, N_pitchers = index_sizes(team_df, pitcher_df)
+
+    # ── Park factors (log adjusted_pf, 0 = neutral) and bullpen quality ──────
+    park_factor_vec = park_factor_column(fit_df, args.park_factors)
+    home_bullpen_vec, away_bullpen_vec = bullpen_columns(fit_df, args.bullpen_quality)
 
     # ── Conference index: team_idx → conf_idx ──────────────────────────────────
     if "conf_idx" in team_df.columns:
@@ -224,6 +237,29 @@ def main() -> int:
     else:
         print("FIP priors: pitcher_table.csv not found, using uninformative priors for all pitchers")
 
+    # ── Comparison slate: held-out days (excluded from the fit) or latest games ──
+    game_dates = pd.to_datetime(fit_df.get("game_date", pd.Series(index=fit_df.index, dtype=str)),
+                                errors="coerce")
+    held = np.zeros(N_games, dtype=bool)
+    if args.holdout_days > 0 and game_dates.notna().any():
+        cutoff = game_dates.max() - pd.Timedelta(days=args.holdout_days - 1)
+        held = (game_dates >= cutoff).to_numpy()
+    if held.any():
+        slate_rows = np.flatnonzero(held)
+    else:
+        order = np.argsort(game_dates.fillna(pd.Timestamp.min).to_numpy(), kind="stable")
+        slate_rows = order[-args.compare_games:]
+    slate_games, slate_home_won = _compare_slate(
+        fit_df, park_factor_vec, home_bullpen_vec, away_bullpen_vec, slate_rows)
+    if held.any():
+        keep = ~held
+        fit_df = fit_df.iloc[np.flatnonzero(keep)]
+        park_factor_vec = [v for v, k in zip(park_factor_vec, keep) if k]
+        home_bullpen_vec = [v for v, k in zip(home_bullpen_vec, keep) if k]
+        away_bullpen_vec = [v for v, k in zip(away_bullpen_vec, keep) if k]
+        N_games = len(fit_df)
+        print(f"Holdout: last {args.holdout_days} day(s), {int(held.sum())} games left out of the fit")
+
     stan_data = {
         "N_games": N_games,
         "N_teams": N_teams,
@@ -246,6 +282,7 @@ def main() -> int:
         "home_bullpen_adj": home_bullpen_vec,
         "away_bullpen_adj": away_bullpen_vec,
         "fip_prior": fip_prior,
+        "grainsize": args.grainsize,  # reduce_sum model only; ignored by the scalar model
     }
 
     args.out_dir.mkdir(parents=True, exist_ok=True)
@@ -256,36 +293,149 @@ def main() -> int:
 
     # Compile and fit
     stan_path = args.stan_file if args.stan_file.is_absolute() else Path.cwd() / args.stan_file
-    model = CmdStanModel(stan_file=str(stan_path))
+    model = CmdStanModel(stan_file=str(stan_path), cpp_options={"STAN_THREADS": True})
     warmup = args.warmup if args.warmup is not None else args.iter // 5
     iter_sampling = max(1, args.iter - warmup)
-    fit = model.sample(
-        data=stan_data,
-        chains=args.chains,
-        iter_warmup=warmup,
-        iter_sampling=iter_sampling,
-        show_progress=True,
-        output_dir=str(args.out_dir),
-    )
+
+    # ── Warm start from the previous fit when the indices only grew ──────────
+    team_ids = ordered_ids(team_df, "canonical_id", "team_idx", N_teams)
+    pitcher_ids = ordered_ids(pitcher_df, "pitcher_espn_id", "pitcher_idx", N_pitchers)
+    warm, reason = None, f"--method {args.method}"
+    sample_kwargs: dict = {}
+    if args.method == "nuts":
+        warm, reason = (None, "--full") if args.full else plan_warmstart(
+            load_warmstart(args.out_dir), str(args.stan_file), N_conf,
+            team_ids, pitcher_ids, team_conf_arr, fip_prior, args.chains,
+        )
+        if warm is not None:
+            warmup = args.warm_warmup
+            sample_kwargs = {
+                "inits": warm.inits,
+                "step_size": warm.step_size,
+                "metric": [{"inv_metric": m} for m in warm.inv_metric],
+                # Metric is already adapted: short init buffer, one slow window.
+                "adapt_init_phase": max(1, warmup // 6),
+                "adapt_metric_window": max(1, warmup * 2 // 3),
+                "adapt_step_size": max(1, warmup // 6),
+            }
+            print(f"Warm start from fit {warm.fit_id} ({reason}): {warmup} warmup iterations")
+        else:
+            print(f"Cold fit ({reason}): {warmup} warmup iterations")
+
+    t0 = time.perf_counter()
+    fit = None
+    min_ess = None
+    if args.method == "nuts":
+        fit = model.sample(
+            data=stan_data,
+            chains=args.chains,
+            parallel_chains=args.chains,
+            threads_per_chain=args.threads_per_chain,
+            iter_warmup=warmup,
+            iter_sampling=iter_sampling,
+            show_progress=True,
+            output_dir=str(args.out_dir),
+            **sample_kwargs,
+        )
+        sample_seconds = time.perf_counter() - t0
+        draws = fit.draws_pd()
+
+        # Wall time per effective draw is the number to compare across model
+        # variants / thread counts (same posterior, so same ESS target).
+        min_ess = _min_bulk_ess(fit)
+        if min_ess is not None:
+            print(f"Sampling: {sample_seconds:.0f}s, min bulk ESS {min_ess:.0f} "
+                  f"({min_ess / max(sample_seconds, 1e-9):.2f} ESS/s)")
+        else:
+            print(f"Sampling: {sample_seconds:.0f}s")
+    else:
+        draws = _fit_approx(model, args.method, stan_data, args)
+        sample_seconds = time.perf_counter() - t0
+        print(f"{args.method}: {sample_seconds:.0f}s, {len(draws)} draws")
 
     # Save posterior draws as single CSV (one row per draw) for simulate script
-    draws = fit.draws_pd()
     posterior_csv = args.out_dir / "run_event_posterior.csv"
     draws.to_csv(posterior_csv, index=False)
     print(f"Posterior: {len(draws)} draws -> {posterior_csv}")
 
+    fitted_at = datetime.now(timezone.utc)
+    fit_id = fitted_at.strftime("%Y%m%dT%H%M%SZ")
+    fit_dates = game_dates[~held]
     meta = {
+        "fit_id": fit_id,
+        "fit_date": fitted_at.date().isoformat(),
+        # Latest game in the fit; update_run_event_posterior.py folds in later games
+        "data_through": fit_dates.max().date().isoformat() if fit_dates.notna().any() else None,
+        "method": args.method,
         "N_teams": N_teams,
         "N_pitchers": N_pitchers,
         "N_conf": N_conf,
         "n_draws": len(draws),
+        "stan_file": str(args.stan_file),
+        "threads_per_chain": args.threads_per_chain,
+        "sample_seconds": round(sample_seconds, 1),
+        "min_ess_bulk": min_ess,
+        "iter_warmup": warmup if args.method == "nuts" else None,
+        "holdout_games": int(held.sum()),
+        "warm_start_from": warm.fit_id if warm is not None else None,
+        "warm_start_reason": reason,
     }
     meta_json = args.out_dir / "run_event_fit_meta.json"
     with open(meta_json, "w") as f:
         json.dump(meta, f)
     print(f"Meta -> {meta_json}")
-    return 0
 
+    # Binary bundle (mmap-able .npy blocks) so daily loads skip CSV parsing
+    arrays = draws_to_arrays(draws, N_teams, N_pitchers)
+    bundle = write_bundle(bundle_path(posterior_csv), arrays, meta, source_csv=posterior_csv)
+    print(f"Posterior bundle -> {bundle}")
+
+    reference_dir = args.out_dir / NUTS_REFERENCE
+    if args.method == "nuts":
+        # Thinned copy kept as the baseline for later approximate fits
+        rows = np.random.default_rng(0).permutation(len(draws))[:REFERENCE_DRAWS]
+        write_bundle(reference_dir, {k: v[np.sort(rows)] for k, v in arrays.items()}, meta)
+        print(f"NUTS reference ({min(len(draws), REFERENCE_DRAWS)} draws) -> {reference_dir}")
+
+        # Sampler state for the next (warm-started) refit
+        layout = param_layout(N_conf, N_teams, N_pitchers)
+        last = fit.draws(concat_chains=False)[-1]  # (chains, columns)
+        state = {
+            "fit_id": fit_id,
+            "stan_file": str(args.stan_file),
+            "metric_type": fit.metric_type,
+            "n_conf": N_conf,
+            "team_ids": team_ids,
+            "pitcher_ids": pitcher_ids,
+            "step_size": [float(x) for x in fit.step_size],
+            "inv_metric": np.asarray(fit.metric).tolist(),
+            "inits": [inits_from_draw(dict(zip(fit.column_names, row)), layout) for row in last],
+        }
+        print(f"Warm-start state -> {save_warmstart(args.out_dir, state)}")
+    elif (reference_dir / "meta.json").exists():
+        ref_arrays, ref_meta = read_bundle(reference_dir)
+        ref = posterior_from_arrays(ref_arrays, int(ref_meta["N_teams"]), int(ref_meta["N_pitchers"]))
+        new = posterior_from_arrays(arrays, N_teams, N_pitchers)
+        summary, params, games = compare_fits(ref, new, slate_games, slate_home_won)
+        summary.update({
+            "method": args.method,
+            "fit_id": fit_id,
+            "reference_fit_id": ref_meta.get("fit_id"),
+            "slate": "holdout" if held.any() else "latest_in_sample",
+            "seconds": round(sample_seconds, 1),
+        })
+        stem = args.out_dir / f"run_event_compare_{args.method}"
+        params.to_csv(stem.with_name(stem.name + "_params.csv"), index=False)
+        games.to_csv(stem.with_name(stem.name + "_games.csv"), index=False)
+        stem.with_suffix(".json").write_text(json.dumps(summary, indent=2))
+        print(f"vs NUTS {summary['reference_fit_id']}: max |Δ win prob| "
+              f"{summary['max_abs_winprob_delta']:.4f}, median SD ratio "
+              f"{summary['median_sd_ratio']:.2f} -> "
+              f"{'safe' if summary['safe_for_intraday'] else 'NOT safe'} for intraday use")
+        print(f"Comparison report -> {stem.with_suffix('.json')}")
+    else:
+        print(f"No NUTS reference at {reference_dir}; skipping comparison report")
+    return 0
 
 if __name__ == "__main__":
     raise SystemExit(main())
\ No newline at end of file
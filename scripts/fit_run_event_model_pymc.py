@@ -7,7 +7,8 @@ single pitcher_ability scalar, single home_advantage, park factors,
 and bullpen quality adjustments.
 
 Writes run_event_posterior.csv and run_event_fit_meta.json in the format
-simulate_run_event_game.py expects.
+simulate_run_event_game.py expects, plus the binary run_event_posterior.bundle/
+that simulate.py memory-maps.
 
 Usage:
   pip install pymc
@@ -24,6 +25,9 @@ from pathlib import Path
 import numpy as np
 import pandas as pd
 
+import _bootstrap  # noqa: F401
+from ncaa_baseball.posterior import bundle_path, draws_to_arrays, write_bundle
+
 try:
     import pymc as pm
     import pytensor.tensor as pt
@@ -292,6 +296,10 @@ def main() -> int:
     with open(meta_json, "w") as f:
         json.dump(meta, f)
     print(f"Meta -> {meta_json}")
+
+    bundle = write_bundle(bundle_path(posterior_csv), draws_to_arrays(draws_df, N_teams, N_pitchers),
+                          meta, source_csv=posterior_csv)
+    print(f"Posterior bundle -> {bundle}")
     return 0
 
 
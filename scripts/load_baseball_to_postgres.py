@@ -7,18 +7,34 @@ Usage:
   python3 scripts/load_baseball_to_postgres.py --table teams
   python3 scripts/load_baseball_to_postgres.py --table predictions --date 2026-03-26
   python3 scripts/load_baseball_to_postgres.py --table model_meta --fit-id 2026-03-21
+  python3 scripts/load_baseball_to_postgres.py --table projections --date 2026-03-26
+  python3 scripts/load_baseball_to_postgres.py --all --full    # ignore upload hashes
+
+Every table, public.projections included, is written the same way: COPY into
+a temp table, then one INSERT ... ON CONFLICT merge, all on one connection in
+one transaction per run. Uploads are diff-only: rows whose content hash is
+unchanged since the last committed upload to the same database are not sent
+(hashes in data/processed/upload_hashes.json, see ncaa_baseball.upload_hashes).
 """
 from __future__ import annotations
 
 import argparse
 import json
 import os
+import re
 import sys
 from io import StringIO
 from pathlib import Path
 
 import pandas as pd
-import psycopg
+
+import _bootstrap  # noqa: F401
+from ncaa_baseball.upload_hashes import DEFAULT_UPLOAD_HASHES, UploadHashes, target_id
+
+try:
+    import psycopg
+except ImportError:
+    psycopg = None
 
 DEFAULT_DSN = (
     "postgresql://postgres:{}@db.{}.supabase.co:5432/postgres?sslmode=require"
@@ -26,9 +42,10 @@ DEFAULT_DSN = (
 PROJECT_REF = "otfybzwvockuwdldfoed"
 
 
-def get_dsn(args) -> str:
-    if args.dsn:
-        return args.dsn
+def resolve_dsn(explicit: str | None = None) -> str:
+    """DSN from --dsn, DATABASE_URL, or SUPABASE_DB_PASSWORD (env or .env); "" if none."""
+    if explicit:
+        return explicit
     env_dsn = os.environ.get("DATABASE_URL")
     if env_dsn:
         return env_dsn
@@ -42,12 +59,32 @@ def get_dsn(args) -> str:
                     pw = line.split("=", 1)[1].strip().strip("'\"")
     if pw:
         return DEFAULT_DSN.format(pw, PROJECT_REF)
+    return ""
+
+
+def get_dsn(args) -> str:
+    dsn = resolve_dsn(args.dsn)
+    if dsn:
+        return dsn
     print("No database connection. Set DATABASE_URL, SUPABASE_DB_PASSWORD, or --dsn.", file=sys.stderr)
     sys.exit(1)
 
 
-def upsert_from_df(cur, df: pd.DataFrame, table: str, conflict_cols: list[str], schema: str = "baseball"):
-    """Bulk upsert a DataFrame via COPY to temp table then INSERT ON CONFLICT."""
+def connect(dsn: str):
+    """The run's single connection (every loader shares its one transaction)."""
+    if psycopg is None:
+        raise RuntimeError("psycopg is not installed (pip install 'psycopg[binary]')")
+    return psycopg.connect(dsn, connect_timeout=30)
+
+
+def upsert_from_df(cur, df: pd.DataFrame, table: str, conflict_cols: list[str], schema: str = "baseball",
+                   hashes: UploadHashes | None = None, now_cols: tuple[str, ...] = ()):
+    """Bulk upsert a DataFrame via COPY to temp table then INSERT ON CONFLICT.
+
+    With ``hashes``, only rows whose content changed since the last committed
+    upload are sent (none: no statements at all). ``now_cols`` are set to
+    ``now()`` on insert and update.
+    """
     if df.empty:
         print(f"  {schema}.{table}: 0 rows (empty)", file=sys.stderr)
         return 0
@@ -55,6 +92,13 @@ def upsert_from_df(cur, df: pd.DataFrame, table: str, conflict_cols: list[str],
     # Always dedupe on conflict columns to avoid "cannot affect row a second time"
     df = df.drop_duplicates(subset=conflict_cols, keep="last")
 
+    if hashes is not None:
+        n_total = len(df)
+        df = hashes.changed(f"{schema}.{table}", df, conflict_cols)
+        if df.empty:
+            print(f"  {schema}.{table}: 0 of {n_total} rows changed (skipped)", file=sys.stderr)
+            return 0
+
     cols = list(df.columns)
     tmp = f"_tmp_{table}"
 
@@ -73,7 +117,7 @@ def upsert_from_df(cur, df: pd.DataFrame, table: str, conflict_cols: list[str],
 
     # Build upsert
     conflict = ", ".join(conflict_cols)
-    insert_cols = ", ".join(cols)
+    insert_cols = ", ".join(cols + list(now_cols))
     select_cols = ", ".join(f'"{c}"' for c in cols)
 
     # For numeric columns, cast from text
@@ -87,16 +131,19 @@ def upsert_from_df(cur, df: pd.DataFrame, table: str, conflict_cols: list[str],
             cast_cols.append(f'CASE WHEN "{c}" = \'\\N\' OR "{c}" = \'\' THEN NULL ELSE "{c}"::double precision END AS "{c}"')
         elif target_type == "boolean":
             cast_cols.append(f'CASE WHEN "{c}" IN (\'True\', \'true\', \'1\') THEN true WHEN "{c}" IN (\'False\', \'false\', \'0\') THEN false ELSE NULL END AS "{c}"')
-        elif target_type == "date":
-            cast_cols.append(f'CASE WHEN "{c}" = \'\\N\' OR "{c}" = \'\' THEN NULL ELSE "{c}"::date END AS "{c}"')
+        elif target_type in ("date", "numeric", "real", "jsonb", "json",
+                             "timestamp with time zone", "timestamp without time zone"):
+            cast_cols.append(f'CASE WHEN "{c}" = \'\\N\' OR "{c}" = \'\' THEN NULL ELSE "{c}"::{target_type} END AS "{c}"')
         else:
             cast_cols.append(f'CASE WHEN "{c}" = \'\\N\' THEN NULL ELSE "{c}" END AS "{c}"')
+    cast_cols.extend(f'now() AS "{c}"' for c in now_cols)
     cast_select = ", ".join(cast_cols)
 
     # Exclude conflict columns from update
     update_cols = [c for c in cols if c not in conflict_cols]
     if update_cols:
-        update_set = ", ".join(f'"{c}" = EXCLUDED."{c}"' for c in update_cols)
+        update_set = ", ".join([f'"{c}" = EXCLUDED."{c}"' for c in update_cols]
+                               + [f'"{c}" = now()' for c in now_cols])
         upsert_sql = f"""
             INSERT INTO {schema}.{table} ({insert_cols})
             SELECT {cast_select} FROM {tmp}
@@ -127,26 +174,26 @@ def _get_column_types(cur, schema: str, table: str) -> dict[str, str]:
 
 # ── Per-table loaders ──────────────────────────────────────────────────────
 
-def load_teams(cur, season: int = 2026):
+def load_teams(cur, season: int = 2026, hashes: UploadHashes | None = None):
     csv = Path("data/registries/canonical_teams_2026.csv")
     df = pd.read_csv(csv, dtype=str)
     df["season"] = str(season)
     keep = ["canonical_id", "season", "team_name", "conference", "ncaa_teams_id",
             "odds_api_name", "espn_name", "baseballr_team_id", "baseballr_team_name", "notes"]
     keep = [c for c in keep if c in df.columns]
-    return upsert_from_df(cur, df[keep], "teams", ["canonical_id", "season"])
+    return upsert_from_df(cur, df[keep], "teams", ["canonical_id", "season"], hashes=hashes)
 
 
-def load_stadiums(cur):
+def load_stadiums(cur, hashes: UploadHashes | None = None):
     csv = Path("data/registries/stadium_orientations.csv")
     df = pd.read_csv(csv, dtype=str)
     keep = ["canonical_id", "venue_name", "lat", "lon", "hp_bearing_deg",
             "elevation_ft", "timezone", "source"]
     keep = [c for c in keep if c in df.columns]
-    return upsert_from_df(cur, df[keep], "stadiums", ["canonical_id"])
+    return upsert_from_df(cur, df[keep], "stadiums", ["canonical_id"], hashes=hashes)
 
 
-def load_games(cur):
+def load_games(cur, hashes: UploadHashes | None = None):
     csv = Path("data/processed/games.csv")
     df = pd.read_csv(csv, dtype=str)
     # Drop rows missing required fields, dedupe on PK
@@ -159,10 +206,10 @@ def load_games(cur):
             "home_pitcher_name", "away_pitcher_name",
             "has_run_events", "has_boxscore"]
     keep = [c for c in keep if c in df.columns]
-    return upsert_from_df(cur, df[keep], "games", ["event_id"])
+    return upsert_from_df(cur, df[keep], "games", ["event_id"], hashes=hashes)
 
 
-def load_pitcher_appearances(cur):
+def load_pitcher_appearances(cur, hashes: UploadHashes | None = None):
     csv = Path("data/processed/pitcher_appearances.csv")
     df = pd.read_csv(csv, dtype=str)
     # Drop rows missing required fields
@@ -173,10 +220,10 @@ def load_pitcher_appearances(cur):
             "pitcher_name", "team_canonical_id", "team_name", "side", "starter",
             "role", "ip", "h", "r", "er", "bb", "k", "hr", "pc"]
     keep = [c for c in keep if c in df.columns]
-    return upsert_from_df(cur, df[keep], "pitcher_appearances", ["event_id", "pitcher_id"])
+    return upsert_from_df(cur, df[keep], "pitcher_appearances", ["event_id", "pitcher_id"], hashes=hashes)
 
 
-def load_players(cur):
+def load_players(cur, hashes: UploadHashes | None = None):
     csv = Path("data/processed/player_registry.csv")
     df = pd.read_csv(csv, dtype=str)
     df = df.dropna(subset=["canonical_id", "player_name"])
@@ -185,10 +232,10 @@ def load_players(cur):
             "is_pitcher", "is_batter", "pitcher_idx", "fip", "era",
             "wrc_plus", "season", "sources"]
     keep = [c for c in keep if c in df.columns]
-    return upsert_from_df(cur, df[keep], "players", ["canonical_id", "player_name", "season"])
+    return upsert_from_df(cur, df[keep], "players", ["canonical_id", "player_name", "season"], hashes=hashes)
 
 
-def load_run_events(cur):
+def load_run_events(cur, hashes: UploadHashes | None = None):
     csv = Path("data/processed/run_events.csv")
     df = pd.read_csv(csv, dtype=str)
     df = df.dropna(subset=["event_id"])
@@ -199,10 +246,10 @@ def load_run_events(cur):
             "away_run_1", "away_run_2", "away_run_3", "away_run_4",
             "home_score", "away_score"]
     keep = [c for c in keep if c in df.columns]
-    return upsert_from_df(cur, df[keep], "run_events", ["event_id"])
+    return upsert_from_df(cur, df[keep], "run_events", ["event_id"], hashes=hashes)
 
 
-def load_model_meta(cur, fit_id: str):
+def load_model_meta(cur, fit_id: str, hashes: UploadHashes | None = None):
     meta_json = Path("data/processed/run_event_fit_meta.json")
     meta = json.loads(meta_json.read_text())
     df = pd.DataFrame([{
@@ -214,10 +261,10 @@ def load_model_meta(cur, fit_id: str):
         "n_draws": str(meta["n_draws"]),
         "scoring_calibration": "0.12",
     }])
-    return upsert_from_df(cur, df, "model_posterior_meta", ["fit_id"])
+    return upsert_from_df(cur, df, "model_posterior_meta", ["fit_id"], hashes=hashes)
 
 
-def load_team_params(cur, fit_id: str):
+def load_team_params(cur, fit_id: str, hashes: UploadHashes | None = None):
     csv = Path("data/processed/team_table.csv")
     df = pd.read_csv(csv, dtype=str)
     df["fit_id"] = fit_id
@@ -225,10 +272,10 @@ def load_team_params(cur, fit_id: str):
             "bullpen_quality_z", "bullpen_adj", "wrc_plus", "wrc_offense_adj",
             "conf_strength_adj", "batting_fb_pct", "batting_fb_factor", "n_games"]
     keep = [c for c in keep if c in df.columns]
-    return upsert_from_df(cur, df[keep], "team_model_params", ["canonical_id", "fit_id"])
+    return upsert_from_df(cur, df[keep], "team_model_params", ["canonical_id", "fit_id"], hashes=hashes)
 
 
-def load_pitcher_params(cur, fit_id: str):
+def load_pitcher_params(cur, fit_id: str, hashes: UploadHashes | None = None):
     csv = Path("data/processed/pitcher_table.csv")
     df = pd.read_csv(csv, dtype=str)
     df["fit_id"] = fit_id
@@ -240,28 +287,14 @@ def load_pitcher_params(cur, fit_id: str):
             "fb_pct", "fb_sensitivity", "d1b_ability_adj", "d1b_ability_source",
             "n_appearances", "last_appearance"]
     keep = [c for c in keep if c in df.columns]
-    return upsert_from_df(cur, df[keep], "pitcher_model_params", ["pitcher_espn_id", "fit_id"])
+    return upsert_from_df(cur, df[keep], "pitcher_model_params", ["pitcher_espn_id", "fit_id"], hashes=hashes)
 
 
-def upload_projections_to_syndicate(date_str: str, predictions_csv: Path | None = None) -> int:
-    """
-    Upload predictions directly to the syndicate-terminal Supabase projections table.
-    Replaces the ncaa_baseball_adapter.py middleman.
+PROJECTION_KEY = ["sport", "game_id", "model_version"]
 
-    Uses the same SUPABASE_DB_PASSWORD / DATABASE_URL credentials as the rest of this script.
-    Upserts on (sport, game_id, model_version='current') so re-runs update in place.
-    """
-    import re
-
-    if predictions_csv is None:
-        predictions_csv = Path(f"data/processed/predictions_{date_str}_standard.csv")
-        if not predictions_csv.exists():
-            # fallback to non-phase filename
-            predictions_csv = Path(f"data/processed/predictions_{date_str}.csv")
-    if not predictions_csv.exists():
-        print(f"  Projections upload skipped — not found: {predictions_csv}", file=sys.stderr)
-        return 0
 
+def projection_rows(date_str: str, predictions_csv: Path) -> pd.DataFrame:
+    """One ``public.projections`` row per game of a predictions CSV."""
     def _slugify(s: str) -> str:
         return re.sub(r"[^a-z0-9]+", "_", str(s).lower().strip()).strip("_")
 
@@ -286,7 +319,7 @@ def upload_projections_to_syndicate(date_str: str, predictions_csv: Path | None
     date_slug = date_str.replace("-", "")
     rows = []
 
-    for _, r in df.iterrows():
+    for r in df.to_dict("records"):
         home_display = _s(r.get("home")) or _s(r.get("home_cid", ""))
         away_display = _s(r.get("away")) or _s(r.get("away_cid", ""))
         game_id = f"bsb_{date_slug}_{_slugify(away_display)}_{_slugify(home_display)}"
@@ -347,62 +380,56 @@ def upload_projections_to_syndicate(date_str: str, predictions_csv: Path | None
             "data":           json.dumps(data_blob),
         })
 
-    if not rows:
+    return pd.DataFrame(rows)
+
+
+def upload_projections_to_syndicate(date_str: str, predictions_csv: Path | None = None,
+                                    cur=None, hashes: UploadHashes | None = None) -> int:
+    """
+    Upload predictions directly to the syndicate-terminal Supabase projections table.
+    Replaces the ncaa_baseball_adapter.py middleman.
+
+    Uses the same SUPABASE_DB_PASSWORD / DATABASE_URL credentials as the rest of this script.
+    Upserts on (sport, game_id, model_version) so re-runs update in place, through the
+    same COPY + merge as every other table. Pass ``cur`` to join a caller's transaction;
+    otherwise this opens, commits and closes its own connection, diff-only against the
+    default upload hashes (an unchanged refresh sends nothing).
+    """
+    if predictions_csv is None:
+        predictions_csv = Path(f"data/processed/predictions_{date_str}_standard.csv")
+        if not predictions_csv.exists():
+            # fallback to non-phase filename
+            predictions_csv = Path(f"data/processed/predictions_{date_str}.csv")
+    if not predictions_csv.exists():
+        print(f"  Projections upload skipped — not found: {predictions_csv}", file=sys.stderr)
+        return 0
+
+    df = projection_rows(date_str, predictions_csv)
+    if df.empty:
         print("  Projections upload: 0 rows (empty dataframe)", file=sys.stderr)
         return 0
 
-    # Build DSN without argparse namespace
-    dsn = os.environ.get("DATABASE_URL", "")
-    if not dsn:
-        pw = os.environ.get("SUPABASE_DB_PASSWORD", "")
-        if not pw:
-            env_file = Path(__file__).parent.parent / ".env"
-            if env_file.exists():
-                for line in env_file.read_text().splitlines():
-                    if line.startswith("SUPABASE_DB_PASSWORD="):
-                        pw = line.split("=", 1)[1].strip().strip("'\"")
-        if pw:
-            dsn = DEFAULT_DSN.format(pw, PROJECT_REF)
+    if cur is not None:
+        return upsert_from_df(cur, df, "projections", PROJECTION_KEY, schema="public",
+                              hashes=hashes, now_cols=("updated_at",))
+
+    dsn = resolve_dsn()
     if not dsn:
         print("  Projections upload skipped — no DB credentials", file=sys.stderr)
         return 0
+    if hashes is None:
+        hashes = UploadHashes(DEFAULT_UPLOAD_HASHES, target_id(dsn))
 
-    with psycopg.connect(dsn, connect_timeout=30) as conn:
+    with connect(dsn) as conn:
         with conn.cursor() as cur:
-            sql = """
-                INSERT INTO public.projections
-                  (sport, game_id, game_date, game_time, home_team, away_team,
-                   home_win_prob, away_win_prob, home_ml, away_ml,
-                   expected_total, model_spread, over_prob, under_prob,
-                   fragility, model_version, data, updated_at)
-                VALUES
-                  (%(sport)s, %(game_id)s, %(game_date)s, %(game_time)s,
-                   %(home_team)s, %(away_team)s,
-                   %(home_win_prob)s, %(away_win_prob)s, %(home_ml)s, %(away_ml)s,
-                   %(expected_total)s, %(model_spread)s, %(over_prob)s, %(under_prob)s,
-                   %(fragility)s, %(model_version)s, %(data)s::jsonb, now())
-                ON CONFLICT (sport, game_id, model_version) DO UPDATE SET
-                  home_win_prob  = EXCLUDED.home_win_prob,
-                  away_win_prob  = EXCLUDED.away_win_prob,
-                  home_ml        = EXCLUDED.home_ml,
-                  away_ml        = EXCLUDED.away_ml,
-                  expected_total = EXCLUDED.expected_total,
-                  model_spread   = EXCLUDED.model_spread,
-                  over_prob      = EXCLUDED.over_prob,
-                  under_prob     = EXCLUDED.under_prob,
-                  fragility      = EXCLUDED.fragility,
-                  data           = EXCLUDED.data,
-                  updated_at     = now()
-            """
-            cur.executemany(sql, rows)
+            n = upsert_from_df(cur, df, "projections", PROJECTION_KEY, schema="public",
+                               hashes=hashes, now_cols=("updated_at",))
         conn.commit()
-
-    n = len(rows)
-    print(f"  public.projections: {n} rows upserted", file=sys.stderr)
+    hashes.save()
     return n
 
 
-def load_predictions(cur, date_str: str):
+def load_predictions(cur, date_str: str, hashes: UploadHashes | None = None):
     csv = Path(f"data/processed/predictions_{date_str}.csv")
     if not csv.exists():
         print(f"  Predictions not found: {csv}", file=sys.stderr)
@@ -428,7 +455,60 @@ def load_predictions(cur, date_str: str):
             "mkt_anchor_weight", "mkt_home_win_prob", "mkt_total_line"]
     keep = [c for c in keep if c in df.columns]
     return upsert_from_df(cur, df[keep], "predictions",
-                          ["prediction_date", "home_canonical_id", "away_canonical_id"])
+                          ["prediction_date", "home_canonical_id", "away_canonical_id"], hashes=hashes)
+
+
+def load_tables(cur, args, hashes: UploadHashes | None = None) -> int:
+    """Run the loaders selected by ``args`` on one cursor (one transaction)."""
+    if args.all:
+        print("Loading all tables...", file=sys.stderr)
+        load_teams(cur, args.season, hashes=hashes)
+        load_stadiums(cur, hashes=hashes)
+        load_games(cur, hashes=hashes)
+        load_pitcher_appearances(cur, hashes=hashes)
+        load_players(cur, hashes=hashes)
+        load_run_events(cur, hashes=hashes)
+        load_model_meta(cur, args.fit_id, hashes=hashes)
+        load_team_params(cur, args.fit_id, hashes=hashes)
+        load_pitcher_params(cur, args.fit_id, hashes=hashes)
+        # Load all available prediction files
+        for f in sorted(Path("data/processed").glob("predictions_2026-*.csv")):
+            date_str = f.stem.replace("predictions_", "").split("_")[0]
+            if len(date_str) == 10:  # YYYY-MM-DD
+                load_predictions(cur, date_str, hashes=hashes)
+        return 0
+
+    t = args.table.lower()
+    if t == "teams":
+        load_teams(cur, args.season, hashes=hashes)
+    elif t == "stadiums":
+        load_stadiums(cur, hashes=hashes)
+    elif t == "games":
+        load_games(cur, hashes=hashes)
+    elif t in ("appearances", "pitcher_appearances"):
+        load_pitcher_appearances(cur, hashes=hashes)
+    elif t == "players":
+        load_players(cur, hashes=hashes)
+    elif t in ("run_events", "runevents"):
+        load_run_events(cur, hashes=hashes)
+    elif t in ("model_meta", "meta"):
+        load_model_meta(cur, args.fit_id, hashes=hashes)
+    elif t in ("team_params", "team_model_params"):
+        load_team_params(cur, args.fit_id, hashes=hashes)
+    elif t in ("pitcher_params", "pitcher_model_params"):
+        load_pitcher_params(cur, args.fit_id, hashes=hashes)
+    elif t in ("predictions", "projections"):
+        if not args.date:
+            print(f"--date required for {t}", file=sys.stderr)
+            return 1
+        if t == "predictions":
+            load_predictions(cur, args.date, hashes=hashes)
+        else:
+            upload_projections_to_syndicate(args.date, cur=cur, hashes=hashes)
+    else:
+        print(f"Unknown table: {t}", file=sys.stderr)
+        return 1
+    return 0
 
 
 def main() -> int:
@@ -436,67 +516,32 @@ def main() -> int:
     parser.add_argument("--dsn", help="Postgres connection string")
     parser.add_argument("--all", action="store_true", help="Load all tables")
     parser.add_argument("--table", help="Load specific table")
-    parser.add_argument("--date", help="Date for predictions (YYYY-MM-DD)")
+    parser.add_argument("--date", help="Date for predictions / projections (YYYY-MM-DD)")
     parser.add_argument("--fit-id", default="2026-03-21", help="Model fit ID")
     parser.add_argument("--season", type=int, default=2026)
+    parser.add_argument("--full", action="store_true",
+                        help="Send every row, ignoring the hashes of the last upload")
+    parser.add_argument("--upload-hashes", type=Path, default=DEFAULT_UPLOAD_HASHES,
+                        help="Per-row content hashes of previous uploads (diff-only upserts)")
     args = parser.parse_args()
 
+    if not args.all and not args.table:
+        print("Specify --all or --table NAME", file=sys.stderr)
+        return 1
+
     dsn = get_dsn(args)
+    hashes = UploadHashes(args.upload_hashes, target_id(dsn), full=args.full)
     print(f"Connecting to database...", file=sys.stderr)
 
-    with psycopg.connect(dsn, connect_timeout=30) as conn:
+    with connect(dsn) as conn:
         with conn.cursor() as cur:
-            if args.all:
-                print("Loading all tables...", file=sys.stderr)
-                load_teams(cur, args.season)
-                load_stadiums(cur)
-                load_games(cur)
-                load_pitcher_appearances(cur)
-                load_players(cur)
-                load_run_events(cur)
-                load_model_meta(cur, args.fit_id)
-                load_team_params(cur, args.fit_id)
-                load_pitcher_params(cur, args.fit_id)
-                # Load all available prediction files
-                for f in sorted(Path("data/processed").glob("predictions_2026-*.csv")):
-                    date_str = f.stem.replace("predictions_", "").split("_")[0]
-                    if len(date_str) == 10:  # YYYY-MM-DD
-                        load_predictions(cur, date_str)
-            elif args.table:
-                t = args.table.lower()
-                if t == "teams":
-                    load_teams(cur, args.season)
-                elif t == "stadiums":
-                    load_stadiums(cur)
-                elif t == "games":
-                    load_games(cur)
-                elif t in ("appearances", "pitcher_appearances"):
-                    load_pitcher_appearances(cur)
-                elif t == "players":
-                    load_players(cur)
-                elif t in ("run_events", "runevents"):
-                    load_run_events(cur)
-                elif t in ("model_meta", "meta"):
-                    load_model_meta(cur, args.fit_id)
-                elif t in ("team_params", "team_model_params"):
-                    load_team_params(cur, args.fit_id)
-                elif t in ("pitcher_params", "pitcher_model_params"):
-                    load_pitcher_params(cur, args.fit_id)
-                elif t == "predictions":
-                    if not args.date:
-                        print("--date required for predictions", file=sys.stderr)
-                        return 1
-                    load_predictions(cur, args.date)
-                else:
-                    print(f"Unknown table: {t}", file=sys.stderr)
-                    return 1
-            else:
-                print("Specify --all or --table NAME", file=sys.stderr)
-                return 1
-
-            conn.commit()
-            print("Done.", file=sys.stderr)
-
+            rc = load_tables(cur, args, hashes)
+        if rc:
+            conn.rollback()
+            return rc
+        conn.commit()
+    hashes.save()
+    print("Done.", file=sys.stderr)
     return 0
 
 
@@ -29,6 +29,10 @@ from urllib.request import Request, urlopen
 
 import pandas as pd
 
+import _bootstrap  # noqa: F401
+from ncaa_baseball.datastore import read_table
+from ncaa_baseball.pipeline_context import PipelineContext
+
 
 def _build_registry_from_appearances(pa: pd.DataFrame) -> pd.DataFrame:
     """Build a minimal pitcher registry when pitcher_registry.csv is unavailable.
@@ -78,10 +82,15 @@ class StarterLookup:
         weekend_rotations_csv: Path | str = "data/processed/weekend_rotations.csv",
         d1baseball_rotations_csv: Path | str = "data/processed/d1baseball_rotations.csv",
         canonical_csv: Path | str = "data/registries/canonical_teams_2026.csv",
+        ctx: PipelineContext | None = None,
     ):
-        self.canonical_csv = Path(canonical_csv)
+        # ctx: the run's PipelineContext; appearances and canonical teams
+        # then come from it instead of the paths.
+        self.ctx = ctx
+        self.canonical_csv = ctx.paths["canonical"] if ctx is not None else Path(canonical_csv)
+        self._canon: pd.DataFrame | None = None
 
-        self.pa = pd.read_csv(appearances_csv, dtype=str)
+        self.pa = ctx.table("pitcher_appearances") if ctx is not None else read_table(appearances_csv)
         self.pa["game_date"] = pd.to_datetime(self.pa["game_date"])
         registry_path = Path(registry_csv)
         if registry_path.exists():
@@ -136,7 +145,7 @@ class StarterLookup:
         # Build ESPN team name → canonical_id mapping
         _espn_to_cid: dict[str, str] = {}
         try:
-            _canon = pd.read_csv(self.canonical_csv, dtype=str)
+            _canon = self._canonical_raw()
             for _, cr in _canon.iterrows():
                 cid = str(cr.get("canonical_id", "")).strip()
                 for col in ("team_name", "odds_api_name", "baseballr_team_name", "espn_name"):
@@ -324,6 +333,14 @@ class StarterLookup:
         pidx = self._resolve_idx(pid)
         return (name, pid, pidx)
 
+    def _canonical_raw(self) -> pd.DataFrame:
+        """Canonical team registry (all-text): from ctx, else read once per lookup."""
+        if self.ctx is not None:
+            return self.ctx.canonical_raw()
+        if self._canon is None:
+            self._canon = pd.read_csv(self.canonical_csv, dtype=str)
+        return self._canon
+
     def _build_ncaa_espn_crosswalk(self) -> None:
         """Build mapping from NCAA-format pitcher IDs to ESPN pitcher indices.
 
@@ -341,7 +358,7 @@ class StarterLookup:
             canonical_path = self.canonical_csv
             if not canonical_path.exists():
                 return
-            canon = pd.read_csv(canonical_path, dtype=str)
+            canon = self._canonical_raw()
         except Exception:
             return
 
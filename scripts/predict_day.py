@@ -21,11 +21,20 @@ from pathlib import Path
 import pandas as pd
 
 import _bootstrap  # noqa: F401
+from ncaa_baseball.exact import EXACT_DRAWS
+from ncaa_baseball.pipeline_context import PipelineContext
+from ncaa_baseball.sim_cache import SIM_CACHE_FILE
 from resolve_schedule import resolve_schedule
 from resolve_starters import resolve_starters
 from resolve_weather import resolve_weather
 from bullpen_fatigue import compute_bullpen_fatigue
-from simulate import simulate_games, format_predictions
+from simulate import (
+    ENGINE_CHOICES,
+    add_precision_args,
+    format_predictions,
+    precision_targets,
+    simulate_games,
+)
 from build_calibration_report import build_calibration_report
 from build_starter_qa_report import build_starter_qa_report
 from scrape_wrrundown import build_url, scrape_page, parse_wrrundown, write_csv as write_wrrundown_csv
@@ -96,6 +105,18 @@ def main() -> int:
                         help="Target home_advantage mean (post-hoc correction). "
                              "0 = use learned posterior (recommended, NCAA HA is ~0.115). "
                              "Set >0 to override.")
+    parser.add_argument("--engine", type=str, default="slate", choices=ENGINE_CHOICES,
+                        help="Simulation engine passed to simulate_games (see simulate.py).")
+    parser.add_argument("--exact-draws", type=int, default=EXACT_DRAWS,
+                        help="Posterior draws averaged per game by --engine exact.")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Simulation worker processes (results are identical for any N).")
+    parser.add_argument("--no-sim-cache", action="store_true",
+                        help="Re-simulate every game instead of reusing unchanged games "
+                             "from data/daily/<date>/sim_cache.json.")
+    add_precision_args(parser)
+    parser.add_argument("--variance-reduction", action="store_true",
+                        help="Stratified/antithetic CDF-inversion sampling (see simulate.py).")
     args = parser.parse_args()
     user_set_n = "--N" in sys.argv
     if not user_set_n:
@@ -107,6 +128,15 @@ def main() -> int:
     daily_dir = Path(f"data/daily/{args.date}")
     daily_dir.mkdir(parents=True, exist_ok=True)
 
+    # Tables shared by every stage, loaded on first use and parsed once per run
+    ctx = PipelineContext(
+        pitcher_table_csv=args.pitcher_table,
+        team_table_csv=args.team_table,
+        appearances_csv=args.appearances,
+        canonical_csv=args.canonical,
+        stadium_csv=args.stadium_csv,
+    )
+
     # ── Step 0: Pull fresh odds (so market anchor fires) ──
     import os, subprocess
     odds_key = os.environ.get("ODDS_API_KEY") or os.environ.get("THE_ODDS_API_KEY", "")
@@ -144,6 +174,7 @@ def main() -> int:
         drop_started=not args.include_started,
         start_buffer_min=args.start_buffer_min,
         out_csv=schedule_csv,
+        ctx=ctx,
     )
     n_games = len(schedule)
     print(f"  {n_games} games found", file=sys.stderr)
@@ -165,6 +196,7 @@ def main() -> int:
         overrides_csv=overrides_csv if overrides_csv.exists() else None,
         date=args.date,
         out_csv=starters_csv,
+        ctx=ctx,
     )
 
     # ── Step 2b: Starter QA report ──
@@ -217,6 +249,7 @@ def main() -> int:
             park_factors_csv=args.park_factors,
             date=args.date,
             out_csv=weather_csv,
+            ctx=ctx,
         )
 
     # ── Step 3b: Bullpen fatigue ──
@@ -228,6 +261,7 @@ def main() -> int:
             game_date=args.date,
             window_days=3,
             required_team_ids=set(schedule["home_cid"].astype(str)) | set(schedule["away_cid"].astype(str)),
+            ctx=ctx,
         )
         fatigue.to_csv(fatigue_csv, index=False)
         n_fatigued = int((fatigue["fatigue_flag"] == 1).sum()) if not fatigue.empty else 0
@@ -246,6 +280,7 @@ def main() -> int:
             date=args.date,
             schedule_csv=schedule_csv,
             out_csv=context_csv,
+            ctx=ctx,
         )
     except Exception as e:
         print(f"  Context computation failed (non-fatal): {e}", file=sys.stderr)
@@ -266,6 +301,13 @@ def main() -> int:
         ha_target=ha_target,
         fatigue_csv=fatigue_csv,
         context_csv=context_csv,
+        engine=args.engine,
+        exact_draws=args.exact_draws,
+        workers=args.workers,
+        cache_path=None if args.no_sim_cache else daily_dir / SIM_CACHE_FILE,
+        targets=precision_targets(args),
+        variance_reduction=args.variance_reduction,
+        ctx=ctx,
     )
 
     # ── Output ──
@@ -12,10 +12,10 @@ from pathlib import Path
 
 import _bootstrap  # noqa: F401
 from ncaa_baseball.phase1 import (
+    TeamResolver,
     build_odds_name_to_canonical,
     load_canonical_teams,
     load_ratings,
-    resolve_odds_teams,
     win_prob_from_elo,
 )
 from ncaa_baseball.pitcher_model import (
@@ -53,8 +53,8 @@ def main() -> int:
 
     canonical = load_canonical_teams(args.canonical)
     name_to_canonical = build_odds_name_to_canonical(canonical)
-    home_t, away_t = resolve_odds_teams(
-        args.team_a.strip(), args.team_b.strip(), canonical, name_to_canonical,
+    home_t, away_t = TeamResolver(canonical, name_to_canonical).resolve_pair(
+        args.team_a.strip(), args.team_b.strip(),
     )
     if home_t is None or away_t is None:
         print(f"Could not resolve teams: {args.team_a!r} / {args.team_b!r}")
@@ -70,65 +70,134 @@ def run_scraper(book_key: str) -> list[dict]:
         return []
 
 
+# ── Book scrapers → game-level rows ──────────────────────────────────────────
+
+_MARKET_KEYS = {"moneyline": "h2h", "spread": "spreads", "total": "totals"}
+
+
+def _scrape_book(book: str) -> list[dict]:
+    """Run one book's scraper for NCAA baseball (network via the shared fetcher)."""
+    if book == "mgm":
+        from betmgm_scraper import scrape_sport
+    elif book == "dk":
+        from draftkings_scraper import scrape_sport
+    elif book == "br":
+        from betrivers_scraper import scrape_sport
+    elif book == "fd":
+        from fanduel_scraper import scrape_sport
+    else:
+        return []
+    return scrape_sport("baseball")
+
+
+def _game_rows(rows: list[dict]) -> list[dict]:
+    """Collapse per-selection scraper rows into one row per (game, market).
+
+    DK/MGM/BetRivers emit one row per selection (``market_type``/``side``);
+    FanDuel already emits game-level rows (``market``/``home_price``/...) and
+    passes through. For spreads/totals the main line is used (``is_main`` where
+    the book flags it, else the first line quoted on both sides); ``line`` is
+    the home spread / the total.
+    """
+    out: list[dict] = []
+    grouped: dict[tuple, dict] = {}
+    for row in rows:
+        if "market" in row:
+            out.append(row)
+            continue
+        market = _MARKET_KEYS.get(row.get("market_type", ""))
+        if not market or not row.get("home_team") or not row.get("away_team"):
+            continue
+        g = grouped.setdefault((row["home_team"], row["away_team"], market), {
+            "home_team": row["home_team"],
+            "away_team": row["away_team"],
+            "commence_time": row.get("start_time", ""),
+            "market": market,
+            "lines": {},
+        })
+        line = row.get("line")
+        if market == "spreads" and row.get("side") == "away" and line is not None:
+            line = -line  # key both sides of a spread by the home line
+        sides = g["lines"].setdefault(line, {"is_main": False})
+        sides[row.get("side")] = row.get("american_odds")
+        sides["is_main"] = sides["is_main"] or bool(row.get("is_main"))
+
+    for g in grouped.values():
+        first, second = ("over", "under") if g["market"] == "totals" else ("home", "away")
+        complete = [(line, s) for line, s in g.pop("lines").items()
+                    if s.get(first) is not None and s.get(second) is not None]
+        if not complete:
+            continue
+        line, sides = next(((ln, s) for ln, s in complete if s["is_main"]), complete[0])
+        out.append({**g, "line": line, "home_price": sides[first], "away_price": sides[second]})
+    return out
+
+
 def pull_all_direct(books: list[str] | None = None) -> dict:
     """Pull from all direct book APIs and return combined game data.
 
+    Books are scraped concurrently (each within its own host rate limit), so
+    their snapshots are taken close together; each book's ``fetched_at`` is
+    when its scrape finished (its prices were read) and is recorded alongside
+    them. The reported snapshot spread is between those completion times.
+
     Returns dict keyed by (home_team, away_team) with prices from each book.
     """
     if books is None:
         books = list(SCRAPERS.keys())
 
-    # Import the scrapers directly instead of subprocess
-    all_odds = {}
-
-    for book in books:
-        book_name = BOOK_NAMES.get(book, book)
-        print(f"Pulling {book_name}...", file=sys.stderr)
+    from ncaa_baseball.http_fetch import shared_fetcher
 
+    def pull(book: str) -> tuple[datetime, datetime, list[dict] | None]:
+        started = datetime.now(timezone.utc)
         try:
-            if book == "mgm":
-                from betmgm_scraper import scrape_betmgm_baseball
-                rows = scrape_betmgm_baseball()
-            elif book == "dk":
-                from draftkings_scraper import scrape_dk_baseball
-                rows = scrape_dk_baseball()
-            elif book == "br":
-                from betrivers_scraper import scrape_betrivers_baseball
-                rows = scrape_betrivers_baseball()
-            elif book == "fd":
-                from fanduel_scraper import scrape_fanduel_baseball
-                rows = scrape_fanduel_baseball()
-            else:
-                rows = []
-
-            print(f"  {book_name}: {len(rows)} odds rows", file=sys.stderr)
-
-            for row in rows:
-                game_key = (row.get("home_team", ""), row.get("away_team", ""))
-                if game_key not in all_odds:
-                    all_odds[game_key] = {
-                        "home_team": row.get("home_team", ""),
-                        "away_team": row.get("away_team", ""),
-                        "commence_time": row.get("commence_time", ""),
-                        "books": {},
-                    }
+            raw = _scrape_book(book)
+        except Exception as e:
+            print(f"  {BOOK_NAMES.get(book, book)}: import/scrape error — {e}", file=sys.stderr)
+            return started, datetime.now(timezone.utc), None
+        return started, datetime.now(timezone.utc), _game_rows(raw)
 
-                book_data = all_odds[game_key]["books"].setdefault(book_name, {})
-                market = row.get("market", "")
-                if market == "moneyline" or market == "h2h":
-                    book_data["home_ml"] = row.get("home_price")
-                    book_data["away_ml"] = row.get("away_price")
-                elif market == "total" or market == "totals":
-                    book_data["total_line"] = row.get("line")
-                    book_data["over_price"] = row.get("home_price")  # over
-                    book_data["under_price"] = row.get("away_price")  # under
-                elif market == "spread" or market == "spreads":
-                    book_data["spread_line"] = row.get("line")
-                    book_data["spread_home_price"] = row.get("home_price")
-                    book_data["spread_away_price"] = row.get("away_price")
+    print(f"Pulling {', '.join(BOOK_NAMES.get(b, b) for b in books)}...", file=sys.stderr)
+    results = shared_fetcher().map(pull, books)
 
-        except Exception as e:
-            print(f"  {book_name}: import/scrape error — {e}", file=sys.stderr)
+    all_odds = {}
+    finished = []
+    for book, (started, done, rows) in zip(books, results):
+        if rows is None:
+            continue
+        book_name = BOOK_NAMES.get(book, book)
+        finished.append(done)
+        fetched_at = done.strftime("%Y-%m-%dT%H:%M:%SZ")
+        print(f"  {book_name}: {len(rows)} odds rows (fetched {fetched_at}, "
+              f"{(done - started).total_seconds():.1f}s)", file=sys.stderr)
+
+        for row in rows:
+            game_key = (row.get("home_team", ""), row.get("away_team", ""))
+            if game_key not in all_odds:
+                all_odds[game_key] = {
+                    "home_team": row.get("home_team", ""),
+                    "away_team": row.get("away_team", ""),
+                    "commence_time": row.get("commence_time") or row.get("game_start", ""),
+                    "books": {},
+                }
+
+            book_data = all_odds[game_key]["books"].setdefault(book_name, {"fetched_at": fetched_at})
+            market = row.get("market", "")
+            if market == "moneyline" or market == "h2h":
+                book_data["home_ml"] = row.get("home_price")
+                book_data["away_ml"] = row.get("away_price")
+            elif market == "total" or market == "totals":
+                book_data["total_line"] = row.get("line")
+                book_data["over_price"] = row.get("home_price")  # over
+                book_data["under_price"] = row.get("away_price")  # under
+            elif market == "spread" or market == "spreads":
+                book_data["spread_line"] = row.get("line")
+                book_data["spread_home_price"] = row.get("home_price")
+                book_data["spread_away_price"] = row.get("away_price")
+
+    if len(finished) > 1:
+        spread_s = (max(finished) - min(finished)).total_seconds()
+        print(f"  Book snapshots within {spread_s:.1f}s of each other", file=sys.stderr)
 
     return all_odds
 
@@ -177,11 +246,14 @@ def merge_to_odds_log(all_odds: dict, odds_log: Path) -> int:
                     })
 
                 if markets:
-                    record["bookmaker_lines"].append({
+                    entry = {
                         "bookmaker_key": book_name.lower().replace(" ", ""),
                         "bookmaker_title": book_name,
                         "markets": markets,
-                    })
+                    }
+                    if prices.get("fetched_at"):
+                        entry["last_update"] = prices["fetched_at"]
+                    record["bookmaker_lines"].append(entry)
 
             if record["bookmaker_lines"]:
                 f.write(json.dumps(record) + "\n")
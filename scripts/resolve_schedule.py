@@ -21,11 +21,13 @@ from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 import pandas as pd
 
 import _bootstrap  # noqa: F401
+from ncaa_baseball.datastore import read_table
 from ncaa_baseball.phase1 import (
+    TeamResolver,
     build_odds_name_to_canonical,
     load_canonical_teams,
-    resolve_odds_teams,
 )
+from ncaa_baseball.pipeline_context import PipelineContext
 
 
 def _american_to_prob(price: float | int) -> float:
@@ -48,8 +50,7 @@ def _resolve_team(
     name: str,
     team_idx_map: dict[str, int],
     name_to_cid: dict[str, str],
-    canonical: pd.DataFrame,
-    name_to_canonical: dict,
+    resolver: TeamResolver,
 ) -> tuple[str, int]:
     """Resolve an ESPN/NCAA team display name to (canonical_id, team_idx).
 
@@ -67,8 +68,8 @@ def _resolve_team(
     cid = name_to_cid.get(name.lower())
     if cid:
         return cid, team_idx_map.get(cid, 0)
-    # Fuzzy via resolve_odds_teams
-    h_t, _ = resolve_odds_teams(name, "", canonical, name_to_canonical)
+    # Fuzzy via the registry resolver
+    h_t = resolver.resolve(name)
     if h_t:
         cid = h_t[0]
         return cid, team_idx_map.get(cid, 0)
@@ -126,6 +127,7 @@ def resolve_schedule(
     drop_started: bool = False,
     start_buffer_min: int = 15,
     out_csv: Path | None = None,
+    ctx: PipelineContext | None = None,
 ) -> pd.DataFrame:
     """Fetch and resolve the game schedule for *date* (YYYY-MM-DD).
 
@@ -133,10 +135,12 @@ def resolve_schedule(
       game_num, home_name, away_name, home_cid, away_cid,
       home_team_idx, away_team_idx, start_utc, start_local_hour
 
-    Also writes to *out_csv* when provided.
+    Also writes to *out_csv* when provided. With *ctx* the team table,
+    canonical teams, stadiums and team resolver come from the run's
+    PipelineContext instead of the paths.
     """
     # ── Load team index ────────────────────────────────────────────────────
-    team_df = pd.read_csv(team_table_csv, dtype=str)
+    team_df = ctx.table("team_table") if ctx is not None else read_table(team_table_csv)
     team_idx_map: dict[str, int] = {
         str(r["canonical_id"]).strip(): int(r["team_idx"])
         for _, r in team_df.iterrows()
@@ -151,8 +155,11 @@ def resolve_schedule(
         N_teams = meta.get("N_teams", 0)
 
     # ── Load canonical teams ───────────────────────────────────────────────
-    canonical = load_canonical_teams(canonical_csv)
-    name_to_canonical = build_odds_name_to_canonical(canonical)
+    if ctx is not None:
+        canonical, resolver = ctx.canonical_teams(), ctx.team_resolver()
+    else:
+        canonical = load_canonical_teams(canonical_csv)
+        resolver = TeamResolver(canonical, build_odds_name_to_canonical(canonical))
 
     # name_to_cid: short team_name (lowercase) → canonical_id
     name_to_cid: dict[str, str] = {}
@@ -174,9 +181,9 @@ def resolve_schedule(
     # Load from stadium_orientations.csv; fall back to empty dict
     stadium_loc: dict[str, tuple[float, float]] = {}
     stadium_tz: dict[str, ZoneInfo] = {}
-    stadium_csv = Path("data/registries/stadium_orientations.csv")
+    stadium_csv = ctx.paths["stadiums"] if ctx is not None else Path("data/registries/stadium_orientations.csv")
     if stadium_csv.exists():
-        sdf = pd.read_csv(stadium_csv, dtype=str)
+        sdf = ctx.stadiums() if ctx is not None else pd.read_csv(stadium_csv, dtype=str)
         for _, row in sdf.iterrows():
             cid = str(row.get("canonical_id", "")).strip()
             try:
@@ -253,10 +260,10 @@ def resolve_schedule(
                     espn_times[(h_espn, a_espn)] = start_utc
                     # Resolve to canonical_ids for fuzzy merge
                     h_cid_e, _ = _resolve_team(
-                        h_espn, team_idx_map, name_to_cid, canonical, name_to_canonical
+                        h_espn, team_idx_map, name_to_cid, resolver
                     )
                     a_cid_e, _ = _resolve_team(
-                        a_espn, team_idx_map, name_to_cid, canonical, name_to_canonical
+                        a_espn, team_idx_map, name_to_cid, resolver
                     )
                     if h_cid_e and a_cid_e:
                         espn_times_cid[(h_cid_e, a_cid_e)] = start_utc
@@ -352,10 +359,10 @@ def resolve_schedule(
     started_cutoff = now_utc - timedelta(minutes=start_buffer_min)
     for game_num, (h_name, a_name, start_utc) in enumerate(matchups):
         h_cid, h_idx = _resolve_team(
-            h_name, team_idx_map, name_to_cid, canonical, name_to_canonical
+            h_name, team_idx_map, name_to_cid, resolver
         )
         a_cid, a_idx = _resolve_team(
-            a_name, team_idx_map, name_to_cid, canonical, name_to_canonical
+            a_name, team_idx_map, name_to_cid, resolver
         )
 
         # Clamp team indices to posterior size (new teams → league avg)
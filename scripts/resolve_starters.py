@@ -25,6 +25,8 @@ from typing import Optional
 import pandas as pd
 
 import _bootstrap  # noqa: F401 — adds scripts/ to sys.path so local imports work
+from ncaa_baseball.datastore import read_table
+from ncaa_baseball.pipeline_context import PipelineContext
 from lookup_starters import StarterLookup
 from platoon_adjustment import PlatoonLookup
 
@@ -205,6 +207,7 @@ def resolve_starters(
     overrides_csv: Optional[Path] = None,
     date: str = "",
     out_csv: Optional[Path] = None,
+    ctx: Optional[PipelineContext] = None,
 ) -> pd.DataFrame:
     """Resolve starting pitchers for each game in schedule_csv.
 
@@ -227,6 +230,9 @@ def resolve_starters(
         Game date string (YYYY-MM-DD).  Required for starter projection.
     out_csv:
         If provided, write output CSV here.
+    ctx:
+        The run's PipelineContext; when given, pitcher_table, team_table,
+        appearances and canonical teams come from it instead of the paths.
 
     Returns
     -------
@@ -248,7 +254,7 @@ def resolve_starters(
         raise ValueError(f"schedule_csv missing columns: {missing}")
 
     # ── Load pitcher_table ────────────────────────────────────────────────────
-    pt = pd.read_csv(pitcher_table_csv, dtype=str)
+    pt = ctx.table("pitcher_table") if ctx is not None else read_table(pitcher_table_csv)
     if "pitcher_espn_id" in pt.columns:
         pt["pitcher_espn_id"] = pt["pitcher_espn_id"].fillna("").astype(str).str.strip()
     # Pre-normalise names for matching
@@ -261,7 +267,7 @@ def resolve_starters(
     pt["d1b_ability_adj"] = pt["d1b_ability_adj"].fillna(0.0)
 
     # ── Load appearances for IP expectation + QA context ─────────────────────
-    app = pd.read_csv(appearances_csv, dtype=str)
+    app = ctx.table("pitcher_appearances") if ctx is not None else read_table(appearances_csv)
     for col in ("pitcher_id", "team_canonical_id", "role"):
         if col not in app.columns:
             app[col] = ""
@@ -357,8 +363,8 @@ def resolve_starters(
     # some offense); teams WITHOUT posteriors get full wRC+ weight.
     WRC_POSTERIOR_SCALE = 0.5   # half-weight for teams already in posterior
     WRC_NO_POSTERIOR_SCALE = 1.0  # full weight for teams with no posterior
-    if team_table_csv.exists():
-        tt = pd.read_csv(team_table_csv, dtype=str)
+    if (ctx.has("team_table") if ctx is not None else team_table_csv.exists()):
+        tt = ctx.table("team_table") if ctx is not None else read_table(team_table_csv)
         tt["team_idx"] = pd.to_numeric(tt["team_idx"], errors="coerce").fillna(0).astype(int)
         tt["wrc_offense_adj"] = pd.to_numeric(tt["wrc_offense_adj"], errors="coerce").fillna(0.0)
         tt["batting_fb_factor"] = pd.to_numeric(tt.get("batting_fb_factor"), errors="coerce").fillna(1.0)
@@ -394,7 +400,7 @@ def resolve_starters(
     if d1b_rotations_csv.exists():
         sl_kwargs["d1baseball_rotations_csv"] = d1b_rotations_csv
 
-    starter_lookup = StarterLookup(**sl_kwargs)
+    starter_lookup = StarterLookup(**sl_kwargs, ctx=ctx)
 
     # ── Platoon lookup ────────────────────────────────────────────────────────
     platoon = PlatoonLookup()
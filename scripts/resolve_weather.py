@@ -3,7 +3,10 @@ Standalone weather + park factor resolver for the daily prediction pipeline.
 
 Reads a schedule CSV (produced by resolve_schedule.py or similar) and fetches
 live/forecast weather for each game's home stadium, combining with static park
-factors from park_factors.csv.
+factors from park_factors.csv. Forecasts are fetched once per (stadium, date),
+concurrently, through the on-disk TTL cache of weather_park_adjustment.WeatherClient.
+Adjustments for every start hour at each stadium are then computed in one array
+pass (weather_day_table), and each hourly game is a lookup into that table.
 
 Output schema (weather.csv):
     game_num        - matches schedule.csv row index
@@ -26,6 +29,7 @@ Output schema (weather.csv):
 Usage:
     python3 scripts/resolve_weather.py --schedule data/daily/2026-03-14/schedule.csv --date 2026-03-14
     python3 scripts/resolve_weather.py --schedule data/daily/2026-03-14/schedule.csv --date 2026-03-14 --out data/daily/2026-03-14/weather.csv
+    python3 scripts/resolve_weather.py --schedule data/daily/2026-03-14/schedule.csv --date 2026-03-14 --no-cache --workers 4
 """
 from __future__ import annotations
 
@@ -37,9 +41,11 @@ from pathlib import Path
 import pandas as pd
 
 import _bootstrap  # noqa: F401
+from ncaa_baseball.pipeline_context import PipelineContext
 from weather_park_adjustment import (
-    get_weather_park_adj, load_stadium_data, get_stadium_info,
-    air_density_ratio, ALTITUDE_COEFF,
+    get_weather_park_adj, load_stadium_data, get_stadium_info, get_weather_at_hours,
+    air_density_ratio, ALTITUDE_COEFF, WEATHER_CACHE_DIR, WEATHER_WORKERS, WeatherClient,
+    weather_day_table,
 )
 
 
@@ -75,9 +81,16 @@ def resolve_weather(
     park_factors_csv: Path = Path("data/processed/park_factors.csv"),
     date: str = "",
     out_csv: Path | None = None,
+    client: WeatherClient | None = None,
+    ctx: PipelineContext | None = None,
 ) -> pd.DataFrame:
     """Fetch weather and park factors for each game in schedule_csv.
 
+    All games' forecasts are fetched up front in one concurrent pass through
+    *client* (default: a WeatherClient on data/cache/weather), one request
+    per (stadium, date), so doubleheaders and refresh runs within the TTL
+    cost no extra API calls.
+
     Args:
         schedule_csv: Path to schedule CSV with at minimum columns:
             game_num, home_cid, start_local_hour
@@ -85,6 +98,9 @@ def resolve_weather(
         park_factors_csv: Path to park factors CSV.
         date: Game date string (YYYY-MM-DD) — used for hourly weather forecasts.
         out_csv: Optional output path; if given, writes CSV there.
+        client: WeatherClient to fetch through (cache dir, TTLs, workers).
+        ctx: the run's PipelineContext; stadiums then come from it (and its
+            stadium path) instead of re-reading stadium_csv.
 
     Returns:
         DataFrame with one row per game containing weather and park factor data.
@@ -92,22 +108,50 @@ def resolve_weather(
     # Load inputs
     schedule = pd.read_csv(schedule_csv)
     pf_map = load_park_factors(park_factors_csv)
-    stadium_df = load_stadium_data(stadium_csv)
-
-    total = len(schedule)
-    rows: list[dict] = []
-
+    if ctx is not None:
+        stadium_csv = ctx.paths["stadiums"]
+    if ctx is not None and ctx.has("stadiums"):
+        stadium_df = ctx.stadiums()
+    else:
+        stadium_df = load_stadium_data(stadium_csv)
+    if client is None:
+        client = WeatherClient()
+
+    games: list[tuple[int, str, int | None, dict | None]] = []
     for _, game_row in schedule.iterrows():
-        game_num = int(game_row["game_num"])
         home_cid = str(game_row.get("home_cid", "")).strip()
         start_local_hour = game_row.get("start_local_hour")
         if pd.isna(start_local_hour):
             start_local_hour = None
         else:
             start_local_hour = int(start_local_hour)
-
-        # Look up stadium info for progress logging
         sinfo = get_stadium_info(home_cid, stadium_df) if home_cid else None
+        games.append((int(game_row["game_num"]), home_cid, start_local_hour, sinfo))
+
+    # ── Prefetch: hourly forecasts, then current conditions where needed ──
+    hourly_games = [(c, s, h) for _, c, h, s in games if s and date and h is not None]
+    client.prefetch(client.key("hourly", s["lat"], s["lon"], date) for _, s, _ in hourly_games)
+    need_current = [s for _, _, h, s in games if s and not (date and h is not None)]
+    day_hourly: dict[str, list[dict] | None] = {}
+    for cid, s, h in hourly_games:
+        hourly = day_hourly.setdefault(cid, client.hourly(s["lat"], s["lon"], date))
+        if not hourly or not get_weather_at_hours(hourly, h, offsets=(0, 1, 2)):
+            need_current.append(s)
+    client.prefetch(client.key("current", s["lat"], s["lon"]) for s in need_current)
+
+    # ── Every start hour at every stadium in one array pass ──
+    table = weather_day_table(day_hourly, {c: s for _, c, _, s in games if s})
+    day_table = {(r.pop("key"), r.pop("start_hour")): r for r in table.to_dict("records")}
+    print(
+        f"Weather: {len(games)} games, {client.stats['requests']} API requests, "
+        f"{client.stats['disk_hits']} cached, {client.stats['errors']} errors",
+        file=sys.stderr,
+    )
+
+    total = len(games)
+    rows: list[dict] = []
+
+    for game_num, home_cid, start_local_hour, sinfo in games:
         venue_name = sinfo["venue_name"] if sinfo else "unknown"
 
         print(
@@ -149,12 +193,16 @@ def resolve_weather(
             elevation_ft = sinfo.get("elevation_ft", 0.0)
             is_dome = sinfo.get("is_dome", False)
             try:
-                w = get_weather_park_adj(
-                    canonical_id=home_cid,
-                    stadium_csv=stadium_csv,
-                    game_date=date if date else None,
-                    game_start_hour=start_local_hour,
-                )
+                w = day_table.get((home_cid, start_local_hour))
+                if w is None:
+                    w = get_weather_park_adj(
+                        canonical_id=home_cid,
+                        stadium_csv=stadium_csv,
+                        game_date=date if date else None,
+                        game_start_hour=start_local_hour,
+                        stadium_df=stadium_df,
+                        client=client,
+                    )
                 if "error" not in w:
                     wind_adj_raw = w.get("wind_adj_raw", 0.0)
                     non_wind_adj = w.get("non_wind_adj", 0.0)
@@ -265,6 +313,12 @@ def main() -> int:
         default=None,
         help="Output CSV path (default: data/daily/{date}/weather.csv if --date given)",
     )
+    parser.add_argument("--cache-dir", type=Path, default=WEATHER_CACHE_DIR,
+                        help="Open-Meteo response cache directory")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Fetch everything fresh and do not write the response cache")
+    parser.add_argument("--workers", type=int, default=WEATHER_WORKERS,
+                        help="Concurrent weather requests")
     args = parser.parse_args()
 
     out_csv = args.out
@@ -277,6 +331,8 @@ def main() -> int:
         park_factors_csv=args.park_factors,
         date=args.date,
         out_csv=out_csv,
+        client=WeatherClient(cache_dir=None if args.no_cache else args.cache_dir,
+                             workers=args.workers),
     )
 
     # Print summary to stdout
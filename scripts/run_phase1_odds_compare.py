@@ -16,12 +16,12 @@ import pandas as pd
 
 import _bootstrap  # noqa: F401
 from ncaa_baseball.phase1 import (
+    TeamResolver,
     build_odds_name_to_canonical,
     compare_to_market,
     load_canonical_teams,
     load_ratings,
     prior_win_prob,
-    resolve_odds_teams,
     win_prob_from_elo,
 )
 
@@ -81,6 +81,7 @@ def main() -> int:
 
     canonical = load_canonical_teams(args.canonical)
     name_to_canonical = build_odds_name_to_canonical(canonical)
+    resolver = TeamResolver(canonical, name_to_canonical)
     ratings = load_ratings(args.ratings)
     use_elo = len(ratings) > 0
     if use_elo:
@@ -105,9 +106,7 @@ def main() -> int:
         market_away = g.get("consensus_fair_away")
         commence = g.get("commence_time") or ""
 
-        home_t, away_t = resolve_odds_teams(
-            home_odds, away_odds, canonical, name_to_canonical,
-        )
+        home_t, away_t = resolver.resolve_pair(home_odds, away_odds)
         if home_t is None or away_t is None:
             unresolved += 1
             rows.append({
@@ -17,8 +17,9 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import json
 import sys
+from dataclasses import asdict, replace
+from functools import partial
 from pathlib import Path
 
 import numpy as np
@@ -31,13 +32,64 @@ from ncaa_baseball.model_runtime import (
     assert_scoring_calibration_parity,
     enforce_fatigue_coverage_policy,
 )
+from ncaa_baseball.posterior import Posterior, load_posterior, posterior_fingerprint
+from ncaa_baseball.simulation import (
+    MAX_EXTRA_INNINGS,
+    RUN_MULT,
+    GameOffsets,
+    PrecisionTargets,
+    game_key,
+    game_seed,
+    pilot_estimate,
+    simulate_game,
+    simulate_game_adaptive,
+    simulate_slate,
+    summarize_runs,
+)
+from ncaa_baseball.datastore import read_table
+from ncaa_baseball.exact import EXACT_DRAWS, exact_game
+from ncaa_baseball.pipeline_context import PipelineContext
+from ncaa_baseball.sim_cache import SimCache, input_hash
 
 # ── Scoring constants ────────────────────────────────────────────────────────
 
-# Run-event multipliers: run_1=1, run_2=2, run_3=3, run_4=5.4
-# run_4 represents "4+ runs in an inning". Actual avg is ~5.4 runs
-# when 4+ score (includes 5, 6, 7+ run innings capped at run_4 count).
-RUN_MULT = [1, 2, 3, 5.4]
+# Run-event multipliers (RUN_MULT) live in ncaa_baseball.simulation.
+
+# Simulation engines: "slate" simulates every game of the day in chunked
+# (game, sim) array passes; "vectorized" does one array pass per game; "adaptive"
+# simulates in batches and stops each game once its win/over/runline SEs
+# meet PrecisionTargets (N is then the per-game cap); "exact" computes each
+# game's run distributions analytically (no sampling noise) averaged over a
+# subsample of posterior draws; "scalar" is the original per-draw loop, kept
+# as a reference. Every engine runs each game from its own identity-keyed
+# seed, so any of them can use --workers.
+ENGINE_CHOICES = ("slate", "vectorized", "adaptive", "exact", "scalar")
+
+# Per-game simulation output columns, in output order.
+SIM_STAT_COLUMNS = (
+    "home_win_prob", "away_win_prob", "ml_home", "ml_away",
+    "exp_home", "exp_away", "exp_total",
+    "home_win_ci_lo", "home_win_ci_hi",
+    "exp_total_p10", "exp_total_p50", "exp_total_p90",
+    "margin_p10", "margin_p50", "margin_p90",
+    "home_rl_cover", "away_rl_cover",
+    "home_win_by_2plus", "away_win_by_2plus",
+    "home_win_by_3plus", "away_win_by_3plus",
+    "home_win_by_4plus", "away_win_by_4plus",
+    "home_win_by_5plus", "away_win_by_5plus",
+    "home_win_by_6plus", "away_win_by_6plus",
+    "over_prob",
+    "n_sims_used",
+)
+
+# Columns stored per game in the simulation cache: the stats plus the
+# market-anchor pilot outputs, so a cache hit skips the pilot too.
+CACHED_COLUMNS = SIM_STAT_COLUMNS + (
+    "pilot_home_win_prob",
+    "pilot_exp_total",
+    "anchor_home_shift",
+    "anchor_away_shift",
+)
 
 # Script-level alias kept for backward compatibility and explicit parity checks.
 SIMULATE_SCORING_CALIBRATION = SCORING_CALIBRATION
@@ -88,78 +140,6 @@ def _clamp(x: float, lo: float, hi: float) -> float:
     return float(max(lo, min(hi, x)))
 
 
-# ── Posterior Loading ────────────────────────────────────────────────────────
-
-def load_posterior(
-    posterior_csv: Path,
-    meta_json: Path,
-) -> dict:
-    """Load Stan posterior draws into NumPy arrays.
-
-    Returns dict with keys:
-        int_run, theta_run, home_adv, beta_park, beta_bullpen,
-        att, def_, pitcher_ab, n_draws, N_teams, N_pitchers
-    """
-    with open(meta_json) as f:
-        meta = json.load(f)
-    N_teams = meta["N_teams"]
-    N_pitchers = meta["N_pitchers"]
-
-    draws_df = pd.read_csv(posterior_csv)
-    n_draws = len(draws_df)
-
-    int_run = np.zeros((n_draws, 4))
-    theta_run = np.zeros((n_draws, 2))
-    home_adv = np.zeros(n_draws)
-    beta_park = np.ones(n_draws)
-    beta_bullpen = np.zeros(n_draws)
-
-    for k in range(4):
-        int_run[:, k] = draws_df[f"int_run_{k+1}"].values
-    # Apply global scoring calibration to intercepts (corrects for Stan shrinkage)
-    int_run += SCORING_CALIBRATION
-    for k in range(2):
-        theta_run[:, k] = draws_df[f"theta_run_{k+1}"].values
-    home_adv[:] = draws_df["home_advantage"].values
-    if "beta_park" in draws_df.columns:
-        beta_park[:] = draws_df["beta_park"].values
-    if "beta_bullpen" in draws_df.columns:
-        beta_bullpen[:] = draws_df["beta_bullpen"].values
-
-    att = np.zeros((n_draws, N_teams + 1, 4))
-    def_ = np.zeros((n_draws, N_teams + 1, 4))
-    for k in range(4):
-        for t in range(1, N_teams + 1):
-            col_a = f"att_run_{k+1}[{t}]"
-            col_d = f"def_run_{k+1}[{t}]"
-            if col_a in draws_df.columns:
-                att[:, t, k] = draws_df[col_a].values
-            if col_d in draws_df.columns:
-                def_[:, t, k] = draws_df[col_d].values
-
-    pitcher_ab = np.zeros((n_draws, N_pitchers + 1))
-    for p in range(1, N_pitchers + 1):
-        col = f"pitcher_ability[{p}]"
-        if col in draws_df.columns:
-            pitcher_ab[:, p] = draws_df[col].values
-
-    del draws_df
-
-    return {
-        "int_run": int_run,
-        "theta_run": theta_run,
-        "home_adv": home_adv,
-        "beta_park": beta_park,
-        "beta_bullpen": beta_bullpen,
-        "att": att,
-        "def_": def_,
-        "pitcher_ab": pitcher_ab,
-        "n_draws": n_draws,
-        "N_teams": N_teams,
-        "N_pitchers": N_pitchers,
-    }
-
-
 # ── Simulation ───────────────────────────────────────────────────────────────
 
 def simulate_games(
@@ -176,6 +156,13 @@ def simulate_games(
     fatigue_policy: str = "de-risk",
     fatigue_min_coverage: float = 0.8,
     context_csv: Path | None = None,
+    engine: str = "slate",
+    exact_draws: int = EXACT_DRAWS,
+    workers: int = 1,
+    cache_path: Path | None = None,
+    targets: PrecisionTargets | None = None,
+    variance_reduction: bool = False,
+    ctx: PipelineContext | None = None,
 ) -> pd.DataFrame:
     """
     Pure Monte Carlo simulation. No API calls. Deterministic.
@@ -185,21 +172,42 @@ def simulate_games(
 
     ha_target: if set, shift home_advantage posterior mean to this value.
                Use 0.05 for ~53-54% NCAA home win rate. None = no correction.
+    engine: "slate" (whole day in chunked (game, sim) passes), "vectorized"
+            (one array pass per game), "adaptive" (batches
+            until ``targets`` are met, at most n_sims per game), "exact"
+            (analytic run distributions averaged over ``exact_draws``
+            posterior draws; n_sims then only sizes the market-anchor pilot)
+            or "scalar" (reference per-draw loop). The n_sims_used column
+            reports the simulations (or exact draws) each game actually used.
+    targets: standard-error targets for engine="adaptive" (default
+             PrecisionTargets()).
+    variance_reduction: stratified posterior draws, antithetic uniforms and
+             CDF-inversion sampling (sampling engines only). With the
+             same seed, two runs that differ in one input then share their
+             random numbers game by game, so scenario deltas need far fewer
+             sims to resolve.
+    workers: simulate games in this many processes. Each game's random
+             stream is seeded from (seed, teams, start time), so results do
+             not depend on workers, schedule order or which games are run.
+    cache_path: per-game result cache (see ncaa_baseball.sim_cache). Games
+                whose resolved inputs hash the same as last run are reused
+                without re-running the pilot or simulation.
+    ctx: the run's PipelineContext; the team table then comes from it
+         instead of team_table_csv.
     """
+    if engine not in ENGINE_CHOICES:
+        raise ValueError(f"Unknown simulation engine: {engine}")
+    if variance_reduction and engine not in ("slate", "vectorized", "adaptive"):
+        raise ValueError(f"variance_reduction needs a sampling engine, not {engine!r}")
+    if targets is None:
+        targets = PrecisionTargets()
     # ── Load posterior ────────────────────────────────────────────────────
     print("Loading posterior...", file=sys.stderr)
     post = load_posterior(posterior_csv, meta_json)
-    int_run = post["int_run"]
-    theta_run = post["theta_run"]
-    home_adv = post["home_adv"]
-    beta_park = post["beta_park"]
-    beta_bullpen = post["beta_bullpen"]
-    att = post["att"]
-    def_ = post["def_"]
-    pitcher_ab = post["pitcher_ab"]
-    n_draws = post["n_draws"]
-    N_teams = post["N_teams"]
-    N_pitchers = post["N_pitchers"]
+    home_adv = post.home_adv
+    n_draws = post.n_draws
+    N_teams = post.N_teams
+    N_pitchers = post.N_pitchers
     print(f"  {n_draws} draws, {N_teams} teams, {N_pitchers} pitchers", file=sys.stderr)
 
     # ── Fix 1: Post-hoc home advantage correction ────────────────────────
@@ -207,11 +215,12 @@ def simulate_games(
         ha_mean = float(home_adv.mean())
         if abs(ha_mean - ha_target) > 0.005:
             ha_shift = ha_mean - ha_target
-            home_adv -= ha_shift
+            home_adv = home_adv - ha_shift
+            post = replace(post, home_adv=home_adv)
             print(f"  HA correction: {ha_mean:.4f} → {home_adv.mean():.4f}", file=sys.stderr)
 
     # ── Load team table (bullpen quality + team index) ────────────────────
-    team_table = pd.read_csv(team_table_csv, dtype=str)
+    team_table = ctx.table("team_table") if ctx is not None else read_table(team_table_csv)
     # Build canonical_id -> team_idx map
     team_idx_map: dict[str, int] = {}
     for _, r in team_table.iterrows():
@@ -284,9 +293,15 @@ def simulate_games(
 
     pass  # constants moved to module level
 
-    # ── Simulate each game ───────────────────────────────────────────────
-    rng = np.random.default_rng(seed)
+    # ── Resolve each game's offsets ──────────────────────────────────────
     all_results = []
+    game_offsets: list[GameOffsets] = []
+    game_seeds: list[np.random.SeedSequence] = []
+    key_counts: dict[str, int] = {}
+    pending: list[tuple[int, str, str]] = []  # (result row, game key, input hash)
+    seen_ids: set[str] = set()
+    sim_cache = SimCache(cache_path) if cache_path is not None else None
+    post_fp = posterior_fingerprint(posterior_csv, meta_json)
 
     for _, sched_row in schedule.iterrows():
         game_num = int(sched_row["game_num"])
@@ -300,6 +315,14 @@ def simulate_games(
         time_to_start_min = _safe_float_or_none(sched_row, "time_to_start_min")
         start_utc = _safe_str(sched_row, "start_utc", "")
 
+        # Per-game random streams keyed on identity, not schedule position
+        base_key = game_key(h_cid, a_cid, start_utc)
+        ordinal = key_counts.get(base_key, 0)
+        key_counts[base_key] = ordinal + 1
+        game_id = game_key(h_cid, a_cid, start_utc, ordinal)
+        seen_ids.add(game_id)
+        pilot_seed, sim_seed = game_seed(seed, game_id).spawn(2)
+
         # Team indices (clamp to posterior size)
         h_idx = team_idx_map.get(h_cid, 0)
         a_idx = team_idx_map.get(a_cid, 0)
@@ -439,61 +462,82 @@ def simulate_games(
         a_fatigue_adj = a_fatigue_adj + a_bp_avail_adj
 
         # ── Game context adjustments (rest, day/night, surface, travel, form) ──
-        ctx = context_by_game.get(str(game_num), {})
-        home_context_adj = _safe_float(ctx, "home_context_adj", 0.0)
-        away_context_adj = _safe_float(ctx, "away_context_adj", 0.0)
+        game_ctx = context_by_game.get(str(game_num), {})
+        home_context_adj = _safe_float(game_ctx, "home_context_adj", 0.0)
+        away_context_adj = _safe_float(game_ctx, "away_context_adj", 0.0)
 
         print(f"  Game {game_num}: {a_name} @ {h_name}  "
               f"[h_idx={h_idx}, a_idx={a_idx}, hp={hp_idx}, ap={ap_idx}]",
               file=sys.stderr)
 
+        # ── Resolved simulation inputs (market anchor added below) ─────────
+        offsets = GameOffsets(
+            h_idx=h_idx,
+            a_idx=a_idx,
+            hp_idx=hp_idx,
+            ap_idx=ap_idx,
+            park_factor=base_pf,
+            home_bp=h_bp,
+            away_bp=a_bp,
+            # home batting: away starter/bullpen; away batting: home starter/bullpen
+            home_const=(non_wind_adj + wind_adj_home + a_fatigue_adj + ap_era_adj
+                        + platoon_h + h_att_adj + home_context_adj),
+            away_const=(non_wind_adj + wind_adj_away + h_fatigue_adj + hp_era_adj
+                        + platoon_a + a_att_adj + away_context_adj),
+            # Extra innings are bullpen-only: no starter ability/platoon,
+            # but bullpen platoon (LHP frac), wRC+ offense, and context still apply.
+            home_const_bp=(non_wind_adj + wind_adj_home_bp + a_fatigue_adj
+                           + platoon_h_bp + h_att_adj + home_context_adj),
+            away_const_bp=(non_wind_adj + wind_adj_away_bp + h_fatigue_adj
+                           + platoon_a_bp + a_att_adj + away_context_adj),
+        )
+
+        # ── Per-game cache: skip simulation if inputs are unchanged ───────
+        game_hash = input_hash({
+            "offsets": asdict(offsets),
+            "market": [mkt_anchor_weight, mkt_home_win_prob, mkt_total_line],
+            "posterior": post_fp,
+            "ha_target": ha_target,
+            "engine": engine,
+            "n_sims": n_sims,
+            "exact_draws": exact_draws if engine == "exact" else None,
+            "targets": asdict(targets) if engine == "adaptive" else None,
+            "variance_reduction": variance_reduction,
+            "seed": seed,
+            "game": game_id,
+        })
+        cached = sim_cache.get(game_id, game_hash) if sim_cache is not None else None
+
         # ── Market anchor adjustment (time-aware, pilot calibrated) ────────
         anchor_home_shift = 0.0
         anchor_away_shift = 0.0
         pilot_home_prob = None
         pilot_total = None
-        if mkt_anchor_weight > 0 and (mkt_home_win_prob is not None or mkt_total_line is not None):
+        if cached is not None:
+            pilot_home_prob = cached["pilot_home_win_prob"]
+            pilot_total = cached["pilot_exp_total"]
+            anchor_home_shift = cached["anchor_home_shift"]
+            anchor_away_shift = cached["anchor_away_shift"]
+        elif mkt_anchor_weight > 0 and (mkt_home_win_prob is not None or mkt_total_line is not None):
+            # The pilot depends on model inputs only: a moved line re-uses it.
             n_pilot = int(max(250, min(800, n_sims // 8)))
-            pilot_wins = 0
-            pilot_h_sum = 0.0
-            pilot_a_sum = 0.0
-            for _ in range(n_pilot):
-                d = rng.integers(0, n_draws)
-                base_park_eff = beta_park[d] * base_pf
-                park_eff_h = base_park_eff + non_wind_adj + wind_adj_home
-                park_eff_a = base_park_eff + non_wind_adj + wind_adj_away
-                bp_h_eff = beta_bullpen[d] * a_bp + a_fatigue_adj  # away BP fatigued → home scores more
-                bp_a_eff = beta_bullpen[d] * h_bp + h_fatigue_adj  # home BP fatigued → away scores more
-                home_runs_sim, away_runs_sim = 0, 0
-                eh, ea = 0.0, 0.0
-                for k in range(4):
-                    log_lam_h = (int_run[d, k] + att[d, h_idx, k] + def_[d, a_idx, k]
-                                 + home_adv[d] + pitcher_ab[d, ap_idx] + ap_era_adj
-                                 + park_eff_h + bp_h_eff + platoon_h + h_att_adj
-                                 + home_context_adj)
-                    log_lam_a = (int_run[d, k] + att[d, a_idx, k] + def_[d, h_idx, k]
-                                 + pitcher_ab[d, hp_idx] + hp_era_adj
-                                 + park_eff_a + bp_a_eff + platoon_a + a_att_adj
-                                 + away_context_adj)
-                    mu_h = np.exp(log_lam_h)
-                    mu_a = np.exp(log_lam_a)
-                    eh += RUN_MULT[k] * mu_h
-                    ea += RUN_MULT[k] * mu_a
-                    if k <= 1:
-                        theta = max(1e-6, theta_run[d, k])
-                        p_h = theta / (theta + max(1e-8, mu_h))
-                        p_a = theta / (theta + max(1e-8, mu_a))
-                        home_runs_sim += RUN_MULT[k] * rng.negative_binomial(n=theta, p=p_h)
-                        away_runs_sim += RUN_MULT[k] * rng.negative_binomial(n=theta, p=p_a)
-                    else:
-                        home_runs_sim += RUN_MULT[k] * rng.poisson(lam=max(1e-8, mu_h))
-                        away_runs_sim += RUN_MULT[k] * rng.poisson(lam=max(1e-8, mu_a))
-                if home_runs_sim > away_runs_sim:
-                    pilot_wins += 1
-                pilot_h_sum += eh
-                pilot_a_sum += ea
-            pilot_home_prob = pilot_wins / max(1, n_pilot)
-            pilot_total = (pilot_h_sum + pilot_a_sum) / max(1, n_pilot)
+            pilot_hash = input_hash({
+                "offsets": asdict(offsets),
+                "posterior": post_fp,
+                "ha_target": ha_target,
+                "n_pilot": n_pilot,
+                "seed": seed,
+                "game": game_id,
+            })
+            pilot = sim_cache.get_pilot(game_id, pilot_hash) if sim_cache is not None else None
+            if pilot is None:
+                pilot_home_prob, pilot_total = pilot_estimate(
+                    post, offsets, n_pilot, np.random.default_rng(pilot_seed))
+                if sim_cache is not None:
+                    sim_cache.put_pilot(game_id, pilot_hash, {
+                        "home_win_prob": pilot_home_prob, "exp_total": pilot_total})
+            else:
+                pilot_home_prob, pilot_total = pilot["home_win_prob"], pilot["exp_total"]
 
             total_shift = 0.0
             side_shift = 0.0
@@ -514,125 +558,12 @@ def simulate_games(
             anchor_home_shift = total_shift + side_shift
             anchor_away_shift = total_shift - side_shift
 
-        # ── Monte Carlo loop ──────────────────────────────────────────────
-        wins_home = 0
-        exp_h_sum, exp_a_sum = 0.0, 0.0
-        home_rl_cover = 0
-        away_rl_cover = 0
-        rl_steps = [2, 3, 4, 5, 6]
-        home_win_by: dict[int, int] = {k: 0 for k in rl_steps}
-        away_win_by: dict[int, int] = {k: 0 for k in rl_steps}
-        overs = 0
-        total_line = 11.5
-        home_runs_mc = np.zeros(n_sims, dtype=np.int16)
-        away_runs_mc = np.zeros(n_sims, dtype=np.int16)
-        total_runs_mc = np.zeros(n_sims, dtype=np.int16)
-
-        for i in range(n_sims):
-            d = rng.integers(0, n_draws)
-            base_park_eff = beta_park[d] * base_pf
-            park_eff_h = base_park_eff + non_wind_adj + wind_adj_home
-            park_eff_a = base_park_eff + non_wind_adj + wind_adj_away
-            bp_h_eff = beta_bullpen[d] * a_bp + a_fatigue_adj  # home batting: away bullpen
-            bp_a_eff = beta_bullpen[d] * h_bp + h_fatigue_adj  # away batting: home bullpen
-
-            home_runs_sim, away_runs_sim = 0, 0
-            eh, ea = 0.0, 0.0
-
-            for k in range(4):
-                log_lam_h = (int_run[d, k] + att[d, h_idx, k] + def_[d, a_idx, k]
-                             + home_adv[d] + pitcher_ab[d, ap_idx] + ap_era_adj
-                             + park_eff_h + bp_h_eff + platoon_h + h_att_adj
-                             + home_context_adj + anchor_home_shift)
-                log_lam_a = (int_run[d, k] + att[d, a_idx, k] + def_[d, h_idx, k]
-                             + pitcher_ab[d, hp_idx] + hp_era_adj
-                             + park_eff_a + bp_a_eff + platoon_a + a_att_adj
-                             + away_context_adj + anchor_away_shift)
-                mu_h = np.exp(log_lam_h)
-                mu_a = np.exp(log_lam_a)
-                eh += RUN_MULT[k] * mu_h
-                ea += RUN_MULT[k] * mu_a
-
-                if k <= 1:
-                    theta = max(1e-6, theta_run[d, k])
-                    p_h = theta / (theta + max(1e-8, mu_h))
-                    p_a = theta / (theta + max(1e-8, mu_a))
-                    home_runs_sim += RUN_MULT[k] * rng.negative_binomial(n=theta, p=p_h)
-                    away_runs_sim += RUN_MULT[k] * rng.negative_binomial(n=theta, p=p_a)
-                else:
-                    home_runs_sim += RUN_MULT[k] * rng.poisson(lam=max(1e-8, mu_h))
-                    away_runs_sim += RUN_MULT[k] * rng.poisson(lam=max(1e-8, mu_a))
-
-            exp_h_sum += eh
-            exp_a_sum += ea
-
-            # Extra innings (bullpen pitching -> use bullpen FB sensitivity for wind)
-            park_eff_h_bp = base_park_eff + non_wind_adj + wind_adj_home_bp
-            park_eff_a_bp = base_park_eff + non_wind_adj + wind_adj_away_bp
-            extra = 0
-            while home_runs_sim == away_runs_sim and extra < 20:
-                for k in range(4):
-                    # Extra innings are bullpen-only: no starter ability/platoon,
-                    # but bullpen platoon (LHP frac), wRC+ offense, and context still apply.
-                    log_lam_h = (int_run[d, k] + att[d, h_idx, k] + def_[d, a_idx, k]
-                                 + home_adv[d]
-                                 + park_eff_h_bp + bp_h_eff + platoon_h_bp + h_att_adj
-                                 + home_context_adj + anchor_home_shift)
-                    log_lam_a = (int_run[d, k] + att[d, a_idx, k] + def_[d, h_idx, k]
-                                 + park_eff_a_bp + bp_a_eff + platoon_a_bp + a_att_adj
-                                 + away_context_adj + anchor_away_shift)
-                    mu_h = np.exp(log_lam_h) / 9.0
-                    mu_a = np.exp(log_lam_a) / 9.0
-                    if k <= 1:
-                        theta = max(1e-6, theta_run[d, k])
-                        p_h = theta / (theta + max(1e-8, mu_h))
-                        p_a = theta / (theta + max(1e-8, mu_a))
-                        home_runs_sim += RUN_MULT[k] * rng.negative_binomial(n=theta, p=p_h)
-                        away_runs_sim += RUN_MULT[k] * rng.negative_binomial(n=theta, p=p_a)
-                    else:
-                        home_runs_sim += RUN_MULT[k] * rng.poisson(lam=max(1e-8, mu_h))
-                        away_runs_sim += RUN_MULT[k] * rng.poisson(lam=max(1e-8, mu_a))
-                extra += 1
-            if home_runs_sim == away_runs_sim:
-                if rng.random() < 0.5:
-                    home_runs_sim += 1
-                else:
-                    away_runs_sim += 1
-
-            margin = home_runs_sim - away_runs_sim
-            if margin > 0:
-                wins_home += 1
-            if margin > 1.5:
-                home_rl_cover += 1
-            if margin < -1.5:
-                away_rl_cover += 1
-            for k in rl_steps:
-                if margin >= k:
-                    home_win_by[k] += 1
-                if margin <= -k:
-                    away_win_by[k] += 1
-            if (home_runs_sim + away_runs_sim) > total_line:
-                overs += 1
-            home_runs_mc[i] = int(home_runs_sim)
-            away_runs_mc[i] = int(away_runs_sim)
-            total_runs_mc[i] = int(home_runs_sim + away_runs_sim)
-
-        # ── Aggregate results ─────────────────────────────────────────────
-        N = n_sims
-        win_prob = wins_home / N
-        exp_h = exp_h_sum / N
-        exp_a = exp_a_sum / N
-        exp_total = exp_h + exp_a
-        total_p10 = float(np.quantile(total_runs_mc, 0.10))
-        total_p50 = float(np.quantile(total_runs_mc, 0.50))
-        total_p90 = float(np.quantile(total_runs_mc, 0.90))
-        margin_mc = home_runs_mc.astype(np.int32) - away_runs_mc.astype(np.int32)
-        margin_p10 = float(np.quantile(margin_mc, 0.10))
-        margin_p50 = float(np.quantile(margin_mc, 0.50))
-        margin_p90 = float(np.quantile(margin_mc, 0.90))
-        win_se = float(np.sqrt(max(1e-8, win_prob * (1.0 - win_prob) / N)))
-        home_win_ci_lo = max(0.0, win_prob - 1.96 * win_se)
-        home_win_ci_hi = min(1.0, win_prob + 1.96 * win_se)
+        # ── Monte Carlo (queued; cached games reuse their stored columns) ──
+        if cached is None:
+            game_offsets.append(replace(offsets, anchor_home=anchor_home_shift,
+                                        anchor_away=anchor_away_shift))
+            game_seeds.append(sim_seed)
+            pending.append((len(all_results), game_id, game_hash))
 
         starter_missing = int(hp_idx == 0) + int(ap_idx == 0)
         any_team_fallback = int(h_idx == 0 or a_idx == 0)
@@ -663,34 +594,7 @@ def simulate_games(
             "away_starter_idx": ap_idx,
             "hp_throws": hp_hand,
             "ap_throws": ap_hand,
-            "home_win_prob": win_prob,
-            "away_win_prob": 1 - win_prob,
-            "ml_home": prob_to_american(win_prob),
-            "ml_away": prob_to_american(1 - win_prob),
-            "exp_home": exp_h,
-            "exp_away": exp_a,
-            "exp_total": exp_total,
-            "home_win_ci_lo": home_win_ci_lo,
-            "home_win_ci_hi": home_win_ci_hi,
-            "exp_total_p10": total_p10,
-            "exp_total_p50": total_p50,
-            "exp_total_p90": total_p90,
-            "margin_p10": margin_p10,
-            "margin_p50": margin_p50,
-            "margin_p90": margin_p90,
-            "home_rl_cover": home_rl_cover / N,
-            "away_rl_cover": away_rl_cover / N,
-            "home_win_by_2plus": home_win_by[2] / N,
-            "away_win_by_2plus": away_win_by[2] / N,
-            "home_win_by_3plus": home_win_by[3] / N,
-            "away_win_by_3plus": away_win_by[3] / N,
-            "home_win_by_4plus": home_win_by[4] / N,
-            "away_win_by_4plus": away_win_by[4] / N,
-            "home_win_by_5plus": home_win_by[5] / N,
-            "away_win_by_5plus": away_win_by[5] / N,
-            "home_win_by_6plus": home_win_by[6] / N,
-            "away_win_by_6plus": away_win_by[6] / N,
-            "over_prob": overs / N,
+            **dict.fromkeys(SIM_STAT_COLUMNS),  # filled in after simulation
             "park_factor": pf,
             "wind_adj_raw": round(wind_adj_raw, 4),
             "non_wind_adj": round(non_wind_adj, 4),
@@ -750,19 +654,175 @@ def simulate_games(
             # Game context layers
             "home_context_adj": round(home_context_adj, 4),
             "away_context_adj": round(away_context_adj, 4),
-            "home_rest_adj": _safe_float(ctx, "home_rest_adj", 0.0),
-            "away_rest_adj": _safe_float(ctx, "away_rest_adj", 0.0),
-            "day_night": str(ctx.get("day_night", "unknown")),
-            "surface": str(ctx.get("surface", "grass")),
-            "travel_miles": ctx.get("travel_miles"),
-            "home_form_adj": _safe_float(ctx, "home_form_adj", 0.0),
-            "away_form_adj": _safe_float(ctx, "away_form_adj", 0.0),
+            "home_rest_adj": _safe_float(game_ctx, "home_rest_adj", 0.0),
+            "away_rest_adj": _safe_float(game_ctx, "away_rest_adj", 0.0),
+            "day_night": str(game_ctx.get("day_night", "unknown")),
+            "surface": str(game_ctx.get("surface", "grass")),
+            "travel_miles": game_ctx.get("travel_miles"),
+            "home_form_adj": _safe_float(game_ctx, "home_form_adj", 0.0),
+            "away_form_adj": _safe_float(game_ctx, "away_form_adj", 0.0),
         }
+        if cached is not None:
+            result.update({k: cached[k] for k in SIM_STAT_COLUMNS})
         all_results.append(result)
 
+    # ── Simulate (per-game streams, optionally across processes) ────────
+    if engine == "slate":
+        game_fn, size = None, n_sims
+    elif engine == "exact":
+        game_fn, size = exact_game, exact_draws
+    elif engine == "scalar":
+        game_fn, size = _simulate_game_scalar, n_sims
+    elif engine == "adaptive":
+        game_fn = partial(simulate_game_adaptive, targets=targets,
+                          variance_reduction=variance_reduction)
+        size = n_sims
+    else:
+        game_fn = partial(simulate_game, variance_reduction=variance_reduction)
+        size = n_sims
+    if sim_cache is not None:
+        print(f"  Sim cache: {len(all_results) - len(pending)} reused, "
+              f"{len(pending)} to simulate", file=sys.stderr)
+    if workers > 1:
+        print(f"  Simulating {len(game_offsets)} games on {workers} workers", file=sys.stderr)
+    all_stats = simulate_slate(post, game_offsets, size, game_seeds, workers=workers,
+                               game_fn=game_fn, variance_reduction=variance_reduction)
+    for (row, game_id, game_hash), stats in zip(pending, all_stats):
+        result = all_results[row]
+        result.update(_stat_columns(stats))
+        if sim_cache is not None:
+            sim_cache.put(game_id, game_hash, {k: result[k] for k in CACHED_COLUMNS})
+    if sim_cache is not None:
+        sim_cache.save(keep=seen_ids)
+    if engine == "adaptive" and pending:
+        used = sum(s["n_sims_used"] for s in all_stats)
+        print(f"  Adaptive: {used:,} sims for {len(pending)} games "
+              f"(cap {n_sims * len(pending):,})", file=sys.stderr)
+
     return pd.DataFrame(all_results)
 
 
+def add_precision_args(parser: argparse.ArgumentParser) -> None:
+    """--target-* flags for --engine adaptive (shared with predict_day.py)."""
+    d = PrecisionTargets()
+    parser.add_argument("--target-win-se", type=float, default=d.win_se,
+                        help="Adaptive: stop once the home win prob SE is at or below this.")
+    parser.add_argument("--target-over-se", type=float, default=d.over_se,
+                        help="Adaptive: stop once the over prob SE is at or below this.")
+    parser.add_argument("--target-rl-se", type=float, default=d.rl_se,
+                        help="Adaptive: stop once both runline cover SEs are at or below this.")
+    parser.add_argument("--batch", type=int, default=d.batch,
+                        help="Adaptive: simulations added per batch (also the minimum N).")
+
+
+def precision_targets(args: argparse.Namespace) -> PrecisionTargets:
+    return PrecisionTargets(
+        win_se=args.target_win_se,
+        over_se=args.target_over_se,
+        rl_se=args.target_rl_se,
+        min_sims=args.batch,
+        batch=args.batch,
+    )
+
+
+def _stat_columns(stats: dict) -> dict:
+    """Simulation output columns (in SIM_STAT_COLUMNS order), incl. moneylines."""
+    win_prob = stats["home_win_prob"]
+    cols = dict(stats)
+    cols["ml_home"] = prob_to_american(win_prob)
+    cols["ml_away"] = prob_to_american(1 - win_prob)
+    return {k: cols[k] for k in SIM_STAT_COLUMNS}
+
+
+def _simulate_game_scalar(
+    post: Posterior,
+    g: GameOffsets,
+    n_sims: int,
+    rng: np.random.Generator,
+) -> dict:
+    """Reference per-draw simulation loop (one scalar draw per run type)."""
+    int_run = post.int_run
+    theta_run = post.theta_run
+    home_adv = post.home_adv
+    beta_park = post.beta_park
+    beta_bullpen = post.beta_bullpen
+    att = post.att
+    def_ = post.def_
+    pitcher_ab = post.pitcher_ab
+    n_draws = post.n_draws
+
+    home_runs_mc = np.zeros(n_sims)
+    away_runs_mc = np.zeros(n_sims)
+    exp_h_mc = np.zeros(n_sims)
+    exp_a_mc = np.zeros(n_sims)
+
+    for i in range(n_sims):
+        d = rng.integers(0, n_draws)
+        base_park_eff = beta_park[d] * g.park_factor
+        bp_h_eff = beta_bullpen[d] * g.away_bp  # home batting: away bullpen
+        bp_a_eff = beta_bullpen[d] * g.home_bp  # away batting: home bullpen
+
+        home_runs_sim, away_runs_sim = 0, 0
+        eh, ea = 0.0, 0.0
+
+        for k in range(4):
+            log_lam_h = (int_run[d, k] + att[d, g.h_idx, k] + def_[d, g.a_idx, k]
+                         + home_adv[d] + pitcher_ab[d, g.ap_idx] + base_park_eff
+                         + bp_h_eff + g.home_const + g.anchor_home)
+            log_lam_a = (int_run[d, k] + att[d, g.a_idx, k] + def_[d, g.h_idx, k]
+                         + pitcher_ab[d, g.hp_idx] + base_park_eff
+                         + bp_a_eff + g.away_const + g.anchor_away)
+            mu_h = np.exp(log_lam_h)
+            mu_a = np.exp(log_lam_a)
+            eh += RUN_MULT[k] * mu_h
+            ea += RUN_MULT[k] * mu_a
+
+            if k <= 1:
+                theta = max(1e-6, theta_run[d, k])
+                p_h = theta / (theta + max(1e-8, mu_h))
+                p_a = theta / (theta + max(1e-8, mu_a))
+                home_runs_sim += RUN_MULT[k] * rng.negative_binomial(n=theta, p=p_h)
+                away_runs_sim += RUN_MULT[k] * rng.negative_binomial(n=theta, p=p_a)
+            else:
+                home_runs_sim += RUN_MULT[k] * rng.poisson(lam=max(1e-8, mu_h))
+                away_runs_sim += RUN_MULT[k] * rng.poisson(lam=max(1e-8, mu_a))
+
+        # Extra innings (bullpen pitching -> bullpen-only offsets)
+        extra = 0
+        while home_runs_sim == away_runs_sim and extra < MAX_EXTRA_INNINGS:
+            for k in range(4):
+                log_lam_h = (int_run[d, k] + att[d, g.h_idx, k] + def_[d, g.a_idx, k]
+                             + home_adv[d] + base_park_eff + bp_h_eff
+                             + g.home_const_bp + g.anchor_home)
+                log_lam_a = (int_run[d, k] + att[d, g.a_idx, k] + def_[d, g.h_idx, k]
+                             + base_park_eff + bp_a_eff
+                             + g.away_const_bp + g.anchor_away)
+                mu_h = np.exp(log_lam_h) / 9.0
+                mu_a = np.exp(log_lam_a) / 9.0
+                if k <= 1:
+                    theta = max(1e-6, theta_run[d, k])
+                    p_h = theta / (theta + max(1e-8, mu_h))
+                    p_a = theta / (theta + max(1e-8, mu_a))
+                    home_runs_sim += RUN_MULT[k] * rng.negative_binomial(n=theta, p=p_h)
+                    away_runs_sim += RUN_MULT[k] * rng.negative_binomial(n=theta, p=p_a)
+                else:
+                    home_runs_sim += RUN_MULT[k] * rng.poisson(lam=max(1e-8, mu_h))
+                    away_runs_sim += RUN_MULT[k] * rng.poisson(lam=max(1e-8, mu_a))
+            extra += 1
+        if home_runs_sim == away_runs_sim:
+            if rng.random() < 0.5:
+                home_runs_sim += 1
+            else:
+                away_runs_sim += 1
+
+        home_runs_mc[i] = home_runs_sim
+        away_runs_mc[i] = away_runs_sim
+        exp_h_mc[i] = eh
+        exp_a_mc[i] = ea
+
+    return summarize_runs(home_runs_mc, away_runs_mc, exp_h_mc, exp_a_mc)
+
+
 # ── Field access helpers (dict or pd.Series, handle NaN/empty) ───────────
 
 def _safe_str(row, key: str, default: str = "") -> str:
@@ -911,7 +971,8 @@ def main() -> int:
                         help="Weather CSV (game_num, park_factor, wind_adj_raw, ...)")
     parser.add_argument("--posterior", type=Path,
                         default=Path("data/processed/run_event_posterior_2k.csv"),
-                        help="Posterior draws CSV")
+                        help="Posterior draws CSV, or a bundle directory (e.g. from "
+                             "update_run_event_posterior.py)")
     parser.add_argument("--meta", type=Path,
                         default=Path("data/processed/run_event_fit_meta.json"),
                         help="Model metadata JSON")
@@ -948,6 +1009,23 @@ def main() -> int:
     )
     parser.add_argument("--context", type=Path, default=None,
                         help="Game context CSV (rest, day/night, surface, travel, form)")
+    parser.add_argument("--engine", type=str, default="slate", choices=ENGINE_CHOICES,
+                        help="Simulation engine: slate (default, whole day in chunked "
+                             "passes), vectorized (per game), adaptive (stop each "
+                             "game at the SE targets, --N is the cap), exact (analytic run "
+                             "distributions, no sampling noise) or scalar reference loop.")
+    parser.add_argument("--exact-draws", type=int, default=EXACT_DRAWS,
+                        help="Posterior draws averaged per game by --engine exact.")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Simulate games in N processes (results are identical for any N).")
+    parser.add_argument("--cache", type=Path, default=None,
+                        help="Per-game simulation cache JSON; games whose inputs are "
+                             "unchanged since the last run are reused, not re-simulated.")
+    add_precision_args(parser)
+    parser.add_argument("--variance-reduction", action="store_true",
+                        help="Stratified draws + antithetic CDF-inversion sampling: common "
+                             "random numbers across runs with the same --seed (for scenario "
+                             "comparisons).")
     args = parser.parse_args()
 
     # Validate inputs
@@ -985,6 +1063,12 @@ def main() -> int:
         fatigue_policy=args.fatigue_policy,
         fatigue_min_coverage=args.fatigue_min_coverage,
         context_csv=args.context,
+        engine=args.engine,
+        exact_draws=args.exact_draws,
+        workers=args.workers,
+        cache_path=args.cache,
+        targets=precision_targets(args),
+        variance_reduction=args.variance_reduction,
     )
 
     # Save CSV
@@ -27,10 +27,11 @@ import pandas as pd
 
 import _bootstrap  # noqa: F401
 from ncaa_baseball.phase1 import (
+    TeamResolver,
     build_odds_name_to_canonical,
     load_canonical_teams,
-    resolve_odds_teams,
 )
+from ncaa_baseball.posterior import Posterior, load_posterior
 
 # Import core simulation functions
 sys.path.insert(0, str(Path(__file__).parent))
@@ -110,6 +111,7 @@ def load_lookups(
         "pitcher_idx_map": pitcher_idx_map,
         "canonical": canonical,
         "name_to_canonical": name_to_canonical,
+        "resolver": TeamResolver(canonical, name_to_canonical),
         "name_to_cid": name_to_cid,
         "pf_map": pf_map,
         "bp_map": bp_map,
@@ -132,10 +134,8 @@ def resolve_team_name(name: str, lookups: dict) -> tuple[str, int]:
     if cid and cid in lookups["team_idx_map"]:
         return cid, lookups["team_idx_map"][cid]
 
-    # Try resolve_odds_teams for fuzzy matching
-    h_t, a_t = resolve_odds_teams(
-        name, "", lookups["canonical"], lookups["name_to_canonical"],
-    )
+    # Fuzzy matching via the registry resolver
+    h_t = lookups["resolver"].resolve(name)
     if h_t:
         cid = h_t[0]
         if cid in lookups["team_idx_map"]:
@@ -171,8 +171,7 @@ def resolve_pitcher(pitcher_str: str, lookups: dict) -> int:
 def simulate_one_matchup(
     home_name: str,
     away_name: str,
-    draws_df: pd.DataFrame,
-    meta: dict,
+    post: Posterior,
     lookups: dict,
     home_pitcher_str: str = "",
     away_pitcher_str: str = "",
@@ -204,9 +203,6 @@ def simulate_one_matchup(
     h_bp = lookups["bp_map"].get((home_cid, season), 0.0)
     a_bp = lookups["bp_map"].get((away_cid, season), 0.0)
 
-    N_teams = meta["N_teams"]
-    N_pitchers = meta["N_pitchers"]
-    n_draws = len(draws_df)
     rng = np.random.default_rng(seed)
 
     wins_home = 0
@@ -218,11 +214,10 @@ def simulate_one_matchup(
     total_hist: list[int] = []
 
     for _ in range(N):
-        row_idx = rng.integers(0, n_draws)
-        draw = draws_df.iloc[row_idx]
+        d = rng.integers(0, post.n_draws)
 
         eh, ea = expected_runs(
-            draw, home_idx, away_idx,
+            post, d, home_idx, away_idx,
             home_pitcher_idx, away_pitcher_idx,
             park_factor=pf, home_bp_adj=h_bp, away_bp_adj=a_bp,
         )
@@ -230,9 +225,8 @@ def simulate_one_matchup(
         exp_away_sum += ea
 
         home_runs, away_runs = simulate_full_game(
-            draw, home_idx, away_idx,
-            home_pitcher_idx, away_pitcher_idx,
-            N_teams, N_pitchers, rng,
+            post, d, home_idx, away_idx,
+            home_pitcher_idx, away_pitcher_idx, rng,
             park_factor=pf, home_bp_adj=h_bp, away_bp_adj=a_bp,
         )
 
@@ -351,14 +345,12 @@ def main() -> int:
 
     # Load lookups
     print("Loading model and lookups...", file=sys.stderr)
-    draws_df = pd.read_csv(args.posterior)
-    with open(args.meta) as f:
-        meta = json.load(f)
+    post = load_posterior(args.posterior, args.meta)
     lookups = load_lookups(
         args.team_index, args.pitcher_index, args.canonical,
         args.park_factors, args.bullpen_quality,
     )
-    print(f"  {len(draws_df)} posterior draws, "
+    print(f"  {post.n_draws} posterior draws, "
           f"{len(lookups['team_idx_map'])} teams, "
           f"{len(lookups['pitcher_idx_map'])} pitchers", file=sys.stderr)
 
@@ -388,7 +380,7 @@ def main() -> int:
             a_name = away.get("team", {}).get("displayName", "?")
 
             r = simulate_one_matchup(
-                h_name, a_name, draws_df, meta, lookups,
+                h_name, a_name, post, lookups,
                 N=args.N, runline=args.runline, total_line=args.total,
                 season=args.season, verbose=args.verbose,
             )
@@ -406,7 +398,7 @@ def main() -> int:
         parser.error("Provide home_team and away_team, or use --date for batch mode")
 
     r = simulate_one_matchup(
-        args.home_team, args.away_team, draws_df, meta, lookups,
+        args.home_team, args.away_team, post, lookups,
         home_pitcher_str=args.home_pitcher,
         away_pitcher_str=args.away_pitcher,
         N=args.N, runline=args.runline, total_line=args.total,
@@ -8,9 +8,9 @@ via NegBin(run_1/run_2) and Poisson(run_3/run_4), compute total runs as
 
 Includes park factors, bullpen quality adjustments, and live weather/wind adjustment.
 
-Reads CmdStanPy-formatted posterior CSV (columns: int_run_k, att_run_k.i,
-def_run_k.i, pitcher_ability.i, home_advantage, theta_run_1, theta_run_2,
-beta_park, beta_bullpen).
+Reads the run-event posterior through the shared ncaa_baseball.posterior
+loader (binary bundle next to the CmdStanPy/PyMC CSV; int_run includes
+SCORING_CALIBRATION).
 
 Usage:
   python3 scripts/simulate_run_event_game.py --home-team 13 --away-team 3 --N 10000
@@ -20,13 +20,15 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import json
 import sys
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
 
+import _bootstrap  # noqa: F401
+from ncaa_baseball.posterior import Posterior, load_posterior
+
 # Optional weather module (for --weather flag)
 try:
     from weather_park_adjustment import get_weather_park_adj
@@ -50,34 +52,41 @@ def _sample_poisson(mu: float, rng: np.random.Generator) -> int:
     return int(rng.poisson(lam=mu))
 
 
-# ── Parameter extraction from CmdStanPy draws row ────────────────────────────
+# ── Core simulation ──────────────────────────────────────────────────────────
 
-def _get_vector(draw: pd.Series, prefix: str, n: int) -> np.ndarray:
-    """Read vector[n] param: prefix[1], prefix[2], ..., prefix[n] (CmdStan bracket notation)."""
-    out = np.zeros(n)
-    for i in range(1, n + 1):
-        # CmdStan uses bracket notation: prefix[i]
-        key = f"{prefix}[{i}]"
-        if key in draw.index:
-            out[i - 1] = draw[key]
-        else:
-            # Fallback: dot notation (PyMC compatibility)
-            key2 = f"{prefix}.{i}"
-            if key2 in draw.index:
-                out[i - 1] = draw[key2]
-    return out
+def _log_rates(
+    post: Posterior,
+    d: int,
+    home_team_idx: int,
+    away_team_idx: int,
+    home_pitcher_idx: int,
+    away_pitcher_idx: int,
+    park_factor: float,
+    home_bp_adj: float,
+    away_bp_adj: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Home/away log-rates (4,) for posterior draw ``d`` (matching Stan model exactly).
 
+    Index 0 (unknown team / pitcher) is a zero row in the posterior arrays.
+    """
+    park = post.beta_park[d] * park_factor
+    # Bullpen direction: away bullpen quality affects home scoring, vice versa
+    bp_h = post.beta_bullpen[d] * away_bp_adj
+    bp_a = post.beta_bullpen[d] * home_bp_adj
+    log_lam_h = (post.int_run[d] + post.att[d, home_team_idx] + post.def_[d, away_team_idx]
+                 + post.home_adv[d] + post.pitcher_ab[d, away_pitcher_idx] + park + bp_h)
+    log_lam_a = (post.int_run[d] + post.att[d, away_team_idx] + post.def_[d, home_team_idx]
+                 + post.pitcher_ab[d, home_pitcher_idx] + park + bp_a)
+    return log_lam_h, log_lam_a
 
-# ── Core simulation ──────────────────────────────────────────────────────────
 
 def simulate_9_innings(
-    draw: pd.Series,
+    post: Posterior,
+    d: int,
     home_team_idx: int,
     away_team_idx: int,
     home_pitcher_idx: int,
     away_pitcher_idx: int,
-    N_teams: int,
-    N_pitchers: int,
     rng: np.random.Generator,
     scale: float = 1.0,
     park_factor: float = 0.0,
@@ -85,7 +94,7 @@ def simulate_9_innings(
     away_bp_adj: float = 0.0,
 ) -> tuple[int, int]:
     """
-    Simulate run-event counts for one game from one posterior draw.
+    Simulate run-event counts for one game from posterior draw ``d``.
 
     Returns (home_total_runs, away_total_runs).
     scale < 1 is used for extra innings (1/9 per inning).
@@ -93,45 +102,24 @@ def simulate_9_innings(
     home_bp_adj: home team's bullpen quality adj (positive = worse bullpen).
     away_bp_adj: away team's bullpen quality adj.
     """
+    log_lam_h, log_lam_a = _log_rates(
+        post, d, home_team_idx, away_team_idx, home_pitcher_idx, away_pitcher_idx,
+        park_factor, home_bp_adj, away_bp_adj,
+    )
+    mu_h = np.exp(log_lam_h) * scale
+    mu_a = np.exp(log_lam_a) * scale
+
     home_runs = 0
     away_runs = 0
-
-    # Park and bullpen effects from posterior
-    beta_park = float(draw.get("beta_park", 1.0))
-    beta_bullpen = float(draw.get("beta_bullpen", 0.0))
-    park = beta_park * park_factor
-    # Bullpen direction: away bullpen quality affects home scoring, vice versa
-    bp_h = beta_bullpen * away_bp_adj
-    bp_a = beta_bullpen * home_bp_adj
-
     for k in range(1, 5):
-        int_k = float(draw[f"int_run_{k}"])
-        # CmdStan bracket notation; fallback to dot for PyMC
-        att_h = float(draw.get(f"att_run_{k}[{home_team_idx}]", draw.get(f"att_run_{k}.{home_team_idx}", 0)))
-        att_a = float(draw.get(f"att_run_{k}[{away_team_idx}]", draw.get(f"att_run_{k}.{away_team_idx}", 0)))
-        def_h = float(draw.get(f"def_run_{k}[{home_team_idx}]", draw.get(f"def_run_{k}.{home_team_idx}", 0)))
-        def_a = float(draw.get(f"def_run_{k}[{away_team_idx}]", draw.get(f"def_run_{k}.{away_team_idx}", 0)))
-        home_adv = float(draw["home_advantage"])
-
-        # Pitcher effects (0 = unknown -> 0)
-        p_away = float(draw.get(f"pitcher_ability[{away_pitcher_idx}]", draw.get(f"pitcher_ability.{away_pitcher_idx}", 0))) if away_pitcher_idx >= 1 else 0.0
-        p_home = float(draw.get(f"pitcher_ability[{home_pitcher_idx}]", draw.get(f"pitcher_ability.{home_pitcher_idx}", 0))) if home_pitcher_idx >= 1 else 0.0
-
-        # Log-linear rate (matching Stan model exactly)
-        log_lam_h = int_k + att_h + def_a + home_adv + p_away + park + bp_h
-        log_lam_a = int_k + att_a + def_h + p_home + park + bp_a
-
-        mu_h = np.exp(log_lam_h) * scale
-        mu_a = np.exp(log_lam_a) * scale
-
         # Sample counts
         if k <= 2:
-            theta = float(draw[f"theta_run_{k}"])
-            count_h = _sample_negbin(mu_h, theta, rng)
-            count_a = _sample_negbin(mu_a, theta, rng)
+            theta = post.theta_run[d, k - 1]
+            count_h = _sample_negbin(mu_h[k - 1], theta, rng)
+            count_a = _sample_negbin(mu_a[k - 1], theta, rng)
         else:
-            count_h = _sample_poisson(mu_h, rng)
-            count_a = _sample_poisson(mu_a, rng)
+            count_h = _sample_poisson(mu_h[k - 1], rng)
+            count_a = _sample_poisson(mu_a[k - 1], rng)
 
         # Total runs: count of k-run events * k runs per event
         home_runs += k * count_h
@@ -141,13 +129,12 @@ def simulate_9_innings(
 
 
 def simulate_full_game(
-    draw: pd.Series,
+    post: Posterior,
+    d: int,
     home_team_idx: int,
     away_team_idx: int,
     home_pitcher_idx: int,
     away_pitcher_idx: int,
-    N_teams: int,
-    N_pitchers: int,
     rng: np.random.Generator,
     max_extra_innings: int = 20,
     park_factor: float = 0.0,
@@ -156,9 +143,8 @@ def simulate_full_game(
 ) -> tuple[int, int]:
     """Simulate 9 innings + extra innings until tie is broken (Mack Ch 18)."""
     home_runs, away_runs = simulate_9_innings(
-        draw, home_team_idx, away_team_idx,
-        home_pitcher_idx, away_pitcher_idx,
-        N_teams, N_pitchers, rng,
+        post, d, home_team_idx, away_team_idx,
+        home_pitcher_idx, away_pitcher_idx, rng,
         park_factor=park_factor,
         home_bp_adj=home_bp_adj,
         away_bp_adj=away_bp_adj,
@@ -168,9 +154,8 @@ def simulate_full_game(
     extra = 0
     while home_runs == away_runs and extra < max_extra_innings:
         h_extra, a_extra = simulate_9_innings(
-            draw, home_team_idx, away_team_idx,
-            home_pitcher_idx, away_pitcher_idx,
-            N_teams, N_pitchers, rng,
+            post, d, home_team_idx, away_team_idx,
+            home_pitcher_idx, away_pitcher_idx, rng,
             scale=1.0 / 9.0,
             park_factor=park_factor,
             home_bp_adj=home_bp_adj,
@@ -191,7 +176,8 @@ def simulate_full_game(
 
 
 def expected_runs(
-    draw: pd.Series,
+    post: Posterior,
+    d: int,
     home_team_idx: int,
     away_team_idx: int,
     home_pitcher_idx: int,
@@ -200,29 +186,13 @@ def expected_runs(
     home_bp_adj: float = 0.0,
     away_bp_adj: float = 0.0,
 ) -> tuple[float, float]:
-    """Expected home and away runs (E[mu]) for one posterior draw."""
-    beta_park = float(draw.get("beta_park", 1.0))
-    beta_bullpen = float(draw.get("beta_bullpen", 0.0))
-    park = beta_park * park_factor
-    bp_h = beta_bullpen * away_bp_adj
-    bp_a = beta_bullpen * home_bp_adj
-
-    exp_home, exp_away = 0.0, 0.0
-    for k in range(1, 5):
-        int_k = float(draw[f"int_run_{k}"])
-        att_h = float(draw.get(f"att_run_{k}[{home_team_idx}]", draw.get(f"att_run_{k}.{home_team_idx}", 0)))
-        att_a = float(draw.get(f"att_run_{k}[{away_team_idx}]", draw.get(f"att_run_{k}.{away_team_idx}", 0)))
-        def_h = float(draw.get(f"def_run_{k}[{home_team_idx}]", draw.get(f"def_run_{k}.{home_team_idx}", 0)))
-        def_a = float(draw.get(f"def_run_{k}[{away_team_idx}]", draw.get(f"def_run_{k}.{away_team_idx}", 0)))
-        home_adv = float(draw["home_advantage"])
-        p_away = float(draw.get(f"pitcher_ability[{away_pitcher_idx}]", draw.get(f"pitcher_ability.{away_pitcher_idx}", 0))) if away_pitcher_idx >= 1 else 0.0
-        p_home = float(draw.get(f"pitcher_ability[{home_pitcher_idx}]", draw.get(f"pitcher_ability.{home_pitcher_idx}", 0))) if home_pitcher_idx >= 1 else 0.0
-
-        mu_h = np.exp(int_k + att_h + def_a + home_adv + p_away + park + bp_h)
-        mu_a = np.exp(int_k + att_a + def_h + p_home + park + bp_a)
-        exp_home += k * mu_h
-        exp_away += k * mu_a
-    return exp_home, exp_away
+    """Expected home and away runs (E[mu]) for posterior draw ``d``."""
+    log_lam_h, log_lam_a = _log_rates(
+        post, d, home_team_idx, away_team_idx, home_pitcher_idx, away_pitcher_idx,
+        park_factor, home_bp_adj, away_bp_adj,
+    )
+    k = np.arange(1, 5)
+    return float(k @ np.exp(log_lam_h)), float(k @ np.exp(log_lam_a))
 
 
 def prob_to_american(p: float) -> int:
@@ -277,11 +247,8 @@ def main() -> int:
         print("Run fit_run_event_model.py first to create posterior and meta.")
         return 1
 
-    draws_df = pd.read_csv(args.posterior)
-    with open(args.meta) as f:
-        meta = json.load(f)
-    N_teams = meta["N_teams"]
-    N_pitchers = meta["N_pitchers"]
+    post = load_posterior(args.posterior, args.meta)
+    N_teams = post.N_teams
 
     # ── Pitcher name -> idx lookup (if pitcher index available) ───────────
     # Allows looking up pitchers by their unified ID (e.g. "NCAA_john_smith__BSB_UCLA")
@@ -318,6 +285,10 @@ def main() -> int:
         if idx < 0 or idx > N_teams:
             print(f"{name} must be in 0..{N_teams} (0 = league average)")
             return 1
+    for idx, name in [(args.home_pitcher, "home_pitcher"), (args.away_pitcher, "away_pitcher")]:
+        if idx < 0 or idx > post.N_pitchers:
+            print(f"{name} must be in 0..{post.N_pitchers} (0 = unknown)")
+            return 1
 
     # ── Live weather adjustment ─────────────────────────────────────────────
     weather_adj = 0.0
@@ -345,7 +316,6 @@ def main() -> int:
     pf = args.park_factor + weather_adj
 
     rng = np.random.default_rng(args.seed)
-    n_draws = len(draws_df)
     wins_home = 0
     runline_covers = 0
     overs = 0
@@ -357,11 +327,10 @@ def main() -> int:
     a_bp = args.away_bp_adj
 
     for _ in range(args.N):
-        row_idx = rng.integers(0, n_draws)
-        draw = draws_df.iloc[row_idx]
+        d = rng.integers(0, post.n_draws)
 
         eh, ea = expected_runs(
-            draw, args.home_team, args.away_team,
+            post, d, args.home_team, args.away_team,
             args.home_pitcher, args.away_pitcher,
             park_factor=pf, home_bp_adj=h_bp, away_bp_adj=a_bp,
         )
@@ -369,9 +338,8 @@ def main() -> int:
         exp_away_sum += ea
 
         home_runs, away_runs = simulate_full_game(
-            draw, args.home_team, args.away_team,
-            args.home_pitcher, args.away_pitcher,
-            N_teams, N_pitchers, rng,
+            post, d, args.home_team, args.away_team,
+            args.home_pitcher, args.away_pitcher, rng,
             park_factor=pf, home_bp_adj=h_bp, away_bp_adj=a_bp,
         )
 
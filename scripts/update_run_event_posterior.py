@@ -0,0 +1,164 @@
+"""
+Fold games played since the last Stan fit into the posterior, in seconds.
+
+Reads the fit's posterior bundle and its cutoff (``data_through`` in
+run_event_fit_meta.json), indexes every game in run_events.csv dated after the
+cutoff exactly as fit_run_event_model.py does, and importance-resamples the
+draws by the run-event likelihood of those games (ncaa_baseball.online_update).
+The result is an ordinary bundle directory that simulate.py / predict_day.py
+read with ``--posterior <bundle dir>``.
+
+Each update is computed from the base fit's draws over all games since the
+cutoff, and appended to ``updates`` in the fit meta (games added, dates, ESS,
+bundle path), so the meta records exactly which games a bundle incorporates.
+A new Stan fit rewrites the meta and starts a fresh chain. If the weights
+collapse below --min-ess effective draws the update is refused: refit.
+
+Usage:
+  python3 scripts/update_run_event_posterior.py
+  python3 scripts/update_run_event_posterior.py --through 2026-04-12
+  python3 scripts/simulate.py ... --posterior data/processed/run_event_posterior_2k_updated.bundle
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+import _bootstrap  # noqa: F401
+from ncaa_baseball.online_update import (
+    games_since,
+    importance_weights,
+    log_likelihood,
+    systematic_resample,
+)
+from ncaa_baseball.posterior import (
+    Posterior,
+    bundle_is_current,
+    bundle_path,
+    convert_posterior_csv,
+    read_bundle,
+    write_bundle,
+)
+from ncaa_baseball.run_event_data import (
+    bullpen_columns,
+    game_offsets,
+    index_games,
+    load_run_events,
+    park_factor_column,
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Importance-resample the run-event posterior on games since the last fit.",
+    )
+    parser.add_argument("--posterior", type=Path,
+                        default=Path("data/processed/run_event_posterior_2k.csv"),
+                        help="Base posterior CSV from the last fit (its bundle is used if current)")
+    parser.add_argument("--meta", type=Path, default=Path("data/processed/run_event_fit_meta.json"))
+    parser.add_argument("--run-events", type=Path, default=Path("data/processed/run_events.csv"))
+    parser.add_argument("--team-index", type=Path, default=Path("data/processed/run_event_team_index.csv"))
+    parser.add_argument("--pitcher-index", type=Path,
+                        default=Path("data/processed/run_event_pitcher_index.csv"))
+    parser.add_argument("--park-factors", type=Path, default=Path("data/processed/park_factors.csv"))
+    parser.add_argument("--bullpen-quality", type=Path, default=Path("data/processed/bullpen_quality.csv"))
+    parser.add_argument("--out", type=Path, default=None,
+                        help="Updated bundle directory (default: <posterior>_updated.bundle)")
+    parser.add_argument("--through", type=str, default=None,
+                        help="Only fold in games on or before this date (YYYY-MM-DD)")
+    parser.add_argument("--min-ess", type=float, default=200.0,
+                        help="Refuse the update below this many effective draws")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    for label, p in [("posterior", args.posterior), ("meta", args.meta),
+                     ("run-events", args.run_events), ("team-index", args.team_index),
+                     ("pitcher-index", args.pitcher_index)]:
+        if not p.exists():
+            print(f"Missing {label}: {p}", file=sys.stderr)
+            return 1
+
+    fit_meta = json.loads(args.meta.read_text())
+    data_through = fit_meta.get("data_through")
+    if not data_through:
+        print(f"{args.meta} has no data_through (fit predates online updates); refit first.",
+              file=sys.stderr)
+        return 1
+    N_teams, N_pitchers = int(fit_meta["N_teams"]), int(fit_meta["N_pitchers"])
+    out = args.out or args.posterior.with_name(f"{args.posterior.stem}_updated.bundle")
+
+    # ── New games, indexed and with covariates exactly as in the fit ─────────
+    t0 = time.perf_counter()
+    team_df = pd.read_csv(args.team_index)
+    pitcher_df = pd.read_csv(args.pitcher_index)
+    games = games_since(index_games(load_run_events(args.run_events), team_df, pitcher_df),
+                        data_through, args.through)
+    if games.empty:
+        print(f"No games after {data_through}; nothing to update.", file=sys.stderr)
+        return 0
+    park = park_factor_column(games, args.park_factors)
+    home_bp, away_bp = bullpen_columns(games, args.bullpen_quality)
+    g = game_offsets(games, park, home_bp, away_bp, N_teams, N_pitchers)
+    home_runs = games[[f"home_run_{k}" for k in range(1, 5)]].to_numpy(dtype=int)
+    away_runs = games[[f"away_run_{k}" for k in range(1, 5)]].to_numpy(dtype=int)
+
+    # ── Base draws (raw parameters, no scoring calibration) ──────────────────
+    bdir = bundle_path(args.posterior)
+    if not bundle_is_current(bdir, args.posterior, fit_meta):
+        convert_posterior_csv(args.posterior, args.meta)
+    arrays, _ = read_bundle(bdir)
+    raw = Posterior(**arrays, N_teams=N_teams, N_pitchers=N_pitchers)
+
+    log_lik = log_likelihood(raw, g, home_runs, away_runs)
+    weights, ess = importance_weights(log_lik)
+    dates = pd.to_datetime(games["game_date"], errors="coerce")
+    print(f"{len(games)} games {dates.min().date()}..{dates.max().date()} after {data_through}: "
+          f"ESS {ess:.0f}/{raw.n_draws} ({time.perf_counter() - t0:.1f}s)", file=sys.stderr)
+    if ess < args.min_ess:
+        print(f"ESS below --min-ess {args.min_ess:.0f}: too much new information for "
+              f"reweighting; run a full refit.", file=sys.stderr)
+        return 1
+
+    idx = systematic_resample(weights, np.random.default_rng(args.seed))
+    updated = {name: np.asarray(a)[idx] for name, a in arrays.items()}
+
+    # ── Update chain: every link is computed from the base fit ───────────────
+    chain = list(fit_meta.get("updates", []))
+    seen = {eid for link in chain for eid in link.get("added_event_ids", [])}
+    event_ids = games["event_id"].astype(str).tolist() if "event_id" in games.columns else []
+    link = {
+        "update_id": datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ"),
+        "base_fit_id": fit_meta.get("fit_id"),
+        "previous_update_id": chain[-1]["update_id"] if chain else None,
+        "games_after": data_through,
+        "games_through": dates.max().date().isoformat(),
+        "n_games": int(len(games)),
+        "added_event_ids": [e for e in event_ids if e not in seen],
+        "ess": round(ess, 1),
+        "n_draws": int(raw.n_draws),
+        "seed": args.seed,
+        "bundle": str(out),
+    }
+    bundle_meta = {k: v for k, v in fit_meta.items() if k != "updates"}
+    bundle_meta["update"] = link
+    write_bundle(out, updated, bundle_meta)
+    print(f"Updated posterior bundle -> {out}", file=sys.stderr)
+
+    fit_meta["updates"] = chain + [link]
+    tmp = args.meta.with_name(f".{args.meta.name}.tmp")
+    tmp.write_text(json.dumps(fit_meta))
+    os.replace(tmp, args.meta)
+    print(f"Update chain ({len(fit_meta['updates'])} links) -> {args.meta}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,14 +1,43 @@
 #!/usr/bin/env python3
+"""
+Walk-forward sweep of spread scale x edge threshold with OOS acceptance checks.
+
+Everything runs in one process: the posterior, run events and odds log are
+loaded once, every market-matched game is simulated once
+(ncaa_baseball.backtest.simulate_margins) and its sorted margin distribution
+kept. A spread scale is a post-hoc stretch of each game's expected margin, so
+each (scale x threshold x fold) cell only re-scores the stored distributions;
+a 10x10 grid costs about one backtest. Folds can run in parallel (--workers).
+
+--reuse-details reloads the stored distributions from --details-dir instead
+of simulating again.
+
+Usage:
+  python3 scripts/walk_forward_sweep.py
+  python3 scripts/walk_forward_sweep.py --spread-scales 0.8,0.9,1.0,1.1,1.2 --workers 4
+"""
 from __future__ import annotations
 
 import argparse
 import json
-import subprocess
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
+import _bootstrap  # noqa: F401
+from backtest_vs_market import parse_odds_log
+from ncaa_baseball.backtest import (
+    MarginDistributions,
+    holdout_games,
+    holdout_offsets,
+    simulate_margins,
+)
+from ncaa_baseball.posterior import load_posterior
 from robustness_reporting import (
     add_regime_columns,
     apply_uncertainty_columns,
@@ -16,6 +45,9 @@ from robustness_reporting import (
     evaluate_threshold_strategy,
 )
 
+MARGINS_FILE = "margin_distributions.npz"
+GAMES_FILE = "sweep_games.csv"
+
 
 def _parse_float_list(text: str) -> list[float]:
     vals: list[float] = []
@@ -27,36 +59,243 @@ def _parse_float_list(text: str) -> list[float]:
     return vals
 
 
-def _run_backtest_for_scale(args, scale: float, out_csv: Path) -> None:
-    cmd = [
-        sys.executable,
-        str(args.backtest_script),
-        "--odds", str(args.odds),
-        "--run-events", str(args.run_events),
-        "--posterior", str(args.posterior),
-        "--meta", str(args.meta),
-        "--team-index", str(args.team_index),
-        "--pitcher-index", str(args.pitcher_index),
-        "--teams-csv", str(args.teams_csv),
-        "--team-table", str(args.team_table),
-        "--N", str(args.N),
-        "--seed", str(args.seed),
-        "--ha-target", str(args.ha_target),
-        "--spread-scale", str(scale),
-        "--d1b-boost", str(args.d1b_boost),
-        "--out", str(out_csv),
-        "--min-bet-confidence", str(args.min_bet_confidence),
-        "--default-weather-confidence", str(args.default_weather_confidence),
-        "--default-fatigue-confidence", str(args.default_fatigue_confidence),
-    ]
-    subprocess.run(cmd, check=True)
+# ── Simulate once ───────────────────────────────────────────────────────────
+
+def _market_games(args) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """(detail rows, indexed games) for finished games that have a market line."""
+    games = holdout_games(
+        pd.read_csv(args.run_events, dtype=str),
+        pd.read_csv(args.team_index),
+        pd.read_csv(args.pitcher_index, dtype=str),
+    )
+    odds = parse_odds_log(args.odds, args.teams_csv)
+    keys = list(zip(games["game_date"].dt.strftime("%Y-%m-%d"),
+                    games["home_canonical_id"], games["away_canonical_id"]))
+    has_line = np.array([k in odds for k in keys], dtype=bool)
+    games = games.loc[has_line].reset_index(drop=True)
+    market = pd.DataFrame([odds[k] for k, ok in zip(keys, has_line) if ok]).reindex(
+        columns=["fair_home_prob", "best_home_ml", "best_away_ml", "mkt_total"])
+    return pd.DataFrame({
+        "date": games["game_date"],
+        "home": games["home_canonical_id"],
+        "away": games["away_canonical_id"],
+        "home_cid": games["home_canonical_id"],
+        "away_cid": games["away_canonical_id"],
+        "hp_idx": games["home_pitcher_idx"],
+        "ap_idx": games["away_pitcher_idx"],
+        "hp_d1b_adj": 0.0,  # posterior starters only; no D1B fallback in the backtest
+        "ap_d1b_adj": 0.0,
+        "home_won": games["home_win"].astype(bool),
+        "market_home_prob": market["fair_home_prob"].to_numpy(dtype=float),
+        "best_home_ml": market["best_home_ml"].to_numpy(dtype=float),
+        "best_away_ml": market["best_away_ml"].to_numpy(dtype=float),
+        "market_total_line": market["mkt_total"].to_numpy(dtype=float),
+    }), games
+
+
+def simulate_market_games(args) -> tuple[pd.DataFrame, MarginDistributions]:
+    """Load inputs once and simulate every market-matched game once."""
+    post = load_posterior(args.posterior, args.meta)
+    ha_mean = float(post.home_adv.mean())
+    if args.ha_target is not None and abs(ha_mean - args.ha_target) > 0.005:
+        # Same post-hoc home advantage shift as simulate.py --ha-target
+        post = replace(post, home_adv=post.home_adv - (ha_mean - args.ha_target))
+    frame, games = _market_games(args)
+    print(f"[walk-forward] {len(frame)} market-matched games, {args.N} sims each", file=sys.stderr)
+    t0 = time.perf_counter()
+    g = holdout_offsets(games, post, args.park_factors, args.bullpen_quality)
+    dist = simulate_margins(post, g, args.N, np.random.default_rng(args.seed))
+    print(f"[walk-forward] simulated in {time.perf_counter() - t0:.1f}s", file=sys.stderr)
+    return frame, dist
+
+
+def save_distributions(details_dir: Path, frame: pd.DataFrame, dist: MarginDistributions) -> None:
+    frame.to_csv(details_dir / GAMES_FILE, index=False)
+    np.savez(details_dir / MARGINS_FILE, margins=dist.margins, exp_margin=dist.exp_margin)
+
+
+def load_distributions(details_dir: Path) -> tuple[pd.DataFrame, MarginDistributions]:
+    frame = pd.read_csv(details_dir / GAMES_FILE)
+    frame["date"] = pd.to_datetime(frame["date"], errors="coerce")
+    with np.load(details_dir / MARGINS_FILE) as z:
+        dist = MarginDistributions(z["margins"], z["exp_margin"])
+    return frame, dist
+
+
+def scale_details(
+    frame: pd.DataFrame,
+    dist: MarginDistributions,
+    scales: list[float],
+) -> dict[float, pd.DataFrame]:
+    """Per-scale detail frames: the shared game rows plus that scale's probabilities."""
+    base_prob = dist.home_win_prob(1.0)
+    return {
+        scale: frame.assign(model_home_prob=base_prob, model_calibrated=dist.home_win_prob(scale))
+        for scale in scales
+    }
+
+
+# ── Folds ───────────────────────────────────────────────────────────────────
+
+def build_folds(
+    dates: list[pd.Timestamp],
+    train_days: int,
+    test_days: int,
+    step_days: int,
+) -> list[dict[str, object]]:
+    """Walk-forward (train, test) windows over the detail timeline."""
+    if not dates:
+        return []
+    first_date, last_date = dates[0], dates[-1]
+    folds: list[dict[str, object]] = []
+    cursor = first_date + pd.Timedelta(days=max(1, train_days))
+    while cursor <= last_date:
+        test_start = cursor
+        test_end = min(last_date, test_start + pd.Timedelta(days=max(1, test_days) - 1))
+        train_end = test_start - pd.Timedelta(days=1)
+        train_start = train_end - pd.Timedelta(days=max(1, train_days) - 1)
+        folds.append({
+            "fold": len(folds) + 1,
+            "train_start": train_start, "train_end": train_end,
+            "test_start": test_start, "test_end": test_end,
+        })
+        cursor = cursor + pd.Timedelta(days=max(1, step_days))
+    return folds
+
+
+_FOLD_STATE: dict[str, object] = {}
+
+
+def _init_fold_worker(by_scale: dict[float, pd.DataFrame], params: dict[str, object]) -> None:
+    _FOLD_STATE["by_scale"] = by_scale
+    _FOLD_STATE["params"] = params
+
+
+def _window(df: pd.DataFrame, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+    return df[(df["date"] >= start) & (df["date"] <= end)]
+
+
+def evaluate_fold(
+    fold: dict[str, object],
+    by_scale: dict[float, pd.DataFrame] | None = None,
+    params: dict[str, object] | None = None,
+):
+    """Train-window grid search, then OOS selected and baseline bets for one fold.
+
+    Returns (fold_row, grid_rows, selected_bets, baseline_bets), or None when
+    the grid is empty. Defaults to the worker state set by _init_fold_worker.
+    """
+    by_scale = by_scale if by_scale is not None else _FOLD_STATE["by_scale"]
+    params = params if params is not None else _FOLD_STATE["params"]
+    fold_id = fold["fold"]
+    train_start, train_end = fold["train_start"], fold["train_end"]
+    test_start, test_end = fold["test_start"], fold["test_end"]
+    scales = list(by_scale)
+    base_scale = params["baseline_spread_scale"] if params["baseline_spread_scale"] in by_scale else scales[0]
+
+    def _eval(df: pd.DataFrame, th: float):
+        return evaluate_threshold_strategy(
+            df=df,
+            prob_col=params["prob_col"],
+            threshold=th,
+            dd_penalty=params["dd_penalty"],
+            min_bet_confidence=params["min_bet_confidence"],
+        )
+
+    grid_rows: list[dict[str, object]] = []
+    best = None
+    best_eval = None
+    for scale in scales:
+        train_df = _window(by_scale[scale], train_start, train_end)
+        for th in params["thresholds"]:
+            ev = _eval(train_df, th)
+            grid_rows.append(
+                {
+                    "fold": fold_id,
+                    "train_start": train_start.date().isoformat(),
+                    "train_end": train_end.date().isoformat(),
+                    "spread_scale": scale,
+                    "threshold": th,
+                    "n": ev.n,
+                    "won": ev.won,
+                    "win_rate": ev.win_rate,
+                    "pnl": ev.pnl,
+                    "roi": ev.roi,
+                    "max_dd": ev.max_dd,
+                    "objective": ev.objective,
+                }
+            )
+            if best is None or ev.objective > best_eval.objective:
+                best = (scale, th)
+                best_eval = ev
+
+    if best is None or best_eval is None:
+        return None
+
+    date_block = f"{test_start.date().isoformat()}_{test_end.date().isoformat()}"
+    sel_scale, sel_th = best
+    sel_oos = _eval(_window(by_scale[sel_scale], test_start, test_end), sel_th)
+    sel_bets = sel_oos.bets.assign(fold=fold_id, date_block=date_block,
+                                   spread_scale=sel_scale, threshold=sel_th)
+
+    base_th = params["baseline_threshold"]
+    base_oos = _eval(_window(by_scale[base_scale], test_start, test_end), base_th)
+    base_bets = base_oos.bets.assign(fold=fold_id, date_block=date_block,
+                                     spread_scale=params["baseline_spread_scale"],
+                                     threshold=base_th)
+
+    fold_row = {
+        "fold": fold_id,
+        "train_start": train_start.date().isoformat(),
+        "train_end": train_end.date().isoformat(),
+        "test_start": test_start.date().isoformat(),
+        "test_end": test_end.date().isoformat(),
+        "selected_spread_scale": sel_scale,
+        "selected_threshold": sel_th,
+        "train_objective": best_eval.objective,
+        "train_roi": best_eval.roi,
+        "train_max_dd": best_eval.max_dd,
+        "oos_n": sel_oos.n,
+        "oos_roi": sel_oos.roi,
+        "oos_max_dd": sel_oos.max_dd,
+        "oos_objective": sel_oos.objective,
+        "baseline_n": base_oos.n,
+        "baseline_roi": base_oos.roi,
+        "baseline_max_dd": base_oos.max_dd,
+        "baseline_objective": base_oos.objective,
+    }
+    return fold_row, grid_rows, sel_bets, base_bets
+
+
+def evaluate_folds(
+    folds: list[dict[str, object]],
+    by_scale: dict[float, pd.DataFrame],
+    params: dict[str, object],
+    workers: int = 1,
+) -> list:
+    """evaluate_fold over every fold, in fold order; stops at the first empty grid.
+
+    With ``workers > 1`` folds run in a process pool; each worker receives the
+    detail frames once (initializer), not once per fold.
+    """
+    if workers <= 1 or len(folds) <= 1:
+        results = [evaluate_fold(f, by_scale, params) for f in folds]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(folds)), initializer=_init_fold_worker,
+                                 initargs=(by_scale, params)) as pool:
+            results = list(pool.map(evaluate_fold, folds))
+    out = []
+    for res in results:
+        if res is None:
+            break
+        out.append(res)
+    return out
 
 
 def build_parser() -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(
         description="Walk-forward sweep for spread-scale + edge threshold with OOS acceptance checks."
     )
-    p.add_argument("--backtest-script", type=Path, default=Path("scripts/backtest_vs_market.py"))
     p.add_argument("--odds", type=Path, default=Path("data/raw/odds/odds_historical_2026.jsonl"))
     p.add_argument("--run-events", type=Path, default=Path("data/processed/run_events_expanded.csv"))
     p.add_argument("--posterior", type=Path, default=Path("data/processed/run_event_posterior_2k.csv"))
@@ -64,11 +303,11 @@ def build_parser() -> argparse.ArgumentParser:
     p.add_argument("--team-index", type=Path, default=Path("data/processed/run_event_team_index.csv"))
     p.add_argument("--pitcher-index", type=Path, default=Path("data/processed/run_event_pitcher_index.csv"))
     p.add_argument("--teams-csv", type=Path, default=Path("data/registries/canonical_teams_2026.csv"))
-    p.add_argument("--team-table", type=Path, default=Path("data/processed/team_table.csv"))
-    p.add_argument("--N", type=int, default=1200)
+    p.add_argument("--park-factors", type=Path, default=Path("data/processed/park_factors.csv"))
+    p.add_argument("--bullpen-quality", type=Path, default=Path("data/processed/bullpen_quality.csv"))
+    p.add_argument("--N", type=int, default=1200, help="Simulations per game (run once for the whole grid)")
     p.add_argument("--seed", type=int, default=42)
     p.add_argument("--ha-target", type=float, default=0.05)
-    p.add_argument("--d1b-boost", type=float, default=1.0)
     p.add_argument("--spread-scales", type=str, default="0.85,1.0,1.15")
     p.add_argument("--thresholds", type=str, default="0.02,0.03,0.05,0.08,0.10")
     p.add_argument("--train-days", type=int, default=21)
@@ -86,7 +325,9 @@ def build_parser() -> argparse.ArgumentParser:
     p.add_argument("--max-oos-drawdown", type=float, default=999.0)
     p.add_argument("--out-dir", type=Path, default=Path("data/processed/audit_sweeps"))
     p.add_argument("--details-dir", type=Path, default=Path("data/processed/audit_sweeps/details"))
-    p.add_argument("--reuse-details", action="store_true", help="Use existing detail CSVs when present")
+    p.add_argument("--reuse-details", action="store_true",
+                   help="Reuse the stored margin distributions in --details-dir when present")
+    p.add_argument("--workers", type=int, default=1, help="Evaluate folds in this many processes")
     return p
 
 
@@ -100,142 +341,47 @@ def main() -> int:
     args.out_dir.mkdir(parents=True, exist_ok=True)
     args.details_dir.mkdir(parents=True, exist_ok=True)
 
-    # 1) Build/load per-scale detailed backtest files.
-    by_scale: dict[float, pd.DataFrame] = {}
-    for scale in scales:
-        detail_path = args.details_dir / f"backtest_vs_market_spread_{scale:.3f}.csv"
-        if not (args.reuse_details and detail_path.exists()):
-            print(f"[walk-forward] running backtest_vs_market for spread_scale={scale:.3f}", file=sys.stderr)
-            _run_backtest_for_scale(args, scale, detail_path)
-        df = pd.read_csv(detail_path)
-        df["date"] = pd.to_datetime(df["date"], errors="coerce")
-        df = apply_uncertainty_columns(
-            df=df,
-            min_bet_confidence=args.min_bet_confidence,
-            default_weather_confidence=args.default_weather_confidence,
-            default_fatigue_confidence=args.default_fatigue_confidence,
-        )
-        df = add_regime_columns(df, args.teams_csv)
-        by_scale[scale] = df
-
-    # 2) Walk-forward fold construction from baseline scale timeline.
-    base_df = by_scale.get(args.baseline_spread_scale)
-    if base_df is None:
-        base_df = by_scale[scales[0]]
-    all_dates = sorted(pd.to_datetime(base_df["date"].dropna().unique()))
+    # 1) Simulate once (or reload), then derive every scale's detail frame.
+    if args.reuse_details and (args.details_dir / MARGINS_FILE).exists() \
+            and (args.details_dir / GAMES_FILE).exists():
+        print(f"[walk-forward] reusing distributions in {args.details_dir}", file=sys.stderr)
+        frame, dist = load_distributions(args.details_dir)
+    else:
+        frame, dist = simulate_market_games(args)
+        save_distributions(args.details_dir, frame, dist)
+    frame = apply_uncertainty_columns(
+        df=frame,
+        min_bet_confidence=args.min_bet_confidence,
+        default_weather_confidence=args.default_weather_confidence,
+        default_fatigue_confidence=args.default_fatigue_confidence,
+    )
+    frame = add_regime_columns(frame, args.teams_csv)
+    by_scale = scale_details(frame, dist, scales)
+    for scale, df in by_scale.items():
+        df.to_csv(args.details_dir / f"backtest_vs_market_spread_{scale:.3f}.csv", index=False)
+
+    # 2) Walk-forward folds over the shared timeline; cells re-score stored results.
+    all_dates = sorted(pd.to_datetime(frame["date"].dropna().unique()))
     if not all_dates:
         raise SystemExit("No dates found in backtest detail data.")
-
-    first_date = all_dates[0]
-    last_date = all_dates[-1]
-    fold_rows: list[dict[str, object]] = []
-    train_grid_rows: list[dict[str, object]] = []
-    selected_bets_all: list[pd.DataFrame] = []
-    baseline_bets_all: list[pd.DataFrame] = []
-
-    fold_id = 0
-    cursor = first_date + pd.Timedelta(days=max(1, args.train_days))
-    while cursor <= last_date:
-        fold_id += 1
-        test_start = cursor
-        test_end = min(last_date, test_start + pd.Timedelta(days=max(1, args.test_days) - 1))
-        train_end = test_start - pd.Timedelta(days=1)
-        train_start = train_end - pd.Timedelta(days=max(1, args.train_days) - 1)
-
-        best = None
-        best_eval = None
-        for scale in scales:
-            df_scale = by_scale[scale]
-            train_df = df_scale[(df_scale["date"] >= train_start) & (df_scale["date"] <= train_end)]
-            for th in thresholds:
-                ev = evaluate_threshold_strategy(
-                    df=train_df,
-                    prob_col=args.prob_col,
-                    threshold=th,
-                    dd_penalty=args.dd_penalty,
-                    min_bet_confidence=args.min_bet_confidence,
-                )
-                train_grid_rows.append(
-                    {
-                        "fold": fold_id,
-                        "train_start": train_start.date().isoformat(),
-                        "train_end": train_end.date().isoformat(),
-                        "spread_scale": scale,
-                        "threshold": th,
-                        "n": ev.n,
-                        "won": ev.won,
-                        "win_rate": ev.win_rate,
-                        "pnl": ev.pnl,
-                        "roi": ev.roi,
-                        "max_dd": ev.max_dd,
-                        "objective": ev.objective,
-                    }
-                )
-                if best is None or ev.objective > best_eval.objective:
-                    best = (scale, th)
-                    best_eval = ev
-
-        if best is None or best_eval is None:
-            break
-
-        sel_scale, sel_th = best
-        oos_df_sel = by_scale[sel_scale][(by_scale[sel_scale]["date"] >= test_start) & (by_scale[sel_scale]["date"] <= test_end)]
-        sel_oos = evaluate_threshold_strategy(
-            df=oos_df_sel,
-            prob_col=args.prob_col,
-            threshold=sel_th,
-            dd_penalty=args.dd_penalty,
-            min_bet_confidence=args.min_bet_confidence,
-        )
-        if not sel_oos.bets.empty:
-            b = sel_oos.bets.copy()
-            b["fold"] = fold_id
-            b["date_block"] = f"{test_start.date().isoformat()}_{test_end.date().isoformat()}"
-            b["spread_scale"] = sel_scale
-            b["threshold"] = sel_th
-            selected_bets_all.append(b)
-
-        oos_df_base = by_scale.get(args.baseline_spread_scale, by_scale[scales[0]])
-        oos_df_base = oos_df_base[(oos_df_base["date"] >= test_start) & (oos_df_base["date"] <= test_end)]
-        base_oos = evaluate_threshold_strategy(
-            df=oos_df_base,
-            prob_col=args.prob_col,
-            threshold=args.baseline_threshold,
-            dd_penalty=args.dd_penalty,
-            min_bet_confidence=args.min_bet_confidence,
-        )
-        if not base_oos.bets.empty:
-            bb = base_oos.bets.copy()
-            bb["fold"] = fold_id
-            bb["date_block"] = f"{test_start.date().isoformat()}_{test_end.date().isoformat()}"
-            bb["spread_scale"] = args.baseline_spread_scale
-            bb["threshold"] = args.baseline_threshold
-            baseline_bets_all.append(bb)
-
-        fold_rows.append(
-            {
-                "fold": fold_id,
-                "train_start": train_start.date().isoformat(),
-                "train_end": train_end.date().isoformat(),
-                "test_start": test_start.date().isoformat(),
-                "test_end": test_end.date().isoformat(),
-                "selected_spread_scale": sel_scale,
-                "selected_threshold": sel_th,
-                "train_objective": best_eval.objective,
-                "train_roi": best_eval.roi,
-                "train_max_dd": best_eval.max_dd,
-                "oos_n": sel_oos.n,
-                "oos_roi": sel_oos.roi,
-                "oos_max_dd": sel_oos.max_dd,
-                "oos_objective": sel_oos.objective,
-                "baseline_n": base_oos.n,
-                "baseline_roi": base_oos.roi,
-                "baseline_max_dd": base_oos.max_dd,
-                "baseline_objective": base_oos.objective,
-            }
-        )
-
-        cursor = cursor + pd.Timedelta(days=max(1, args.step_days))
+    folds = build_folds(all_dates, args.train_days, args.test_days, args.step_days)
+    params = {
+        "thresholds": thresholds,
+        "prob_col": args.prob_col,
+        "dd_penalty": args.dd_penalty,
+        "min_bet_confidence": args.min_bet_confidence,
+        "baseline_spread_scale": args.baseline_spread_scale,
+        "baseline_threshold": args.baseline_threshold,
+    }
+    t0 = time.perf_counter()
+    results = evaluate_folds(folds, by_scale, params, workers=args.workers)
+    print(f"[walk-forward] {len(results)} folds x {len(scales)} scales x {len(thresholds)} thresholds "
+          f"in {time.perf_counter() - t0:.1f}s", file=sys.stderr)
+
+    fold_rows = [r[0] for r in results]
+    train_grid_rows = [row for r in results for row in r[1]]
+    selected_bets_all = [r[2] for r in results if not r[2].empty]
+    baseline_bets_all = [r[3] for r in results if not r[3].empty]
 
     folds_df = pd.DataFrame(fold_rows)
     grid_df = pd.DataFrame(train_grid_rows)
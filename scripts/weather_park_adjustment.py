@@ -8,6 +8,15 @@ blowing out from home plate toward center field.
 Stadium orientations (home plate → center field compass bearing) and lat/lon are
 loaded from data/registries/stadium_orientations.csv.
 
+WeatherClient wraps the Open-Meteo calls for whole slates: requests are
+de-duplicated by (lat, lon, date), fetched on a bounded thread pool and cached
+on disk (data/cache/weather) with separate TTLs for hourly forecasts and
+current conditions.
+
+The physics also comes in array form (``*_array`` functions,
+``weather_day_table``) for whole hourly grids: every start hour at every
+stadium of a slate in one call, or seasons of historical weather.
+
 Physics model:
   - Wind blowing out → carries fly balls further → more runs
   - Wind blowing in → suppresses fly balls → fewer runs
@@ -30,11 +39,15 @@ from __future__ import annotations
 import argparse
 import json
 import math
+import os
 import sys
+import threading
+import time
 import urllib.request
-import urllib.error
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 
@@ -123,28 +136,50 @@ def get_stadium_info(
 # Weather API (Open-Meteo — free, no API key)
 # ──────────────────────────────────────────────────────────────────────────────
 
-def fetch_current_weather(lat: float, lon: float) -> dict | None:
-    """
-    Fetch current weather from Open-Meteo API.
-    Returns dict with wind_speed_mph, wind_direction_deg, temperature_f,
-    wind_gusts_mph, precip_prob_pct.
-    """
-    url = (
-        f"https://api.open-meteo.com/v1/forecast?"
+OPEN_METEO_URL = "https://api.open-meteo.com/v1/forecast"
+USER_AGENT = "ncaa-baseball-model/1.0"
+REQUEST_TIMEOUT_S = 10.0
+
+# On-disk response cache (WeatherClient). Forecasts are refreshed upstream
+# about hourly and barely move within a couple of hours; current conditions
+# go stale much faster.
+WEATHER_CACHE_DIR = Path("data/cache/weather")
+FORECAST_TTL_S = 2 * 3600
+CURRENT_TTL_S = 20 * 60
+WEATHER_WORKERS = 8
+
+
+def _current_url(lat: float, lon: float, base_url: str = OPEN_METEO_URL) -> str:
+    return (
+        f"{base_url}?"
         f"latitude={lat}&longitude={lon}"
         f"&current=temperature_2m,relative_humidity_2m,wind_speed_10m,wind_direction_10m,wind_gusts_10m,precipitation"
         f"&temperature_unit=fahrenheit"
         f"&wind_speed_unit=mph"
         f"&timezone=auto"
     )
-    try:
-        req = urllib.request.Request(url, headers={"User-Agent": "ncaa-baseball-model/1.0"})
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            data = json.loads(resp.read().decode())
-    except (urllib.error.URLError, json.JSONDecodeError, TimeoutError) as e:
-        print(f"Weather API error: {e}", file=sys.stderr)
-        return None
 
+
+def _hourly_url(lat: float, lon: float, date: str, base_url: str = OPEN_METEO_URL) -> str:
+    return (
+        f"{base_url}?"
+        f"latitude={lat}&longitude={lon}"
+        f"&hourly=temperature_2m,relative_humidity_2m,wind_speed_10m,wind_direction_10m,wind_gusts_10m,precipitation_probability,precipitation"
+        f"&temperature_unit=fahrenheit"
+        f"&wind_speed_unit=mph"
+        f"&timezone=auto"
+        f"&start_date={date}&end_date={date}"
+    )
+
+
+def _get_json(url: str, timeout: float = REQUEST_TIMEOUT_S) -> dict:
+    req = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
+    with urllib.request.urlopen(req, timeout=timeout) as resp:
+        return json.loads(resp.read().decode())
+
+
+def parse_current(data: dict) -> dict:
+    """Open-Meteo ``current=`` response → weather dict (see fetch_current_weather)."""
     current = data.get("current", {})
     precip_mm = float(current.get("precipitation", 0) or 0)
     # Open-Meteo current endpoint doesn't provide probability directly.
@@ -161,35 +196,8 @@ def fetch_current_weather(lat: float, lon: float) -> dict | None:
     }
 
 
-def fetch_hourly_weather(lat: float, lon: float, date: str) -> list[dict] | None:
-    """
-    Fetch full day of hourly forecasts from Open-Meteo API.
-
-    Args:
-        lat, lon: stadium coordinates
-        date: YYYY-MM-DD
-
-    Returns list of hourly dicts with keys:
-        time (ISO str), wind_speed_mph, wind_direction_deg, temperature_f,
-        wind_gusts_mph, precip_prob_pct
-    """
-    url = (
-        f"https://api.open-meteo.com/v1/forecast?"
-        f"latitude={lat}&longitude={lon}"
-        f"&hourly=temperature_2m,relative_humidity_2m,wind_speed_10m,wind_direction_10m,wind_gusts_10m,precipitation_probability,precipitation"
-        f"&temperature_unit=fahrenheit"
-        f"&wind_speed_unit=mph"
-        f"&timezone=auto"
-        f"&start_date={date}&end_date={date}"
-    )
-    try:
-        req = urllib.request.Request(url, headers={"User-Agent": "ncaa-baseball-model/1.0"})
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            data = json.loads(resp.read().decode())
-    except (urllib.error.URLError, json.JSONDecodeError, TimeoutError) as e:
-        print(f"Hourly weather API error: {e}", file=sys.stderr)
-        return None
-
+def parse_hourly(data: dict) -> list[dict] | None:
+    """Open-Meteo ``hourly=`` response → list of hourly dicts, or None if empty."""
     hourly = data.get("hourly", {})
     times = hourly.get("time", [])
     if not times:
@@ -210,6 +218,163 @@ def fetch_hourly_weather(lat: float, lon: float, date: str) -> list[dict] | None
     return results
 
 
+def fetch_current_weather(lat: float, lon: float) -> dict | None:
+    """
+    Fetch current weather from Open-Meteo API.
+    Returns dict with wind_speed_mph, wind_direction_deg, temperature_f,
+    wind_gusts_mph, precip_prob_pct.
+    """
+    try:
+        data = _get_json(_current_url(lat, lon))
+    except (OSError, ValueError) as e:
+        print(f"Weather API error: {e}", file=sys.stderr)
+        return None
+    return parse_current(data)
+
+
+def fetch_hourly_weather(lat: float, lon: float, date: str) -> list[dict] | None:
+    """
+    Fetch full day of hourly forecasts from Open-Meteo API.
+
+    Args:
+        lat, lon: stadium coordinates
+        date: YYYY-MM-DD
+
+    Returns list of hourly dicts with keys:
+        time (ISO str), wind_speed_mph, wind_direction_deg, temperature_f,
+        wind_gusts_mph, precip_prob_pct
+    """
+    try:
+        data = _get_json(_hourly_url(lat, lon, date))
+    except (OSError, ValueError) as e:
+        print(f"Hourly weather API error: {e}", file=sys.stderr)
+        return None
+    return parse_hourly(data)
+
+
+class WeatherClient:
+    """Open-Meteo client with request de-duplication, concurrency and a TTL cache.
+
+    Requests are keyed by (kind, lat, lon, date), with coordinates rounded to
+    4 decimals (~10 m, far below the forecast grid), so doubleheaders and
+    shared parks cost one request. ``prefetch`` fetches every key that is
+    not already fresh on a bounded thread pool; ``hourly``/``current`` then
+    answer from memory.
+
+    Raw responses are cached as JSON under ``cache_dir``, one file per key,
+    stamped with the fetch time. An entry is fresh for ``forecast_ttl``
+    seconds (hourly forecasts) or ``current_ttl`` seconds (current
+    conditions); a stale entry is re-fetched, and kept as the answer if the
+    API fails. ``cache_dir=None`` disables the disk cache. ``base_url`` and
+    ``clock`` exist for tests (a local stub server, a fake time).
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path | None = WEATHER_CACHE_DIR,
+        base_url: str = OPEN_METEO_URL,
+        forecast_ttl: float = FORECAST_TTL_S,
+        current_ttl: float = CURRENT_TTL_S,
+        workers: int = WEATHER_WORKERS,
+        timeout: float = REQUEST_TIMEOUT_S,
+        clock=time.time,
+    ) -> None:
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.base_url = base_url
+        self.ttl = {"hourly": forecast_ttl, "current": current_ttl}
+        self.workers = max(1, int(workers))
+        self.timeout = timeout
+        self.clock = clock
+        self._memo: dict[tuple, dict | None] = {}
+        self._lock = threading.Lock()
+        self.stats = {"requests": 0, "disk_hits": 0, "errors": 0}
+
+    def _count(self, stat: str) -> None:
+        with self._lock:
+            self.stats[stat] += 1
+
+    @staticmethod
+    def key(kind: str, lat: float, lon: float, date: str | None = None) -> tuple:
+        return (kind, round(float(lat), 4), round(float(lon), 4), date if kind == "hourly" else None)
+
+    def _url(self, key: tuple) -> str:
+        kind, lat, lon, date = key
+        if kind == "hourly":
+            return _hourly_url(lat, lon, date, self.base_url)
+        return _current_url(lat, lon, self.base_url)
+
+    def _path(self, key: tuple) -> Path:
+        kind, lat, lon, date = key
+        suffix = f"_{date}" if date else ""
+        return self.cache_dir / f"{kind}_{lat:.4f}_{lon:.4f}{suffix}.json"
+
+    def _read_cache(self, key: tuple) -> dict | None:
+        if self.cache_dir is None:
+            return None
+        try:
+            entry = json.loads(self._path(key).read_text())
+        except (OSError, ValueError):
+            return None
+        return entry if isinstance(entry, dict) and "payload" in entry else None
+
+    def _fresh(self, entry: dict | None, key: tuple) -> bool:
+        return entry is not None and self.clock() - float(entry.get("fetched_at", 0)) < self.ttl[key[0]]
+
+    def _fetch(self, key: tuple) -> dict | None:
+        """Fetch one key over HTTP and cache it; falls back to a stale entry."""
+        try:
+            payload = _get_json(self._url(key), self.timeout)
+        except (OSError, ValueError) as e:
+            self._count("errors")
+            stale = self._read_cache(key)
+            label = "Hourly weather" if key[0] == "hourly" else "Weather"
+            print(f"{label} API error: {e}" + (" (using stale cache)" if stale else ""),
+                  file=sys.stderr)
+            return stale["payload"] if stale else None
+        self._count("requests")
+        if self.cache_dir is not None:
+            path = self._path(key)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f".{path.name}.tmp")
+            tmp.write_text(json.dumps({"fetched_at": self.clock(), "payload": payload}))
+            os.replace(tmp, path)
+        return payload
+
+    def prefetch(self, keys) -> None:
+        """Load every key: memory, then fresh disk entries, then HTTP in parallel."""
+        todo = []
+        for key in dict.fromkeys(keys):
+            if key in self._memo:
+                continue
+            entry = self._read_cache(key)
+            if self._fresh(entry, key):
+                self._count("disk_hits")
+                self._memo[key] = entry["payload"]
+            else:
+                todo.append(key)
+        if not todo:
+            return
+        if len(todo) == 1 or self.workers == 1:
+            self._memo.update({key: self._fetch(key) for key in todo})
+            return
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(todo))) as pool:
+            self._memo.update(zip(todo, pool.map(self._fetch, todo)))
+
+    def _payload(self, key: tuple) -> dict | None:
+        self.prefetch([key])
+        return self._memo[key]
+
+    def hourly(self, lat: float, lon: float, date: str) -> list[dict] | None:
+        """``fetch_hourly_weather`` through the cache."""
+        payload = self._payload(self.key("hourly", lat, lon, date))
+        return parse_hourly(payload) if payload is not None else None
+
+    def current(self, lat: float, lon: float) -> dict | None:
+        """``fetch_current_weather`` through the cache."""
+        payload = self._payload(self.key("current", lat, lon))
+        return parse_current(payload) if payload is not None else None
+
+
 def get_weather_at_hours(
     hourly_data: list[dict],
     start_hour_local: int,
@@ -277,6 +442,7 @@ def air_density_ratio(elevation_ft: float) -> float:
     Simplified: (1 - 2.25577e-5 × elevation_m)^5.25588
 
     Returns 1.0 at sea level, ~0.82 at Denver (5280 ft), ~0.78 at 7000 ft.
+    Works elementwise on numpy arrays.
     """
     elevation_m = elevation_ft * 0.3048
     return (1 - 2.25577e-5 * elevation_m) ** 5.25588
@@ -291,6 +457,7 @@ def humidity_density_reduction(temp_f: float, rh_pct: float) -> float:
 
     At 90°F, 85% RH → ~1.5% density reduction → +0.38% runs (via ALTITUDE_COEFF).
     At 72°F, 50% RH → ~0.5% density reduction → +0.13% runs.
+    Works elementwise on numpy arrays.
     """
     tc = (temp_f - 32) * 5 / 9
     # Saturation vapor pressure (Magnus formula, hPa)
@@ -517,6 +684,8 @@ def get_weather_park_adj(
     game_date: str | None = None,
     game_start_hour: int | None = None,
     fb_sensitivity: float = 1.0,
+    stadium_df: pd.DataFrame | None = None,
+    client: WeatherClient | None = None,
 ) -> dict:
     """
     Full pipeline: look up stadium → fetch weather → compute adjustment.
@@ -526,12 +695,16 @@ def get_weather_park_adj(
     If game_date and game_start_hour are provided, uses hourly forecast data
     averaged over start, +1hr, and +2hr to account for wind direction changes
     during the game. Otherwise falls back to current conditions.
+
+    Callers resolving many games pass the loaded ``stadium_df`` (instead of
+    re-reading ``stadium_csv``) and a shared ``WeatherClient`` (cached,
+    de-duplicated fetches; see ``resolve_weather``).
     """
     venue_name = ""
     elevation_ft = 0.0
     is_dome = False
     if canonical_id and (lat is None or lon is None):
-        sdf = load_stadium_data(stadium_csv)
+        sdf = stadium_df if stadium_df is not None else load_stadium_data(stadium_csv)
         info = get_stadium_info(canonical_id, sdf)
         if info is None:
             return {"error": f"No stadium data for {canonical_id}", "total_adj": 0.0}
@@ -547,9 +720,11 @@ def get_weather_park_adj(
     hp_bearing = hp_bearing or DEFAULT_HP_BEARING
 
     # ── Hourly mode: average weather over game duration ──────────────────
+    fetch_hourly = client.hourly if client is not None else fetch_hourly_weather
+    fetch_current = client.current if client is not None else fetch_current_weather
     hourly_detail = []
     if game_date and game_start_hour is not None:
-        hourly_data = fetch_hourly_weather(lat, lon, game_date)
+        hourly_data = fetch_hourly(lat, lon, game_date)
         if hourly_data:
             hours = get_weather_at_hours(hourly_data, game_start_hour, offsets=(0, 1, 2))
             if hours:
@@ -573,11 +748,11 @@ def get_weather_park_adj(
                     })
                 weather = average_weather(hours)
             else:
-                weather = fetch_current_weather(lat, lon)
+                weather = fetch_current(lat, lon)
         else:
-            weather = fetch_current_weather(lat, lon)
+            weather = fetch_current(lat, lon)
     else:
-        weather = fetch_current_weather(lat, lon)
+        weather = fetch_current(lat, lon)
 
     if weather is None:
         return {"error": "Weather API failed", "total_adj": 0.0}
@@ -614,6 +789,213 @@ def get_weather_park_adj(
     return adj
 
 
+# ──────────────────────────────────────────────────────────────────────────────
+# Array forms: hourly grids, full-day tables, backfills
+# ──────────────────────────────────────────────────────────────────────────────
+# Same physics, constants and rounding as the scalar functions above, with
+# every input a scalar or an array broadcast against the others (hours ×
+# stadiums, seasons of games). air_density_ratio and humidity_density_reduction
+# are plain arithmetic and already broadcast over arrays.
+
+def _as_arrays(*values) -> list[np.ndarray]:
+    return np.broadcast_arrays(*(np.asarray(v, dtype=np.float64) for v in values))
+
+
+def wind_out_directional_array(
+    wind_dir_deg,
+    wind_speed_mph,
+    hp_bearing_deg,
+) -> dict[str, np.ndarray]:
+    """Array form of ``wind_out_directional``: same keys, one array each."""
+    wind_dir, speed, bearing = _as_arrays(wind_dir_deg, wind_speed_mph, hp_bearing_deg)
+    calm = speed < CALM_WIND_MPH
+    wind_toward = (wind_dir + 180.0) % 360.0
+
+    def out_toward(b: np.ndarray) -> np.ndarray:
+        return np.where(calm, 0.0, speed * np.cos(np.radians(wind_toward - b)))
+
+    lf_bearing = (bearing - 45.0) % 360.0
+    rf_bearing = (bearing + 45.0) % 360.0
+    w_cf = out_toward(bearing)
+    w_lf = out_toward(lf_bearing)
+    w_rf = out_toward(rf_bearing)
+    w_lcf = out_toward((bearing - 22.5) % 360.0)
+    w_rcf = out_toward((bearing + 22.5) % 360.0)
+    w_eff = 0.10 * w_lf + 0.25 * w_lcf + 0.30 * w_cf + 0.25 * w_rcf + 0.10 * w_rf
+
+    return {
+        "wind_out_lf": np.round(w_lf, 1),
+        "wind_out_cf": np.round(w_cf, 1),
+        "wind_out_rf": np.round(w_rf, 1),
+        "wind_out_eff": np.round(w_eff, 1),
+        "lf_bearing": np.round(lf_bearing, 1),
+        "cf_bearing": np.round(bearing, 1),
+        "rf_bearing": np.round(rf_bearing, 1),
+    }
+
+
+def compute_weather_adjustment_array(
+    wind_speed_mph,
+    wind_direction_deg,
+    temperature_f,
+    hp_bearing_deg,
+    elevation_ft=0.0,
+    fb_sensitivity=1.0,
+    humidity_pct=50.0,
+    rain_pct=0.0,
+    wind_gusts_mph=0.0,
+    is_dome=False,
+) -> dict[str, np.ndarray]:
+    """
+    Array form of ``compute_weather_adjustment``.
+
+    Arguments broadcast together, so e.g. (stadiums, 1) bearings/elevations
+    against (stadiums, hours) weather give a (stadiums, hours) grid. Returns
+    the same keys as the scalar version, one array each; dome entries get the
+    dome bypass (altitude only).
+    """
+    (speed, wind_dir, temp, bearing, elevation, fb, humidity, rain,
+     gusts_in, dome_in) = _as_arrays(wind_speed_mph, wind_direction_deg, temperature_f,
+                                     hp_bearing_deg, elevation_ft, fb_sensitivity,
+                                     humidity_pct, rain_pct, wind_gusts_mph, is_dome)
+    dome = dome_in != 0
+
+    density_ratio = air_density_ratio(elevation)
+    alt_adj = ALTITUDE_COEFF * (1.0 - density_ratio)
+
+    gusts = np.where(gusts_in > 0, gusts_in, speed)
+    eff_wind_speed = speed * (1 - GUST_BLEND) + gusts * GUST_BLEND
+    dir_wind = wind_out_directional_array(wind_dir, eff_wind_speed, bearing)
+
+    wind_adj_raw = np.where(dome, 0.0, WIND_OUT_COEFF * dir_wind["wind_out_eff"])
+    wind_adj = wind_adj_raw * fb
+    temp_adj = np.where(dome | (temp < COLD_WEATHER_FLOOR_F), 0.0,
+                        TEMP_COEFF * (temp - TEMP_BASELINE_F))
+    humid_adj = np.where(dome, 0.0, ALTITUDE_COEFF * humidity_density_reduction(temp, humidity))
+    rain_adj = np.where(dome, 0.0, np.maximum(
+        RAIN_ADJ_FLOOR, RAIN_COEFF * np.maximum(0.0, rain - RAIN_THRESHOLD_PCT)))
+    non_wind_adj = temp_adj + alt_adj + humid_adj + rain_adj
+
+    def wind(key: str) -> np.ndarray:
+        return np.where(dome, 0.0, dir_wind[key])
+
+    # The dome branch reports its bearings unrounded
+    bearings = {"lf_bearing": (bearing - 45.0) % 360.0, "cf_bearing": bearing,
+                "rf_bearing": (bearing + 45.0) % 360.0}
+
+    return {
+        "wind_out_mph": wind("wind_out_eff"),
+        "wind_out_cf_mph": wind("wind_out_cf"),
+        "wind_out_lf_mph": wind("wind_out_lf"),
+        "wind_out_rf_mph": wind("wind_out_rf"),
+        "lf_bearing": np.where(dome, bearings["lf_bearing"], dir_wind["lf_bearing"]),
+        "cf_bearing": np.where(dome, bearings["cf_bearing"], dir_wind["cf_bearing"]),
+        "rf_bearing": np.where(dome, bearings["rf_bearing"], dir_wind["rf_bearing"]),
+        "wind_adj": np.round(wind_adj, 4),
+        "wind_adj_raw": np.round(wind_adj_raw, 4),
+        "non_wind_adj": np.round(non_wind_adj, 4),
+        "temp_adj": np.round(temp_adj, 4),
+        "alt_adj": np.round(alt_adj, 4),
+        "humid_adj": np.round(humid_adj, 4),
+        "rain_adj": np.round(rain_adj, 4),
+        "density_ratio": np.round(density_ratio, 4),
+        "elevation_ft": np.round(elevation),
+        "fb_sensitivity": np.round(fb, 3),
+        "humidity_pct": np.round(humidity, 1),
+        "total_adj": np.round(wind_adj + non_wind_adj, 4),
+        "is_dome": dome,
+    }
+
+
+_HOURLY_FIELDS = ("wind_speed_mph", "wind_direction_deg", "temperature_f", "wind_gusts_mph",
+                  "humidity_pct", "precip_prob_pct", "precipitation_mm")
+
+
+def _hourly_value(h: dict, field: str) -> float:
+    # Missing/zero humidity and precipitation read as average_weather reads them
+    if field == "humidity_pct":
+        return float(h.get(field, 50) or 50)
+    if field in ("precip_prob_pct", "precipitation_mm"):
+        return float(h.get(field, 0) or 0)
+    return float(h[field])
+
+
+def weather_day_table(
+    hourly: dict[str, list[dict]],
+    sites: dict[str, dict],
+    offsets: tuple[int, ...] = (0, 1, 2),
+) -> pd.DataFrame:
+    """
+    Weather adjustment for every possible start hour at every site, in one pass.
+
+    Args:
+        hourly: site key → one day of hourly readings (fetch_hourly_weather /
+            WeatherClient.hourly); sites with no readings are skipped
+        sites: site key → stadium info (get_stadium_info)
+        offsets: hours after start averaged over (as get_weather_park_adj)
+
+    Each start hour averages the readings at start + offsets the way
+    get_weather_park_adj does (vector-averaged wind direction; hours past the
+    end of the day dropped), so row (key, h) carries the same adjustment and
+    weather fields as get_weather_park_adj(..., game_start_hour=h). Returns
+    one row per (key, start_hour) with at least one reading.
+    """
+    keys = [k for k in hourly if hourly[k] and k in sites]
+    if not keys:
+        return pd.DataFrame(columns=["key", "start_hour"])
+
+    n_hours = max(len(hourly[k]) for k in keys)
+    grid = {f: np.full((len(keys), n_hours), np.nan) for f in _HOURLY_FIELDS}
+    for i, k in enumerate(keys):
+        for j, h in enumerate(hourly[k]):
+            for f in _HOURLY_FIELDS:
+                grid[f][i, j] = _hourly_value(h, f)
+
+    # (hours, offsets) reading index per start hour; out-of-day slots masked
+    idx = np.arange(n_hours)[:, None] + np.asarray(offsets)[None, :]
+    in_day = (idx >= 0) & (idx < n_hours)
+    idx = np.clip(idx, 0, n_hours - 1)
+    mask = in_day[None, :, :] & ~np.isnan(grid["wind_speed_mph"][:, idx])
+    n = mask.sum(axis=-1)
+    has = n > 0
+    n_safe = np.where(has, n, 1)
+
+    def mean_of(values: np.ndarray) -> np.ndarray:
+        return np.where(mask, values[:, idx], 0.0).sum(axis=-1) / n_safe
+
+    rad = np.radians(grid["wind_direction_deg"])
+    avg_dir = np.round(np.degrees(np.arctan2(mean_of(np.sin(rad)), mean_of(np.cos(rad)))) % 360, 1)
+    weather = {f: mean_of(grid[f]) for f in _HOURLY_FIELDS if f != "wind_direction_deg"}
+
+    bearing = np.array([sites[k]["hp_bearing"] or DEFAULT_HP_BEARING for k in keys])[:, None]
+    elevation = np.array([sites[k].get("elevation_ft", 0.0) for k in keys])[:, None]
+    dome = np.array([bool(sites[k].get("is_dome", False)) for k in keys])[:, None]
+    adj = compute_weather_adjustment_array(
+        weather["wind_speed_mph"], avg_dir, weather["temperature_f"], bearing,
+        elevation_ft=elevation,
+        humidity_pct=weather["humidity_pct"],
+        rain_pct=weather["precip_prob_pct"],
+        wind_gusts_mph=weather["wind_gusts_mph"],
+        is_dome=dome,
+    )
+
+    site_i, hour = np.nonzero(has)
+    cols = {"key": [keys[i] for i in site_i], "start_hour": hour}
+    cols.update({k: np.broadcast_to(v, has.shape)[has] for k, v in adj.items()})
+    cols.update({
+        "wind_speed_mph": weather["wind_speed_mph"][has],
+        "wind_dir_deg": avg_dir[has],
+        "wind_gusts_mph": weather["wind_gusts_mph"][has],
+        "precip_prob_pct": weather["precip_prob_pct"][has],
+        "precipitation_mm": weather["precipitation_mm"][has],
+        "temp_f": weather["temperature_f"][has],
+        "hp_bearing_deg": np.broadcast_to(bearing, has.shape)[has],
+    })
+    out = pd.DataFrame(cols)
+    out["weather_mode"] = "hourly_avg"
+    return out
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # CLI
 # ──────────────────────────────────────────────────────────────────────────────
@@ -0,0 +1,305 @@
+"""
+Vectorized backtest engine for the run-event model.
+
+The backtest scripts used to carry their own posterior plumbing and a scalar
+per-game, per-draw simulation loop, each slightly different from the others
+and from what ``predict_day.py`` ships (no extra innings in one, clipped
+log-rates and no park/bullpen terms in another). Everything now goes through
+this module:
+
+  - ``holdout_games`` selects finished games and indexes them exactly as the
+    fit does (``ncaa_baseball.run_event_data``);
+  - ``simulate_holdout`` runs every game through ``simulation.simulate_draws``
+    (the production engine, extra innings included) as one array computation
+    over (games x sims), chunked to bound memory;
+  - ``score_predictions`` / ``calibration_table`` compute Brier, log-loss,
+    total-runs MAE/RMSE/bias/correlation and calibration bins with NumPy.
+
+``simulate_margins`` keeps each game's sorted simulated margins instead of
+only their summary, so parameter sweeps (walk_forward_sweep.py) simulate
+once and re-score every spread scale from the stored distributions.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from ncaa_baseball.posterior import Posterior
+from ncaa_baseball.run_event_data import (
+    bullpen_columns,
+    game_offsets,
+    index_games,
+    park_factor_column,
+)
+from ncaa_baseball.simulation import TOTAL_LINE, GameOffsets, simulate_draws, take_offsets
+
+
+SIMS_PER_CHUNK = 400_000   # simulated games per simulate_draws call
+CALIBRATION_EDGES = (0.0, 0.30, 0.40, 0.50, 0.60, 0.70, 1.01)
+CALIBRATION_LABELS = ("<30%", "30-40%", "40-50%", "50-60%", "60-70%", "70%+")
+LOG_LOSS_EPS = 1e-8
+
+
+# ── Games ───────────────────────────────────────────────────────────────────
+
+def holdout_games(
+    games: pd.DataFrame,
+    team_df: pd.DataFrame,
+    pitcher_df: pd.DataFrame,
+    start: str | pd.Timestamp | None = None,
+    end: str | pd.Timestamp | None = None,
+    holdout_days: int | None = None,
+) -> pd.DataFrame:
+    """Finished, indexed games in [start, end] or the last ``holdout_days`` days.
+
+    ``games`` is run_events.csv or games.csv (``game_date`` or ``date``,
+    ``home_score``/``away_score`` or ``home_total_runs``/``away_total_runs``).
+    Adds ``game_date`` (Timestamp), ``home_score``/``away_score`` (int),
+    ``actual_total`` and ``home_win``.
+    """
+    df = games.copy()
+    date_col = "game_date" if "game_date" in df.columns else "date"
+    df["game_date"] = pd.to_datetime(df[date_col], errors="coerce")
+    for side in ("home", "away"):
+        col = f"{side}_score" if f"{side}_score" in df.columns else f"{side}_total_runs"
+        df[f"{side}_score"] = pd.to_numeric(df[col], errors="coerce")
+    df = df.dropna(subset=["game_date", "home_score", "away_score"])
+
+    keep = np.ones(len(df), dtype=bool)
+    if holdout_days is not None:
+        keep &= (df["game_date"] > df["game_date"].max() - pd.Timedelta(days=holdout_days)).to_numpy()
+    if start is not None:
+        keep &= (df["game_date"] >= pd.Timestamp(start)).to_numpy()
+    if end is not None:
+        keep &= (df["game_date"] <= pd.Timestamp(end)).to_numpy()
+
+    out = index_games(df.loc[keep], team_df, pitcher_df)
+    out["home_score"] = out["home_score"].astype(int)
+    out["away_score"] = out["away_score"].astype(int)
+    out["actual_total"] = out["home_score"] + out["away_score"]
+    out["home_win"] = (out["home_score"] > out["away_score"]).astype(int)
+    return out.reset_index(drop=True)
+
+
+def holdout_offsets(
+    games: pd.DataFrame,
+    post: Posterior,
+    park_factors: Path | None = None,
+    bullpen_quality: Path | None = None,
+) -> GameOffsets:
+    """Array-valued GameOffsets for ``holdout_games`` output, covariates as in the fit."""
+    n = len(games)
+    park = park_factor_column(games, park_factors) if park_factors is not None else [0.0] * n
+    home_bp, away_bp = (bullpen_columns(games, bullpen_quality) if bullpen_quality is not None
+                        else ([0.0] * n, [0.0] * n))
+    return game_offsets(games, park, home_bp, away_bp, post.N_teams, post.N_pitchers)
+
+
+def with_constants(g: GameOffsets, home_const: np.ndarray, away_const: np.ndarray) -> GameOffsets:
+    """Add per-game fixed log-rate offsets (e.g. fatigue) to regulation and extras."""
+    return replace(g, home_const=home_const, away_const=away_const,
+                   home_const_bp=home_const, away_const_bp=away_const)
+
+
+# ── Simulation ──────────────────────────────────────────────────────────────
+
+def _simulated_chunks(post: Posterior, g: GameOffsets, n_sims: int, rng: np.random.Generator):
+    """Yield (home, away, exp_h, exp_a), each (games, n_sims), over chunks of whole games."""
+    n_games = len(np.atleast_1d(g.h_idx))
+    per_chunk = max(1, SIMS_PER_CHUNK // max(n_sims, 1))
+    for start in range(0, n_games, per_chunk):
+        games = np.arange(start, min(start + per_chunk, n_games))
+        rows = np.repeat(games, n_sims)
+        d = rng.integers(0, post.n_draws, size=rows.size)
+        yield tuple(
+            x.reshape(games.size, n_sims)
+            for x in simulate_draws(post, take_offsets(g, rows), d, rng)
+        )
+
+
+def simulate_holdout(
+    post: Posterior,
+    g: GameOffsets,
+    n_sims: int,
+    rng: np.random.Generator,
+) -> pd.DataFrame:
+    """Per-game prediction columns for every game in array-valued ``g``.
+
+    Games are tiled ``n_sims`` times and simulated together through
+    ``simulate_draws``; chunks of whole games keep each call near
+    SIMS_PER_CHUNK simulated games.
+    """
+    parts = []
+    for home, away, exp_h, exp_a in _simulated_chunks(post, g, n_sims, rng):
+        margin = home - away
+        parts.append(pd.DataFrame({
+            "home_win_prob": np.mean(margin > 0, axis=1),
+            "exp_home": exp_h.mean(axis=1),
+            "exp_away": exp_a.mean(axis=1),
+            "exp_total": (exp_h + exp_a).mean(axis=1),
+            "over_prob": np.mean(home + away > TOTAL_LINE, axis=1),
+            "home_rl_cover": np.mean(margin > 1.5, axis=1),
+            "away_rl_cover": np.mean(margin < -1.5, axis=1),
+        }))
+    if not parts:
+        return pd.DataFrame(columns=["home_win_prob", "exp_home", "exp_away", "exp_total",
+                                     "over_prob", "home_rl_cover", "away_rl_cover"])
+    return pd.concat(parts, ignore_index=True)
+
+
+@dataclass(frozen=True)
+class MarginDistributions:
+    """Simulated home-minus-away run margins, sorted per game.
+
+    margins     (n_games, n_sims) float32, ascending along axis 1
+    exp_margin  (n_games,)        mean expected margin (exp_home - exp_away)
+    """
+
+    margins: np.ndarray
+    exp_margin: np.ndarray
+
+    def home_win_prob(self, spread_scale: float = 1.0) -> np.ndarray:
+        """P(home wins) with each game's expected margin scaled by ``spread_scale``.
+
+        The scale stretches the model's predicted gap between the teams
+        (``spread_scale * exp_margin``) and keeps the game's own run noise,
+        i.e. margin + (spread_scale - 1) * exp_margin > 0. Scale 1.0 is
+        exactly ``simulate_holdout``'s home_win_prob for the same seed.
+        """
+        n_games, n_sims = self.margins.shape
+        if n_games == 0:
+            return np.zeros(0)
+        cut = -(float(spread_scale) - 1.0) * self.exp_margin
+        rank = np.empty(n_games, dtype=np.int64)
+        for i in range(n_games):
+            rank[i] = np.searchsorted(self.margins[i], cut[i], side="right")
+        return (n_sims - rank) / n_sims
+
+
+def simulate_margins(
+    post: Posterior,
+    g: GameOffsets,
+    n_sims: int,
+    rng: np.random.Generator,
+) -> MarginDistributions:
+    """Simulate every game in ``g`` once and keep its margin distribution.
+
+    Same chunks and random stream as ``simulate_holdout``, so scale 1.0
+    reproduces its win probabilities draw for draw.
+    """
+    margins, exp_margin = [], []
+    for home, away, exp_h, exp_a in _simulated_chunks(post, g, n_sims, rng):
+        margins.append(np.sort((home - away).astype(np.float32), axis=1))
+        exp_margin.append((exp_h - exp_a).mean(axis=1))
+    if not margins:
+        return MarginDistributions(np.zeros((0, n_sims), dtype=np.float32), np.zeros(0))
+    return MarginDistributions(np.concatenate(margins), np.concatenate(exp_margin))
+
+
+def run_backtest(
+    post: Posterior,
+    games: pd.DataFrame,
+    g: GameOffsets,
+    n_sims: int,
+    seed: int = 42,
+) -> pd.DataFrame:
+    """``games`` (from ``holdout_games``) with the simulated prediction columns."""
+    preds = simulate_holdout(post, g, n_sims, np.random.default_rng(seed))
+    return pd.concat([games.reset_index(drop=True), preds], axis=1)
+
+
+# ── Scoring ─────────────────────────────────────────────────────────────────
+
+def calibration_table(
+    prob: np.ndarray,
+    outcome: np.ndarray,
+    edges: tuple[float, ...] = CALIBRATION_EDGES,
+    labels: tuple[str, ...] = CALIBRATION_LABELS,
+) -> pd.DataFrame:
+    """Reliability bins: n, mean predicted, actual rate and gap (empty bins dropped)."""
+    prob = np.asarray(prob, dtype=float)
+    outcome = np.asarray(outcome, dtype=float)
+    nbins = len(edges) - 1
+    b = np.digitize(prob, edges[1:-1])
+    inside = (prob >= edges[0]) & (prob < edges[-1])
+    n = np.bincount(b[inside], minlength=nbins)
+    pred = np.bincount(b[inside], weights=prob[inside], minlength=nbins)
+    act = np.bincount(b[inside], weights=outcome[inside], minlength=nbins)
+    has = n > 0
+    pred_mean = pred[has] / n[has]
+    actual_pct = act[has] / n[has]
+    return pd.DataFrame({
+        "bin": np.asarray(labels)[has],
+        "lo": np.asarray(edges[:-1])[has],
+        "hi": np.asarray(edges[1:])[has],
+        "n": n[has],
+        "pred_mean": pred_mean,
+        "actual_pct": actual_pct,
+        "gap": actual_pct - pred_mean,
+    })
+
+
+def score_predictions(
+    home_win_prob: np.ndarray,
+    home_win: np.ndarray,
+    exp_total: np.ndarray,
+    actual_total: np.ndarray,
+) -> dict:
+    """Win-probability and total-runs metrics for a set of games."""
+    p = np.asarray(home_win_prob, dtype=float)
+    y = np.asarray(home_win, dtype=float)
+    et = np.asarray(exp_total, dtype=float)
+    at = np.asarray(actual_total, dtype=float)
+    n = len(p)
+    if n == 0:
+        return {"n_games": 0}
+    pc = np.clip(p, LOG_LOSS_EPS, 1 - LOG_LOSS_EPS)
+    brier = float(np.mean((p - y) ** 2))
+    brier_baseline = float(np.mean((y.mean() - y) ** 2))
+    err = et - at
+    return {
+        "n_games": n,
+        "brier_score": brier,
+        "brier_baseline": brier_baseline,
+        "brier_skill": 1 - brier / brier_baseline if brier_baseline > 0 else 0.0,
+        "log_loss": float(-np.mean(y * np.log(pc) + (1 - y) * np.log(1 - pc))),
+        "accuracy": float(np.mean((p > 0.5) == (y == 1))),
+        "actual_home_pct": float(y.mean()),
+        "pred_home_pct": float(p.mean()),
+        "total_mae": float(np.mean(np.abs(err))),
+        "total_rmse": float(np.sqrt(np.mean(err ** 2))),
+        "total_bias": float(np.mean(err)),
+        "total_corr": float(np.corrcoef(et, at)[0, 1]) if n > 2 else 0.0,
+        "mean_exp_total": float(et.mean()),
+        "mean_actual_total": float(at.mean()),
+    }
+
+
+def print_report(metrics: dict, bins: pd.DataFrame, title: str) -> None:
+    """Human-readable summary shared by the backtest scripts."""
+    print(f"\n{'=' * 60}")
+    print(f"  {title} — {metrics['n_games']} games")
+    print(f"{'=' * 60}")
+    if not metrics["n_games"]:
+        return
+    print("\n  WIN PROBABILITY:")
+    print(f"    Brier Score: {metrics['brier_score']:.4f}  (baseline {metrics['brier_baseline']:.4f}, "
+          f"skill {metrics['brier_skill']:.3f})")
+    print(f"    Log Loss:    {metrics['log_loss']:.4f}  (coin flip = 0.693)")
+    print(f"    Accuracy:    {metrics['accuracy']:.1%}")
+    print(f"    Home win: actual={metrics['actual_home_pct']:.1%}  "
+          f"predicted={metrics['pred_home_pct']:.1%}")
+    print(f"\n    {'Bin':>10s} {'N':>5s} {'Pred':>7s} {'Actual':>7s} {'Gap':>7s}")
+    print(f"    {'-' * 40}")
+    for b in bins.itertuples():
+        print(f"    {b.bin:>10s} {b.n:>5d} {b.pred_mean:>6.1%} {b.actual_pct:>6.1%} {b.gap:>+6.1%}")
+    print("\n  TOTAL SCORING:")
+    print(f"    MAE:  {metrics['total_mae']:.2f} runs")
+    print(f"    RMSE: {metrics['total_rmse']:.2f} runs")
+    print(f"    Bias: {metrics['total_bias']:+.2f} runs (positive = model too high)")
+    print(f"    Corr: {metrics['total_corr']:.3f}")
+    print(f"    Avg actual: {metrics['mean_actual_total']:.2f}  "
+          f"Avg predicted: {metrics['mean_exp_total']:.2f}")
@@ -0,0 +1,278 @@
+"""
+Typed, cached access to the tables in data/processed.
+
+Every pipeline step used to ``pd.read_csv(..., dtype=str)`` the same tables
+(pitcher_appearances, games, team_table, ...) and re-coerce the numeric
+columns by hand, so one ``predict_day`` run parsed pitcher_appearances.csv
+three times. This module declares a schema per table and gives one reader:
+
+* ``read_table(path, columns=None)`` returns the table with declared dtypes
+  (ids and text as strings with NaN for missing, exactly as ``dtype=str``
+  reads them; counts as nullable ``Int64``; measurements as ``float64``;
+  flags as ``bool``/``boolean``). Columns not in the schema read as strings.
+  Only the requested columns are parsed, and each parsed column is cached
+  in-process by the file's path, mtime and size, so later steps (and later
+  projections) reuse it. Every call returns a fresh copy.
+* ``write_table(df, path)`` writes the CSV as before and, when pyarrow is
+  installed, a typed ``.parquet`` next to it. Readers prefer the Parquet
+  file whenever it is at least as new as the CSV, so a CSV rewritten by an
+  older script is never shadowed by a stale Parquet file.
+* ``export_csv(path)`` regenerates the CSV from the Parquet file on demand
+  (``write_table(..., csv=False)`` skips it at build time).
+
+Without pyarrow everything falls back to the CSVs, with the same dtypes.
+"""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+try:  # Optional: Parquet storage. Without it tables are read from CSV.
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - depends on the environment
+    pq = None
+
+
+DEFAULT_DATA_DIR = Path("data/processed")
+
+# ── Schemas ──────────────────────────────────────────────────────────────────
+# dtype vocabulary: "object" (text/ids), "Int64", "float64", "bool", "boolean".
+
+RUN_EVENT_KEYS = ("run_1", "run_2", "run_3", "run_4")
+
+SCHEMAS: dict[str, dict[str, str]] = {
+    "games": {
+        "event_id": "object", "game_date": "object", "season": "Int64",
+        "home_name": "object", "away_name": "object",
+        "home_canonical_id": "object", "away_canonical_id": "object",
+        "home_score": "Int64", "away_score": "Int64", "winner_home": "boolean",
+        "venue_name": "object", "venue_city": "object", "venue_state": "object",
+        "neutral_site": "bool",
+        "home_pitcher_espn_id": "object", "away_pitcher_espn_id": "object",
+        "home_pitcher_name": "object", "away_pitcher_name": "object",
+        "has_run_events": "bool", "has_boxscore": "bool",
+    },
+    "run_events": {
+        "event_id": "object", "game_date": "object", "season": "Int64",
+        "home_canonical_id": "object", "away_canonical_id": "object",
+        "home_pitcher_espn_id": "object", "away_pitcher_espn_id": "object",
+        **{f"{side}_{k}": "Int64" for side in ("home", "away") for k in RUN_EVENT_KEYS},
+        "home_score": "Int64", "away_score": "Int64",
+    },
+    "pitcher_appearances": {
+        "event_id": "object", "game_date": "object", "season": "Int64",
+        "pitcher_espn_id": "object", "pitcher_id": "object", "pitcher_name": "object",
+        "team_canonical_id": "object", "team_name": "object", "side": "object",
+        "starter": "bool", "role": "object",
+        "ip": "float64", "h": "Int64", "r": "Int64", "er": "Int64",
+        "bb": "Int64", "k": "Int64", "hr": "Int64", "pc": "float64",
+    },
+    "pitcher_table": {
+        "pitcher_espn_id": "object", "pitcher_idx": "Int64", "pitcher_name": "object",
+        "team_canonical_id": "object", "season": "Int64", "throws": "object",
+        "role": "object", "season_ip": "float64", "season_era": "float64",
+        "fip": "float64", "siera": "float64", "fb_pct": "float64",
+        "fb_sensitivity": "float64", "d1b_ability_adj": "float64",
+        "d1b_ability_source": "object", "n_appearances": "Int64",
+        "last_appearance": "object",
+    },
+    "team_table": {
+        "canonical_id": "object", "team_idx": "Int64", "team_name": "object",
+        "conference": "object", "season": "Int64",
+        "bullpen_quality_z": "float64", "bullpen_adj": "float64",
+        "wrc_plus": "float64", "wrc_offense_adj": "float64",
+        "conf_strength_adj": "float64", "batting_fb_pct": "float64",
+        "batting_fb_factor": "float64", "pct_rhb": "float64", "pct_lhb": "float64",
+        "effective_rhb_frac": "float64", "n_games": "Int64",
+    },
+    "player_registry": {
+        "canonical_id": "object", "team_name": "object", "conference": "object",
+        "player_name": "object", "position": "object", "bats": "object",
+        "throws": "object", "is_pitcher": "boolean", "is_batter": "boolean",
+        "pitcher_idx": "Int64", "fip": "float64", "era": "float64",
+        "wrc_plus": "float64", "season": "Int64", "sources": "object",
+    },
+}
+
+# The dtype ``read_csv(dtype=str)`` produces (object on pandas 2, str on 3).
+_TEXT = pd.Series(["x"], dtype=str).dtype
+_BOOL_TEXT = {"true": True, "false": False, "1": True, "0": False}
+
+
+def parquet_available() -> bool:
+    return pq is not None
+
+
+# ── Paths ────────────────────────────────────────────────────────────────────
+
+def table_paths(table: str | Path, data_dir: Path = DEFAULT_DATA_DIR) -> tuple[Path, Path]:
+    """(csv, parquet) paths for a table name or a path to either file."""
+    p = Path(table)
+    if p.suffix not in (".csv", ".parquet"):
+        p = Path(data_dir) / f"{p.name}.csv"
+    return p.with_suffix(".csv"), p.with_suffix(".parquet")
+
+
+def schema_for(table: str | Path) -> dict[str, str]:
+    """Declared dtypes for a table (by file stem); {} for undeclared tables."""
+    return SCHEMAS.get(Path(table).with_suffix("").name, {})
+
+
+def _source(csv_path: Path, pq_path: Path) -> tuple[Path, str]:
+    """The file to read: Parquet when available and not older than the CSV."""
+    if pq is not None and pq_path.exists():
+        if not csv_path.exists() or pq_path.stat().st_mtime_ns >= csv_path.stat().st_mtime_ns:
+            return pq_path, "parquet"
+    return csv_path, "csv"
+
+
+# ── Coercion ─────────────────────────────────────────────────────────────────
+
+def _as_text(s: pd.Series) -> pd.Series:
+    out = s.astype(object).where(s.notna(), np.nan)
+    return out if _TEXT == object else out.astype(_TEXT)
+
+
+def coerce(s: pd.Series, dtype: str) -> pd.Series:
+    """Cast one column (raw text or already typed) to a schema dtype.
+
+    Unparseable numbers become missing, as the callers' ``to_numeric(...,
+    errors="coerce")`` did. An ``Int64`` column holding fractional values
+    stays ``float64`` rather than failing the read.
+    """
+    if dtype == "object":
+        return _as_text(s)
+    if dtype in ("bool", "boolean"):
+        if s.dtype == bool or s.dtype == "boolean":
+            flags = s.astype("boolean")
+        else:
+            flags = s.map(lambda v: _BOOL_TEXT.get(str(v).strip().lower()) if pd.notna(v) else None)
+            flags = flags.astype("boolean")
+        return flags.astype(bool) if dtype == "bool" and not flags.isna().any() else flags
+    num = pd.to_numeric(s, errors="coerce")
+    if dtype == "Int64":
+        vals = num.to_numpy(dtype=np.float64, na_value=np.nan)
+        finite = vals[~np.isnan(vals)]
+        if np.all(finite == np.round(finite)):
+            return num.astype("Int64")
+    return num.astype(np.float64)
+
+
+def conform(df: pd.DataFrame, schema: dict[str, str]) -> pd.DataFrame:
+    """Copy of ``df`` with every declared column cast; other columns as text."""
+    out = df.copy()
+    for c in out.columns:
+        dtype = schema.get(c)
+        if dtype is not None:
+            out[c] = coerce(out[c], dtype)
+        elif out[c].dtype == object:
+            out[c] = _as_text(out[c].map(lambda v: v if pd.isna(v) or isinstance(v, str) else str(v)))
+    return out
+
+
+# ── Reading ──────────────────────────────────────────────────────────────────
+
+class _Entry:
+    """Parsed columns of one table file, valid while its stamp is unchanged."""
+
+    def __init__(self, stamp: tuple, order: list[str]) -> None:
+        self.stamp = stamp
+        self.order = order
+        self.columns: dict[str, pd.Series] = {}
+
+
+# csv path -> _Entry. One entry per table, so a rewritten file replaces its
+# stale columns instead of accumulating.
+_CACHE: dict[str, _Entry] = {}
+
+
+def clear_table_cache() -> None:
+    """Drop every cached column (tests, long-lived notebooks)."""
+    _CACHE.clear()
+
+
+def cache_info() -> dict[str, list[str]]:
+    """Table path -> names of the columns parsed so far."""
+    return {key: list(e.columns) for key, e in _CACHE.items()}
+
+
+def _header(path: Path, kind: str) -> list[str]:
+    if kind == "parquet":
+        return list(pq.read_schema(path).names)
+    return list(pd.read_csv(path, nrows=0).columns)
+
+
+def _read_columns(path: Path, kind: str, columns: list[str], schema: dict[str, str]) -> pd.DataFrame:
+    if kind == "parquet":
+        df = pd.read_parquet(path, columns=columns)
+    else:
+        df = pd.read_csv(path, usecols=columns, dtype=str)
+    return conform(df, schema)
+
+
+def read_table(
+    table: str | Path,
+    columns: list[str] | None = None,
+    data_dir: Path = DEFAULT_DATA_DIR,
+) -> pd.DataFrame:
+    """Read a processed table with its declared dtypes, parsing each column once.
+
+    ``table`` is a table name (resolved under ``data_dir``) or a path to its
+    ``.csv`` or ``.parquet`` file. ``columns`` projects the read (in that
+    order); a missing column raises KeyError. The returned frame is a copy
+    the caller may modify freely.
+    """
+    csv_path, pq_path = table_paths(table, data_dir)
+    path, kind = _source(csv_path, pq_path)
+    st = path.stat()  # FileNotFoundError for a missing table, as read_csv
+    stamp = (str(path.resolve()), st.st_mtime_ns, st.st_size)
+    key = str(csv_path.resolve())
+    entry = _CACHE.get(key)
+    if entry is None or entry.stamp != stamp:
+        entry = _CACHE[key] = _Entry(stamp, _header(path, kind))
+
+    wanted = entry.order if columns is None else list(columns)
+    missing = [c for c in wanted if c not in entry.order]
+    if missing:
+        raise KeyError(f"{path.name} has no columns {missing}")
+    todo = [c for c in wanted if c not in entry.columns]
+    if todo:
+        parsed = _read_columns(path, kind, todo, schema_for(csv_path))
+        entry.columns.update({c: parsed[c] for c in todo})
+    return pd.DataFrame({c: entry.columns[c] for c in wanted}, columns=wanted, copy=True)
+
+
+# ── Writing ──────────────────────────────────────────────────────────────────
+
+def _replace(path: Path, write) -> None:
+    tmp = path.with_name(f".{path.name}.tmp")
+    write(tmp)
+    os.replace(tmp, path)
+
+
+def write_table(df: pd.DataFrame, table: str | Path, data_dir: Path = DEFAULT_DATA_DIR,
+                csv: bool = True) -> None:
+    """Write a table: the CSV exactly as ``df.to_csv`` and, with pyarrow, typed Parquet.
+
+    The Parquet file is written last so readers pick it over the CSV. With
+    ``csv=False`` only the Parquet file is written (use ``export_csv`` when a
+    CSV is needed); without pyarrow the CSV is always written.
+    """
+    csv_path, pq_path = table_paths(table, data_dir)
+    csv_path.parent.mkdir(parents=True, exist_ok=True)
+    if csv or pq is None:
+        _replace(csv_path, lambda tmp: df.to_csv(tmp, index=False))
+    if pq is not None:
+        typed = conform(df, schema_for(csv_path))
+        _replace(pq_path, lambda tmp: typed.to_parquet(tmp, index=False))
+
+
+def export_csv(table: str | Path, data_dir: Path = DEFAULT_DATA_DIR) -> Path:
+    """(Re)write a table's CSV from its stored data; returns the CSV path."""
+    csv_path, _ = table_paths(table, data_dir)
+    df = read_table(table, data_dir=data_dir)
+    _replace(csv_path, lambda tmp: df.to_csv(tmp, index=False))
+    return csv_path
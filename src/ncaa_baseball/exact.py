@@ -0,0 +1,272 @@
+"""
+Analytic ("exact") run-distribution engine for the run-event model.
+
+For a fixed posterior draw a team's 9-inning score is
+
+    1*run_1 + 2*run_2 + 3*run_3 + 5.4*run_4
+
+with independent NegBin (run_1/2) and Poisson (run_3/4) counts, so its
+distribution is the convolution of four count PMFs placed on a runs grid.
+With a 0.2-run grid every multiplier is an integer step (5, 10, 15, 27), so
+the grid is exact rather than an approximation.
+
+All convolutions are done in the Fourier domain on one circular grid of
+``EXACT_GRID`` steps: the home score spectrum times the away spectrum gives
+the total, times its conjugate gives the margin. Extra innings are resolved
+analytically per draw: bullpen-only innings at 1/9 rate are played until one
+inning is not tied (a geometric series over at most MAX_EXTRA_INNINGS
+innings), after which the remaining tie goes to a coin flip worth one run,
+exactly as in the sampling engine.
+
+Per-draw margin/total distributions are averaged over a subsample of
+posterior draws; the only remaining noise is which draws were used, which is
+what ``home_win_ci_*`` reports for this engine.
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+
+import numpy as np
+
+from ncaa_baseball.posterior import Posterior
+from ncaa_baseball.simulation import (
+    MAX_EXTRA_INNINGS,
+    RL_STEPS,
+    RUN_MULT,
+    TOTAL_LINE,
+    GameOffsets,
+    draw_log_rates,
+    draw_log_rates_bp,
+)
+
+
+# Runs per grid step and the run-event multipliers expressed in grid steps.
+RUN_GRID_STEP = 0.2
+RUN_STEPS = np.rint(RUN_MULT / RUN_GRID_STEP).astype(int)
+assert np.allclose(RUN_STEPS * RUN_GRID_STEP, RUN_MULT), "RUN_MULT must sit on the runs grid"
+
+# Circular grid length: totals up to ~102 runs and margins within ±51 runs
+# are represented without wrap-around (probability mass beyond is ~0).
+EXACT_GRID = 512
+
+# Default number of posterior draws averaged per game, and how many are
+# transformed per batch (keeps the (4 * batch, grid) work arrays cache-sized).
+EXACT_DRAWS = 100
+EXACT_BATCH = 32
+
+# One run (the extra-innings coin flip) in grid steps.
+_ONE_RUN = int(round(1.0 / RUN_GRID_STEP))
+
+
+def _negbin_pmf(mu: np.ndarray, theta: np.ndarray, kmax: int) -> np.ndarray:
+    """NegBin(mean mu, dispersion theta) PMF for counts 0..kmax-1, shape (n, kmax)."""
+    th = np.maximum(1e-6, theta)[:, None]
+    mu = np.maximum(1e-8, mu)[:, None]
+    p = th / (th + mu)
+    k = np.arange(1, kmax)[None, :]
+    pmf = np.empty((mu.shape[0], kmax))
+    pmf[:, :1] = p ** th
+    pmf[:, 1:] = pmf[:, :1] * np.cumprod((k - 1 + th) / k * (1.0 - p), axis=1)
+    return pmf
+
+
+def _poisson_pmf(mu: np.ndarray, kmax: int) -> np.ndarray:
+    """Poisson(mu) PMF for counts 0..kmax-1, shape (n, kmax)."""
+    mu = np.maximum(1e-8, mu)[:, None]
+    k = np.arange(1, kmax)[None, :]
+    pmf = np.empty((mu.shape[0], kmax))
+    pmf[:, :1] = np.exp(-mu)
+    pmf[:, 1:] = pmf[:, :1] * np.cumprod(mu / k, axis=1)
+    return pmf
+
+
+@lru_cache(maxsize=8)
+def _component_basis(step: int, grid: int) -> tuple[int, np.ndarray, np.ndarray]:
+    """(kmax, cos, sin) DFT rows for counts 0..kmax-1 placed every ``step`` grid points.
+
+    Only counts whose runs stay on the positive half of the circular grid are
+    kept. A component has few nonzeros (kmax <= 52), so its spectrum is a
+    small matrix product rather than a full-length FFT.
+    """
+    kmax = (grid // 2 - 1) // step + 1
+    phase = 2.0 * np.pi * np.outer(np.arange(kmax) * step, np.arange(grid // 2 + 1)) / grid
+    return kmax, np.cos(phase), np.sin(phase)
+
+
+def score_spectrum(mu: np.ndarray, theta: np.ndarray, grid: int = EXACT_GRID) -> np.ndarray:
+    """rfft of the score PMF on the runs grid for (n, 4) event rates."""
+    spec = np.ones((mu.shape[0], grid // 2 + 1), dtype=np.complex128)
+    for k, step in enumerate(RUN_STEPS):
+        kmax, cos, sin = _component_basis(int(step), grid)
+        if k < 2:
+            pmf = _negbin_pmf(mu[:, k], theta[:, k], kmax)
+        else:
+            pmf = _poisson_pmf(mu[:, k], kmax)
+        spec *= (pmf @ cos) - 1j * (pmf @ sin)
+    return spec
+
+
+def _diagonal_spectrum(p_h: np.ndarray, p_a: np.ndarray, grid: int) -> np.ndarray:
+    """Spectrum of the total for tied outcomes: mass P(h=s)P(a=s) at 2s."""
+    tied = np.zeros_like(p_h)
+    half = grid // 2
+    tied[:, ::2] = (p_h * p_a)[:, :half]
+    return np.fft.rfft(tied, axis=1)
+
+
+def _int_power(x: np.ndarray, k: int) -> np.ndarray:
+    """x**k for a small positive integer k by repeated squaring (no complex pow)."""
+    out = None
+    while k:
+        if k & 1:
+            out = x if out is None else out * x
+        k >>= 1
+        if k:
+            x = x * x
+    return out
+
+
+def _grid_shift(steps: int, grid: int) -> np.ndarray:
+    """rfft of a unit mass at +steps on the circular grid."""
+    w = np.arange(grid // 2 + 1)
+    return np.exp(-2j * np.pi * w * steps / grid)
+
+
+def game_distributions(
+    post: Posterior,
+    g: GameOffsets,
+    d: np.ndarray,
+    grid: int = EXACT_GRID,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Exact final margin/total distributions for posterior draws ``d``.
+
+    Returns (margin_pmf, total_pmf, exp_home, exp_away): the PMFs are
+    (len(d), grid) on the runs grid (margin index m < 0 stored at grid + m),
+    exp_* are the per-draw expected regulation runs.
+    """
+    n = len(d)
+    theta = post.theta_run[d]
+
+    # Score spectra for regulation (9 innings at full rate) and one
+    # bullpen-only extra inning (1/9 rate), home and away, in one batch.
+    log_h, log_a = draw_log_rates(post, g, d)
+    log_h_bp, log_a_bp = draw_log_rates_bp(post, g, d)
+    mu_h = np.exp(log_h)
+    mu_a = np.exp(log_a)
+    mu = np.concatenate([mu_h, mu_a, np.exp(log_h_bp) / 9.0, np.exp(log_a_bp) / 9.0])
+    spec = score_spectrum(mu, np.tile(theta, (4, 1)), grid)
+    pmf = np.fft.irfft(spec, grid, axis=1)
+    f_h, f_a, f_hi, f_ai = (spec[i * n:(i + 1) * n] for i in range(4))
+    p_h, p_a, p_hi, p_ai = (pmf[i * n:(i + 1) * n] for i in range(4))
+
+    p_tie = np.sum(p_h * p_a, axis=1)  # P(regulation tied)
+    q = np.sum(p_hi * p_ai, axis=1)    # P(extra inning tied)
+    f_tie_total, f_inn_tie = np.split(
+        _diagonal_spectrum(np.concatenate([p_h, p_hi]), np.concatenate([p_a, p_ai]), grid), 2)
+    f_inn_dec = f_hi * f_ai - f_inn_tie
+
+    # Innings are played while tied: j tied innings then a deciding one
+    # (j < MAX_EXTRA_INNINGS), else a coin flip adding one run to one side.
+    # |f_inn_tie| <= q < 1, so the geometric sums have closed forms.
+    power = _int_power(f_inn_tie, MAX_EXTRA_INNINGS)
+    geo_total = (1.0 - power) / (1.0 - f_inn_tie)
+    q_all = q ** MAX_EXTRA_INNINGS
+    geo_margin = (1.0 - q_all) / np.maximum(1e-12, 1.0 - q)
+    shift_one = _grid_shift(_ONE_RUN, grid)
+    f_extra_total = f_inn_dec * geo_total + power * shift_one
+    f_extra_margin = ((f_hi * np.conj(f_ai) - q[:, None]) * geo_margin[:, None]
+                      + q_all[:, None] * shift_one.real)
+
+    f_margin = (f_h * np.conj(f_a) - p_tie[:, None]
+                + p_tie[:, None] * f_extra_margin)
+    f_total = f_h * f_a - f_tie_total + f_tie_total * f_extra_total
+
+    margin, total = np.split(
+        np.clip(np.fft.irfft(np.concatenate([f_margin, f_total]), grid, axis=1), 0.0, None), 2)
+    return margin, total, mu_h @ RUN_MULT, mu_a @ RUN_MULT
+
+
+def _pmf_quantile(values: np.ndarray, pmf: np.ndarray, q: float) -> float:
+    """Smallest value whose CDF reaches q (values sorted ascending)."""
+    cdf = np.cumsum(pmf)
+    i = int(np.searchsorted(cdf, q * cdf[-1]))
+    return float(values[min(i, len(values) - 1)])
+
+
+def summarize_distributions(
+    margin: np.ndarray,
+    total: np.ndarray,
+    exp_h: np.ndarray,
+    exp_a: np.ndarray,
+) -> dict:
+    """Aggregate per-draw margin/total PMFs into the sampling engine's stat columns."""
+    grid = margin.shape[1]
+    half = grid // 2
+    # Grid index -> signed margin in steps (negative margins wrap to the top).
+    m_steps = np.where(np.arange(grid) < half, np.arange(grid), np.arange(grid) - grid)
+
+    win_d = margin[:, m_steps > 0].sum(axis=1) / margin.sum(axis=1)
+    win_prob = float(np.mean(win_d))
+    n = len(win_d)
+    win_se = float(np.std(win_d, ddof=1) / np.sqrt(n)) if n > 1 else 0.0
+
+    margin_pmf = margin.mean(axis=0)
+    margin_pmf /= margin_pmf.sum()
+    total_pmf = total.mean(axis=0)
+    total_pmf /= total_pmf.sum()
+    margin_runs = m_steps * RUN_GRID_STEP
+    total_runs = np.arange(grid) * RUN_GRID_STEP
+
+    order = np.argsort(m_steps)
+    m_sorted, pm_sorted = margin_runs[order], margin_pmf[order]
+    exp_home = float(np.mean(exp_h))
+    exp_away = float(np.mean(exp_a))
+
+    def p_margin(mask: np.ndarray) -> float:
+        return float(margin_pmf[mask].sum())
+
+    # Quantiles are integer-truncated like the sampling engine's scores.
+    out = {
+        "home_win_prob": win_prob,
+        "away_win_prob": 1 - win_prob,
+        "exp_home": exp_home,
+        "exp_away": exp_away,
+        "exp_total": exp_home + exp_away,
+        "home_win_ci_lo": max(0.0, win_prob - 1.96 * win_se),
+        "home_win_ci_hi": min(1.0, win_prob + 1.96 * win_se),
+        "exp_total_p10": float(np.trunc(_pmf_quantile(total_runs, total_pmf, 0.10))),
+        "exp_total_p50": float(np.trunc(_pmf_quantile(total_runs, total_pmf, 0.50))),
+        "exp_total_p90": float(np.trunc(_pmf_quantile(total_runs, total_pmf, 0.90))),
+        "margin_p10": float(np.trunc(_pmf_quantile(m_sorted, pm_sorted, 0.10))),
+        "margin_p50": float(np.trunc(_pmf_quantile(m_sorted, pm_sorted, 0.50))),
+        "margin_p90": float(np.trunc(_pmf_quantile(m_sorted, pm_sorted, 0.90))),
+        "home_rl_cover": p_margin(margin_runs > 1.5),
+        "away_rl_cover": p_margin(margin_runs < -1.5),
+    }
+    eps = RUN_GRID_STEP / 2
+    for k in RL_STEPS:
+        out[f"home_win_by_{k}plus"] = p_margin(margin_runs >= k - eps)
+        out[f"away_win_by_{k}plus"] = p_margin(margin_runs <= -k + eps)
+    out["over_prob"] = float(total_pmf[total_runs > TOTAL_LINE].sum())
+    out["n_sims_used"] = n
+    return out
+
+
+def exact_draw_indices(post: Posterior, n_draws: int, rng: np.random.Generator) -> np.ndarray:
+    """Posterior draws to average over: all of them, or a subsample without replacement."""
+    if n_draws >= post.n_draws:
+        return np.arange(post.n_draws)
+    return np.sort(rng.choice(post.n_draws, size=n_draws, replace=False))
+
+
+def exact_game(
+    post: Posterior,
+    g: GameOffsets,
+    n_draws: int,
+    rng: np.random.Generator,
+) -> dict:
+    """Exact win/runline/total columns for one game averaged over ``n_draws`` draws."""
+    d = exact_draw_indices(post, n_draws, rng)
+    parts = [game_distributions(post, g, d[i:i + EXACT_BATCH])
+             for i in range(0, len(d), EXACT_BATCH)]
+    return summarize_distributions(*(np.concatenate(x) for x in zip(*parts)))
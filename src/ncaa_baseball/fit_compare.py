@@ -0,0 +1,148 @@
+"""
+Compare an approximate run-event fit (Pathfinder / Laplace / ADVI) with NUTS.
+
+``fit_run_event_model.py --method`` can replace the NUTS sampler with one of
+CmdStan's fast approximations for intraday refits. Whether that is safe
+depends on how far the approximation moves the numbers we bet on, so every
+approximate fit is compared with the last NUTS reference:
+
+  - parameter deltas: posterior mean and SD of every model parameter, with the
+    mean shift in units of the NUTS SD and the SD ratio (ADVI and Laplace tend
+    to under-disperse);
+  - win-prob deltas on a slate of games, computed with the exact engine so the
+    differences carry no Monte Carlo noise; when the slate has results, Brier
+    scores for both fits as well.
+
+``safe_for_intraday`` applies the thresholds below to the summary.
+"""
+from __future__ import annotations
+
+from dataclasses import replace
+
+import numpy as np
+import pandas as pd
+
+from ncaa_baseball.exact import exact_game
+from ncaa_baseball.posterior import Posterior
+from ncaa_baseball.simulation import GameOffsets
+
+
+COMPARE_DRAWS = 200            # posterior draws averaged per game (exact engine)
+REFERENCE_DRAWS = 2000         # draws kept in the NUTS reference bundle
+SAFE_MAX_WINPROB_DELTA = 0.02  # largest |Δ home win prob| on the slate
+SAFE_MEAN_WINPROB_DELTA = 0.005
+SAFE_MAX_MEAN_SHIFT = 0.5      # |Δ mean| / NUTS SD, over the global parameters
+SAFE_MIN_SD_RATIO = 0.7        # median approx/NUTS SD over all parameters
+
+_GLOBALS = ("int_run", "theta_run", "home_adv", "beta_park", "beta_bullpen")
+
+
+def _named_columns(post: Posterior) -> dict[str, np.ndarray]:
+    """Parameter name -> (n_draws,) draws, skipping the zero 'unknown' rows."""
+    cols: dict[str, np.ndarray] = {}
+    for k in range(4):
+        cols[f"int_run[{k + 1}]"] = post.int_run[:, k]
+    for k in range(2):
+        cols[f"theta_run[{k + 1}]"] = post.theta_run[:, k]
+    cols["home_adv"] = post.home_adv
+    cols["beta_park"] = post.beta_park
+    cols["beta_bullpen"] = post.beta_bullpen
+    for t in range(1, post.N_teams + 1):
+        for k in range(4):
+            cols[f"att[{t},{k + 1}]"] = post.att[:, t, k]
+            cols[f"def_[{t},{k + 1}]"] = post.def_[:, t, k]
+    for p in range(1, post.N_pitchers + 1):
+        cols[f"pitcher_ab[{p}]"] = post.pitcher_ab[:, p]
+    return cols
+
+
+def parameter_deltas(ref: Posterior, new: Posterior) -> pd.DataFrame:
+    """Mean/SD of every parameter present in both fits, with shifts vs the reference."""
+    ref_cols = _named_columns(ref)
+    new_cols = _named_columns(new)
+    rows = []
+    for name, r in ref_cols.items():
+        if name not in new_cols:
+            continue
+        n = new_cols[name]
+        r_mean, r_sd = float(np.mean(r)), float(np.std(r))
+        n_mean, n_sd = float(np.mean(n)), float(np.std(n))
+        rows.append({
+            "param": name,
+            "global": name.split("[")[0] in _GLOBALS,
+            "ref_mean": r_mean,
+            "new_mean": n_mean,
+            "ref_sd": r_sd,
+            "new_sd": n_sd,
+            "mean_delta": n_mean - r_mean,
+            "mean_shift_sd": (n_mean - r_mean) / r_sd if r_sd > 0 else np.nan,
+            "sd_ratio": n_sd / r_sd if r_sd > 0 else np.nan,
+        })
+    return pd.DataFrame(rows)
+
+
+def pad_posterior(post: Posterior, N_teams: int, N_pitchers: int) -> Posterior:
+    """Extend a posterior to larger indices with zero (prior-mean) effects."""
+    if post.N_teams >= N_teams and post.N_pitchers >= N_pitchers:
+        return post
+    n = post.n_draws
+    att = np.zeros((n, N_teams + 1, 4))
+    def_ = np.zeros((n, N_teams + 1, 4))
+    pitcher_ab = np.zeros((n, N_pitchers + 1))
+    att[:, :post.N_teams + 1] = post.att
+    def_[:, :post.N_teams + 1] = post.def_
+    pitcher_ab[:, :post.N_pitchers + 1] = post.pitcher_ab
+    return replace(post, att=att, def_=def_, pitcher_ab=pitcher_ab,
+                   N_teams=N_teams, N_pitchers=N_pitchers)
+
+
+def slate_win_probs(post: Posterior, games: list[GameOffsets], n_draws: int = COMPARE_DRAWS,
+                    seed: int = 0) -> np.ndarray:
+    """Exact home win probability per game (same draw subsample for every game)."""
+    out = np.empty(len(games))
+    for i, g in enumerate(games):
+        out[i] = exact_game(post, g, n_draws, np.random.default_rng(seed))["home_win_prob"]
+    return out
+
+
+def compare_fits(
+    ref: Posterior,
+    new: Posterior,
+    games: list[GameOffsets],
+    home_won: np.ndarray | None = None,
+    n_draws: int = COMPARE_DRAWS,
+) -> tuple[dict, pd.DataFrame, pd.DataFrame]:
+    """(summary, per-parameter deltas, per-game win probs) for ``new`` vs ``ref``."""
+    params = parameter_deltas(ref, new)
+    p_ref = slate_win_probs(pad_posterior(ref, new.N_teams, new.N_pitchers), games, n_draws)
+    p_new = slate_win_probs(new, games, n_draws)
+    slate = pd.DataFrame({"ref_home_win_prob": p_ref, "new_home_win_prob": p_new,
+                          "delta": p_new - p_ref})
+    glob = params[params["global"]]
+    summary = {
+        "n_params": int(len(params)),
+        "n_games": int(len(games)),
+        "max_abs_mean_shift_sd_global": float(glob["mean_shift_sd"].abs().max()) if len(glob) else None,
+        "p95_abs_mean_shift_sd": float(params["mean_shift_sd"].abs().quantile(0.95)) if len(params) else None,
+        "median_sd_ratio": float(params["sd_ratio"].median()) if len(params) else None,
+        "mean_abs_winprob_delta": float(np.mean(np.abs(slate["delta"]))) if len(slate) else None,
+        "max_abs_winprob_delta": float(np.max(np.abs(slate["delta"]))) if len(slate) else None,
+    }
+    if home_won is not None and len(slate):
+        y = np.asarray(home_won, dtype=float)
+        slate["home_won"] = y
+        summary["brier_ref"] = float(np.mean((p_ref - y) ** 2))
+        summary["brier_new"] = float(np.mean((p_new - y) ** 2))
+    summary["safe_for_intraday"] = safe_for_intraday(summary)
+    return summary, params, slate
+
+
+def safe_for_intraday(summary: dict) -> bool:
+    """Thresholds for trusting an approximate fit in place of NUTS."""
+    checks = [
+        (summary.get("max_abs_winprob_delta"), lambda v: v <= SAFE_MAX_WINPROB_DELTA),
+        (summary.get("mean_abs_winprob_delta"), lambda v: v <= SAFE_MEAN_WINPROB_DELTA),
+        (summary.get("max_abs_mean_shift_sd_global"), lambda v: v <= SAFE_MAX_MEAN_SHIFT),
+        (summary.get("median_sd_ratio"), lambda v: v >= SAFE_MIN_SD_RATIO),
+    ]
+    return all(value is not None and ok(value) for value, ok in checks)
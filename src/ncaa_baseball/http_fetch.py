@@ -0,0 +1,159 @@
+"""
+Pooled, rate-limited HTTP for the sportsbook scrapers.
+
+The book scrapers (draftkings/fanduel/betmgm/betrivers) used to call
+``requests.get`` once per event with a fixed ``time.sleep`` between calls,
+one book after another. They now share one ``Fetcher``:
+
+* one ``requests.Session`` (HTTP keep-alive, connection pool sized to the
+  worker count) instead of a new connection per request;
+* a token bucket per host, so each book is held to its own request rate
+  however many threads are fetching from it (this replaces the sleeps);
+* ``map`` to fetch a book's events concurrently, within that rate.
+
+``pull_direct_odds.pull_all_direct`` additionally runs the books in
+parallel, so their snapshots are taken as close together as possible.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, TypeVar
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+DEFAULT_RATE_PER_S = 4.0
+DEFAULT_BURST = 2
+DEFAULT_WORKERS = 8
+
+
+class TokenBucket:
+    """Allow ``rate_per_s`` acquisitions per second on average, up to ``burst`` at once.
+
+    Thread-safe: waiting callers queue on the lock, so concurrent callers
+    are spaced out rather than released together.
+    """
+
+    def __init__(
+        self,
+        rate_per_s: float,
+        burst: int = DEFAULT_BURST,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if rate_per_s <= 0:
+            raise ValueError("rate_per_s must be positive")
+        self.rate = float(rate_per_s)
+        self.capacity = float(max(1, burst))
+        self.tokens = self.capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._last = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token, waiting if needed; returns the seconds waited."""
+        with self._lock:
+            now = self._clock()
+            self.tokens = min(self.capacity, self.tokens + (now - self._last) * self.rate)
+            self._last = now
+            wait = 0.0
+            if self.tokens < 1.0:
+                wait = (1.0 - self.tokens) / self.rate
+                self._sleep(wait)
+                self._last = self._clock()
+                self.tokens = 1.0
+            self.tokens -= 1.0
+            return wait
+
+
+class Fetcher:
+    """Shared session + per-host token buckets + bounded concurrency."""
+
+    def __init__(
+        self,
+        rate_per_s: float = DEFAULT_RATE_PER_S,
+        burst: int = DEFAULT_BURST,
+        workers: int = DEFAULT_WORKERS,
+        timeout: float = 20.0,
+    ) -> None:
+        self.rate_per_s = rate_per_s
+        self.burst = burst
+        self.workers = max(1, int(workers))
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=self.workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+        self.stats = {"requests": 0, "errors": 0, "waited_s": 0.0}
+
+    def bucket(self, host: str, rate_per_s: float | None = None) -> TokenBucket:
+        """The host's bucket, created at ``rate_per_s`` (default: the fetcher's) on first use."""
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(rate_per_s or self.rate_per_s, self.burst)
+            return self._buckets[host]
+
+    def get(
+        self,
+        url: str,
+        params: dict | None = None,
+        headers: dict | None = None,
+        timeout: float | None = None,
+        rate_per_s: float | None = None,
+    ) -> requests.Response:
+        """``requests.get`` through the pooled session, after the host's rate limit.
+
+        Raises like ``requests.get`` on connection errors; callers check the status.
+        """
+        waited = self.bucket(urlsplit(url).netloc, rate_per_s).acquire()
+        try:
+            return self.session.get(url, params=params, headers=headers,
+                                    timeout=timeout if timeout is not None else self.timeout)
+        except requests.RequestException:
+            with self._lock:
+                self.stats["errors"] += 1
+            raise
+        finally:
+            with self._lock:
+                self.stats["requests"] += 1
+                self.stats["waited_s"] += waited
+
+    def map(self, fn: Callable[[T], R], items: Iterable[T]) -> list[R]:
+        """``[fn(x) for x in items]`` on up to ``workers`` threads, in input order."""
+        items = list(items)
+        if len(items) <= 1 or self.workers == 1:
+            return [fn(x) for x in items]
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(items))) as pool:
+            return list(pool.map(fn, items))
+
+    def close(self) -> None:
+        self.session.close()
+
+
+_SHARED: Fetcher | None = None
+_SHARED_LOCK = threading.Lock()
+
+
+def shared_fetcher() -> Fetcher:
+    """The process-wide fetcher the scrapers use (created on first use)."""
+    global _SHARED
+    with _SHARED_LOCK:
+        if _SHARED is None:
+            _SHARED = Fetcher()
+        return _SHARED
+
+
+def set_shared_fetcher(fetcher: Fetcher | None) -> None:
+    """Replace the process-wide fetcher (``None``: a fresh default on next use)."""
+    global _SHARED
+    with _SHARED_LOCK:
+        _SHARED = fetcher
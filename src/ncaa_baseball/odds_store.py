@@ -0,0 +1,394 @@
+"""
+Indexed history of odds_pull_log.jsonl.
+
+The pull log is append-only (``pull_odds.py`` and
+``pull_direct_odds.merge_to_odds_log`` add one JSON record per game per
+pull) and grows all season, yet readers only ever want a few games out of
+it. ``OddsStore`` keeps a SQLite index next to the log and stays the
+log's only reader:
+
+* The JSONL stays the ingest log. ``sync()`` imports just the lines
+  appended since the last sync (tracked by byte offset); a log that was
+  truncated or rewritten is re-imported from scratch.
+* Rewrites are detected from per-block digests: the imported prefix is
+  checkpointed every _HASH_BLOCK bytes (``log_blocks``) plus a digest of
+  the partial block up to the offset (``log_head``). A sync re-reads only
+  the last checkpointed block and that partial block, so it costs at most
+  two blocks of I/O however long the season log is. The residual risk is
+  an in-place edit confined to older blocks that leaves the file no
+  shorter; the writers only ever append, and a hand-edited log can be
+  re-imported by deleting the database.
+* ``records`` holds each snapshot (commence date, home/away names and
+  canonical ids, fetched_at, the raw record); ``prices`` holds one row
+  per (book, market, outcome) quote, keyed by (commence date, home cid,
+  away cid, market, book) in log order.
+* Opening snapshot, latest snapshot, per-book quotes and best prices are
+  indexed lookups instead of a ``json.loads`` of every line.
+
+Team names resolve to canonical ids the way the odds readers always have
+(exact ``odds_api_name``, ``espn_name`` or ``team_name``). When the
+canonical registry changes, the stored ids are re-resolved on the next
+sync. The database is derived data and can be deleted at any time.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator
+
+import pandas as pd
+
+
+DEFAULT_ODDS_LOG = Path("data/raw/odds/odds_pull_log.jsonl")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ingest (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    log_offset INTEGER NOT NULL,
+    log_head TEXT NOT NULL,             -- sha1 of the partial block ending at log_offset
+    teams_stamp TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS log_blocks (
+    block INTEGER PRIMARY KEY,          -- bytes [block * _HASH_BLOCK, (block + 1) * _HASH_BLOCK)
+    digest TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS records (
+    seq INTEGER PRIMARY KEY,            -- byte offset of the line in the log
+    commence_date TEXT,
+    commence_time TEXT,
+    home_team TEXT,
+    away_team TEXT,
+    home_cid TEXT,
+    away_cid TEXT,
+    fetched_at TEXT,
+    source TEXT,
+    body TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS records_by_names ON records (commence_date, home_team, away_team, seq);
+CREATE INDEX IF NOT EXISTS records_by_cids ON records (commence_date, home_cid, away_cid, seq);
+CREATE TABLE IF NOT EXISTS prices (
+    seq INTEGER NOT NULL,
+    commence_date TEXT,
+    home_cid TEXT,
+    away_cid TEXT,
+    fetched_at TEXT,
+    book TEXT NOT NULL,
+    market TEXT NOT NULL,
+    outcome TEXT NOT NULL,              -- home/away (h2h, spreads), over/under (totals)
+    point REAL,
+    price REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS prices_by_game ON prices (commence_date, home_cid, away_cid, market, book, seq);
+CREATE INDEX IF NOT EXISTS prices_by_seq ON prices (seq);
+CREATE TABLE IF NOT EXISTS team_names (
+    name TEXT PRIMARY KEY,
+    cid TEXT NOT NULL
+);
+"""
+
+_HASH_BLOCK = 1 << 20
+
+
+def default_store_path(odds_log: Path) -> Path:
+    """Where the index for a log lives: next to it, ``<log>.sqlite``."""
+    return Path(odds_log).with_suffix(".sqlite")
+
+
+def odds_name_map(canonical: pd.DataFrame) -> dict[str, str]:
+    """Odds-feed team name -> canonical_id (exact odds_api_name/espn_name/team_name)."""
+    out: dict[str, str] = {}
+    for _, r in canonical.iterrows():
+        cid = str(r.get("canonical_id", "")).strip()
+        for col in ("odds_api_name", "espn_name", "team_name"):
+            n = str(r.get(col, "")).strip()
+            if n and n != "nan":
+                out[n] = cid
+    return out
+
+
+def _file_stamp(path: Path) -> str:
+    st = path.stat()
+    return f"{path.resolve()}:{st.st_mtime_ns}:{st.st_size}"
+
+
+def _read_span(path: Path, start: int, stop: int) -> bytes:
+    """Bytes [start, stop) of a file."""
+    with open(path, "rb") as f:
+        f.seek(start)
+        return f.read(stop - start)
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha1(data).hexdigest()
+
+
+def _price_rows(seq: int, rec: dict, date: str | None, h_cid: str | None,
+                a_cid: str | None) -> list[tuple]:
+    """One row per quoted outcome of a record."""
+    home, away = rec.get("home_team"), rec.get("away_team")
+    rows = []
+    for bk in rec.get("bookmaker_lines") or []:
+        book = str(bk.get("bookmaker_key", "")).lower()
+        for mkt in bk.get("markets") or []:
+            market = mkt.get("key")
+            if not market:
+                continue
+            for o in mkt.get("outcomes") or []:
+                try:
+                    price = float(o["price"])
+                except (KeyError, TypeError, ValueError):
+                    continue
+                name = o.get("name")
+                outcome = "home" if name == home else "away" if name == away else str(name).lower()
+                point = o.get("point")
+                try:
+                    point = float(point) if point is not None else None
+                except (TypeError, ValueError):
+                    point = None
+                rows.append((seq, date, h_cid, a_cid, rec.get("fetched_at"),
+                             book, market, outcome, point, price))
+    return rows
+
+
+class OddsStore:
+    """SQLite index over one odds pull log. Call ``sync()`` before querying
+    (``open_odds_store`` does)."""
+
+    def __init__(
+        self,
+        odds_log: Path = DEFAULT_ODDS_LOG,
+        canonical_csv: Path | None = None,
+        db_path: Path | None = None,
+    ) -> None:
+        self.odds_log = Path(odds_log)
+        self.canonical_csv = Path(canonical_csv) if canonical_csv is not None else None
+        self.db_path = Path(db_path) if db_path is not None else default_store_path(self.odds_log)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.db_path, isolation_level=None, timeout=60)
+        self.conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> OddsStore:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @contextmanager
+    def _write(self):
+        # BEGIN IMMEDIATE: concurrent syncs serialize instead of double-importing
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.conn.execute("COMMIT")
+
+    # ── Ingest ───────────────────────────────────────────────────────────────
+
+    def sync(self) -> int:
+        """Import the log lines appended since the last sync; returns records added."""
+        with self._write():
+            state = self.conn.execute(
+                "SELECT log_offset, log_head, teams_stamp FROM ingest").fetchone()
+            offset, head, teams_stamp = state if state else (0, "", "")
+            names, teams_stamp = self._sync_team_names(teams_stamp)
+            if not self.odds_log.exists():
+                return 0
+            # Appends leave the imported prefix untouched; anything else is a rewrite
+            size = self.odds_log.stat().st_size
+            tail_start = offset - offset % _HASH_BLOCK
+            rewritten, tail = size < offset, b""
+            if offset and not rewritten:
+                tail, rewritten = self._verify_tail(tail_start, offset, head)
+            if rewritten:
+                self.conn.execute("DELETE FROM records")
+                self.conn.execute("DELETE FROM prices")
+                self.conn.execute("DELETE FROM log_blocks")
+                offset, tail_start, tail = 0, 0, b""
+            added, offset, imported = self._import(offset, names)
+            head = self._checkpoint(tail_start, tail + imported)
+            self.conn.execute(
+                "INSERT OR REPLACE INTO ingest (id, log_offset, log_head, teams_stamp) "
+                "VALUES (0, ?, ?, ?)",
+                (offset, head, teams_stamp),
+            )
+        return added
+
+    def _verify_tail(self, tail_start: int, offset: int, head: str) -> tuple[bytes, bool]:
+        """Re-hash the last checkpointed block and the partial block up to
+        ``offset``; returns the partial block's bytes and whether either changed."""
+        block = tail_start // _HASH_BLOCK - 1
+        start = tail_start - _HASH_BLOCK if block >= 0 else tail_start
+        data = _read_span(self.odds_log, start, offset)
+        tail = data[tail_start - start:]
+        if _digest(tail) != head:
+            return tail, True
+        if block >= 0:
+            stored = self.conn.execute(
+                "SELECT digest FROM log_blocks WHERE block = ?", (block,)).fetchone()
+            if stored is None or stored[0] != _digest(data[:_HASH_BLOCK]):
+                return tail, True
+        return tail, False
+
+    def _checkpoint(self, start: int, data: bytes) -> str:
+        """Record digests of the complete blocks in ``data`` (which begins at
+        block boundary ``start``); returns the digest of the partial rest."""
+        n_full = len(data) // _HASH_BLOCK
+        first = start // _HASH_BLOCK
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO log_blocks (block, digest) VALUES (?, ?)",
+            [(first + i, _digest(data[i * _HASH_BLOCK:(i + 1) * _HASH_BLOCK])) for i in range(n_full)],
+        )
+        return _digest(data[n_full * _HASH_BLOCK:])
+
+    def _sync_team_names(self, stored_stamp: str) -> tuple[dict[str, str], str]:
+        """The name map and its registry stamp; rebuilt (and the stored ids
+        re-resolved) when the registry changed. A store opened without a
+        registry keeps the ids resolved so far."""
+        if self.canonical_csv is not None and self.canonical_csv.exists():
+            stamp = _file_stamp(self.canonical_csv)
+        else:
+            stamp = stored_stamp
+        if stamp != stored_stamp:
+            names = odds_name_map(pd.read_csv(self.canonical_csv, dtype=str))
+            self.conn.execute("DELETE FROM team_names")
+            self.conn.executemany("INSERT INTO team_names (name, cid) VALUES (?, ?)", names.items())
+            self.conn.execute(
+                "UPDATE records SET "
+                "home_cid = (SELECT NULLIF(cid, '') FROM team_names WHERE name = records.home_team), "
+                "away_cid = (SELECT NULLIF(cid, '') FROM team_names WHERE name = records.away_team)")
+            self.conn.execute(
+                "UPDATE prices SET "
+                "home_cid = (SELECT home_cid FROM records WHERE records.seq = prices.seq), "
+                "away_cid = (SELECT away_cid FROM records WHERE records.seq = prices.seq)")
+            return names, stamp
+        return dict(self.conn.execute("SELECT name, cid FROM team_names")), stamp
+
+    def _import(self, offset: int, names: dict[str, str]) -> tuple[int, int, bytes]:
+        """Import complete lines from ``offset``; returns (records added, new
+        offset, the bytes imported)."""
+        with open(self.odds_log, "rb") as f:
+            f.seek(offset)
+            data = f.read()
+        end = data.rfind(b"\n") + 1  # a partially written last line waits for the next sync
+        records, prices = [], []
+        pos = 0
+        while pos < end:
+            nl = data.index(b"\n", pos)
+            line, seq = data[pos:nl], offset + pos
+            pos = nl + 1
+            if not line.strip():
+                continue
+            try:
+                rec = json.loads(line)
+            except ValueError:
+                continue
+            if not isinstance(rec, dict):
+                continue
+            ct = rec.get("commence_time") or ""
+            date = ct[:10] or None
+            home, away = rec.get("home_team"), rec.get("away_team")
+            h_cid, a_cid = names.get(home) or None, names.get(away) or None
+            records.append((seq, date, ct or None, home, away, h_cid, a_cid,
+                            rec.get("fetched_at"), rec.get("source"), line.decode("utf-8")))
+            prices.extend(_price_rows(seq, rec, date, h_cid, a_cid))
+        self.conn.executemany("INSERT INTO records VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", records)
+        self.conn.executemany("INSERT INTO prices VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", prices)
+        return len(records), offset + end, data[:end]
+
+    # ── Queries ──────────────────────────────────────────────────────────────
+
+    def records(
+        self,
+        game_date: str | None = None,
+        date_prefix: str | None = None,
+        resolved: bool = False,
+    ) -> Iterator[dict]:
+        """Raw log records in log order, optionally for one commence date (or
+        date prefix, e.g. a season) and only those with both teams resolved."""
+        where, args = [], []
+        if game_date is not None:
+            where.append("commence_date = ?")
+            args.append(game_date)
+        if date_prefix is not None:
+            where.append("commence_date >= ? AND commence_date < ?")
+            args += [date_prefix, date_prefix + "\uffff"]
+        if resolved:
+            where.append("home_cid IS NOT NULL AND away_cid IS NOT NULL")
+        sql = "SELECT body FROM records"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        for (body,) in self.conn.execute(sql + " ORDER BY seq", args):
+            yield json.loads(body)
+
+    def opening_records(self, game_date: str) -> dict[tuple[str, str], dict]:
+        """(home_team, away_team) -> first logged record for games on ``game_date``."""
+        rows = self.conn.execute(
+            "SELECT body FROM records WHERE seq IN ("
+            " SELECT MIN(seq) FROM records WHERE commence_date = ?"
+            " GROUP BY home_team, away_team) ORDER BY seq", (game_date,))
+        out: dict[tuple[str, str], dict] = {}
+        for (body,) in rows:
+            rec = json.loads(body)
+            out[(rec.get("home_team", ""), rec.get("away_team", ""))] = rec
+        return out
+
+    def latest_records(self, game_date: str) -> dict[tuple[str, str], dict]:
+        """(home_cid, away_cid) -> last logged record for games on ``game_date``."""
+        rows = self.conn.execute(
+            "SELECT home_cid, away_cid, body FROM records WHERE seq IN ("
+            " SELECT MAX(seq) FROM records WHERE commence_date = ?"
+            " AND home_cid IS NOT NULL AND away_cid IS NOT NULL"
+            " GROUP BY home_cid, away_cid) ORDER BY seq", (game_date,))
+        return {(h, a): json.loads(body) for h, a, body in rows}
+
+    def quotes(
+        self,
+        game_date: str,
+        home_cid: str,
+        away_cid: str,
+        market: str = "h2h",
+        which: str = "latest",
+    ) -> list[dict[str, Any]]:
+        """Each book's opening (``which="opening"``) or latest quote for one game/market."""
+        agg = {"latest": "MAX", "opening": "MIN"}[which]
+        rows = self.conn.execute(
+            "SELECT book, outcome, point, price, fetched_at FROM prices AS p"
+            " WHERE commence_date = ? AND home_cid = ? AND away_cid = ? AND market = ?"
+            f" AND seq = (SELECT {agg}(seq) FROM prices AS q"
+            "  WHERE q.commence_date = p.commence_date AND q.home_cid = p.home_cid"
+            "  AND q.away_cid = p.away_cid AND q.market = p.market AND q.book = p.book)"
+            " ORDER BY book, outcome", (game_date, home_cid, away_cid, market))
+        return [dict(zip(("book", "outcome", "point", "price", "fetched_at"), r)) for r in rows]
+
+    def best_prices(
+        self,
+        game_date: str,
+        home_cid: str,
+        away_cid: str,
+        market: str = "h2h",
+    ) -> dict[str, dict[str, Any]]:
+        """outcome -> best (highest American price) current quote across books."""
+        best: dict[str, dict[str, Any]] = {}
+        for q in self.quotes(game_date, home_cid, away_cid, market):
+            if q["outcome"] not in best or q["price"] > best[q["outcome"]]["price"]:
+                best[q["outcome"]] = q
+        return best
+
+
+def open_odds_store(
+    odds_log: Path = DEFAULT_ODDS_LOG,
+    canonical_csv: Path | None = None,
+    db_path: Path | None = None,
+) -> OddsStore:
+    """An ``OddsStore`` synced with everything logged so far."""
+    store = OddsStore(odds_log, canonical_csv=canonical_csv, db_path=db_path)
+    store.sync()
+    return store
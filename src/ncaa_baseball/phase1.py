@@ -59,6 +59,87 @@ def build_odds_name_to_canonical(
     return out
 
 
+class TeamResolver:
+    """
+    Resolve display names (Odds API, ESPN, schedules) to (canonical_id, ncaa_teams_id).
+
+    Same rules and results as the original per-call matcher: the normalized
+    exact map (build_odds_name_to_canonical) first, then the longest canonical
+    team_name (ties in registry order) that is either a whole-word prefix of
+    the name, or that the name abbreviates by at most two trailing characters
+    ("Kansas St" -> "Kansas St."). Both fallbacks are precomputed as dict
+    indexes keyed by normalized text, so a miss costs one lookup per word of
+    the name instead of a sort over the registry, and every answer (misses
+    included) is memoized.
+    """
+
+    def __init__(
+        self,
+        canonical: pd.DataFrame,
+        name_to_canonical: dict[str, tuple[str, int]] | None = None,
+    ):
+        if name_to_canonical is None:
+            name_to_canonical = build_odds_name_to_canonical(canonical)
+        self._exact = name_to_canonical
+        # Fallback candidates in match priority: longest team_name first, registry order on ties
+        rows = []
+        if "team_name" in canonical.columns:
+            for cid, tid, name in zip(canonical["canonical_id"], canonical["ncaa_teams_id"],
+                                      canonical["team_name"]):
+                name = (name or "").strip()
+                if name:
+                    rows.append((len(name), _normalize_for_match(name), (cid, tid)))
+        rows.sort(key=lambda x: -x[0])
+        self._entries = [entry for _, _, entry in rows]
+        # Whole-word prefix rule: normalized team_name -> best rank
+        self._by_name: dict[str, int] = {}
+        # Abbreviation rule: team_name minus 0-2 trailing chars -> best rank
+        self._by_stem: dict[str, int] = {}
+        for rank, (_, norm, _) in enumerate(rows):
+            self._by_name.setdefault(norm, rank)
+            for cut in range(min(2, len(norm)) + 1):
+                self._by_stem.setdefault(norm[:len(norm) - cut], rank)
+        self._memo: dict[str, tuple[str, int] | None] = {}
+
+    def resolve(self, name: str) -> tuple[str, int] | None:
+        """(canonical_id, ncaa_teams_id) for one display name, or None."""
+        try:
+            return self._memo[name]
+        except KeyError:
+            pass
+        n = _normalize_for_match(name)
+        if n in self._exact:
+            out = self._exact[n]
+        else:
+            ranks = [self._by_name.get(n), self._by_stem.get(n)]
+            # Every whole-word prefix "w1", "w1 w2", ... of the name
+            pos = n.find(" ")
+            while pos != -1:
+                ranks.append(self._by_name.get(n[:pos]))
+                pos = n.find(" ", pos + 1)
+            ranks = [r for r in ranks if r is not None]
+            out = None
+            if ranks:
+                cid, tid = self._entries[min(ranks)]
+                out = (cid, int(tid))
+        self._memo[name] = out
+        return out
+
+    def resolve_many(self, names) -> list[tuple[str, int] | None]:
+        """``resolve`` over an iterable of names (each distinct name matched once)."""
+        return [self.resolve(name) for name in names]
+
+    def resolve_pair(
+        self, home_name: str, away_name: str,
+    ) -> tuple[tuple[str, int] | None, tuple[str, int] | None]:
+        return self.resolve(home_name), self.resolve(away_name)
+
+    def canonical_id(self, name: str) -> str:
+        """canonical_id for ``name``, or "" when it does not resolve."""
+        t = self.resolve(name)
+        return t[0] if t else ""
+
+
 def resolve_odds_teams(
     home_odds_name: str,
     away_odds_name: str,
@@ -69,37 +150,10 @@ def resolve_odds_teams(
     Resolve (home_odds_name, away_odds_name) to (canonical_id, ncaa_teams_id) each.
 
     Returns (home_tuple, away_tuple) or (None, None) when no match.
-    Tries exact odds name first, then "odds name starts with team_name" for each canonical row.
+    One-off convenience: builds a TeamResolver per call. Anything resolving
+    more than a pair of names should build one TeamResolver and reuse it.
     """
-    if name_to_canonical is None:
-        name_to_canonical = build_odds_name_to_canonical(canonical)
-
-    def resolve_one(odds_name: str) -> tuple[str, int] | None:
-        n = _normalize_for_match(odds_name)
-        if n in name_to_canonical:
-            return name_to_canonical[n]
-        # Try: canonical team_name is prefix of odds name; try longest first to avoid "Florida" matching "Florida St"
-        rows_sorted = sorted(
-            [
-                (len((row.get("team_name") or "").strip()), row)
-                for _, row in canonical.iterrows()
-                if (row.get("team_name") or "").strip()
-            ],
-            key=lambda x: -x[0],
-        )
-        for _, row in rows_sorted:
-            name = (row.get("team_name") or "").strip()
-            norm_name = _normalize_for_match(name)
-            if n.startswith(norm_name + " ") or n == norm_name:
-                return (row["canonical_id"], int(row["ncaa_teams_id"]))
-            # "Kansas St" vs canonical "Kansas St.": allow when canonical starts with input (trailing punctuation)
-            if norm_name.startswith(n) and len(n) >= len(norm_name) - 2:
-                return (row["canonical_id"], int(row["ncaa_teams_id"]))
-        return None
-
-    home_t = resolve_one(home_odds_name)
-    away_t = resolve_one(away_odds_name)
-    return (home_t, away_t)
+    return TeamResolver(canonical, name_to_canonical).resolve_pair(home_odds_name, away_odds_name)
 
 
 def prior_win_prob(
@@ -0,0 +1,95 @@
+"""
+Tables shared by the stages of one predict_day run.
+
+``predict_day.main`` creates one ``PipelineContext`` and passes it to every
+``resolve_*``/``compute_*`` stage (and ``simulate_games``). Each stage keeps
+its path-based signature for CLI use; given a context it takes the tables
+from it instead, so pitcher_appearances, games, team_table, the canonical
+team registry and the stadium registry are parsed once per run rather than
+once per stage, and all stages share one memoized ``TeamResolver``.
+
+Tables load on first use. Accessors return copies, so a stage that adds or
+coerces columns cannot leak them into the next stage.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Callable, Iterable
+
+import pandas as pd
+
+from ncaa_baseball.datastore import DEFAULT_DATA_DIR, read_table
+from ncaa_baseball.phase1 import TeamResolver, build_odds_name_to_canonical, load_canonical_teams
+
+
+class PipelineContext:
+    """Lazily loaded tables for one run, keyed by table name.
+
+    Processed tables (``table(name)``): pitcher_table, team_table,
+    pitcher_appearances, games; read through ``datastore.read_table`` with
+    their declared dtypes. Registries: ``canonical_teams()`` (as
+    ``load_canonical_teams`` returns it), ``canonical_raw()`` and
+    ``stadiums()`` (all-text, as ``read_csv(dtype=str)``), and
+    ``team_resolver()``.
+    """
+
+    def __init__(
+        self,
+        pitcher_table_csv: Path = DEFAULT_DATA_DIR / "pitcher_table.csv",
+        team_table_csv: Path = DEFAULT_DATA_DIR / "team_table.csv",
+        appearances_csv: Path = DEFAULT_DATA_DIR / "pitcher_appearances.csv",
+        games_csv: Path = DEFAULT_DATA_DIR / "games.csv",
+        canonical_csv: Path = Path("data/registries/canonical_teams_2026.csv"),
+        stadium_csv: Path = Path("data/registries/stadium_orientations.csv"),
+    ) -> None:
+        self.paths: dict[str, Path] = {
+            "pitcher_table": Path(pitcher_table_csv),
+            "team_table": Path(team_table_csv),
+            "pitcher_appearances": Path(appearances_csv),
+            "games": Path(games_csv),
+            "canonical": Path(canonical_csv),
+            "stadiums": Path(stadium_csv),
+        }
+        self._loaded: dict[str, object] = {}
+
+    def _memo(self, key: str, load: Callable[[], object]):
+        if key not in self._loaded:
+            self._loaded[key] = load()
+        return self._loaded[key]
+
+    def has(self, name: str) -> bool:
+        """Whether the file behind a table exists."""
+        return self.paths[name].exists()
+
+    def loaded(self) -> list[str]:
+        """Names of the tables loaded so far (progress logs, tests)."""
+        return list(self._loaded)
+
+    # ── Tables ───────────────────────────────────────────────────────────────
+
+    def table(self, name: str, columns: Iterable[str] | None = None) -> pd.DataFrame:
+        """A processed table, typed per ``datastore.SCHEMAS``; optionally projected."""
+        if name not in ("pitcher_table", "team_table", "pitcher_appearances", "games"):
+            raise KeyError(f"not a processed table: {name}")
+        df = self._memo(name, lambda: read_table(self.paths[name]))
+        return df.copy() if columns is None else df[list(columns)].copy()
+
+    def canonical_teams(self) -> pd.DataFrame:
+        """Canonical team registry as ``phase1.load_canonical_teams`` returns it."""
+        return self._memo("canonical", lambda: load_canonical_teams(self.paths["canonical"])).copy()
+
+    def canonical_raw(self) -> pd.DataFrame:
+        """Canonical team registry read all-text (``dtype=str``)."""
+        return self._memo("canonical_raw",
+                          lambda: pd.read_csv(self.paths["canonical"], dtype=str)).copy()
+
+    def stadiums(self) -> pd.DataFrame:
+        """Stadium orientations registry read all-text (``dtype=str``)."""
+        return self._memo("stadiums", lambda: pd.read_csv(self.paths["stadiums"], dtype=str)).copy()
+
+    def team_resolver(self) -> TeamResolver:
+        """One shared resolver, so every stage reuses the memoized name matches."""
+        def build() -> TeamResolver:
+            canonical = self.canonical_teams()
+            return TeamResolver(canonical, build_odds_name_to_canonical(canonical))
+        return self._memo("team_resolver", build)
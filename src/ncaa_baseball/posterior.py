@@ -0,0 +1,343 @@
+"""
+Binary posterior bundle for the run-event model.
+
+The wide posterior CSV (one column per ``att_run_k[t]`` / ``pitcher_ability[p]``)
+is slow to parse and is re-read by every script. A bundle is a directory next
+to the CSV (``run_event_posterior_2k.csv`` -> ``run_event_posterior_2k.bundle/``)
+holding one ``.npy`` per parameter block plus ``meta.json``:
+
+    int_run      (n_draws, 4)              raw intercepts (no calibration)
+    theta_run    (n_draws, 2)
+    home_adv     (n_draws,)
+    beta_park    (n_draws,)
+    beta_bullpen (n_draws,)
+    att, def_    (n_draws, N_teams + 1, 4)  index 0 = unknown team (zeros)
+    pitcher_ab   (n_draws, N_pitchers + 1)  index 0 = unknown pitcher (zeros)
+
+The large team/pitcher blocks are memory-mapped on load. ``meta.json`` records
+the fit meta plus the size/mtime of the CSV it was converted from, so a CSV
+that is re-written (e.g. by ``make model``) triggers a one-time re-conversion.
+
+``load_posterior`` is the single entry point used by the simulators and
+backtests: it returns a ``Posterior`` (typed, read-only arrays with the shared
+SCORING_CALIBRATION applied to ``int_run``) and caches it per process. It also
+accepts a bundle directory in place of the CSV, which is how the between-fit
+updates (``update_run_event_posterior.py``) are consumed.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from ncaa_baseball.model_runtime import SCORING_CALIBRATION
+
+
+BUNDLE_SUFFIX = ".bundle"
+BUNDLE_META = "meta.json"
+BUNDLE_ARRAYS = (
+    "int_run",
+    "theta_run",
+    "home_adv",
+    "beta_park",
+    "beta_bullpen",
+    "att",
+    "def_",
+    "pitcher_ab",
+)
+# Large per-team / per-pitcher blocks are memory-mapped (read-only); the small
+# per-draw vectors are loaded into ordinary arrays.
+MMAP_ARRAYS = ("att", "def_", "pitcher_ab")
+
+
+def bundle_path(posterior_csv: Path) -> Path:
+    """Bundle directory that sits next to a posterior CSV."""
+    posterior_csv = Path(posterior_csv)
+    return posterior_csv.with_suffix(BUNDLE_SUFFIX)
+
+
+def _indexed_columns(columns: pd.Index, prefix: str, n: int) -> tuple[list[int], list[str]]:
+    """Columns for ``prefix[i]`` (CmdStan) or ``prefix.i`` (PyMC), i = 1..n."""
+    colset = set(columns)
+    idx: list[int] = []
+    cols: list[str] = []
+    for i in range(1, n + 1):
+        for name in (f"{prefix}[{i}]", f"{prefix}.{i}"):
+            if name in colset:
+                idx.append(i)
+                cols.append(name)
+                break
+    return idx, cols
+
+
+def draws_to_arrays(draws_df: pd.DataFrame, N_teams: int, N_pitchers: int) -> dict[str, np.ndarray]:
+    """Convert a wide draws DataFrame into the bundle arrays (uncalibrated)."""
+    n_draws = len(draws_df)
+    out: dict[str, np.ndarray] = {}
+    out["int_run"] = draws_df[[f"int_run_{k+1}" for k in range(4)]].to_numpy(dtype=np.float64)
+    out["theta_run"] = draws_df[[f"theta_run_{k+1}" for k in range(2)]].to_numpy(dtype=np.float64)
+    out["home_adv"] = draws_df["home_advantage"].to_numpy(dtype=np.float64)
+    out["beta_park"] = (draws_df["beta_park"].to_numpy(dtype=np.float64)
+                        if "beta_park" in draws_df.columns else np.ones(n_draws))
+    out["beta_bullpen"] = (draws_df["beta_bullpen"].to_numpy(dtype=np.float64)
+                           if "beta_bullpen" in draws_df.columns else np.zeros(n_draws))
+
+    att = np.zeros((n_draws, N_teams + 1, 4))
+    def_ = np.zeros((n_draws, N_teams + 1, 4))
+    for k in range(4):
+        idx, cols = _indexed_columns(draws_df.columns, f"att_run_{k+1}", N_teams)
+        if cols:
+            att[:, idx, k] = draws_df[cols].to_numpy(dtype=np.float64)
+        idx, cols = _indexed_columns(draws_df.columns, f"def_run_{k+1}", N_teams)
+        if cols:
+            def_[:, idx, k] = draws_df[cols].to_numpy(dtype=np.float64)
+    out["att"] = att
+    out["def_"] = def_
+
+    pitcher_ab = np.zeros((n_draws, N_pitchers + 1))
+    idx, cols = _indexed_columns(draws_df.columns, "pitcher_ability", N_pitchers)
+    if cols:
+        pitcher_ab[:, idx] = draws_df[cols].to_numpy(dtype=np.float64)
+    out["pitcher_ab"] = pitcher_ab
+    return out
+
+
+def _source_fingerprint(path: Path) -> dict:
+    st = path.stat()
+    return {"source": path.name, "source_size": st.st_size, "source_mtime_ns": st.st_mtime_ns}
+
+
+def write_bundle(
+    bundle_dir: Path,
+    arrays: dict[str, np.ndarray],
+    meta: dict,
+    source_csv: Path | None = None,
+) -> Path:
+    """Write bundle arrays + meta. meta.json is written last and marks validity."""
+    bundle_dir = Path(bundle_dir)
+    bundle_dir.mkdir(parents=True, exist_ok=True)
+    meta_path = bundle_dir / BUNDLE_META
+    if meta_path.exists():
+        meta_path.unlink()
+    for name in BUNDLE_ARRAYS:
+        tmp = bundle_dir / f".{name}.tmp.npy"
+        np.save(tmp, np.ascontiguousarray(arrays[name]))
+        os.replace(tmp, bundle_dir / f"{name}.npy")
+    bundle_meta = dict(meta)
+    bundle_meta["n_draws"] = int(arrays["int_run"].shape[0])
+    if source_csv is not None and Path(source_csv).exists():
+        bundle_meta.update(_source_fingerprint(Path(source_csv)))
+    tmp = bundle_dir / f".{BUNDLE_META}.tmp"
+    tmp.write_text(json.dumps(bundle_meta, indent=2))
+    os.replace(tmp, meta_path)
+    return bundle_dir
+
+
+def read_bundle(bundle_dir: Path, mmap: bool = True) -> tuple[dict[str, np.ndarray], dict]:
+    """Read bundle arrays (large blocks memory-mapped) and its meta."""
+    bundle_dir = Path(bundle_dir)
+    meta = json.loads((bundle_dir / BUNDLE_META).read_text())
+    arrays: dict[str, np.ndarray] = {}
+    for name in BUNDLE_ARRAYS:
+        mode = "r" if (mmap and name in MMAP_ARRAYS) else None
+        arrays[name] = np.load(bundle_dir / f"{name}.npy", mmap_mode=mode)
+    return arrays, meta
+
+
+def bundle_is_current(bundle_dir: Path, posterior_csv: Path, fit_meta: dict | None = None) -> bool:
+    """True when the bundle is complete and matches its source CSV and fit meta."""
+    meta_path = Path(bundle_dir) / BUNDLE_META
+    if not meta_path.exists():
+        return False
+    try:
+        meta = json.loads(meta_path.read_text())
+    except (OSError, json.JSONDecodeError):
+        return False
+    if fit_meta is not None:
+        for key in ("N_teams", "N_pitchers"):
+            if key in fit_meta and meta.get(key) != fit_meta[key]:
+                return False
+    posterior_csv = Path(posterior_csv)
+    if not posterior_csv.exists():
+        # Bundle-only deployment (CSV pruned): trust the bundle.
+        return True
+    fp = _source_fingerprint(posterior_csv)
+    return all(meta.get(k) == v for k, v in fp.items())
+
+
+def convert_posterior_csv(
+    posterior_csv: Path,
+    meta_json: Path,
+    bundle_dir: Path | None = None,
+) -> Path:
+    """Parse a posterior CSV once and write its binary bundle."""
+    posterior_csv = Path(posterior_csv)
+    with open(meta_json) as f:
+        fit_meta = json.load(f)
+    draws_df = pd.read_csv(posterior_csv)
+    arrays = draws_to_arrays(draws_df, fit_meta["N_teams"], fit_meta["N_pitchers"])
+    del draws_df
+    return write_bundle(bundle_dir or bundle_path(posterior_csv), arrays, fit_meta,
+                        source_csv=posterior_csv)
+
+
+# ── Posterior object + process-wide cache ───────────────────────────────────
+
+@dataclass(frozen=True, eq=False)
+class Posterior:
+    """Run-event posterior draws as read-only NumPy arrays.
+
+    ``int_run`` already includes SCORING_CALIBRATION. Index 0 of ``att``,
+    ``def_`` and ``pitcher_ab`` is the unknown team/pitcher (all zeros), so
+    callers can index with 0 without branching. Instances are shared by the
+    process-wide cache: derive adjusted copies with ``dataclasses.replace``
+    instead of writing into the arrays.
+    """
+
+    int_run: np.ndarray       # (n_draws, 4)
+    theta_run: np.ndarray     # (n_draws, 2)
+    home_adv: np.ndarray      # (n_draws,)
+    beta_park: np.ndarray     # (n_draws,)
+    beta_bullpen: np.ndarray  # (n_draws,)
+    att: np.ndarray           # (n_draws, N_teams + 1, 4)
+    def_: np.ndarray          # (n_draws, N_teams + 1, 4)
+    pitcher_ab: np.ndarray    # (n_draws, N_pitchers + 1)
+    N_teams: int
+    N_pitchers: int
+
+    @property
+    def n_draws(self) -> int:
+        return int(self.int_run.shape[0])
+
+    def __reduce__(self):
+        # Memory-mapped bundle blocks pickle as their file paths (re-mapped on
+        # unpickle), so process pools share the draws instead of copying them.
+        mapped = {}
+        arrays = {}
+        for name in BUNDLE_ARRAYS:
+            a = getattr(self, name)
+            if isinstance(a, np.memmap) and a.filename is not None:
+                mapped[name] = a.filename
+            else:
+                arrays[name] = np.asarray(a)
+        return (_rebuild_posterior, (mapped, arrays, self.N_teams, self.N_pitchers))
+
+
+def _rebuild_posterior(mapped: dict, arrays: dict, N_teams: int, N_pitchers: int) -> Posterior:
+    arrays = {name: _readonly(a) for name, a in arrays.items()}
+    for name, filename in mapped.items():
+        arrays[name] = np.load(filename, mmap_mode="r")
+    return Posterior(**arrays, N_teams=N_teams, N_pitchers=N_pitchers)
+
+
+def _readonly(a: np.ndarray) -> np.ndarray:
+    if a.flags.writeable:
+        a.flags.writeable = False
+    return a
+
+
+def _file_stamp(path: Path) -> tuple:
+    """(resolved path, mtime_ns, size); missing files stamp as (path, None, None)."""
+    path = Path(path)
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return (str(path.resolve()), None, None)
+    return (str(path.resolve()), st.st_mtime_ns, st.st_size)
+
+
+def _posterior_stamp(path: Path) -> tuple:
+    """File stamp of a posterior CSV, or of the meta.json of a bundle directory."""
+    path = Path(path)
+    return _file_stamp(path / BUNDLE_META if path.is_dir() else path)
+
+
+def posterior_fingerprint(posterior_csv: Path, meta_json: Path) -> str:
+    """Short digest of the posterior files' identity (path, mtime, size).
+
+    Changes whenever the CSV (or bundle) or fit meta is rewritten, so results
+    derived from a posterior (e.g. the per-game simulation cache) can be
+    keyed on it.
+    """
+    stamp = (_posterior_stamp(Path(posterior_csv)), _file_stamp(Path(meta_json)))
+    return hashlib.sha256(repr(stamp).encode()).hexdigest()[:16]
+
+
+# posterior CSV path -> (stamp, Posterior). One entry per path, so a rewritten
+# CSV replaces its stale entry instead of accumulating.
+_CACHE: dict[str, tuple[tuple, Posterior]] = {}
+
+
+def clear_posterior_cache() -> None:
+    """Drop every cached Posterior (tests, long-lived notebooks)."""
+    _CACHE.clear()
+
+
+def _read_posterior(posterior_csv: Path, fit_meta: dict) -> Posterior:
+    N_teams = int(fit_meta["N_teams"])
+    N_pitchers = int(fit_meta["N_pitchers"])
+    if Path(posterior_csv).is_dir():
+        # A bundle passed directly (e.g. an updated posterior): no CSV behind it
+        arrays, _ = read_bundle(posterior_csv)
+        return posterior_from_arrays(arrays, N_teams, N_pitchers)
+    bdir = bundle_path(posterior_csv)
+    if bundle_is_current(bdir, posterior_csv, fit_meta):
+        arrays, _ = read_bundle(bdir)
+    else:
+        draws_df = pd.read_csv(posterior_csv)
+        arrays = draws_to_arrays(draws_df, N_teams, N_pitchers)
+        del draws_df
+        try:
+            write_bundle(bdir, arrays, fit_meta, source_csv=posterior_csv)
+            arrays, _ = read_bundle(bdir)  # map it like any later load would
+        except OSError:
+            pass  # read-only location: keep working from the parsed CSV
+
+    return posterior_from_arrays(arrays, N_teams, N_pitchers)
+
+
+def posterior_from_arrays(arrays: dict[str, np.ndarray], N_teams: int, N_pitchers: int) -> Posterior:
+    """Wrap uncalibrated bundle arrays (``draws_to_arrays``/``read_bundle``) as a Posterior."""
+    arrays = dict(arrays)
+    # Apply global scoring calibration to intercepts (corrects for Stan shrinkage)
+    arrays["int_run"] = np.asarray(arrays["int_run"], dtype=np.float64) + SCORING_CALIBRATION
+    return Posterior(
+        **{name: _readonly(arrays[name]) for name in BUNDLE_ARRAYS},
+        N_teams=N_teams,
+        N_pitchers=N_pitchers,
+    )
+
+
+def load_posterior(posterior_csv: Path, meta_json: Path) -> Posterior:
+    """Load the run-event posterior, reusing arrays already loaded in-process.
+
+    Prefers the binary bundle next to the CSV; if no current bundle exists the
+    CSV is parsed and converted once (the bundle is written next to the CSV
+    when the directory is writable). Results are cached by the path, mtime
+    and size of the CSV, fit meta and bundle meta, so refresh runs, sweeps
+    and notebooks pay the load once and pick up a re-fit automatically.
+    ``posterior_csv`` may also be a bundle directory, which is read as is.
+    """
+    posterior_csv = Path(posterior_csv)
+    stamp = (
+        _posterior_stamp(posterior_csv),
+        _file_stamp(Path(meta_json)),
+        _file_stamp(bundle_path(posterior_csv) / BUNDLE_META),
+    )
+    key = stamp[0][0]
+    hit = _CACHE.get(key)
+    if hit is not None and hit[0] == stamp:
+        return hit[1]
+
+    with open(meta_json) as f:
+        fit_meta = json.load(f)
+    post = _read_posterior(posterior_csv, fit_meta)
+    # Conversion may just have (re)written the bundle: stamp what is on disk now.
+    stamp = stamp[:2] + (_file_stamp(bundle_path(posterior_csv) / BUNDLE_META),)
+    _CACHE[key] = (stamp, post)
+    return post
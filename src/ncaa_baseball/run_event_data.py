@@ -0,0 +1,178 @@
+"""
+Indexed game table for the run-event model.
+
+``fit_run_event_model.py`` and the between-fit updater
+(``update_run_event_posterior.py``) must see each game with exactly the same
+team/pitcher indices and covariates, so the preparation lives here:
+``load_run_events`` reads ``run_events.csv``, ``index_games`` attaches the
+Stan indices (dropping games with a team outside the index), and
+``park_factor_column`` / ``bullpen_columns`` add the log-scale park factor and
+bullpen adjustments the likelihood uses. ``game_offsets`` turns the result
+into array-valued ``GameOffsets`` for the vectorized simulation/likelihood.
+"""
+from __future__ import annotations
+
+import math
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from ncaa_baseball.simulation import GameOffsets
+
+
+RUN_COLUMNS = [f"home_run_{k}" for k in range(1, 5)] + [f"away_run_{k}" for k in range(1, 5)]
+
+
+def load_run_events(path: Path) -> pd.DataFrame:
+    """run_events.csv as strings, with run counts coerced to int."""
+    re_df = pd.read_csv(path, dtype=str)
+    for c in RUN_COLUMNS:
+        if c in re_df.columns:
+            re_df[c] = pd.to_numeric(re_df[c], errors="coerce").fillna(0).astype(int)
+    return re_df
+
+
+def index_sizes(team_df: pd.DataFrame, pitcher_df: pd.DataFrame) -> tuple[int, int]:
+    """(N_teams, N_pitchers) of the run-event indices."""
+    n_teams = int(team_df["team_idx"].max())
+    n_pitchers = int(pitcher_df.loc[pitcher_df["pitcher_espn_id"] != "unknown", "pitcher_idx"].max())
+    return n_teams, n_pitchers
+
+
+def index_games(re_df: pd.DataFrame, team_df: pd.DataFrame, pitcher_df: pd.DataFrame) -> pd.DataFrame:
+    """Games with both teams in the index, plus team/pitcher index columns."""
+    # Map canonical_id -> team_idx, pitcher_id -> pitcher_idx
+    team_map = dict(zip(team_df["canonical_id"], team_df["team_idx"]))
+    pitcher_map: dict[str, int] = {"unknown": 0, "": 0}
+    for _, r in pitcher_df.iterrows():
+        pid = str(r["pitcher_espn_id"]).strip()
+        if pid and pid.lower() != "unknown":
+            pitcher_map[pid] = int(r["pitcher_idx"])
+            # Also index without .0 suffix for float-formatted IDs
+            if pid.endswith(".0"):
+                pitcher_map[pid[:-2]] = int(r["pitcher_idx"])
+
+    def team_idx(cid) -> int | None:
+        if cid is None or (isinstance(cid, float) and pd.isna(cid)):
+            return None
+        cid = str(cid).strip()
+        return team_map.get(cid) if cid else None
+
+    def pitcher_idx(pid_val) -> int:
+        if pid_val is None or (isinstance(pid_val, float) and pd.isna(pid_val)):
+            return 0
+        pid = str(pid_val).strip() or "unknown"
+        return pitcher_map.get(pid, 0)
+
+    re_df = re_df.copy()
+    re_df["home_team_idx"] = re_df["home_canonical_id"].map(team_idx)
+    re_df["away_team_idx"] = re_df["away_canonical_id"].map(team_idx)
+    # Always prefer home_pitcher_espn_id (ESPN data has actual IDs; linescore home_pitcher_id is empty)
+    hp_col = "home_pitcher_espn_id" if "home_pitcher_espn_id" in re_df.columns else "home_pitcher_id"
+    ap_col = "away_pitcher_espn_id" if "away_pitcher_espn_id" in re_df.columns else "away_pitcher_id"
+    re_df["home_pitcher_idx"] = re_df[hp_col].map(pitcher_idx)
+    re_df["away_pitcher_idx"] = re_df[ap_col].map(pitcher_idx)
+
+    # Keep only games with both teams in index
+    mask = re_df["home_team_idx"].notna() & re_df["away_team_idx"].notna()
+    fit_df = re_df.loc[mask].copy()
+    fit_df["home_team_idx"] = fit_df["home_team_idx"].astype(int)
+    fit_df["away_team_idx"] = fit_df["away_team_idx"].astype(int)
+    return fit_df
+
+
+def park_factor_column(fit_df: pd.DataFrame, park_factors: Path) -> list[float]:
+    """log(adjusted_pf) per game by home team, then venue; 0 (neutral) if unmatched."""
+    n_games = len(fit_df)
+    park_factor_vec = [0.0] * n_games
+    if not Path(park_factors).exists():
+        print(f"Park factors: {park_factors} not found, using 0 (neutral) for all games.")
+        return park_factor_vec
+    pf_df = pd.read_csv(park_factors)
+    # Build lookup by home_team_id -> adjusted_pf (log scale)
+    pf_map: dict[str, float] = {}
+    for _, r in pf_df.iterrows():
+        htid = str(r.get("home_team_id", "")).strip()
+        adj = r.get("adjusted_pf")
+        if htid and adj is not None and not (isinstance(adj, float) and math.isnan(adj)):
+            pf_map[htid] = math.log(float(adj))
+    # Also build venue-name lookup as fallback
+    pf_venue_map: dict[str, float] = {}
+    for _, r in pf_df.iterrows():
+        vname = str(r.get("venue_name", "")).strip()
+        adj = r.get("adjusted_pf")
+        if vname and adj is not None and not (isinstance(adj, float) and math.isnan(adj)):
+            pf_venue_map[vname] = math.log(float(adj))
+
+    # Map each game: use home_canonical_id to look up park factor
+    n_park_matched = 0
+    for idx, (_, row) in enumerate(fit_df.iterrows()):
+        home_cid = str(row.get("home_canonical_id", "")).strip()
+        venue = str(row.get("venue_name", "")).strip()
+        pf = pf_map.get(home_cid)
+        if pf is None and venue:
+            pf = pf_venue_map.get(venue)
+        if pf is not None:
+            park_factor_vec[idx] = pf
+            n_park_matched += 1
+    print(f"Park factors: {n_park_matched}/{n_games} games matched "
+          f"({n_park_matched / max(n_games, 1) * 100:.1f}%)")
+    return park_factor_vec
+
+
+def bullpen_columns(fit_df: pd.DataFrame, bullpen_quality: Path) -> tuple[list[float], list[float]]:
+    """(home, away) log-scale bullpen adjustments per game; positive = worse bullpen."""
+    n_games = len(fit_df)
+    home_bullpen_vec = [0.0] * n_games
+    away_bullpen_vec = [0.0] * n_games
+    if not Path(bullpen_quality).exists():
+        print(f"Bullpen quality: {bullpen_quality} not found, using 0 for all games.")
+        return home_bullpen_vec, away_bullpen_vec
+    bq_df = pd.read_csv(bullpen_quality)
+    # Build (canonical_id, season) -> bullpen_depth_score
+    # Then convert to z-score-based log-scale adjustment
+    # Positive score = better bullpen; we want: better bullpen -> negative adj
+    # (opponent scores less), so bullpen_adj = -depth_score * scale
+    bp_map: dict[tuple[str, int], float] = {}
+    for _, r in bq_df.iterrows():
+        cid = str(r.get("team_canonical_id", "")).strip()
+        season = int(r.get("season", 0))
+        score = r.get("bullpen_depth_score")
+        if cid and season and score is not None and not (isinstance(score, float) and math.isnan(score)):
+            # depth_score is already z-score composite; negate and scale
+            # so positive adj = worse bullpen = opponent scores more
+            bp_map[(cid, season)] = -float(score) * 0.1  # scale to log-rate magnitude
+    n_bp_matched = 0
+    for idx, (_, row) in enumerate(fit_df.iterrows()):
+        home_cid = str(row.get("home_canonical_id", "")).strip()
+        away_cid = str(row.get("away_canonical_id", "")).strip()
+        season = int(row.get("season", 0)) if "season" in row.index else 0
+        h_bp = bp_map.get((home_cid, season))
+        a_bp = bp_map.get((away_cid, season))
+        if h_bp is not None:
+            home_bullpen_vec[idx] = h_bp
+        if a_bp is not None:
+            away_bullpen_vec[idx] = a_bp
+        if h_bp is not None or a_bp is not None:
+            n_bp_matched += 1
+    print(f"Bullpen quality: {n_bp_matched}/{n_games} games with at least one team matched")
+    return home_bullpen_vec, away_bullpen_vec
+
+
+def game_offsets(games: pd.DataFrame, park: list[float], home_bp: list[float],
+                 away_bp: list[float], N_teams: int, N_pitchers: int) -> GameOffsets:
+    """Array-valued GameOffsets, one entry per game; indices beyond the posterior map to 0."""
+    def idx(col: str, n: int) -> np.ndarray:
+        v = games[col].to_numpy(dtype=int)
+        return np.where(v <= n, v, 0)
+
+    return GameOffsets(
+        h_idx=idx("home_team_idx", N_teams),
+        a_idx=idx("away_team_idx", N_teams),
+        hp_idx=idx("home_pitcher_idx", N_pitchers),
+        ap_idx=idx("away_pitcher_idx", N_pitchers),
+        park_factor=np.asarray(park, dtype=float),
+        home_bp=np.asarray(home_bp, dtype=float),
+        away_bp=np.asarray(away_bp, dtype=float),
+    )
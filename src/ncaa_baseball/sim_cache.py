@@ -0,0 +1,95 @@
+"""
+Per-game simulation cache for intraday refreshes.
+
+A refresh of ``predict_day`` usually changes only a handful of games (a
+starter confirmed, a new odds pull, a weather update), yet re-simulated the
+whole slate. ``SimCache`` stores each game's simulated columns in
+``data/daily/<date>/sim_cache.json`` under the game's identity key, together
+with a content hash of every input that reaches the simulation: the resolved
+``GameOffsets``, the market-anchor inputs, the posterior fingerprint, the
+engine settings and the game's seed key. A game whose hash is unchanged is
+served from the cache; everything else is re-simulated and merged back.
+The market-anchor pilot is cached separately on model inputs alone, so a
+game whose only change is a new line skips straight to the anchor shift and
+main simulation.
+
+Because each game draws from its own identity-keyed random stream, a cached
+row is exactly what a fresh run would produce. Bump ``SIM_CACHE_VERSION``
+whenever the engines change their output for the same inputs.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+
+SIM_CACHE_FILE = "sim_cache.json"
+SIM_CACHE_VERSION = 3
+
+
+def input_hash(payload: dict) -> str:
+    """Stable sha256 of a JSON-able payload (keys sorted, floats by repr)."""
+    blob = json.dumps(
+        {"version": SIM_CACHE_VERSION, **payload},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+class SimCache:
+    """Game key -> cached simulation columns and pilot estimate, in one JSON file.
+
+    Each game holds two independently hashed records: ``sim`` (the full
+    simulated columns, keyed on every input) and ``pilot`` (the market-anchor
+    pilot estimate, keyed on model inputs only, so a moved line re-uses it).
+    A missing, unreadable or older-version file starts an empty cache.
+    ``save`` writes atomically and keeps only the games passed to it, so
+    postponed or dropped games do not accumulate.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self.entries: dict[str, dict] = {}
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("version") == SIM_CACHE_VERSION:
+            self.entries = dict(data.get("games", {}))
+
+    def _lookup(self, key: str, record: str, digest: str) -> dict | None:
+        entry = self.entries.get(key, {}).get(record)
+        if entry is None or entry.get("hash") != digest:
+            return None
+        return dict(entry["values"])
+
+    def _store(self, key: str, record: str, digest: str, values: dict) -> None:
+        self.entries.setdefault(key, {})[record] = {"hash": digest, "values": dict(values)}
+
+    def get(self, key: str, digest: str) -> dict | None:
+        """Cached simulation columns for ``key`` if computed from ``digest``."""
+        return self._lookup(key, "sim", digest)
+
+    def put(self, key: str, digest: str, columns: dict) -> None:
+        self._store(key, "sim", digest, columns)
+
+    def get_pilot(self, key: str, digest: str) -> dict | None:
+        """Cached pilot estimate for ``key`` if computed from ``digest``."""
+        return self._lookup(key, "pilot", digest)
+
+    def put_pilot(self, key: str, digest: str, values: dict) -> None:
+        self._store(key, "pilot", digest, values)
+
+    def save(self, keep: set[str] | None = None) -> None:
+        if keep is not None:
+            self.entries = {k: v for k, v in self.entries.items() if k in keep}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f".{self.path.name}.tmp")
+        tmp.write_text(json.dumps(
+            {"version": SIM_CACHE_VERSION, "games": self.entries},
+            sort_keys=True,
+        ))
+        os.replace(tmp, self.path)
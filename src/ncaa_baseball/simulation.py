@@ -0,0 +1,570 @@
+"""
+Vectorized Monte Carlo engine for the run-event model.
+
+The per-game log-rate for each run type k is
+
+    int_run[d, k] + att[d, bat, k] + def_[d, opp, k] + pitcher_ab[d, sp]
+    + beta_park[d] * park_factor + beta_bullpen[d] * opp_bullpen + const
+
+where everything in ``const`` (weather, platoon, fatigue, context, anchor...)
+is fixed for the game and resolved by the caller into a ``GameOffsets``.
+All simulations for a game are drawn as arrays: posterior indices, the
+(n_sims, 4) log-rate matrices, NegBin/Poisson counts, and a masked loop over
+the still-tied rows for extra innings.
+
+``simulate_slate`` runs a whole day: the per-game offsets are stacked into
+index/offset vectors and every (game, sim) pair becomes one row of a flat
+(n_games * n_sims, 4) tensor, chunked over games to bound memory. Every game
+still draws from its own random stream, seeded by ``game_seed`` from the run
+seed and the game's identity (teams, start time), never its row position:
+re-running one game or reordering the schedule reproduces identical numbers,
+and chunks can be farmed out to worker processes without changing any output.
+"""
+from __future__ import annotations
+
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields
+from typing import Callable
+
+import numpy as np
+
+from ncaa_baseball.posterior import Posterior
+
+
+# Run-event multipliers: run_1=1, run_2=2, run_3=3, run_4=5.4
+# run_4 represents "4+ runs in an inning". Actual avg is ~5.4 runs
+# when 4+ score (includes 5, 6, 7+ run innings capped at run_4 count).
+RUN_MULT = np.array([1.0, 2.0, 3.0, 5.4])
+
+RL_STEPS = (2, 3, 4, 5, 6)
+TOTAL_LINE = 11.5
+MAX_EXTRA_INNINGS = 20
+
+# Upper bound on (game, sim) rows held in memory at once by simulate_slate.
+# Each row carries a handful of (4,) float64 arrays, so 500k rows ≈ 100 MB.
+SLATE_CHUNK_ROWS = 500_000
+
+
+@dataclass(frozen=True)
+class GameOffsets:
+    """Resolved per-game inputs to the simulation (log-rate scale).
+
+    ``home_*`` terms apply to home scoring (home batting vs away pitching),
+    ``away_*`` terms to away scoring. ``*_const`` is the sum of every fixed
+    additive offset for regulation innings, ``*_const_bp`` the same for
+    bullpen-only extra innings (no starter ability/platoon). Market anchor
+    shifts are kept separate so the pilot can run without them.
+    """
+
+    h_idx: int
+    a_idx: int
+    hp_idx: int
+    ap_idx: int
+    park_factor: float = 0.0
+    home_bp: float = 0.0
+    away_bp: float = 0.0
+    home_const: float = 0.0
+    away_const: float = 0.0
+    home_const_bp: float = 0.0
+    away_const_bp: float = 0.0
+    anchor_home: float = 0.0
+    anchor_away: float = 0.0
+
+
+def stack_offsets(games: list[GameOffsets]) -> GameOffsets:
+    """Column-stack per-game offsets into one GameOffsets of (n_games,) arrays."""
+    return GameOffsets(**{
+        f.name: np.array([getattr(g, f.name) for g in games]) for f in fields(GameOffsets)
+    })
+
+
+def take_offsets(g: GameOffsets, rows: np.ndarray) -> GameOffsets:
+    """Select rows from array-valued offsets; scalar fields pass through."""
+    return GameOffsets(**{
+        f.name: (v[rows] if np.ndim(v) else v)
+        for f in fields(GameOffsets)
+        for v in (getattr(g, f.name),)
+    })
+
+
+def draw_log_rates(
+    post: Posterior,
+    g: GameOffsets,
+    d: np.ndarray,
+    anchored: bool = True,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Regulation log-rates for posterior draws ``d``: two (len(d), 4) arrays.
+
+    Offset fields may be scalars (one game) or arrays aligned with ``d``.
+    """
+    park = post.beta_park[d] * g.park_factor
+    anc_h = g.anchor_home if anchored else 0.0
+    anc_a = g.anchor_away if anchored else 0.0
+    base_h = (post.home_adv[d] + post.pitcher_ab[d, g.ap_idx] + park
+              + post.beta_bullpen[d] * g.away_bp + g.home_const + anc_h)
+    base_a = (post.pitcher_ab[d, g.hp_idx] + park
+              + post.beta_bullpen[d] * g.home_bp + g.away_const + anc_a)
+    int_run = post.int_run[d]
+    log_h = int_run + post.att[d, g.h_idx] + post.def_[d, g.a_idx] + base_h[..., None]
+    log_a = int_run + post.att[d, g.a_idx] + post.def_[d, g.h_idx] + base_a[..., None]
+    return log_h, log_a
+
+
+def draw_log_rates_bp(post: Posterior, g: GameOffsets, d: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Bullpen-only (extra-inning) log-rates for posterior draws ``d``."""
+    park = post.beta_park[d] * g.park_factor
+    base_h = (post.home_adv[d] + park + post.beta_bullpen[d] * g.away_bp
+              + g.home_const_bp + g.anchor_home)
+    base_a = park + post.beta_bullpen[d] * g.home_bp + g.away_const_bp + g.anchor_away
+    int_run = post.int_run[d]
+    log_h = int_run + post.att[d, g.h_idx] + post.def_[d, g.a_idx] + base_h[..., None]
+    log_a = int_run + post.att[d, g.a_idx] + post.def_[d, g.h_idx] + base_a[..., None]
+    return log_h, log_a
+
+
+def sample_runs(mu: np.ndarray, theta: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """Sample run totals from (n, 4) event rates: NegBin for run_1/2, Poisson for run_3/4."""
+    th = np.maximum(1e-6, theta)
+    mu = np.maximum(1e-8, mu)
+    counts = np.empty(mu.shape)
+    counts[:, :2] = rng.negative_binomial(th, th / (th + mu[:, :2]))
+    counts[:, 2:] = rng.poisson(mu[:, 2:])
+    return counts @ RUN_MULT
+
+
+# ── Variance reduction ──────────────────────────────────────────────────────
+#
+# Scenario comparisons (what-if starters, spread scales, weather toggles) run
+# the same game twice with one input changed. Each game already draws from an
+# identity-keyed stream, so both runs see the same uniforms; inverting the
+# event-count CDFs at those uniforms (instead of NumPy's rejection samplers,
+# whose consumption depends on the rates) turns that into common random
+# numbers, and the scenario delta is no longer swamped by sampling noise.
+# Draw indices are stratified across the posterior and the uniforms come in
+# antithetic pairs (u, 1 - u) sharing a draw index.
+
+MAX_EVENT_COUNT = 200
+
+
+def inverse_runs(mu: np.ndarray, theta: np.ndarray, u: np.ndarray) -> np.ndarray:
+    """Run totals from (n, 4) event rates by inverting each count's CDF at ``u``.
+
+    Same distributions as ``sample_runs`` (NegBin for run_1/2, Poisson for
+    run_3/4), but monotone in ``u`` so nearby rates give nearby counts. The
+    CDF walk only carries the cells still above their CDF, so the cost is
+    proportional to the counts drawn rather than the largest one.
+    """
+    th = np.maximum(1e-6, theta)
+    mu = np.maximum(1e-8, mu)
+    q = mu[:, :2] / (th + mu[:, :2])
+    # pmf(k + 1) = pmf(k) * (c0 + k * c1) / (k + 1)  for both families
+    pmf = np.empty(mu.shape)
+    pmf[:, :2] = (1.0 - q) ** th
+    pmf[:, 2:] = np.exp(-mu[:, 2:])
+    c0 = np.empty(mu.shape)
+    c0[:, :2] = th * q
+    c0[:, 2:] = mu[:, 2:]
+    c1 = np.zeros(mu.shape)
+    c1[:, :2] = q
+
+    counts = np.zeros(mu.size)
+    pmf, c0, c1, u = pmf.ravel(), c0.ravel(), c1.ravel(), u.ravel()
+    live = np.flatnonzero(u >= pmf)
+    pmf, cdf, c0, c1, u = pmf[live], pmf[live], c0[live], c1[live], u[live]
+    k = 0
+    while live.size and k < MAX_EVENT_COUNT:
+        counts[live] += 1
+        pmf = pmf * (c0 + k * c1) / (k + 1)
+        cdf = cdf + pmf
+        keep = u >= cdf
+        live, pmf, cdf, c0, c1, u = live[keep], pmf[keep], cdf[keep], c0[keep], c1[keep], u[keep]
+        k += 1
+    return counts.reshape(mu.shape) @ RUN_MULT
+
+
+def _inverse_sample(mu: np.ndarray, theta: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    return inverse_runs(mu, theta, rng.random(mu.shape))
+
+
+def stratified_draws(n_draws: int, n: int, rng: np.random.Generator) -> np.ndarray:
+    """``n`` posterior indices, one from each of ``n`` equal slices of the draws."""
+    idx = ((np.arange(n) + rng.random(n)) * (n_draws / n)).astype(np.int64)
+    return np.minimum(idx, n_draws - 1)
+
+
+def antithetic_inputs(
+    n_draws: int,
+    n: int,
+    rng: np.random.Generator,
+) -> tuple[np.ndarray, tuple[np.ndarray, np.ndarray]]:
+    """Stratified draw indices and antithetic (home, away) uniforms for ``n`` sims."""
+    half = (n + 1) // 2
+    d = stratified_draws(n_draws, half, rng)
+    u = rng.random((half, 2, 4))
+    d = np.concatenate([d, d])[:n]
+    u = np.concatenate([u, 1.0 - u])[:n]
+    return d, (u[:, 0], u[:, 1])
+
+
+def simulate_draws(
+    post: Posterior,
+    g: GameOffsets,
+    d: np.ndarray,
+    rng: np.random.Generator,
+    uniforms: tuple[np.ndarray, np.ndarray] | None = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Simulate one game per posterior draw in ``d``.
+
+    Returns (home_runs, away_runs, exp_home, exp_away), each shaped like ``d``.
+    With ``uniforms`` ((home, away), each (len(d), 4)) regulation counts are
+    drawn by CDF inversion at those uniforms, and extra innings by inversion
+    at fresh uniforms from ``rng``.
+    """
+    theta, home, away, exp_h, exp_a = _regulation(post, g, d, rng, uniforms)
+    sample = sample_runs if uniforms is None else _inverse_sample
+    _extra_innings(post, g, d, theta, home, away, rng, sample)
+    return home, away, exp_h, exp_a
+
+
+def _regulation(
+    post: Posterior,
+    g: GameOffsets,
+    d: np.ndarray,
+    rng: np.random.Generator | None,
+    uniforms: tuple[np.ndarray, np.ndarray] | None,
+) -> tuple[np.ndarray, ...]:
+    theta = post.theta_run[d]
+    log_h, log_a = draw_log_rates(post, g, d)
+    mu_h = np.exp(log_h)
+    mu_a = np.exp(log_a)
+    exp_h = mu_h @ RUN_MULT
+    exp_a = mu_a @ RUN_MULT
+    if uniforms is None:
+        home = sample_runs(mu_h, theta, rng)
+        away = sample_runs(mu_a, theta, rng)
+    else:
+        home = inverse_runs(mu_h, theta, uniforms[0])
+        away = inverse_runs(mu_a, theta, uniforms[1])
+    return theta, home, away, exp_h, exp_a
+
+
+def _extra_innings(
+    post: Posterior,
+    g: GameOffsets,
+    d: np.ndarray,
+    theta: np.ndarray,
+    home: np.ndarray,
+    away: np.ndarray,
+    rng: np.random.Generator,
+    sample: Callable[[np.ndarray, np.ndarray, np.random.Generator], np.ndarray],
+) -> None:
+    """Play out tied rows in place: bullpen-only rates at 1/9 scale per inning."""
+    tied = np.flatnonzero(home == away)
+    if not tied.size:
+        return
+    log_h_bp, log_a_bp = draw_log_rates_bp(post, take_offsets(g, tied), d[tied])
+    mu_h_bp = np.exp(log_h_bp) / 9.0
+    mu_a_bp = np.exp(log_a_bp) / 9.0
+    theta_bp = theta[tied]
+    live = np.arange(tied.size)
+    extra = 0
+    while live.size and extra < MAX_EXTRA_INNINGS:
+        rows = tied[live]
+        home[rows] += sample(mu_h_bp[live], theta_bp[live], rng)
+        away[rows] += sample(mu_a_bp[live], theta_bp[live], rng)
+        live = live[home[rows] == away[rows]]
+        extra += 1
+    if live.size:
+        rows = tied[live]
+        coin = rng.random(rows.size) < 0.5
+        home[rows[coin]] += 1
+        away[rows[~coin]] += 1
+
+
+def pilot_estimate(
+    post: Posterior,
+    g: GameOffsets,
+    n_pilot: int,
+    rng: np.random.Generator,
+) -> tuple[float, float]:
+    """Unanchored (home win prob, expected total) for calibrating the market anchor.
+
+    Regulation only, as the anchor pilot always was: ties count as non-wins
+    and the total is the mean expected runs, not a sampled score.
+    """
+    d = rng.integers(0, post.n_draws, size=n_pilot)
+    theta = post.theta_run[d]
+    log_h, log_a = draw_log_rates(post, g, d, anchored=False)
+    mu_h = np.exp(log_h)
+    mu_a = np.exp(log_a)
+    home = sample_runs(mu_h, theta, rng)
+    away = sample_runs(mu_a, theta, rng)
+    home_prob = float(np.mean(home > away))
+    exp_total = float(np.mean(mu_h @ RUN_MULT + mu_a @ RUN_MULT))
+    return home_prob, exp_total
+
+
+def _simulate_batch(
+    post: Posterior,
+    g: GameOffsets,
+    n: int,
+    rng: np.random.Generator,
+    variance_reduction: bool,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    if not variance_reduction:
+        return simulate_draws(post, g, rng.integers(0, post.n_draws, size=n), rng)
+    d, uniforms = antithetic_inputs(post.n_draws, n, rng)
+    return simulate_draws(post, g, d, rng, uniforms=uniforms)
+
+
+def simulate_game(
+    post: Posterior,
+    g: GameOffsets,
+    n_sims: int,
+    rng: np.random.Generator,
+    variance_reduction: bool = False,
+) -> dict:
+    """Simulate one game ``n_sims`` times; returns the aggregate stat columns.
+
+    ``variance_reduction`` uses stratified draw indices, antithetic uniforms
+    and CDF-inversion sampling (common random numbers across scenarios).
+    """
+    return summarize_runs(*_simulate_batch(post, g, n_sims, rng, variance_reduction))
+
+
+# ── Adaptive simulation count ──────────────────────────────────────────────
+
+@dataclass(frozen=True)
+class PrecisionTargets:
+    """Standard-error targets for ``simulate_game_adaptive``.
+
+    A game stops once the binomial SEs of home win, over (at TOTAL_LINE) and
+    both runline covers are all at or below their targets, after at least
+    ``min_sims`` simulations. ``batch`` is the number of simulations added
+    per round.
+    """
+
+    win_se: float = 0.008
+    over_se: float = 0.01
+    rl_se: float = 0.01
+    min_sims: int = 500
+    batch: int = 500
+
+
+def _binomial_se(hits: int, n: int) -> float:
+    p = hits / n
+    return float(np.sqrt(p * (1.0 - p) / n))
+
+
+def simulate_game_adaptive(
+    post: Posterior,
+    g: GameOffsets,
+    max_sims: int,
+    rng: np.random.Generator,
+    targets: PrecisionTargets = PrecisionTargets(),
+    variance_reduction: bool = False,
+) -> dict:
+    """Simulate in batches until ``targets`` are met or ``max_sims`` is reached.
+
+    Lopsided games converge in a batch or two; coin flips and totals near the
+    line run longer. ``n_sims_used`` in the result is the count actually run.
+    """
+    parts: list[tuple[np.ndarray, ...]] = []
+    n = wins = overs = rl_home = rl_away = 0
+    while n < max_sims:
+        size = min(targets.batch, max_sims - n)
+        home, away, exp_h, exp_a = _simulate_batch(post, g, size, rng, variance_reduction)
+        parts.append((home, away, exp_h, exp_a))
+        margin = home - away
+        n += size
+        wins += int(np.count_nonzero(margin > 0))
+        overs += int(np.count_nonzero((home + away) > TOTAL_LINE))
+        rl_home += int(np.count_nonzero(margin > 1.5))
+        rl_away += int(np.count_nonzero(margin < -1.5))
+        if n >= targets.min_sims and (
+            _binomial_se(wins, n) <= targets.win_se
+            and _binomial_se(overs, n) <= targets.over_se
+            and max(_binomial_se(rl_home, n), _binomial_se(rl_away, n)) <= targets.rl_se
+        ):
+            break
+    return summarize_runs(*(np.concatenate(x) for x in zip(*parts)))
+
+
+# ── Per-game seeding + process pool ─────────────────────────────────────────
+
+GameFn = Callable[[Posterior, GameOffsets, int, np.random.Generator], dict]
+
+
+def game_key(home_cid: str, away_cid: str, start_utc: str = "", ordinal: int = 0) -> str:
+    """Stable identity of a game within a slate (ordinal separates doubleheaders
+    that share teams and start time)."""
+    return f"{home_cid}|{away_cid}|{start_utc}|{ordinal}"
+
+
+def game_seed(seed: int, key: str) -> np.random.SeedSequence:
+    """Seed sequence for one game, spawned from ``seed`` and keyed on its identity.
+
+    This is the child ``SeedSequence(seed).spawn`` would hand out, except the
+    spawn key is a hash of ``key`` rather than the game's position, so the
+    stream does not depend on which other games are on the slate.
+    """
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+    words = tuple(int.from_bytes(digest[i:i + 4], "little") for i in range(0, 16, 4))
+    return np.random.SeedSequence(seed, spawn_key=words)
+
+
+_WORKER_POST: Posterior | None = None
+
+
+def _init_worker(post: Posterior) -> None:
+    # Bundle-backed posteriors pickle as file references and are re-mapped
+    # here, so workers share the page cache instead of copying the draws.
+    global _WORKER_POST
+    _WORKER_POST = post
+
+
+def _run_game(task: tuple[GameFn, GameOffsets, int, np.random.SeedSequence]) -> dict:
+    game_fn, g, n, seed_seq = task
+    return game_fn(_WORKER_POST, g, n, np.random.default_rng(seed_seq))
+
+
+def slate_inputs(
+    n_draws: int,
+    n: int,
+    rng: np.random.Generator,
+    variance_reduction: bool = False,
+) -> tuple[np.ndarray, tuple[np.ndarray, np.ndarray]]:
+    """Posterior indices and (home, away) regulation uniforms for ``n`` sims of one game.
+
+    The slate pass draws these from each game's own stream before stacking
+    games together, so a game's numbers do not depend on its neighbours.
+    """
+    if variance_reduction:
+        return antithetic_inputs(n_draws, n, rng)
+    d = rng.integers(0, n_draws, size=n)
+    u = rng.random((n, 2, 4))
+    return d, (u[:, 0], u[:, 1])
+
+
+def _simulate_slate_chunk(
+    post: Posterior,
+    games: list[GameOffsets],
+    n_sims: int,
+    seeds: list[np.random.SeedSequence],
+    variance_reduction: bool,
+) -> list[dict]:
+    """One flat (game, sim) pass over ``games``; extra innings per game."""
+    rngs = [np.random.default_rng(ss) for ss in seeds]
+    inputs = [slate_inputs(post.n_draws, n_sims, rng, variance_reduction) for rng in rngs]
+    d = np.concatenate([x[0] for x in inputs])
+    uniforms = (np.concatenate([x[1][0] for x in inputs]),
+                np.concatenate([x[1][1] for x in inputs]))
+    gi = np.repeat(np.arange(len(games)), n_sims)
+    g = take_offsets(stack_offsets(games), gi)
+    theta, home, away, exp_h, exp_a = _regulation(post, g, d, None, uniforms)
+
+    out: list[dict] = []
+    for j, (game, rng) in enumerate(zip(games, rngs)):
+        sl = slice(j * n_sims, (j + 1) * n_sims)
+        h, a = home[sl], away[sl]
+        _extra_innings(post, game, d[sl], theta[sl], h, a, rng, _inverse_sample)
+        out.append(summarize_runs(h, a, exp_h[sl], exp_a[sl]))
+    return out
+
+
+def _run_slate_chunk(task: tuple) -> list[dict]:
+    return _simulate_slate_chunk(_WORKER_POST, *task)
+
+
+def simulate_slate(
+    post: Posterior,
+    games: list[GameOffsets],
+    n_sims: int,
+    seeds: list[np.random.SeedSequence],
+    workers: int = 1,
+    game_fn: GameFn | None = None,
+    chunk_rows: int = SLATE_CHUNK_ROWS,
+    variance_reduction: bool = False,
+) -> list[dict]:
+    """Simulate every game of a slate, each from its own seed sequence.
+
+    By default games are stacked into flat (game, sim) array passes of at
+    most ``chunk_rows // n_sims`` games, so peak memory is independent of
+    slate size. Each game's draw indices and uniforms come from its own
+    stream (see ``slate_inputs``) and counts are drawn by CDF inversion, so
+    results do not depend on the chunk size or the other games. Given a
+    ``game_fn`` (any per-game engine with the ``simulate_game`` signature;
+    ``n_sims`` is passed through as its size argument) games run one by one
+    instead. With ``workers > 1`` chunks or games run in a process pool;
+    results are identical to ``workers=1``. Returns one stat dict per game,
+    in order.
+    """
+    if len(seeds) != len(games):
+        raise ValueError(f"Need one seed per game: {len(seeds)} seeds for {len(games)} games")
+    if not games:
+        return []
+    if game_fn is None:
+        per_chunk = max(1, chunk_rows // max(1, n_sims))
+        if workers > 1:
+            per_chunk = min(per_chunk, -(-len(games) // workers))
+        chunks = [(games[i:i + per_chunk], n_sims, seeds[i:i + per_chunk], variance_reduction)
+                  for i in range(0, len(games), per_chunk)]
+        if workers <= 1 or len(chunks) <= 1:
+            return [s for task in chunks for s in _simulate_slate_chunk(post, *task)]
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks)),
+                                 initializer=_init_worker, initargs=(post,)) as pool:
+            return [s for part in pool.map(_run_slate_chunk, chunks) for s in part]
+    if workers <= 1 or len(games) <= 1:
+        return [game_fn(post, g, n_sims, np.random.default_rng(ss)) for g, ss in zip(games, seeds)]
+    tasks = [(game_fn, g, n_sims, ss) for g, ss in zip(games, seeds)]
+    workers = min(workers, len(games))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(post,)) as pool:
+        return list(pool.map(_run_game, tasks, chunksize=max(1, len(tasks) // (4 * workers))))
+
+
+def summarize_runs(
+    home: np.ndarray,
+    away: np.ndarray,
+    exp_h: np.ndarray,
+    exp_a: np.ndarray,
+) -> dict:
+    """Aggregate simulated scores into win/runline/total/quantile columns."""
+    n = len(home)
+    margin = home - away
+    win_prob = float(np.mean(margin > 0))
+    exp_home = float(np.mean(exp_h))
+    exp_away = float(np.mean(exp_a))
+
+    # Quantiles use integer-truncated scores (matches the int16 buffers of
+    # the original per-draw loop).
+    home_i = home.astype(np.int32)
+    away_i = away.astype(np.int32)
+    total_i = (home + away).astype(np.int32)
+    margin_i = home_i - away_i
+
+    win_se = float(np.sqrt(max(1e-8, win_prob * (1.0 - win_prob) / n)))
+    out = {
+        "home_win_prob": win_prob,
+        "away_win_prob": 1 - win_prob,
+        "exp_home": exp_home,
+        "exp_away": exp_away,
+        "exp_total": exp_home + exp_away,
+        "home_win_ci_lo": max(0.0, win_prob - 1.96 * win_se),
+        "home_win_ci_hi": min(1.0, win_prob + 1.96 * win_se),
+        "exp_total_p10": float(np.quantile(total_i, 0.10)),
+        "exp_total_p50": float(np.quantile(total_i, 0.50)),
+        "exp_total_p90": float(np.quantile(total_i, 0.90)),
+        "margin_p10": float(np.quantile(margin_i, 0.10)),
+        "margin_p50": float(np.quantile(margin_i, 0.50)),
+        "margin_p90": float(np.quantile(margin_i, 0.90)),
+        "home_rl_cover": float(np.mean(margin > 1.5)),
+        "away_rl_cover": float(np.mean(margin < -1.5)),
+    }
+    for k in RL_STEPS:
+        out[f"home_win_by_{k}plus"] = float(np.mean(margin >= k))
+        out[f"away_win_by_{k}plus"] = float(np.mean(margin <= -k))
+    out["over_prob"] = float(np.mean((home + away) > TOTAL_LINE))
+    out["n_sims_used"] = n
+    return out
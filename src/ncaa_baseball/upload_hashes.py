@@ -0,0 +1,112 @@
+"""
+Per-row content hashes of the last database upload, for diff-only upserts.
+
+``load_baseball_to_postgres`` re-uploads whole tables (and ``predict_day``
+re-uploads the whole slate's projections on every refresh), although most
+rows are byte-for-byte what the database already holds. ``UploadHashes``
+keeps, per database target and table, a hash of every row as last sent,
+keyed by the table's conflict columns. ``changed`` returns only the rows
+whose hash differs (or that were never sent), so an unchanged slate uploads
+nothing; ``save`` records the new hashes and must be called only after the
+transaction commits, so a failed upload is retried in full next time.
+
+The manifest is a local record, not a view of the database: if rows are
+edited or deleted server-side, run the loader with ``--full`` to resend
+everything. Hashes are over the values as uploaded, so a column-set change
+re-sends the whole table.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import pandas as pd
+
+
+UPLOAD_HASHES_VERSION = 1
+DEFAULT_UPLOAD_HASHES = Path("data/processed/upload_hashes.json")
+
+
+def target_id(dsn: str) -> str:
+    """Short stable id for a database target (the DSN itself is not stored)."""
+    return hashlib.sha256(dsn.encode("utf-8")).hexdigest()[:16]
+
+
+def row_hashes(df: pd.DataFrame) -> pd.Series:
+    """Hex content hash of each row's values (index ignored)."""
+    return pd.util.hash_pandas_object(df, index=False).map("{:016x}".format)
+
+
+def row_keys(df: pd.DataFrame, key_cols: list[str]) -> pd.Series:
+    """Each row's conflict-key values joined into one string."""
+    return df[key_cols].astype(str).agg("\x1f".join, axis=1)
+
+
+class UploadHashes:
+    """Target -> table -> {row key: content hash}, in one JSON file.
+
+    A missing, unreadable or older-version file starts empty (everything is
+    sent). ``full=True`` ignores the stored hashes for this run but still
+    records what was sent.
+    """
+
+    def __init__(self, path: Path, target: str, full: bool = False) -> None:
+        self.path = Path(path)
+        self.target = target
+        self.full = full
+        self.targets: dict[str, dict] = {}
+        self._pending: dict[str, dict] = {}
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("version") == UPLOAD_HASHES_VERSION:
+            self.targets = dict(data.get("targets", {}))
+
+    def changed(self, table: str, df: pd.DataFrame, key_cols: list[str]) -> pd.DataFrame:
+        """Rows of ``df`` not already uploaded with identical content.
+
+        The hashes of all of ``df`` are staged for ``save``, on top of what is
+        already staged for ``table`` in this transaction (one call per
+        prediction date all stage under the same table).
+        """
+        columns = list(df.columns)
+        keys = row_keys(df, key_cols)
+        hashes = row_hashes(df)
+        staged = self._pending.get(table)
+        if staged and staged["columns"] == columns:
+            staged["rows"].update(zip(keys, hashes))
+        else:
+            self._pending[table] = {"columns": columns, "rows": dict(zip(keys, hashes))}
+
+        stored = self.targets.get(self.target, {}).get(table)
+        if self.full or not stored or stored.get("columns") != columns:
+            return df
+        previous = keys.map(stored.get("rows", {}))
+        return df[(previous != hashes).to_numpy()]
+
+    def discard(self) -> None:
+        """Drop staged hashes (the upload was rolled back)."""
+        self._pending = {}
+
+    def save(self) -> None:
+        """Record the staged hashes (call after the upload commits)."""
+        if not self._pending:
+            return
+        tables = self.targets.setdefault(self.target, {})
+        for table, staged in self._pending.items():
+            stored = tables.get(table)
+            if stored and stored.get("columns") == staged["columns"]:
+                stored["rows"].update(staged["rows"])
+            else:
+                tables[table] = staged
+        self._pending = {}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f".{self.path.name}.tmp")
+        tmp.write_text(json.dumps(
+            {"version": UPLOAD_HASHES_VERSION, "targets": self.targets},
+            sort_keys=True,
+        ))
+        os.replace(tmp, self.path)
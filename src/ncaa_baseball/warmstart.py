@@ -0,0 +1,185 @@
+"""
+Warm-start state for incremental refits of the run-event model.
+
+A nightly refit adds a day of games to ``run_events.csv``; the posterior
+barely moves, but a cold fit re-runs the full NUTS warmup. After each fit
+``fit_run_event_model.py`` saves the adapted step size, diagonal inverse
+metric and final draw of every chain (``run_event_warmstart.json``) together
+with the team and pitcher index it was fitted on. The next fit starts from
+that state with a short warmup, provided the indices only grew (existing
+teams/pitchers keep their positions). New teams and pitchers are initialized
+from their priors, and their metric entries from the mean of their block.
+
+The parameter layout mirrors the ``parameters`` block of both Stan models, in
+declaration order, which is also the order of the unconstrained metric.
+"""
+from __future__ import annotations
+
+import json
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+
+WARMSTART_FILE = "run_event_warmstart.json"
+
+_SCALARS_HEAD = (
+    "theta_run_1", "theta_run_2", "home_advantage",
+    "int_run_1", "int_run_2", "int_run_3", "int_run_4",
+    "sigma_att", "sigma_def", "sigma_pitcher", "sigma_conf_att", "sigma_conf_def",
+)
+_TEAM_VECTORS = tuple(
+    f"{side}_run_{k}_raw" for k in range(1, 5) for side in ("att", "def")
+)
+_SCALARS_TAIL = ("beta_park", "beta_bullpen")
+
+
+def param_layout(n_conf: int, n_teams: int, n_pitchers: int) -> list[tuple[str, int | None]]:
+    """(name, length) per sampled parameter in declaration order; None = scalar."""
+    layout: list[tuple[str, int | None]] = [(name, None) for name in _SCALARS_HEAD]
+    layout += [("conf_att_raw", n_conf), ("conf_def_raw", n_conf)]
+    layout += [(name, n_teams) for name in _TEAM_VECTORS]
+    layout += [("pitcher_ability_raw", n_pitchers)]
+    layout += [(name, None) for name in _SCALARS_TAIL]
+    return layout
+
+
+def index_only_grew(old_ids: list[str], new_ids: list[str]) -> bool:
+    """True if every previously indexed id keeps its position in the new index."""
+    return len(new_ids) >= len(old_ids) and new_ids[:len(old_ids)] == old_ids
+
+
+def ordered_ids(df, id_col: str, idx_col: str, n: int) -> list[str]:
+    """Ids for positions 1..n of an index table (missing positions as "")."""
+    by_idx = {int(i): str(v).strip() for v, i in zip(df[id_col], df[idx_col])}
+    return [by_idx.get(i, "") for i in range(1, n + 1)]
+
+
+_COLUMN = re.compile(r"^(\w+?)(?:\[(\d+)\])?$")
+
+
+def inits_from_draw(row: dict[str, float], layout: list[tuple[str, int | None]]) -> dict:
+    """Stan init dict for the sampled parameters from one posterior draw."""
+    inits: dict = {}
+    vectors: dict[str, list[float]] = {
+        name: [0.0] * size for name, size in layout if size is not None
+    }
+    for col, value in row.items():
+        m = _COLUMN.match(col)
+        if not m:
+            continue
+        name, pos = m.group(1), m.group(2)
+        if pos is None and any(name == n and s is None for n, s in layout):
+            inits[name] = float(value)
+        elif pos is not None and name in vectors and int(pos) <= len(vectors[name]):
+            vectors[name][int(pos) - 1] = float(value)
+    inits.update(vectors)
+    return inits
+
+
+def grow_inits(inits: dict, team_conf: list[int], fip_prior: list[float],
+               n_teams: int, n_pitchers: int) -> dict:
+    """Extend per-chain inits to the new index sizes with prior-mean values.
+
+    New teams start at their conference mean (centered ``conf_*_raw``), new
+    pitchers at their FIP prior mean.
+    """
+    out = dict(inits)
+    conf_att = np.asarray(inits["conf_att_raw"], dtype=float)
+    conf_def = np.asarray(inits["conf_def_raw"], dtype=float)
+    conf_att = conf_att - conf_att.mean()
+    conf_def = conf_def - conf_def.mean()
+    for name in _TEAM_VECTORS:
+        old = list(inits[name])
+        conf = conf_att if name.startswith("att") else conf_def
+        out[name] = old + [float(conf[team_conf[t] - 1]) for t in range(len(old), n_teams)]
+    old = list(inits["pitcher_ability_raw"])
+    out["pitcher_ability_raw"] = old + [float(fip_prior[p]) for p in range(len(old), n_pitchers)]
+    return out
+
+
+def grow_metric(metric: np.ndarray, old_layout, new_layout) -> np.ndarray:
+    """Expand a diagonal inverse metric to a grown layout (new entries = block mean)."""
+    metric = np.asarray(metric, dtype=float)
+    blocks = []
+    pos = 0
+    for (_, old_size), (_, new_size) in zip(old_layout, new_layout):
+        width = 1 if old_size is None else old_size
+        block = metric[pos:pos + width]
+        pos += width
+        if new_size is not None and new_size > width:
+            fill = float(block.mean()) if block.size else 1.0
+            block = np.concatenate([block, np.full(new_size - width, fill)])
+        blocks.append(block)
+    if pos != metric.size:
+        raise ValueError(f"metric has {metric.size} entries, layout expects {pos}")
+    return np.concatenate(blocks)
+
+
+@dataclass(frozen=True)
+class WarmStart:
+    """Per-chain sampler state for ``CmdStanModel.sample``."""
+
+    fit_id: str
+    inits: list[dict]
+    step_size: list[float]
+    inv_metric: list[list[float]]
+
+
+def plan_warmstart(
+    state: dict | None,
+    stan_file: str,
+    n_conf: int,
+    team_ids: list[str],
+    pitcher_ids: list[str],
+    team_conf: list[int],
+    fip_prior: list[float],
+    chains: int,
+) -> tuple[WarmStart | None, str]:
+    """Warm-start plan from the previous fit's state, or (None, reason for a cold fit)."""
+    if state is None:
+        return None, "no previous warm-start state"
+    if state.get("stan_file") != stan_file:
+        return None, "Stan model changed"
+    if state.get("metric_type") != "diag_e":
+        return None, "previous fit did not use a diagonal metric"
+    if state.get("n_conf") != n_conf:
+        return None, "conference count changed"
+    if not index_only_grew(state["team_ids"], team_ids):
+        return None, "team index changed (not append-only)"
+    if not index_only_grew(state["pitcher_ids"], pitcher_ids):
+        return None, "pitcher index changed (not append-only)"
+
+    n_teams, n_pitchers = len(team_ids), len(pitcher_ids)
+    old_layout = param_layout(n_conf, len(state["team_ids"]), len(state["pitcher_ids"]))
+    new_layout = param_layout(n_conf, n_teams, n_pitchers)
+    prev = len(state["inits"])
+    # More chains than last time: reuse chain states round-robin.
+    chain_ids = [c % prev for c in range(chains)]
+    return WarmStart(
+        fit_id=state["fit_id"],
+        inits=[grow_inits(state["inits"][c], team_conf, fip_prior, n_teams, n_pitchers)
+               for c in chain_ids],
+        step_size=[float(state["step_size"][c]) for c in chain_ids],
+        inv_metric=[grow_metric(state["inv_metric"][c], old_layout, new_layout).tolist()
+                    for c in chain_ids],
+    ), "indices unchanged or append-only"
+
+
+def save_warmstart(out_dir: Path, state: dict) -> Path:
+    path = Path(out_dir) / WARMSTART_FILE
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(json.dumps(state))
+    os.replace(tmp, path)
+    return path
+
+
+def load_warmstart(out_dir: Path) -> dict | None:
+    path = Path(out_dir) / WARMSTART_FILE
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
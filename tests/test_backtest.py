@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import backtest_fast
+import backtest_model
+
+from ncaa_baseball.backtest import (
+    calibration_table,
+    holdout_games,
+    run_backtest,
+    score_predictions,
+    simulate_holdout,
+    simulate_margins,
+)
+from ncaa_baseball.posterior import posterior_from_arrays
+from ncaa_baseball.run_event_data import game_offsets
+from ncaa_baseball.simulation import GameOffsets, simulate_game
+
+
+def _posterior(n: int = 200, n_teams: int = 3, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    att = np.zeros((n, n_teams + 1, 4))
+    att[:, 1:] = rng.normal(0, 0.15, (n, n_teams, 4))
+    return posterior_from_arrays({
+        "int_run": np.array([1.2, -0.1, -1.3, -2.1]) + rng.normal(0, 0.05, (n, 4)),
+        "theta_run": rng.uniform(20, 40, (n, 2)),
+        "home_adv": rng.normal(0.05, 0.02, n),
+        "beta_park": np.ones(n),
+        "beta_bullpen": np.zeros(n),
+        "att": att,
+        "def_": np.zeros((n, n_teams + 1, 4)),
+        "pitcher_ab": np.zeros((n, 2)),
+    }, n_teams, 1)
+
+
+def test_scores_and_bins_match_per_game_definitions() -> None:
+    rng = np.random.default_rng(3)
+    p = rng.uniform(0.1, 0.9, 500)
+    y = (rng.random(500) < p).astype(float)
+    et = rng.normal(12, 2, 500)
+    at = rng.poisson(12, 500).astype(float)
+    m = score_predictions(p, y, et, at)
+    assert np.isclose(m["brier_score"], np.mean([(a - b) ** 2 for a, b in zip(p, y)]))
+    assert np.isclose(m["log_loss"], -np.mean([b * np.log(a) + (1 - b) * np.log(1 - a)
+                                               for a, b in zip(p, y)]))
+    assert np.isclose(m["total_mae"], np.mean(np.abs(et - at)))
+
+    bins = calibration_table(p, y)
+    assert bins["n"].sum() == 500
+    lo, hi = 0.4, 0.5
+    mask = (p >= lo) & (p < hi)
+    row = bins.set_index("bin").loc["40-50%"]
+    assert row["n"] == mask.sum()
+    assert np.isclose(row["actual_pct"], y[mask].mean())
+    assert np.isclose(row["gap"], y[mask].mean() - p[mask].mean())
+
+
+def test_vectorized_holdout_matches_production_engine() -> None:
+    post = _posterior()
+    games = [GameOffsets(h_idx=1, a_idx=2, hp_idx=0, ap_idx=0),
+             GameOffsets(h_idx=3, a_idx=1, hp_idx=1, ap_idx=0, park_factor=0.1)]
+    g = GameOffsets(h_idx=np.array([1, 3]), a_idx=np.array([2, 1]), hp_idx=np.array([0, 1]),
+                    ap_idx=np.array([0, 0]), park_factor=np.array([0.0, 0.1]),
+                    home_bp=np.zeros(2), away_bp=np.zeros(2))
+    batch = simulate_holdout(post, g, 20_000, np.random.default_rng(0))
+    for i, single in enumerate(games):
+        ref = simulate_game(post, single, 20_000, np.random.default_rng(i + 1))
+        assert abs(batch.loc[i, "home_win_prob"] - ref["home_win_prob"]) < 0.02
+        assert abs(batch.loc[i, "exp_total"] - ref["exp_total"]) < 0.1
+        assert abs(batch.loc[i, "over_prob"] - ref["over_prob"]) < 0.02
+
+
+def test_holdout_games_selects_indexes_and_scores() -> None:
+    games = pd.DataFrame({
+        "game_date": ["2026-03-01", "2026-03-10", "2026-03-12", "2026-03-12"],
+        "home_canonical_id": ["A", "A", "B", "Z"],
+        "away_canonical_id": ["B", "C", "C", "A"],
+        "home_pitcher_espn_id": ["p1", "", "p1", ""],
+        "away_pitcher_espn_id": ["", "p1", "", ""],
+        "home_score": ["5", "2", "7", "1"],
+        "away_score": ["3", "4", "", "0"],
+    })
+    team_df = pd.DataFrame({"canonical_id": ["A", "B", "C"], "team_idx": [1, 2, 3]})
+    pitcher_df = pd.DataFrame({"pitcher_espn_id": ["unknown", "p1"], "pitcher_idx": ["0", "1"]})
+    out = holdout_games(games, team_df, pitcher_df, holdout_days=7)
+    # Unscored (game 3) and unindexed (team Z) games drop; game 1 is outside the window
+    assert out["home_canonical_id"].tolist() == ["A"]
+    assert out.loc[0, "away_pitcher_idx"] == 1 and out.loc[0, "home_win"] == 0
+
+    post = _posterior()
+    g = game_offsets(out, [0.0], [0.0], [0.0], post.N_teams, post.N_pitchers)
+    res = run_backtest(post, out, g, 500, seed=1)
+    assert len(res) == 1 and 0 < res.loc[0, "home_win_prob"] < 1
+    pd.testing.assert_frame_equal(res, run_backtest(post, out, g, 500, seed=1))
+
+
+def test_margin_distributions_rescore_without_resimulating() -> None:
+    post = _posterior()
+    g = GameOffsets(h_idx=np.array([1, 3, 2]), a_idx=np.array([2, 1, 3]), hp_idx=np.zeros(3, dtype=int),
+                    ap_idx=np.zeros(3, dtype=int), park_factor=np.zeros(3),
+                    home_bp=np.zeros(3), away_bp=np.zeros(3))
+    dist = simulate_margins(post, g, 3000, np.random.default_rng(5))
+    ref = simulate_holdout(post, g, 3000, np.random.default_rng(5))
+    np.testing.assert_array_equal(dist.home_win_prob(1.0), ref["home_win_prob"].to_numpy())
+    # Stretching the expected margin pushes every game away from its own side of 50%
+    wide, narrow = dist.home_win_prob(1.5), dist.home_win_prob(0.5)
+    fav = dist.exp_margin > 0
+    assert np.all(wide[fav] >= narrow[fav]) and np.all(wide[~fav] <= narrow[~fav])
+    shifted = dist.margins[1] + 0.5 * dist.exp_margin[1]
+    assert np.isclose(wide[1], np.mean(shifted > 0))
+
+
+def test_backtest_model_passes_full_posterior_defaults(
+        monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture) -> None:
+    seen = []
+    monkeypatch.setattr(backtest_model, "run", lambda args: seen.append(args) or 0)
+    assert backtest_model.main(["--holdout-days", "3"]) == 0
+    (args,) = seen
+    assert args.posterior == Path("data/processed/run_event_posterior.csv")
+    assert args.N == 5_000 and args.holdout_days == 3
+    assert backtest_fast.parse_args([]).posterior == Path("data/processed/run_event_posterior_2k.csv")
+
+    with pytest.raises(SystemExit):
+        backtest_model.main(["--help"])
+    assert "Backtest run-event model predictions against actuals." in capsys.readouterr().out
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import pytest
+
+import betrivers_scraper
+import pull_direct_odds
+from ncaa_baseball.http_fetch import Fetcher, TokenBucket, set_shared_fetcher
+
+
+def test_token_bucket_spaces_requests() -> None:
+    now = [0.0]
+    slept: list[float] = []
+
+    def sleep(s: float) -> None:
+        slept.append(s)
+        now[0] += s
+
+    bucket = TokenBucket(rate_per_s=4.0, burst=2, clock=lambda: now[0], sleep=sleep)
+    waits = [bucket.acquire() for _ in range(4)]
+    assert waits == pytest.approx([0.0, 0.0, 0.25, 0.25])   # burst, then 1/rate apart
+    now[0] += 10.0                                          # idle refills only up to the burst
+    assert [bucket.acquire() for _ in range(3)] == pytest.approx([0.0, 0.0, 0.25])
+    assert sum(slept) == pytest.approx(0.75)
+
+
+# ── Recorded Kambi (BetRivers) responses, served locally ─────────────────────
+
+_GAMES = {
+    101: ("Beta Bears @ Alpha Aces", -150, 130, 9.5, -1.5),
+    102: ("Delta Dogs @ Gamma Goats", 110, -130, 11.5, 1.5),
+    103: ("Zeta Zebras @ Eta Eagles", -200, 165, 8.5, -1.5),
+    104: ("Theta Tigers @ Iota Ibis", -120, 100, 10.5, -1.5),
+}
+
+
+def _betoffers(eid: int) -> dict:
+    name, home_ml, away_ml, total, home_spread = _GAMES[eid]
+    away, home = name.split(" @ ")
+
+    def oc(label: str, american: int, line: float | None = None) -> dict:
+        dec = 1 + (american / 100 if american > 0 else 100 / -american)
+        out = {"label": label, "odds": round(dec * 1000), "oddsAmerican": f"{american:+d}", "status": "OPEN"}
+        if line is not None:
+            out["line"] = round(line * 1000)
+        return out
+
+    return {
+        "events": [{"id": eid, "name": name, "start": "2026-04-10T23:00:00Z"}],
+        "betOffers": [
+            {"criterion": {"label": "Moneyline"}, "outcomes": [oc(home, home_ml), oc(away, away_ml)]},
+            {"criterion": {"label": "Total Runs"}, "outcomes": [oc("Over", -110, total), oc("Under", -110, total)]},
+            {"criterion": {"label": "Run Line"}, "outcomes": [oc(home, 140, home_spread),
+                                                             oc(away, -165, -home_spread)]},
+        ],
+    }
+
+
+class _KambiFixtures(BaseHTTPRequestHandler):
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def do_GET(self) -> None:  # noqa: N802
+        cls = type(self)
+        with cls.lock:
+            cls.in_flight += 1
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+        try:
+            time.sleep(0.05)
+            path = urlsplit(self.path).path
+            if path.endswith("/listView/baseball/ncaa/all/all.json"):
+                body = {"events": [{"event": {"id": eid, "name": g[0]}} for eid, g in _GAMES.items()]}
+            elif "/betoffer/event/" in path:
+                body = _betoffers(int(Path(path).stem))
+            else:
+                self.send_error(404)
+                return
+            data = json.dumps(body).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+        finally:
+            with cls.lock:
+                cls.in_flight -= 1
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def kambi_server(monkeypatch: pytest.MonkeyPatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KambiFixtures)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(betrivers_scraper, "BASE_URL", f"http://127.0.0.1:{server.server_port}/rsiusil")
+    monkeypatch.setattr(betrivers_scraper, "RATE_PER_S", 200.0)
+    fetcher = Fetcher(workers=4, burst=8)
+    set_shared_fetcher(fetcher)
+    _KambiFixtures.max_in_flight = 0
+    yield fetcher
+    set_shared_fetcher(None)
+    fetcher.close()
+    server.shutdown()
+    server.server_close()
+
+
+def test_pull_direct_odds_from_recorded_book(kambi_server: Fetcher, tmp_path: Path) -> None:
+    all_odds = pull_direct_odds.pull_all_direct(["br"])
+
+    # Event odds are fetched concurrently over the pooled session
+    assert kambi_server.stats == {"requests": 1 + len(_GAMES), "errors": 0, "waited_s": 0.0}
+    assert _KambiFixtures.max_in_flight > 1
+
+    assert set(all_odds) == {tuple(reversed(g[0].split(" @ "))) for g in _GAMES.values()}
+    game = all_odds[("Gamma Goats", "Delta Dogs")]
+    assert game["commence_time"] == "2026-04-10T23:00:00Z"
+    br = game["books"]["BetRivers"]
+    assert (br["home_ml"], br["away_ml"]) == (110, -130)
+    assert (br["total_line"], br["over_price"], br["under_price"]) == (11.5, -110, -110)
+    assert (br["spread_line"], br["spread_home_price"], br["spread_away_price"]) == (1.5, 140, -165)
+
+    log = tmp_path / "odds_pull_log.jsonl"
+    assert pull_direct_odds.merge_to_odds_log(all_odds, log) == len(_GAMES)
+    rec = json.loads(log.read_text().splitlines()[0])
+    (entry,) = rec["bookmaker_lines"]
+    assert entry["last_update"] == br["fetched_at"]
+    assert [m["key"] for m in entry["markets"]] == ["h2h", "totals", "spreads"]
+
+
+def test_snapshot_spread_is_measured_from_scrape_completion(
+        kambi_server: Fetcher, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture) -> None:
+    delays = {"br": 0.0, "dk": 1.2}
+
+    def slow_scrape(book: str) -> list[dict]:
+        time.sleep(delays[book])
+        return []
+
+    monkeypatch.setattr(pull_direct_odds, "_scrape_book", slow_scrape)
+    assert pull_direct_odds.pull_all_direct(list(delays)) == {}
+    (line,) = [ln for ln in capsys.readouterr().err.splitlines() if "snapshots within" in ln]
+    assert 1.1 <= float(line.split("within ")[1].split("s")[0]) < 2.0
+
+
+def test_game_rows_prefer_main_line() -> None:
+    base = {"home_team": "Alpha", "away_team": "Beta", "start_time": "2026-04-10T23:00:00Z"}
+    rows = [
+        {**base, "market_type": "total", "side": "over", "line": 8.5, "american_odds": -140},
+        {**base, "market_type": "total", "side": "under", "line": 8.5, "american_odds": 115},
+        {**base, "market_type": "total", "side": "over", "line": 9.5, "american_odds": -110, "is_main": True},
+        {**base, "market_type": "total", "side": "under", "line": 9.5, "american_odds": -110, "is_main": True},
+        {**base, "market_type": "moneyline", "side": "home", "american_odds": -150},   # one side only
+        {**base, "market_type": "period", "side": "home", "american_odds": -150},
+    ]
+    (total,) = pull_direct_odds._game_rows(rows)
+    assert (total["market"], total["line"], total["home_price"], total["away_price"]) == ("totals", 9.5, -110, -110)
+    assert total["commence_time"] == "2026-04-10T23:00:00Z"
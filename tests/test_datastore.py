@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ncaa_baseball import datastore
+from ncaa_baseball.datastore import clear_table_cache, export_csv, read_table, write_table
+
+TEAM_TABLE = (
+    "canonical_id,team_idx,team_name,conference,season,bullpen_adj,wrc_plus,n_games,notes\n"
+    "BSB_A,1,Alpha,SEC,2026,-0.02,101.5,,x\n"
+    "BSB_B,2,Beta,,2026,,nan,12,\n"
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_table_cache()
+    yield
+    clear_table_cache()
+
+
+def test_typed_projected_reads_parse_each_column_once(tmp_path: Path, monkeypatch) -> None:
+    path = tmp_path / "team_table.csv"
+    path.write_text(TEAM_TABLE)
+    parsed: list[list[str]] = []
+    real = datastore._read_columns
+    monkeypatch.setattr(datastore, "_read_columns",
+                        lambda p, kind, cols, schema: parsed.append(cols) or real(p, kind, cols, schema))
+
+    tt = read_table(path, ["canonical_id", "team_idx", "bullpen_adj"])
+    assert list(tt.columns) == ["canonical_id", "team_idx", "bullpen_adj"]
+    assert str(tt["team_idx"].dtype) == "Int64" and tt["bullpen_adj"].dtype == np.float64
+    assert np.isnan(tt.loc[1, "bullpen_adj"])
+
+    full = read_table(path)
+    # Text columns read exactly as dtype=str did; undeclared columns stay text
+    ref = pd.read_csv(path, dtype=str)
+    for c in ("canonical_id", "conference", "notes"):
+        pd.testing.assert_series_equal(full[c], ref[c])
+    assert full["n_games"].isna().tolist() == [True, False] and full.loc[1, "n_games"] == 12
+    assert parsed == [["canonical_id", "team_idx", "bullpen_adj"],
+                      ["team_name", "conference", "season", "wrc_plus", "n_games", "notes"]]
+
+    # Callers get copies; the cache is untouched by their edits
+    full["team_idx"] = 0
+    assert read_table(path)["team_idx"].tolist() == [1, 2] and len(parsed) == 2
+
+    # A rewritten file is re-parsed
+    path.write_text(TEAM_TABLE.replace("BSB_A,1,", "BSB_A,7,"))
+    os.utime(path, ns=(1, 1))
+    assert read_table(path, ["team_idx"])["team_idx"].tolist() == [7, 2]
+    with pytest.raises(KeyError):
+        read_table(path, ["no_such_column"])
+
+
+def test_write_table_without_pyarrow_keeps_csv(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(datastore, "pq", None)
+    df = pd.DataFrame({"canonical_id": ["A", None], "team_idx": [1, 2], "bullpen_adj": [0.5, None]})
+    write_table(df, tmp_path / "team_table.csv", csv=False)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["team_table.csv"]
+    df.to_csv(tmp_path / "ref.csv", index=False)
+    assert (tmp_path / "team_table.csv").read_bytes() == (tmp_path / "ref.csv").read_bytes()
+    assert read_table("team_table", data_dir=tmp_path)["team_idx"].tolist() == [1, 2]
+
+
+def test_parquet_roundtrip_matches_csv(tmp_path: Path) -> None:
+    pytest.importorskip("pyarrow")
+    (tmp_path / "src.csv").write_text(TEAM_TABLE)
+    df = pd.read_csv(tmp_path / "src.csv")
+    write_table(df, tmp_path / "team_table.csv")
+    from_parquet = read_table(tmp_path / "team_table.csv")
+    clear_table_cache()
+    os.remove(tmp_path / "team_table.parquet")
+    pd.testing.assert_frame_equal(from_parquet, read_table(tmp_path / "team_table.csv"))
+
+    write_table(df, tmp_path / "team_table.csv", csv=False)
+    os.remove(tmp_path / "team_table.csv")
+    export_csv(tmp_path / "team_table.csv")
+    pd.testing.assert_frame_equal(read_table(tmp_path / "team_table.csv"), from_parquet)
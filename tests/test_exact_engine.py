@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from ncaa_baseball.exact import exact_game, game_distributions
+from ncaa_baseball.posterior import load_posterior
+from ncaa_baseball.simulation import GameOffsets, simulate_draws, summarize_runs
+from test_simulate_engine import _write_slate
+
+
+def test_distributions_are_normalized_and_never_tied(tmp_path: Path) -> None:
+    paths = _write_slate(tmp_path)
+    post = load_posterior(paths["posterior_csv"], paths["meta_json"])
+    g = GameOffsets(h_idx=1, a_idx=2, hp_idx=1, ap_idx=2, home_const=-1.5, away_const=-1.5)
+    margin, total, _, _ = game_distributions(post, g, np.arange(post.n_draws))
+    np.testing.assert_allclose(margin.sum(axis=1), 1.0, atol=1e-9)
+    np.testing.assert_allclose(total.sum(axis=1), 1.0, atol=1e-9)
+    assert margin[:, 0].max() < 1e-12  # extra innings / coin flip always break the tie
+
+
+def test_low_scoring_extra_innings_match_sampling(tmp_path: Path) -> None:
+    # Rates scaled down ~e^-1.5 so a large share of games go to extra innings.
+    paths = _write_slate(tmp_path)
+    post = load_posterior(paths["posterior_csv"], paths["meta_json"])
+    g = GameOffsets(h_idx=3, a_idx=1, hp_idx=0, ap_idx=2, home_const=-1.5, away_const=-1.5,
+                    home_const_bp=-1.5, away_const_bp=-1.5)
+    exact = exact_game(post, g, post.n_draws, np.random.default_rng(0))
+
+    rng = np.random.default_rng(1)
+    d = np.repeat(np.arange(post.n_draws), 4000)
+    sampled = summarize_runs(*simulate_draws(post, g, d, rng))
+
+    assert set(exact) == set(sampled)
+    for key in ("home_win_prob", "home_rl_cover", "away_rl_cover", "over_prob",
+                "home_win_by_2plus", "away_win_by_3plus"):
+        assert exact[key] == pytest.approx(sampled[key], abs=0.01), key
+    assert exact["exp_total"] == pytest.approx(sampled["exp_total"], rel=1e-9)
+    for key in ("exp_total_p10", "exp_total_p50", "exp_total_p90", "margin_p50"):
+        assert abs(exact[key] - sampled[key]) <= 1.0, key
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pandas as pd
+
+from extract_espn import main
+
+OUTPUTS = ("games.csv", "run_events.csv", "pitcher_appearances.csv", "venue_stats.csv")
+
+
+def _game(event_id: int, day: int, home: str, away: str, hs: int | None, as_: int | None,
+          venue: str = "Park A", run_events: bool = True) -> dict:
+    g = {
+        "event_id": str(event_id),
+        "date": f"2026-03-{day:02d}T18:00Z",
+        "season": 2026,
+        "home_team": {"name": home, "abbreviation": home[:3].upper(), "id": 1},
+        "away_team": {"name": away, "abbreviation": away[:3].upper(), "id": 2},
+        "home_score": hs,
+        "away_score": as_,
+        "venue": {"name": venue, "city": "Town", "state": "TX"},
+        "starters": {"home_pitcher": {"espn_id": 100 + event_id, "name": "H P"}},
+        "boxscore": {home[:3].upper(): {"pitching": [
+            {"espn_id": 100 + event_id, "name": "H P", "starter": True,
+             "stats": {"IP": "5.1", "H": "4", "ER": "2", "PC": "88"}},
+            {"espn_id": 900, "name": "R P", "stats": {"IP": "1.2", "K": "3"}},
+        ]}},
+    }
+    if run_events:
+        g["run_events"] = {"home": {"run_1": hs or 0, "run_2": 1}, "away": {"run_1": as_ or 0}}
+    return g
+
+
+def _lines(games: list[dict]) -> str:
+    return "".join(json.dumps(g) + "\n" for g in games)
+
+
+def _setup(tmp_path: Path) -> tuple[Path, Path]:
+    espn = tmp_path / "espn"
+    espn.mkdir()
+    canonical = tmp_path / "canonical.csv"
+    pd.DataFrame({
+        "canonical_id": ["T_ALPHA", "T_BETA", "T_GAMMA"],
+        "ncaa_teams_id": [1, 2, 3],
+        "team_name": ["Alpha", "Beta", "Gamma"],
+        "odds_api_name": ["", "", ""],
+        "espn_name": ["Alpha Aces", "Beta Bears", ""],
+    }).to_csv(canonical, index=False)
+    return espn, canonical
+
+
+def _run(espn: Path, canonical: Path, out: Path, *extra: str) -> None:
+    assert main(["--espn-dir", str(espn), "--canonical", str(canonical), "--out-dir", str(out),
+                 "--seasons", "2025,2026", "--workers", "1", *extra]) == 0
+
+
+def _assert_same_outputs(a: Path, b: Path) -> None:
+    for name in OUTPUTS:
+        assert (a / name).read_bytes() == (b / name).read_bytes(), name
+
+
+def test_incremental_extract_matches_full_rebuild(tmp_path: Path, capsys) -> None:
+    espn, canonical = _setup(tmp_path)
+    f25, f26 = espn / "games_2025.jsonl", espn / "games_2026.jsonl"
+    f25.write_text(_lines([_game(1, 1, "Alpha Aces", "Beta Bears", 5, 3),
+                           _game(2, 2, "Beta Bears", "Gamma Goats", 2, 7, venue="Park B")]))
+    first = [_game(10, 5, "Alpha Aces", "Gamma Goats", 4, 4),
+             _game(11, 6, "Gamma Goats", "Alpha Aces", None, None, run_events=False)]
+    partial = json.dumps(_game(12, 7, "Beta Bears", "Alpha Aces", 1, 0))
+    f26.write_text(_lines(first) + partial[:40])          # scraper mid-write
+
+    inc = tmp_path / "inc"
+    _run(espn, canonical, inc)
+    manifest = json.loads((inc / "extract_manifest.json").read_text())
+    assert manifest["inputs"]["2026"]["lines"] == 2
+    assert manifest["inputs"]["2026"]["offset"] == len(_lines(first).encode())
+
+    # Daily scrape: the partial line completes, new games arrive, game 10 is re-scraped
+    with f26.open("a") as f:
+        f.write(partial[40:] + "\n")
+        f.write(_lines([_game(13, 8, "Alpha Aces", "Beta Bears", 9, 1),
+                        _game(10, 5, "Alpha Aces", "Gamma Goats", 6, 4),
+                        _game(14, 9, "Unknown U", "Beta Bears", 3, 2, venue="Park B")]))
+    capsys.readouterr()
+    _run(espn, canonical, inc)
+    log = capsys.readouterr().out
+    assert "2025: 0 lines parsed" in log and "2026: 4 lines parsed (tail" in log
+
+    full = tmp_path / "full"
+    _run(espn, canonical, full, "--full", "--workers", "2")
+    _assert_same_outputs(inc, full)
+
+    games = pd.read_csv(full / "games.csv", dtype=str)
+    assert games["event_id"].tolist() == ["1", "2", "11", "12", "13", "10", "14"]
+    assert games.set_index("event_id").loc["10", "home_score"] == "6"
+    pitchers = pd.read_csv(full / "pitcher_appearances.csv", dtype=str)
+    assert (pitchers["event_id"] == "10").sum() == 2
+
+
+def test_rewritten_file_is_reparsed(tmp_path: Path, capsys) -> None:
+    espn, canonical = _setup(tmp_path)
+    f25 = espn / "games_2025.jsonl"
+    f25.write_text(_lines([_game(1, 1, "Alpha Aces", "Beta Bears", 5, 3),
+                           _game(2, 2, "Beta Bears", "Gamma Goats", 2, 7)]))
+    inc = tmp_path / "inc"
+    _run(espn, canonical, inc)
+
+    # A corrected score in place (same length, not an append)
+    f25.write_text(_lines([_game(1, 1, "Alpha Aces", "Beta Bears", 3, 5),
+                           _game(2, 2, "Beta Bears", "Gamma Goats", 2, 7),
+                           _game(3, 3, "Gamma Goats", "Beta Bears", 1, 2)]))
+    capsys.readouterr()
+    _run(espn, canonical, inc)
+    assert "2025: 3 lines parsed (full)" in capsys.readouterr().out
+
+    full = tmp_path / "full"
+    _run(espn, canonical, full, "--full")
+    _assert_same_outputs(inc, full)
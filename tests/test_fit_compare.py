@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ncaa_baseball.fit_compare import compare_fits, pad_posterior, parameter_deltas
+from ncaa_baseball.posterior import posterior_from_arrays
+from ncaa_baseball.simulation import GameOffsets
+
+
+def _posterior(n_teams: int = 3, n_pitchers: int = 2, shift: float = 0.0, scale: float = 1.0,
+               seed: int = 0):
+    rng = np.random.default_rng(seed)
+    n = 400
+    arrays = {
+        "int_run": np.array([1.2, -0.1, -1.3, -2.1]) + rng.normal(0, 0.05, (n, 4)) * scale,
+        "theta_run": rng.uniform(20, 40, (n, 2)),
+        "home_adv": 0.05 + shift + rng.normal(0, 0.02, n) * scale,
+        "beta_park": 1 + rng.normal(0, 0.1, n) * scale,
+        "beta_bullpen": rng.normal(0, 0.05, n) * scale,
+        "att": np.zeros((n, n_teams + 1, 4)),
+        "def_": np.zeros((n, n_teams + 1, 4)),
+        "pitcher_ab": np.zeros((n, n_pitchers + 1)),
+    }
+    arrays["att"][:, 1:] = rng.normal(0, 0.1, (n, n_teams, 4)) * scale
+    arrays["def_"][:, 1:] = rng.normal(0, 0.1, (n, n_teams, 4)) * scale
+    arrays["pitcher_ab"][:, 1:] = rng.normal(0, 0.1, (n, n_pitchers)) * scale
+    return posterior_from_arrays(arrays, n_teams, n_pitchers)
+
+
+SLATE = [
+    GameOffsets(h_idx=1, a_idx=2, hp_idx=1, ap_idx=2, park_factor=0.0),
+    GameOffsets(h_idx=3, a_idx=1, hp_idx=0, ap_idx=1, park_factor=0.05),
+]
+
+
+def test_identical_fits_are_safe_with_zero_deltas() -> None:
+    ref = _posterior()
+    summary, params, slate = compare_fits(ref, _posterior(), SLATE, home_won=np.array([1.0, 0.0]),
+                                          n_draws=50)
+    assert np.allclose(params["mean_delta"], 0) and np.allclose(params["sd_ratio"], 1)
+    assert summary["max_abs_winprob_delta"] == 0
+    assert summary["brier_ref"] == summary["brier_new"]
+    assert summary["safe_for_intraday"]
+    assert list(slate["home_won"]) == [1.0, 0.0]
+
+
+def test_shifted_or_underdispersed_fit_is_flagged() -> None:
+    ref = _posterior()
+    shifted, _, _ = compare_fits(ref, _posterior(shift=0.2), SLATE, n_draws=50)
+    assert shifted["max_abs_mean_shift_sd_global"] > 5
+    assert shifted["max_abs_winprob_delta"] > 0.02
+    assert not shifted["safe_for_intraday"]
+
+    narrow = parameter_deltas(ref, _posterior(scale=0.5, seed=1))
+    assert narrow["sd_ratio"].median() < 0.7
+
+
+def test_new_teams_and_pitchers_pad_the_reference_at_zero() -> None:
+    ref = _posterior()
+    grown = _posterior(n_teams=4, n_pitchers=3)
+    padded = pad_posterior(ref, grown.N_teams, grown.N_pitchers)
+    assert padded.att.shape[1] == 5 and padded.pitcher_ab.shape[1] == 4
+    assert not padded.att[:, 4].any() and not padded.pitcher_ab[:, 3].any()
+    np.testing.assert_array_equal(padded.att[:, :4], ref.att)
+
+    games = SLATE + [GameOffsets(h_idx=4, a_idx=1, hp_idx=3, ap_idx=0, park_factor=0.0)]
+    summary, params, slate = compare_fits(ref, grown, games, n_draws=20)
+    assert len(slate) == 3 and "att[4,1]" not in set(params["param"])
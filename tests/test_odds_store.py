@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pandas as pd
+
+from export_web_data import load_opening_lines
+from ncaa_baseball import odds_store
+from ncaa_baseball.odds_store import OddsStore, open_odds_store
+
+
+def _rec(home: str, away: str, date: str, fetched: str, books: dict[str, tuple]) -> dict:
+    lines = []
+    for book, (h_ml, a_ml, total) in books.items():
+        lines.append({"bookmaker_key": book, "markets": [
+            {"key": "h2h", "outcomes": [{"name": home, "price": h_ml}, {"name": away, "price": a_ml}]},
+            {"key": "totals", "outcomes": [{"name": "Over", "point": total, "price": -110},
+                                           {"name": "Under", "point": total, "price": -110}]},
+        ]})
+    return {"home_team": home, "away_team": away, "commence_time": f"{date}T23:00:00Z",
+            "fetched_at": fetched, "bookmaker_lines": lines}
+
+
+def _append(log: Path, *recs: dict, partial: str = "") -> None:
+    with open(log, "a") as f:
+        for r in recs:
+            f.write(json.dumps(r) + "\n")
+        f.write(partial)
+
+
+def _canonical(path: Path, alpha_name: str = "Alpha Aces") -> Path:
+    pd.DataFrame({"canonical_id": ["BSB_A", "BSB_B", "BSB_C"],
+                  "team_name": ["Alpha", "Beta", "Gamma"],
+                  "odds_api_name": [alpha_name, "Beta Bears", "Gamma Goats"]}).to_csv(path, index=False)
+    return path
+
+
+def test_incremental_import_and_indexed_queries(tmp_path: Path) -> None:
+    log, canon = tmp_path / "odds_pull_log.jsonl", _canonical(tmp_path / "canon.csv")
+    day = "2026-04-10"
+    _append(log,
+            _rec("Alpha Aces", "Beta Bears", day, "t1", {"dk": (-150, 130, 9.5), "fd": (-145, 125, 9.5)}),
+            _rec("Gamma Goats", "Beta Bears", "2026-04-11", "t1", {"dk": (110, -130, 11.5)}))
+    with open_odds_store(log, canonical_csv=canon) as store:
+        assert store.db_path == tmp_path / "odds_pull_log.sqlite"
+        assert len(list(store.records())) == 2
+
+    # Later pulls append; a half-written line waits for the next sync
+    later = _rec("Alpha Aces", "Beta Bears", day, "t2", {"dk": (-170, 150, 10.5)})
+    text = json.dumps(_rec("Alpha", "Gamma Goats", day, "t3", {"mgm": (-120, 100, 8.5)}))
+    _append(log, later, partial=text[:20])
+    with OddsStore(log, canonical_csv=canon) as store:
+        assert store.sync() == 1
+        _append(log, partial=text[20:] + "\n")
+        assert store.sync() == 1 and store.sync() == 0
+
+        assert [r["fetched_at"] for r in store.records(game_date=day, resolved=True)] == ["t1", "t2", "t3"]
+        opening = store.opening_records(day)
+        assert opening[("Alpha Aces", "Beta Bears")]["fetched_at"] == "t1"
+        latest = store.latest_records(day)
+        assert set(latest) == {("BSB_A", "BSB_B"), ("BSB_A", "BSB_C")}
+        assert latest[("BSB_A", "BSB_B")]["fetched_at"] == "t2"
+
+        # Each book's own latest quote; best price across books
+        quotes = store.quotes(day, "BSB_A", "BSB_B", "h2h")
+        assert {(q["book"], q["outcome"]): q["price"] for q in quotes} == {
+            ("dk", "home"): -170, ("dk", "away"): 150, ("fd", "home"): -145, ("fd", "away"): 125}
+        best = store.best_prices(day, "BSB_A", "BSB_B")
+        assert (best["home"]["book"], best["home"]["price"]) == ("fd", -145)
+        assert (best["away"]["book"], best["away"]["price"]) == ("dk", 150)
+        opening_totals = store.quotes(day, "BSB_A", "BSB_B", "totals", which="opening")
+        assert {q["point"] for q in opening_totals if q["book"] == "dk"} == {9.5}
+
+    assert load_opening_lines(log, day) == {
+        ("Alpha Aces", "Beta Bears"): {"open_home_ml": -145, "open_away_ml": 130, "open_total_line": 9.5},
+        ("Alpha", "Gamma Goats"): {"open_home_ml": -120, "open_away_ml": 100, "open_total_line": 8.5},
+    }
+
+
+def test_registry_change_and_log_rewrite(tmp_path: Path) -> None:
+    log, canon = tmp_path / "odds_pull_log.jsonl", _canonical(tmp_path / "canon.csv", "Alpha U")
+    day = "2026-04-10"
+    _append(log, _rec("Alpha Aces", "Beta Bears", day, "t1", {"dk": (-150, 130, 9.5)}))
+    with open_odds_store(log, canonical_csv=canon) as store:
+        assert store.latest_records(day) == {}
+
+    # The registry learns the odds name: stored snapshots re-resolve
+    _canonical(canon)
+    os.utime(canon, ns=(1, 1))
+    with open_odds_store(log, canonical_csv=canon) as store:
+        assert list(store.latest_records(day)) == [("BSB_A", "BSB_B")]
+        assert store.best_prices(day, "BSB_A", "BSB_B")["home"]["price"] == -150
+    # Opened without a registry, the resolved ids are kept
+    with open_odds_store(log) as store:
+        assert list(store.latest_records(day)) == [("BSB_A", "BSB_B")]
+
+    # A rewritten (not appended) log is re-imported from scratch
+    log.write_text("")
+    _append(log, _rec("Gamma Goats", "Beta Bears", day, "t9", {"fd": (100, -120, 7.5)}))
+    with open_odds_store(log, canonical_csv=canon) as store:
+        assert [r["fetched_at"] for r in store.records()] == ["t9"]
+        assert store.quotes(day, "BSB_A", "BSB_B") == []
+
+
+def test_rewrite_past_the_first_block_is_detected(tmp_path: Path) -> None:
+    log, canon = tmp_path / "odds_pull_log.jsonl", _canonical(tmp_path / "canon.csv")
+    day = "2026-04-10"
+    recs = [_rec("Alpha Aces", "Beta Bears", day, f"t{i:03d}", {"dk": (-150, 130, 9.5)})
+            for i in range(60)]
+    _append(log, *recs)
+    assert log.stat().st_size > 8192
+    with open_odds_store(log, canonical_csv=canon) as store:
+        assert len(list(store.records())) == 60
+
+    # Same length, edited in place near the end, then appended to
+    log.write_text(log.read_text().replace('"t058"', '"x058"'))
+    _append(log, _rec("Gamma Goats", "Beta Bears", day, "t999", {"fd": (100, -120, 7.5)}))
+    with OddsStore(log, canonical_csv=canon) as store:
+        assert store.sync() == 61
+        fetched = [r["fetched_at"] for r in store.records()]
+    assert len(fetched) == 61 and "x058" in fetched and "t058" not in fetched
+
+
+def test_sync_verifies_only_the_last_blocks(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(odds_store, "_HASH_BLOCK", 1024)
+    reads: list[int] = []
+    real_read = odds_store._read_span
+
+    def counting_read(path: Path, start: int, stop: int) -> bytes:
+        reads.append(stop - start)
+        return real_read(path, start, stop)
+
+    monkeypatch.setattr(odds_store, "_read_span", counting_read)
+    log, canon = tmp_path / "odds_pull_log.jsonl", _canonical(tmp_path / "canon.csv")
+    day = "2026-04-10"
+    _append(log, *[_rec("Alpha Aces", "Beta Bears", day, f"t{i:03d}", {"dk": (-150, 130, 9.5)})
+                   for i in range(60)])
+    size = log.stat().st_size
+    with OddsStore(log, canonical_csv=canon) as store:
+        assert store.sync() == 60
+        assert store.sync() == 0
+    assert reads == [1024 + size % 1024]
+
+    # An in-place edit inside the last checkpointed block is caught
+    text = log.read_text()
+    block_start = size - size % 1024 - 1024
+    stamp = next(f"t{i:03d}" for i in range(60) if text.find(f'"t{i:03d}"') >= block_start)
+    log.write_text(text.replace(f'"{stamp}"', '"x999"'))
+    with OddsStore(log, canonical_csv=canon) as store:
+        assert store.sync() == 60
+        assert "x999" in [r["fetched_at"] for r in store.records()]
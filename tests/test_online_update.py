@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import json
+import math
+
+import numpy as np
+
+from ncaa_baseball.model_runtime import SCORING_CALIBRATION
+from ncaa_baseball.online_update import (
+    importance_weights,
+    log_likelihood,
+    systematic_resample,
+)
+from ncaa_baseball.posterior import Posterior, clear_posterior_cache, load_posterior, write_bundle
+from ncaa_baseball.simulation import GameOffsets
+
+
+def _arrays(n: int = 300, n_teams: int = 2, n_pitchers: int = 1, seed: int = 0) -> dict:
+    rng = np.random.default_rng(seed)
+    att = np.zeros((n, n_teams + 1, 4))
+    att[:, 1] = rng.normal(0, 0.3, (n, 1))  # team 1's offense is the uncertain quantity
+    return {
+        "int_run": np.tile([0.8, -0.4, -1.5, -2.3], (n, 1)),
+        "theta_run": rng.uniform(5, 30, (n, 2)),
+        "home_adv": rng.normal(0.05, 0.02, n),
+        "beta_park": np.ones(n),
+        "beta_bullpen": np.zeros(n),
+        "att": att,
+        "def_": np.zeros((n, n_teams + 1, 4)),
+        "pitcher_ab": np.zeros((n, n_pitchers + 1)),
+    }
+
+
+def _scalar_log_lik(eta: float, y: int, phi: float | None) -> float:
+    if phi is None:
+        return y * eta - math.exp(eta) - math.lgamma(y + 1)
+    mu = math.exp(eta)
+    return (math.lgamma(y + phi) - math.lgamma(phi) - math.lgamma(y + 1)
+            + phi * math.log(phi / (phi + mu)) + y * math.log(mu / (phi + mu)))
+
+
+def test_log_likelihood_matches_negbin_poisson_pmf() -> None:
+    arrays = _arrays(n=5)
+    post = Posterior(**arrays, N_teams=2, N_pitchers=1)
+    g = GameOffsets(h_idx=np.array([1, 2]), a_idx=np.array([2, 1]),
+                    hp_idx=np.array([1, 0]), ap_idx=np.array([0, 1]),
+                    park_factor=np.array([0.1, -0.05]))
+    home_runs = np.array([[4, 1, 0, 1], [0, 0, 0, 0]])
+    away_runs = np.array([[2, 0, 1, 0], [7, 2, 0, 0]])
+    got = log_likelihood(post, g, home_runs, away_runs)
+
+    want = np.zeros(5)
+    for d in range(5):
+        for i in range(2):
+            h, a = g.h_idx[i], g.a_idx[i]
+            park = arrays["beta_park"][d] * g.park_factor[i]
+            for k in range(4):
+                phi = arrays["theta_run"][d, k] if k < 2 else None
+                eta_h = (arrays["int_run"][d, k] + arrays["att"][d, h, k]
+                         + arrays["home_adv"][d] + park)
+                eta_a = arrays["int_run"][d, k] + arrays["att"][d, a, k] + park
+                want[d] += _scalar_log_lik(eta_h, home_runs[i, k], phi)
+                want[d] += _scalar_log_lik(eta_a, away_runs[i, k], phi)
+    # Dropped terms are constant across draws: compare up to one offset
+    np.testing.assert_allclose(got - got[0], want - want[0], atol=1e-9)
+
+
+def test_reweighting_moves_team_strength_toward_new_results() -> None:
+    arrays = _arrays()
+    post = Posterior(**arrays, N_teams=2, N_pitchers=1)
+    n_games = 6
+    g = GameOffsets(h_idx=np.full(n_games, 1), a_idx=np.full(n_games, 2),
+                    hp_idx=np.zeros(n_games, int), ap_idx=np.zeros(n_games, int))
+    home_runs = np.tile([6, 2, 1, 1], (n_games, 1))  # team 1 keeps scoring heavily
+    away_runs = np.tile([2, 1, 0, 0], (n_games, 1))
+
+    weights, ess = importance_weights(log_likelihood(post, g, home_runs, away_runs))
+    assert 1 < ess < post.n_draws
+    idx = systematic_resample(weights, np.random.default_rng(0))
+    assert len(idx) == post.n_draws and np.all(np.diff(idx) >= 0)
+    assert arrays["att"][idx, 1, 0].mean() > arrays["att"][:, 1, 0].mean() + 0.1
+
+
+def test_updated_bundle_loads_directly(tmp_path) -> None:
+    arrays = _arrays(n=10)
+    meta = tmp_path / "meta.json"
+    meta.write_text(json.dumps({"N_teams": 2, "N_pitchers": 1}))
+    bundle = write_bundle(tmp_path / "posterior_updated.bundle", arrays,
+                          {"N_teams": 2, "N_pitchers": 1, "update": {"n_games": 3}})
+    clear_posterior_cache()
+    post = load_posterior(bundle, meta)
+    clear_posterior_cache()
+    assert post.n_draws == 10
+    np.testing.assert_allclose(post.int_run, arrays["int_run"] + SCORING_CALIBRATION)
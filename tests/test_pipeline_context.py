@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+
+from compute_game_context import compute_recent_form, compute_rest_fatigue
+from ncaa_baseball.datastore import clear_table_cache
+from ncaa_baseball.pipeline_context import PipelineContext
+
+
+def _write(tmp_path: Path) -> PipelineContext:
+    pd.DataFrame({
+        "canonical_id": ["BSB_A", "BSB_B"],
+        "ncaa_teams_id": [1, 2],
+        "team_name": ["Alpha", "Beta"],
+        "odds_api_name": ["Alpha Aces", ""],
+    }).to_csv(tmp_path / "canonical.csv", index=False)
+    pd.DataFrame({"canonical_id": ["BSB_A", "BSB_B"], "team_idx": [1, 2],
+                  "conference": ["SEC", None]}).to_csv(tmp_path / "team_table.csv", index=False)
+    days = pd.date_range("2026-03-01", periods=12).strftime("%Y-%m-%d")
+    pd.DataFrame({
+        "game_date": days,
+        "home_canonical_id": ["BSB_A", "BSB_B"] * 6,
+        "away_canonical_id": ["BSB_B", "BSB_A"] * 6,
+        "home_score": [5, 2, 9, 4, 7, 1, 3, 8, 6, 2, 11, None],
+        "away_score": [3, 6, 1, 4, 2, 5, 3, 0, 7, 2, 4, None],
+    }).to_csv(tmp_path / "games.csv", index=False)
+    return PipelineContext(team_table_csv=tmp_path / "team_table.csv",
+                           games_csv=tmp_path / "games.csv",
+                           canonical_csv=tmp_path / "canonical.csv")
+
+
+def test_tables_load_lazily_once_and_return_copies(tmp_path: Path) -> None:
+    ctx = _write(tmp_path)
+    assert ctx.loaded() == []
+    tt = ctx.table("team_table")
+    tt["team_idx"] = 0
+    assert ctx.table("team_table")["team_idx"].tolist() == [1, 2]
+    assert ctx.table("team_table", ["conference"]).columns.tolist() == ["conference"]
+
+    resolver = ctx.team_resolver()
+    assert resolver is ctx.team_resolver()
+    assert resolver.canonical_id("Alpha Aces") == "BSB_A"
+    assert ctx.canonical_raw()["ncaa_teams_id"].tolist() == ["1", "2"]
+    assert sorted(ctx.loaded()) == ["canonical", "canonical_raw", "team_resolver", "team_table"]
+
+
+def test_context_stages_match_path_based_calls(tmp_path: Path) -> None:
+    ctx = _write(tmp_path)
+    games = tmp_path / "games.csv"
+    teams = ["BSB_A", "BSB_B"]
+    for day in ("2026-03-08", "2026-03-13"):
+        clear_table_cache()
+        assert compute_rest_fatigue(games, day, teams, ctx=ctx) == compute_rest_fatigue(games, day, teams)
+        assert compute_recent_form(games, day, teams, ctx=ctx) == compute_recent_form(games, day, teams)
+    assert ctx.loaded() == ["games"]
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import importlib
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ncaa_baseball import posterior as posterior_mod
+from ncaa_baseball.model_runtime import SCORING_CALIBRATION
+from ncaa_baseball.posterior import bundle_path, clear_posterior_cache, load_posterior
+
+
+def _write_posterior(tmp_path: Path, bracket: bool = True, seed: int = 0) -> tuple[Path, Path]:
+    rng = np.random.default_rng(seed)
+    n_draws, n_teams, n_pitchers = 8, 3, 2
+    fmt = "{}[{}]" if bracket else "{}.{}"
+    cols: dict[str, np.ndarray] = {
+        "home_advantage": rng.normal(size=n_draws),
+        "beta_park": rng.normal(size=n_draws),
+        "beta_bullpen": rng.normal(size=n_draws),
+    }
+    for k in range(1, 5):
+        cols[f"int_run_{k}"] = rng.normal(size=n_draws)
+        for t in range(1, n_teams + 1):
+            cols[fmt.format(f"att_run_{k}", t)] = rng.normal(size=n_draws)
+            cols[fmt.format(f"def_run_{k}", t)] = rng.normal(size=n_draws)
+    for k in range(1, 3):
+        cols[f"theta_run_{k}"] = rng.uniform(1, 5, size=n_draws)
+    for p in range(1, n_pitchers + 1):
+        cols[fmt.format("pitcher_ability", p)] = rng.normal(size=n_draws)
+    csv = tmp_path / "posterior.csv"
+    meta = tmp_path / "meta.json"
+    pd.DataFrame(cols).to_csv(csv, index=False)
+    meta.write_text(json.dumps({"N_teams": n_teams, "N_pitchers": n_pitchers}))
+    return csv, meta
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_posterior_cache()
+    yield
+    clear_posterior_cache()
+
+
+def test_first_load_converts_and_second_load_memory_maps(tmp_path: Path) -> None:
+    csv, meta = _write_posterior(tmp_path)
+    first = load_posterior(csv, meta)
+    assert (bundle_path(csv) / "meta.json").exists()
+    clear_posterior_cache()
+    second = load_posterior(csv, meta)
+
+    assert isinstance(second.att, np.memmap)
+    for key in ("int_run", "theta_run", "home_adv", "att", "def_", "pitcher_ab"):
+        np.testing.assert_array_equal(getattr(first, key), getattr(second, key))
+
+    draws = pd.read_csv(csv)
+    np.testing.assert_allclose(second.int_run[:, 0], draws["int_run_1"] + SCORING_CALIBRATION)
+    np.testing.assert_array_equal(second.att[:, 2, 1], draws["att_run_2[2]"])
+    np.testing.assert_array_equal(second.pitcher_ab[:, 1], draws["pitcher_ability[1]"])
+    assert (second.att[:, 0, :] == 0).all()
+
+
+def test_rewritten_csv_triggers_reconversion(tmp_path: Path) -> None:
+    csv, meta = _write_posterior(tmp_path, seed=0)
+    before = load_posterior(csv, meta).home_adv.copy()
+    _write_posterior(tmp_path, seed=1)
+    os.utime(csv, ns=(1, 1))  # force a different fingerprint even within one mtime tick
+    after = load_posterior(csv, meta).home_adv
+    np.testing.assert_array_equal(after, pd.read_csv(csv)["home_advantage"])
+    assert not np.array_equal(before, after)
+
+
+def test_pymc_dot_notation_columns(tmp_path: Path) -> None:
+    csv, meta = _write_posterior(tmp_path, bracket=False)
+    post = load_posterior(csv, meta)
+    np.testing.assert_array_equal(post.def_[:, 3, 3], pd.read_csv(csv)["def_run_4.3"])
+
+
+def test_loader_is_cached_per_process_and_read_only(tmp_path: Path) -> None:
+    csv, meta = _write_posterior(tmp_path)
+    post = load_posterior(csv, meta)
+    assert load_posterior(str(csv), str(meta)) is post
+    assert post.n_draws == 8 and post.N_teams == 3 and post.N_pitchers == 2
+    for key in ("int_run", "theta_run", "home_adv", "beta_park", "beta_bullpen",
+                "att", "def_", "pitcher_ab"):
+        with pytest.raises(ValueError):
+            getattr(post, key)[0, ...] = 0.0
+
+
+SCRIPTS = (
+    "simulate",
+    "backtest_fast",
+    "backtest_posterior",
+    "simulate_matchup",
+    "simulate_run_event_game",
+)
+
+
+@pytest.mark.parametrize("script", SCRIPTS)
+def test_scripts_share_one_calibrated_posterior(tmp_path: Path, script: str) -> None:
+    csv, meta = _write_posterior(tmp_path)
+    shared = load_posterior(csv, meta)
+    module = importlib.import_module(script)
+    assert module.load_posterior is posterior_mod.load_posterior
+    post = module.load_posterior(csv, meta)
+    assert post is shared
+    draws = pd.read_csv(csv)
+    raw = draws[[f"int_run_{k}" for k in range(1, 5)]].to_numpy()
+    np.testing.assert_allclose(post.int_run, raw + SCORING_CALIBRATION)
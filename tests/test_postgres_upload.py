@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import csv
+import io
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+import load_baseball_to_postgres as lbp
+from ncaa_baseball.upload_hashes import UploadHashes
+
+
+class _Copy:
+    def __init__(self, cur: "_FakeCursor") -> None:
+        self.cur = cur
+        self.buf = io.BytesIO()
+
+    def __enter__(self) -> "_Copy":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.cur.copied.append(list(csv.reader(io.StringIO(self.buf.getvalue().decode()))))
+
+    def write(self, data: bytes) -> None:
+        self.buf.write(data)
+
+
+class _FakeCursor:
+    """In-process stand-in for a psycopg cursor: records statements and COPY payloads."""
+
+    COLUMN_TYPES = {"game_date": "date", "game_time": "timestamp with time zone", "home_ml": "integer",
+                    "away_ml": "integer", "home_win_prob": "double precision", "data": "jsonb"}
+
+    def __init__(self) -> None:
+        self.statements: list[str] = []
+        self.copied: list[list[list[str]]] = []
+        self.rowcount = -1
+        self._result: list[tuple] = []
+
+    def __enter__(self) -> "_FakeCursor":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        pass
+
+    def execute(self, sql: str, params: tuple | None = None) -> None:
+        self.statements.append(" ".join(sql.split()))
+        if "information_schema.columns" in sql:
+            self._result = list(self.COLUMN_TYPES.items())
+        elif sql.lstrip().startswith("INSERT"):
+            self.rowcount = len(self.copied[-1])
+
+    def executemany(self, sql: str, rows: list) -> None:
+        raise AssertionError("row-at-a-time executemany is not used")
+
+    def fetchall(self) -> list[tuple]:
+        return self._result
+
+    def copy(self, sql: str) -> _Copy:
+        self.statements.append(sql)
+        return _Copy(self)
+
+
+class _FakeConnection:
+    opened: list["_FakeConnection"] = []
+
+    def __init__(self) -> None:
+        self.cur = _FakeCursor()
+        self.commits = 0
+        _FakeConnection.opened.append(self)
+
+    def __enter__(self) -> "_FakeConnection":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        pass
+
+    def cursor(self) -> _FakeCursor:
+        return self.cur
+
+    def commit(self) -> None:
+        self.commits += 1
+
+    def rollback(self) -> None:
+        pass
+
+
+def _predictions(path: Path, home_prob: str = "0.61") -> Path:
+    pd.DataFrame({
+        "home": ["Alpha", "Gamma", "Eta"], "away": ["Beta", "Delta", "Zeta"],
+        "home_cid": ["BSB_A", "BSB_G", "BSB_E"], "away_cid": ["BSB_B", "BSB_D", "BSB_Z"],
+        "start_utc": ["2026-04-10T23:00:00Z", "", "2026-04-10T18:00:00Z"],
+        "home_win_prob": [home_prob, "0.48", "0.55"], "away_win_prob": ["0.39", "0.52", "0.45"],
+        "ml_home": ["-156", "108", "-122"], "ml_away": ["156", "-108", "122"],
+        "exp_home": ["6.1", "5.0", "4.4"], "exp_away": ["4.9", "5.2", "4.0"], "exp_total": ["11.0", "10.2", "8.4"],
+        "over_prob": ["0.52", "", "0.47"], "hp_confirmed": ["1", "0", "1"], "ap_confirmed": ["0", "0", "1"],
+    }).to_csv(path, index=False)
+    return path
+
+
+def test_projections_staged_copy_and_diff_only(tmp_path: Path) -> None:
+    csv_path = _predictions(tmp_path / "predictions_2026-04-10.csv")
+    hashes = UploadHashes(tmp_path / "upload_hashes.json", "db1")
+
+    cur = _FakeCursor()
+    assert lbp.upload_projections_to_syndicate("2026-04-10", csv_path, cur=cur, hashes=hashes) == 3
+    (payload,) = cur.copied
+    assert [row[1] for row in payload] == ["bsb_20260410_beta_alpha", "bsb_20260410_delta_gamma",
+                                           "bsb_20260410_zeta_eta"]
+    (merge,) = [s for s in cur.statements if s.startswith("INSERT INTO public.projections")]
+    assert "ON CONFLICT (sport, game_id, model_version) DO UPDATE" in merge
+    assert '"data"::jsonb' in merge and '"game_time"::timestamp with time zone' in merge
+    assert 'now() AS "updated_at"' in merge and '"updated_at" = now()' in merge
+
+    # Not committed yet: a rolled-back upload is resent in full
+    hashes.discard()
+    cur = _FakeCursor()
+    assert lbp.upload_projections_to_syndicate("2026-04-10", csv_path, cur=cur, hashes=hashes) == 3
+    hashes.save()
+
+    # Unchanged slate: nothing is sent at all
+    hashes = UploadHashes(tmp_path / "upload_hashes.json", "db1")
+    cur = _FakeCursor()
+    assert lbp.upload_projections_to_syndicate("2026-04-10", csv_path, cur=cur, hashes=hashes) == 0
+    assert cur.statements == []
+
+    # One changed game: only that row is staged; another database gets everything
+    _predictions(csv_path, home_prob="0.64")
+    cur = _FakeCursor()
+    assert lbp.upload_projections_to_syndicate("2026-04-10", csv_path, cur=cur, hashes=hashes) == 1
+    assert [row[1] for row in cur.copied[0]] == ["bsb_20260410_beta_alpha"]
+    other = UploadHashes(tmp_path / "upload_hashes.json", "db2")
+    assert len(other.changed("public.projections", lbp.projection_rows("2026-04-10", csv_path),
+                             lbp.PROJECTION_KEY)) == 3
+
+
+def test_several_dates_staged_in_one_transaction_all_become_unchanged(
+        tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    Path("data/processed").mkdir(parents=True)
+    dates = ["2026-04-10", "2026-04-11"]
+    for date in dates:
+        _predictions(Path(f"data/processed/predictions_{date}.csv"))
+
+    def run() -> list[int]:
+        hashes = UploadHashes(tmp_path / "upload_hashes.json", "db1")
+        sent = [lbp.load_predictions(_FakeCursor(), date, hashes=hashes) for date in dates]
+        hashes.save()
+        return sent
+
+    assert run() == [3, 3]
+    assert run() == [0, 0]
+
+
+def test_main_uses_one_connection_and_saves_hashes_after_commit(
+        tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    Path("data/processed").mkdir(parents=True)
+    _predictions(Path("data/processed/predictions_2026-04-10.csv"))
+    monkeypatch.setattr(lbp, "connect", lambda dsn: _FakeConnection())
+    _FakeConnection.opened = []
+
+    argv = ["load_baseball_to_postgres.py", "--dsn", "postgresql://test", "--table", "projections",
+            "--date", "2026-04-10"]
+    monkeypatch.setattr(sys, "argv", argv)
+    assert lbp.main() == 0
+    (conn,) = _FakeConnection.opened
+    assert conn.commits == 1 and len(conn.cur.copied) == 1
+    assert Path("data/processed/upload_hashes.json").exists()
+
+    assert lbp.main() == 0                                   # refresh of an unchanged slate
+    assert _FakeConnection.opened[-1].cur.statements == []
+
+    monkeypatch.setattr(sys, "argv", argv + ["--full"])
+    assert lbp.main() == 0
+    assert len(_FakeConnection.opened[-1].cur.copied[0]) == 3
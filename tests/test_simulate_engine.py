@@ -0,0 +1,335 @@
+from __future__ import annotations
+
+import json
+import pickle
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ncaa_baseball import simulation
+from ncaa_baseball.simulation import (
+    GameOffsets,
+    PrecisionTargets,
+    game_key,
+    game_seed,
+    inverse_runs,
+    sample_runs,
+    simulate_game,
+    simulate_slate,
+)
+from simulate import load_posterior, simulate_games
+
+
+N_TEAMS = 4
+N_PITCHERS = 3
+
+
+def _write_slate(tmp_path: Path, n_draws: int = 60) -> dict[str, Path]:
+    rng = np.random.default_rng(7)
+    cols: dict[str, np.ndarray] = {}
+    base = np.log([3.0, 1.0, 0.4, 0.3])
+    for k in range(4):
+        cols[f"int_run_{k+1}"] = base[k] + rng.normal(0, 0.05, n_draws)
+    for k in range(2):
+        cols[f"theta_run_{k+1}"] = rng.uniform(4.0, 8.0, n_draws)
+    cols["home_advantage"] = rng.normal(0.05, 0.01, n_draws)
+    cols["beta_park"] = rng.normal(1.0, 0.05, n_draws)
+    cols["beta_bullpen"] = rng.normal(0.5, 0.05, n_draws)
+    for k in range(4):
+        for t in range(1, N_TEAMS + 1):
+            cols[f"att_run_{k+1}[{t}]"] = rng.normal(0.1 * (t - 2), 0.03, n_draws)
+            cols[f"def_run_{k+1}[{t}]"] = rng.normal(-0.05 * (t - 2), 0.03, n_draws)
+    for p in range(1, N_PITCHERS + 1):
+        cols[f"pitcher_ability[{p}]"] = rng.normal(0.1 * (p - 2), 0.03, n_draws)
+
+    paths = {
+        "posterior_csv": tmp_path / "posterior.csv",
+        "meta_json": tmp_path / "meta.json",
+        "schedule_csv": tmp_path / "schedule.csv",
+        "starters_csv": tmp_path / "starters.csv",
+        "weather_csv": tmp_path / "weather.csv",
+        "team_table_csv": tmp_path / "team_table.csv",
+    }
+    pd.DataFrame(cols).to_csv(paths["posterior_csv"], index=False)
+    paths["meta_json"].write_text(json.dumps({"N_teams": N_TEAMS, "N_pitchers": N_PITCHERS}))
+    pd.DataFrame([
+        {"game_num": 1, "home_cid": "T1", "away_cid": "T2", "home_name": "One", "away_name": "Two"},
+        {"game_num": 2, "home_cid": "T4", "away_cid": "T3", "home_name": "Four", "away_name": "Three"},
+        {"game_num": 3, "home_cid": "T2", "away_cid": "TX", "home_name": "Two", "away_name": "Unknown"},
+    ]).to_csv(paths["schedule_csv"], index=False)
+    pd.DataFrame([
+        {"game_num": 1, "home_starter": "A", "away_starter": "B", "home_starter_idx": 1,
+         "away_starter_idx": 2, "hp_throws": "L", "ap_throws": "R"},
+        {"game_num": 2, "home_starter": "C", "away_starter": "D", "home_starter_idx": 3,
+         "away_starter_idx": 0, "hp_throws": "R", "ap_throws": "L", "hp_ability_adj": 0.05},
+        {"game_num": 3, "home_starter": "E", "away_starter": "F", "home_starter_idx": 0,
+         "away_starter_idx": 0},
+    ]).to_csv(paths["starters_csv"], index=False)
+    pd.DataFrame([
+        {"game_num": 1, "park_factor": 0.05, "wind_adj_raw": 0.02, "non_wind_adj": 0.01},
+        {"game_num": 2, "park_factor": -0.03, "wind_adj_raw": -0.01, "non_wind_adj": 0.0},
+        {"game_num": 3, "park_factor": 0.0, "wind_adj_raw": 0.0, "non_wind_adj": 0.0},
+    ]).to_csv(paths["weather_csv"], index=False)
+    pd.DataFrame([
+        {"canonical_id": f"T{t}", "team_idx": t, "bullpen_adj": 0.02 * (t - 2)}
+        for t in range(1, N_TEAMS + 1)
+    ]).to_csv(paths["team_table_csv"], index=False)
+    return paths
+
+
+@pytest.mark.parametrize("engine", ["slate", "vectorized", "exact"])
+def test_array_engines_match_scalar_reference(tmp_path: Path, engine: str) -> None:
+    paths = _write_slate(tmp_path)
+    n_sims = 20000
+    vec = simulate_games(**paths, n_sims=n_sims, seed=11, engine=engine, exact_draws=60)
+    ref = simulate_games(**paths, n_sims=n_sims, seed=12, engine="scalar")
+
+    assert list(vec.columns) == list(ref.columns)
+    assert vec["game_num"].tolist() == ref["game_num"].tolist()
+    for col in ["home_win_prob", "home_rl_cover", "away_rl_cover", "over_prob",
+                "home_win_by_3plus", "away_win_by_3plus"]:
+        np.testing.assert_allclose(vec[col], ref[col], atol=0.02, err_msg=col)
+    np.testing.assert_allclose(vec["exp_total"], ref["exp_total"], rtol=0.01)
+    np.testing.assert_allclose(vec["exp_total_p50"], ref["exp_total_p50"], atol=1.0)
+    np.testing.assert_allclose(vec["margin_p50"], ref["margin_p50"], atol=1.0)
+
+
+def test_default_engine_is_seed_deterministic(tmp_path: Path) -> None:
+    paths = _write_slate(tmp_path)
+    a = simulate_games(**paths, n_sims=500, seed=3)
+    b = simulate_games(**paths, n_sims=500, seed=3)
+    c = simulate_games(**paths, n_sims=500, seed=4)
+    pd.testing.assert_frame_equal(a, b)
+    assert not a["home_win_prob"].equals(c["home_win_prob"])
+
+
+def test_unknown_engine_rejected(tmp_path: Path) -> None:
+    paths = _write_slate(tmp_path)
+    with pytest.raises(ValueError, match="Unknown simulation engine"):
+        simulate_games(**paths, n_sims=10, engine="gpu")
+
+
+def test_games_reproduce_regardless_of_schedule_order_or_subset(tmp_path: Path) -> None:
+    paths = _write_slate(tmp_path)
+    full = simulate_games(**paths, n_sims=500, seed=3).set_index("game_num")
+
+    schedule = pd.read_csv(paths["schedule_csv"])
+    schedule.iloc[::-1].to_csv(paths["schedule_csv"], index=False)
+    reordered = simulate_games(**paths, n_sims=500, seed=3).set_index("game_num")
+    pd.testing.assert_frame_equal(reordered.loc[full.index], full)
+
+    schedule[schedule["game_num"] == 2].to_csv(paths["schedule_csv"], index=False)
+    single = simulate_games(**paths, n_sims=500, seed=3).set_index("game_num")
+    pd.testing.assert_frame_equal(single, full.loc[[2]])
+
+
+@pytest.mark.parametrize("engine", ["slate", "vectorized", "exact"])
+def test_worker_pool_matches_serial(tmp_path: Path, engine: str) -> None:
+    paths = _write_slate(tmp_path)
+    serial = simulate_games(**paths, n_sims=500, seed=5, engine=engine, exact_draws=20)
+    pooled = simulate_games(**paths, n_sims=500, seed=5, engine=engine, exact_draws=20, workers=2)
+    pd.testing.assert_frame_equal(serial, pooled)
+
+
+def test_slate_chunking_bounds_rows_without_changing_results(tmp_path: Path) -> None:
+    paths = _write_slate(tmp_path)
+    post = load_posterior(paths["posterior_csv"], paths["meta_json"])
+    games = [GameOffsets(h_idx=1, a_idx=2, hp_idx=1, ap_idx=2, home_const=0.05),
+             GameOffsets(h_idx=3, a_idx=4, hp_idx=3, ap_idx=0, park_factor=0.1),
+             GameOffsets(h_idx=0, a_idx=2, hp_idx=0, ap_idx=0)]
+    seeds = [game_seed(1, game_key(f"T{i}", "T0")) for i in range(len(games))]
+    n_sims = 20000
+
+    rows: list[int] = []
+    real_regulation = simulation._regulation
+
+    def counting_regulation(post, g, d, *args):
+        rows.append(len(d))
+        return real_regulation(post, g, d, *args)
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(simulation, "_regulation", counting_regulation)
+        whole = simulate_slate(post, games, n_sims, seeds)
+        assert rows == [len(games) * n_sims]
+        rows.clear()
+        one_per_chunk = simulate_slate(post, games, n_sims, seeds, chunk_rows=n_sims)
+        assert rows == [n_sims] * len(games)
+
+    assert len(whole) == len(one_per_chunk) == len(games)
+    for w, c in zip(whole, one_per_chunk):
+        assert w.keys() == c.keys()
+        for k in w:
+            assert w[k] == pytest.approx(c[k], rel=1e-12, abs=1e-12), k
+    # Each game's stream is its own: simulating it alone gives the same numbers.
+    alone = simulate_slate(post, games[1:2], n_sims, seeds[1:2])[0]
+    assert alone["home_win_prob"] == whole[1]["home_win_prob"]
+    assert alone["exp_total"] == pytest.approx(whole[1]["exp_total"], rel=1e-12)
+
+
+def test_slate_with_variance_reduction_matches_per_game_engine(tmp_path: Path) -> None:
+    paths = _write_slate(tmp_path)
+    post = load_posterior(paths["posterior_csv"], paths["meta_json"])
+    games = [GameOffsets(h_idx=1, a_idx=2, hp_idx=1, ap_idx=2),
+             GameOffsets(h_idx=4, a_idx=3, hp_idx=3, ap_idx=0, away_const=0.1)]
+    seeds = [game_seed(2, game_key("T1", "T2")), game_seed(2, game_key("T4", "T3"))]
+    slate = simulate_slate(post, games, 3000, seeds, variance_reduction=True)
+    for g, ss, s in zip(games, seeds, slate):
+        ref = simulate_game(post, g, 3000, np.random.default_rng(ss), variance_reduction=True)
+        assert s["home_win_prob"] == ref["home_win_prob"]
+        assert s["exp_total"] == pytest.approx(ref["exp_total"], rel=1e-12)
+
+
+def test_game_seed_depends_on_identity_only() -> None:
+    a = np.random.default_rng(game_seed(42, game_key("T1", "T2", "2026-03-14T18:00Z"))).random(3)
+    b = np.random.default_rng(game_seed(42, game_key("T1", "T2", "2026-03-14T18:00Z"))).random(3)
+    c = np.random.default_rng(game_seed(42, game_key("T1", "T2", "2026-03-14T18:00Z", 1))).random(3)
+    d = np.random.default_rng(game_seed(43, game_key("T1", "T2", "2026-03-14T18:00Z"))).random(3)
+    np.testing.assert_array_equal(a, b)
+    assert not np.array_equal(a, c) and not np.array_equal(a, d)
+
+
+def test_bundle_posterior_pickles_as_memory_map_reference(tmp_path: Path) -> None:
+    paths = _write_slate(tmp_path, n_draws=400)
+    post = load_posterior(paths["posterior_csv"], paths["meta_json"])
+    clone = pickle.loads(pickle.dumps(post))
+    assert isinstance(clone.att, np.memmap) and isinstance(clone.pitcher_ab, np.memmap)
+    np.testing.assert_array_equal(clone.att, post.att)
+    np.testing.assert_array_equal(clone.int_run, post.int_run)
+    assert len(pickle.dumps(post)) < post.att.nbytes
+
+
+def test_home_advantage_correction_leaves_cached_posterior_untouched(tmp_path: Path) -> None:
+    paths = _write_slate(tmp_path)
+    post = load_posterior(paths["posterior_csv"], paths["meta_json"])
+    before = post.home_adv.copy()
+    simulate_games(**paths, n_sims=200, seed=1, ha_target=0.0)
+    again = load_posterior(paths["posterior_csv"], paths["meta_json"])
+    assert again is post
+    np.testing.assert_array_equal(again.home_adv, before)
+
+
+def test_sim_cache_resimulates_only_changed_games(tmp_path: Path, monkeypatch) -> None:
+    import simulate
+
+    paths = _write_slate(tmp_path)
+    cache = tmp_path / "daily" / "sim_cache.json"
+    first = simulate_games(**paths, n_sims=500, seed=3, cache_path=cache)
+    pd.testing.assert_frame_equal(first, simulate_games(**paths, n_sims=500, seed=3))
+
+    starters = pd.read_csv(paths["starters_csv"])
+    starters.loc[starters["game_num"] == 2, "away_starter_idx"] = 1
+    starters.to_csv(paths["starters_csv"], index=False)
+
+    simulated: list[int] = []
+    real_slate = simulate.simulate_slate
+
+    def counting_slate(post, games, *args, **kwargs):
+        simulated.append(len(games))
+        return real_slate(post, games, *args, **kwargs)
+
+    monkeypatch.setattr(simulate, "simulate_slate", counting_slate)
+    second = simulate_games(**paths, n_sims=500, seed=3, cache_path=cache)
+    assert simulated == [1]
+    fresh = simulate_games(**paths, n_sims=500, seed=3)
+    pd.testing.assert_frame_equal(second, fresh)
+    assert second.loc[1, "home_win_prob"] != first.loc[1, "home_win_prob"]
+    pd.testing.assert_frame_equal(second.drop(index=1), first.drop(index=1))
+
+    simulate_games(**paths, n_sims=500, seed=4, cache_path=cache)
+    assert simulated[-1] == 3
+
+
+def test_adaptive_engine_stops_at_precision_targets(tmp_path: Path) -> None:
+    paths = _write_slate(tmp_path)
+    targets = PrecisionTargets(win_se=0.01, over_se=0.01, rl_se=0.01, min_sims=500, batch=500)
+    out = simulate_games(**paths, n_sims=20000, seed=8, engine="adaptive", targets=targets)
+    used = out["n_sims_used"].to_numpy()
+    assert ((used >= 500) & (used < 20000) & (used % 500 == 0)).all()
+    for col in ["home_win_prob", "over_prob", "home_rl_cover", "away_rl_cover"]:
+        p = out[col].to_numpy()
+        assert (np.sqrt(p * (1 - p) / used) <= 0.01 + 1e-12).all(), col
+
+    ref = simulate_games(**paths, n_sims=20000, seed=9)
+    assert (ref["n_sims_used"] == 20000).all()
+    np.testing.assert_allclose(out["home_win_prob"], ref["home_win_prob"], atol=0.04)
+
+    capped = simulate_games(**paths, n_sims=1500, seed=8, engine="adaptive",
+                            targets=PrecisionTargets(win_se=1e-4))
+    assert (capped["n_sims_used"] == 1500).all()
+
+
+def test_market_only_change_reuses_cached_pilot(tmp_path: Path, monkeypatch) -> None:
+    import simulate
+
+    paths = _write_slate(tmp_path)
+    schedule = pd.read_csv(paths["schedule_csv"])
+    schedule["mkt_anchor_weight"] = 0.5
+    schedule["mkt_home_win_prob"] = 0.6
+    schedule["mkt_total_line"] = 11.5
+    schedule.to_csv(paths["schedule_csv"], index=False)
+    cache = tmp_path / "sim_cache.json"
+    first = simulate_games(**paths, n_sims=800, seed=3, cache_path=cache)
+    assert first["pilot_home_win_prob"].notna().all()
+    assert (first["anchor_home_shift"] != 0).all()
+
+    schedule.loc[schedule["game_num"] == 1, "mkt_home_win_prob"] = 0.4
+    schedule.to_csv(paths["schedule_csv"], index=False)
+    pilots: list[int] = []
+    real_pilot = simulate.pilot_estimate
+
+    def counting_pilot(*args, **kwargs):
+        pilots.append(1)
+        return real_pilot(*args, **kwargs)
+
+    monkeypatch.setattr(simulate, "pilot_estimate", counting_pilot)
+    second = simulate_games(**paths, n_sims=800, seed=3, cache_path=cache)
+    assert pilots == []
+    pd.testing.assert_series_equal(second["pilot_home_win_prob"], first["pilot_home_win_prob"])
+    assert second.loc[0, "anchor_home_shift"] < first.loc[0, "anchor_home_shift"]
+    pd.testing.assert_frame_equal(second.iloc[1:], first.iloc[1:])
+    pd.testing.assert_frame_equal(second, simulate_games(**paths, n_sims=800, seed=3))
+
+
+def test_inverse_sampling_matches_numpy_samplers() -> None:
+    rng = np.random.default_rng(0)
+    n = 100_000
+    mu = np.tile([3.0, 1.0, 0.4, 0.3], (n, 1)) * rng.uniform(0.7, 1.3, (n, 1))
+    theta = rng.uniform(4.0, 8.0, (n, 2))
+    ref = sample_runs(mu, theta, rng)
+    inv = inverse_runs(mu, theta, rng.random(mu.shape))
+    assert abs(inv.mean() - ref.mean()) < 0.05
+    assert abs(inv.std() - ref.std()) < 0.05
+    assert abs(np.mean(inv > 11.5) - np.mean(ref > 11.5)) < 0.01
+
+
+def test_variance_reduction_resolves_scenario_deltas(tmp_path: Path) -> None:
+    paths = _write_slate(tmp_path, n_draws=200)
+    post = load_posterior(paths["posterior_csv"], paths["meta_json"])
+    base = GameOffsets(h_idx=1, a_idx=2, hp_idx=1, ap_idx=2, park_factor=0.02)
+    what_if = GameOffsets(h_idx=1, a_idx=2, hp_idx=1, ap_idx=2, park_factor=0.02, home_const=0.03)
+
+    def deltas(vr: bool) -> np.ndarray:
+        out = []
+        for rep in range(20):
+            key = game_key("T1", "T2", str(rep))
+            a = simulate_game(post, base, 2000, np.random.default_rng(game_seed(1, key)), vr)
+            b = simulate_game(post, what_if, 2000, np.random.default_rng(game_seed(1, key)), vr)
+            out.append(b["home_win_prob"] - a["home_win_prob"])
+        return np.array(out)
+
+    plain, reduced = deltas(False), deltas(True)
+    assert reduced.std() < 0.5 * plain.std()
+    assert (reduced >= 0).all()
+    assert abs(reduced.mean() - plain.mean()) < 0.02
+
+
+def test_variance_reduction_runs_through_simulate_games(tmp_path: Path) -> None:
+    paths = _write_slate(tmp_path)
+    vr = simulate_games(**paths, n_sims=20000, seed=2, variance_reduction=True)
+    ref = simulate_games(**paths, n_sims=20000, seed=3)
+    np.testing.assert_allclose(vr["home_win_prob"], ref["home_win_prob"], atol=0.02)
+    np.testing.assert_allclose(vr["exp_total"], ref["exp_total"], rtol=0.01)
+    with pytest.raises(ValueError, match="sampling engine"):
+        simulate_games(**paths, n_sims=10, engine="exact", variance_reduction=True)
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import pandas as pd
+
+from ncaa_baseball.phase1 import (
+    TeamResolver,
+    _normalize_for_match,
+    build_odds_name_to_canonical,
+    resolve_odds_teams,
+)
+
+
+def _reference(name: str, canonical: pd.DataFrame, name_to_canonical: dict):
+    """The original per-call matcher (sort by name length, scan every row)."""
+    n = _normalize_for_match(name)
+    if n in name_to_canonical:
+        return name_to_canonical[n]
+    rows = sorted(
+        [(len((r.get("team_name") or "").strip()), r) for _, r in canonical.iterrows()
+         if (r.get("team_name") or "").strip()],
+        key=lambda x: -x[0],
+    )
+    for _, row in rows:
+        norm = _normalize_for_match(row["team_name"].strip())
+        if n.startswith(norm + " ") or n == norm:
+            return (row["canonical_id"], int(row["ncaa_teams_id"]))
+        if norm.startswith(n) and len(n) >= len(norm) - 2:
+            return (row["canonical_id"], int(row["ncaa_teams_id"]))
+    return None
+
+
+CANONICAL = pd.DataFrame({
+    "canonical_id": ["FLA", "FSU", "KSU", "KAN", "TAM", "TEX", "TXAM", "UNC", "NCS", "DUP"],
+    "ncaa_teams_id": [1, 2, 3, 4, 5, 6, 7, 8, 9, 10],
+    "team_name": ["Florida", "Florida St.", "Kansas St.", "Kansas", "Texas A&M", "Texas",
+                  "Texas A&M-CC", "North Carolina", "NC State", "Texas"],
+    "odds_api_name": ["Florida Gators", "", "", "", "", "", "", "", "", ""],
+    "espn_name": ["", "Florida State Seminoles", "", "", "", "", "", "", "", ""],
+})
+
+NAMES = [
+    "Florida Gators", "florida  gators", "Florida State Seminoles", "Florida St. Seminoles",
+    "Florida St", "Florida", "Flor", "Kansas St", "Kansas St.", "Kansas Jayhawks", "Kansas",
+    "Texas A&amp;M Aggies", "Texas A&M-CC Islanders", "Texas Longhorns", "Tex", "Texa",
+    "North Carolina Tar Heels", "North", "NC State Wolfpack", "NC", "", "Unknown Team", "Kansa",
+]
+
+
+def test_resolver_matches_original_rules() -> None:
+    n2c = build_odds_name_to_canonical(CANONICAL)
+    resolver = TeamResolver(CANONICAL, n2c)
+    expected = [_reference(n, CANONICAL, n2c) for n in NAMES]
+    assert resolver.resolve_many(NAMES) == expected
+    # Longest name wins, registry order breaks ties; abbreviations up to two chars
+    assert resolver.resolve("Florida St. Seminoles") == ("FSU", 2)
+    assert resolver.resolve("Texas Longhorns") == ("TEX", 6)
+    assert resolver.resolve("Kansas St") == ("KSU", 3)
+    assert resolver.resolve("Unknown Team") is None
+    assert resolver.canonical_id("Unknown Team") == ""
+    assert resolve_odds_teams("Texas A&amp;M Aggies", "Flor", CANONICAL, n2c) == (
+        ("TAM", 5), expected[NAMES.index("Flor")])
+
+
+def test_resolver_memoizes_hits_and_misses() -> None:
+    resolver = TeamResolver(CANONICAL)
+    resolver.resolve_many(["Kansas St", "Nowhere U", "Kansas St"])
+    assert resolver._memo == {"Kansas St": ("KSU", 3), "Nowhere U": None}
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from ncaa_baseball.backtest import MarginDistributions
+from robustness_reporting import apply_uncertainty_columns, evaluate_threshold_strategy
+from walk_forward_sweep import build_folds, evaluate_folds, scale_details
+
+
+def _details(n_days: int = 40, per_day: int = 6, n_sims: int = 400, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    n = n_days * per_day
+    dates = np.repeat(pd.date_range("2026-02-14", periods=n_days), per_day)
+    exp_margin = rng.normal(0, 2.0, n)
+    margins = np.sort((exp_margin[:, None] + rng.normal(0, 4.0, (n, n_sims))).astype(np.float32), axis=1)
+    frame = pd.DataFrame({
+        "date": dates,
+        "home": [f"H{i}" for i in range(n)],
+        "away": [f"A{i}" for i in range(n)],
+        "hp_idx": 1,
+        "ap_idx": 1,
+        "hp_d1b_adj": 0.0,
+        "ap_d1b_adj": 0.0,
+        "home_won": rng.random(n) < 0.5 + 0.05 * np.sign(exp_margin),
+        "market_home_prob": np.clip(0.5 + 0.04 * exp_margin + rng.normal(0, 0.05, n), 0.05, 0.95),
+        "best_home_ml": -120.0,
+        "best_away_ml": 105.0,
+    })
+    frame = apply_uncertainty_columns(frame, min_bet_confidence=0.0)
+    return frame, MarginDistributions(margins, exp_margin)
+
+
+PARAMS = {
+    "thresholds": [0.02, 0.05],
+    "prob_col": "model_calibrated",
+    "dd_penalty": 1.0,
+    "min_bet_confidence": 0.0,
+    "baseline_spread_scale": 1.0,
+    "baseline_threshold": 0.05,
+}
+
+
+def test_grid_cells_rescore_stored_distributions() -> None:
+    frame, dist = _details()
+    by_scale = scale_details(frame, dist, [0.8, 1.0, 1.2])
+    np.testing.assert_array_equal(by_scale[1.0]["model_calibrated"], by_scale[0.8]["model_home_prob"])
+    cut = -0.2 * dist.exp_margin
+    assert np.allclose(by_scale[1.2]["model_calibrated"], (dist.margins > cut[:, None]).mean(axis=1))
+
+    folds = build_folds(sorted(frame["date"].unique()), train_days=14, test_days=7, step_days=7)
+    assert [f["fold"] for f in folds] == [1, 2, 3, 4]
+    results = evaluate_folds(folds, by_scale, PARAMS)
+    fold_row, grid, _, _ = results[0]
+    assert len(grid) == 3 * 2
+    cell = next(r for r in grid if r["spread_scale"] == 1.2 and r["threshold"] == 0.02)
+    train = by_scale[1.2][(by_scale[1.2]["date"] >= folds[0]["train_start"])
+                          & (by_scale[1.2]["date"] <= folds[0]["train_end"])]
+    ev = evaluate_threshold_strategy(train, "model_calibrated", 0.02, 1.0, 0.0)
+    assert (cell["n"], cell["pnl"]) == (ev.n, ev.pnl)
+    assert fold_row["train_objective"] == max(r["objective"] for r in grid)
+
+
+def test_parallel_folds_match_serial() -> None:
+    frame, dist = _details(seed=1)
+    by_scale = scale_details(frame, dist, [0.9, 1.0, 1.1])
+    folds = build_folds(sorted(frame["date"].unique()), train_days=14, test_days=7, step_days=7)
+    serial = evaluate_folds(folds, by_scale, PARAMS)
+    parallel = evaluate_folds(folds, by_scale, PARAMS, workers=2)
+    assert [r[0] for r in serial] == [r[0] for r in parallel]
+    for a, b in zip(serial, parallel):
+        pd.testing.assert_frame_equal(a[2], b[2])
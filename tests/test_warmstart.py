@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ncaa_baseball.warmstart import (
+    inits_from_draw,
+    load_warmstart,
+    param_layout,
+    plan_warmstart,
+    save_warmstart,
+)
+
+
+def _draw_row(n_conf: int, n_teams: int, n_pitchers: int, offset: float) -> dict[str, float]:
+    row = {"lp__": -1234.0, "accept_stat__": 0.9}
+    for name, size in param_layout(n_conf, n_teams, n_pitchers):
+        if size is None:
+            row[name] = offset
+        else:
+            for i in range(1, size + 1):
+                row[f"{name}[{i}]"] = offset + i / 100
+    row["att_run_1[1]"] = 99.0  # transformed parameter: not an init
+    return row
+
+
+def _state(tmp_path, n_conf=2, teams=("A", "B", "C"), pitchers=("p1", "p2")) -> dict:
+    layout = param_layout(n_conf, len(teams), len(pitchers))
+    n_unc = sum(1 if s is None else s for _, s in layout)
+    state = {
+        "fit_id": "20260401T060000Z",
+        "stan_file": "stan/model.stan",
+        "metric_type": "diag_e",
+        "n_conf": n_conf,
+        "team_ids": list(teams),
+        "pitcher_ids": list(pitchers),
+        "step_size": [0.1, 0.2],
+        "inv_metric": [np.linspace(0.5, 1.5, n_unc).tolist(), np.ones(n_unc).tolist()],
+        "inits": [inits_from_draw(_draw_row(n_conf, len(teams), len(pitchers), c), layout)
+                  for c in (0.0, 1.0)],
+    }
+    save_warmstart(tmp_path, state)
+    return load_warmstart(tmp_path)
+
+
+def test_inits_from_draw_keeps_only_sampled_parameters() -> None:
+    layout = param_layout(2, 3, 2)
+    inits = inits_from_draw(_draw_row(2, 3, 2, 0.5), layout)
+    assert set(inits) == {name for name, _ in layout}
+    assert inits["home_advantage"] == 0.5
+    assert inits["att_run_1_raw"] == [0.51, 0.52, 0.53]
+    assert len(inits["pitcher_ability_raw"]) == 2
+
+
+def test_grown_indices_warm_start_with_prior_inits(tmp_path) -> None:
+    state = _state(tmp_path)
+    team_conf = [1, 2, 1, 2]
+    fip_prior = [0.0, 0.0, 0.08]
+    warm, _ = plan_warmstart(state, "stan/model.stan", 2, ["A", "B", "C", "D"],
+                             ["p1", "p2", "p3"], team_conf, fip_prior, chains=3)
+    assert warm is not None and warm.fit_id == "20260401T060000Z"
+    assert warm.step_size == [0.1, 0.2, 0.1]
+
+    init = warm.inits[0]
+    conf_def = np.array(state["inits"][0]["conf_def_raw"])
+    assert init["att_run_1_raw"][:3] == state["inits"][0]["att_run_1_raw"]
+    assert np.isclose(init["def_run_2_raw"][3], (conf_def - conf_def.mean())[1])
+    assert init["pitcher_ability_raw"] == state["inits"][0]["pitcher_ability_raw"] + [0.08]
+
+    new_layout = param_layout(2, 4, 3)
+    metric = np.array(warm.inv_metric[0])
+    assert metric.size == sum(1 if s is None else s for _, s in new_layout)
+    old = np.array(state["inv_metric"][0])
+    np.testing.assert_array_equal(metric[:19], old[:19])  # scalars, conf blocks, 3 old teams
+    assert metric[19] == old[16:19].mean()  # new team = mean of its block
+    assert metric[-3] == old[-4:-2].mean()  # new pitcher = mean of the old pitcher block
+    np.testing.assert_array_equal(metric[-2:], old[-2:])
+
+
+def test_reindexed_or_changed_model_fits_cold(tmp_path) -> None:
+    state = _state(tmp_path)
+    args = ([1, 2, 1], [0.0, 0.0], 2)
+    warm, reason = plan_warmstart(state, "stan/model.stan", 2, ["B", "A", "C"], ["p1", "p2"], *args)
+    assert warm is None and "team index" in reason
+    warm, reason = plan_warmstart(state, "stan/other.stan", 2, ["A", "B", "C"], ["p1", "p2"], *args)
+    assert warm is None and "model" in reason
+    warm, reason = plan_warmstart(None, "stan/model.stan", 2, ["A", "B", "C"], ["p1", "p2"], *args)
+    assert warm is None
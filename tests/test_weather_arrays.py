@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from weather_park_adjustment import (
+    compute_weather_adjustment, compute_weather_adjustment_array, get_weather_park_adj,
+    weather_day_table, wind_out_directional, wind_out_directional_array,
+)
+
+
+def test_array_forms_match_scalar_functions() -> None:
+    rng = np.random.default_rng(7)
+    n = 2000
+    speed = rng.uniform(0, 30, n)                # includes calm (< 3 mph) winds
+    wind_dir = rng.uniform(0, 360, n)
+    temp = rng.uniform(35, 100, n)               # both sides of the cold-weather floor
+    bearing = rng.uniform(0, 360, n)
+    elevation = rng.uniform(0, 7000, n)
+    fb = rng.uniform(0.6, 1.4, n)
+    humidity = rng.uniform(10, 100, n)
+    rain = rng.uniform(0, 100, n)
+    gusts = np.where(rng.random(n) < 0.3, 0.0, speed + rng.uniform(0, 15, n))
+    dome = rng.random(n) < 0.1
+
+    arr = compute_weather_adjustment_array(speed, wind_dir, temp, bearing, elevation, fb,
+                                           humidity, rain, gusts, dome)
+    wind = wind_out_directional_array(wind_dir, speed, bearing)
+    for i in range(n):
+        ref = compute_weather_adjustment(speed[i], wind_dir[i], temp[i], bearing[i], elevation[i],
+                                         fb[i], humidity[i], rain[i], gusts[i], bool(dome[i]))
+        for key, value in ref.items():
+            assert arr[key][i] == pytest.approx(value, abs=1e-9), (i, key)
+        for key, value in wind_out_directional(wind_dir[i], speed[i], bearing[i]).items():
+            assert wind[key][i] == pytest.approx(value, abs=1e-9), (i, key)
+
+    # Per-stadium constants broadcast against a (stadiums, hours) weather grid
+    grid = compute_weather_adjustment_array(speed[:48].reshape(2, 24), wind_dir[:48].reshape(2, 24),
+                                            72.0, [[67.0], [120.0]], elevation_ft=[[0.0], [5280.0]])
+    assert grid["total_adj"].shape == (2, 24)
+    assert grid["alt_adj"][1, 0] == compute_weather_adjustment(5, 0, 72, 120, 5280.0)["alt_adj"]
+
+
+class _FixedHourly:
+    """WeatherClient stand-in serving one day of hourly readings per location."""
+
+    def __init__(self, by_lat: dict[float, list[dict]]) -> None:
+        self.by_lat = by_lat
+
+    def hourly(self, lat: float, lon: float, date: str) -> list[dict]:
+        return self.by_lat[lat]
+
+    def current(self, lat: float, lon: float) -> None:
+        return None
+
+
+def test_day_table_matches_per_game_adjustment() -> None:
+    rng = np.random.default_rng(11)
+
+    def day(n_hours: int) -> list[dict]:
+        return [{
+            "time": f"2026-04-10T{h:02d}:00",
+            "wind_speed_mph": float(rng.uniform(0, 25)),
+            "wind_direction_deg": float(rng.uniform(0, 360)),
+            "temperature_f": float(rng.uniform(40, 95)),
+            "wind_gusts_mph": float(rng.choice([0.0, rng.uniform(5, 35)])),
+            "humidity_pct": float(rng.choice([0.0, rng.uniform(20, 100)])),
+            "precip_prob_pct": float(rng.uniform(0, 80)),
+            "precipitation_mm": float(rng.uniform(0, 2)),
+        } for h in range(n_hours)]
+
+    sites = {
+        "A": {"lat": 1.0, "lon": 0.0, "hp_bearing": 67.0, "elevation_ft": 0.0, "is_dome": False},
+        "B": {"lat": 2.0, "lon": 0.0, "hp_bearing": 0.0, "elevation_ft": 5280.0, "is_dome": False},
+        "C": {"lat": 3.0, "lon": 0.0, "hp_bearing": 200.0, "elevation_ft": 900.0, "is_dome": True},
+    }
+    hourly = {"A": day(24), "B": day(23), "C": day(24), "D": []}
+    client = _FixedHourly({s["lat"]: hourly[k] for k, s in sites.items()})
+
+    table = weather_day_table(hourly, sites)
+    assert len(table) == 24 + 23 + 24
+    for r in table.to_dict("records"):
+        site = sites[r["key"]]
+        ref = get_weather_park_adj(lat=site["lat"], lon=site["lon"], hp_bearing=site["hp_bearing"],
+                                   game_date="2026-04-10", game_start_hour=r["start_hour"],
+                                   client=client)
+        # get_weather_park_adj takes elevation/dome from the registry; pass them through
+        ref_adj = compute_weather_adjustment(
+            ref["wind_speed_mph"], ref["wind_dir_deg"], ref["temp_f"], ref["hp_bearing_deg"],
+            elevation_ft=site["elevation_ft"], humidity_pct=ref["humidity_pct"],
+            rain_pct=ref["precip_prob_pct"], wind_gusts_mph=ref["wind_gusts_mph"],
+            is_dome=site["is_dome"])
+        ref.update(ref_adj)
+        for key in ("wind_adj_raw", "non_wind_adj", "total_adj", "wind_out_mph", "wind_out_lf_mph",
+                    "wind_out_cf_mph", "wind_out_rf_mph", "temp_f", "wind_speed_mph", "wind_dir_deg",
+                    "wind_gusts_mph", "precip_prob_pct", "precipitation_mm", "humidity_pct",
+                    "hp_bearing_deg", "is_dome", "weather_mode"):
+            assert r[key] == pytest.approx(ref[key], abs=1e-9), (r["key"], r["start_hour"], key)
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import pandas as pd
+import pytest
+
+from ncaa_baseball.pipeline_context import PipelineContext
+from resolve_weather import resolve_weather
+from weather_park_adjustment import CURRENT_TTL_S, FORECAST_TTL_S, WeatherClient
+
+
+class _OpenMeteoStub(BaseHTTPRequestHandler):
+    """Answers like Open-Meteo: 24 hourly readings, temperature = 50 + hour."""
+
+    hits: list[tuple] = []
+    fail = False
+
+    def do_GET(self) -> None:  # noqa: N802
+        q = {k: v[0] for k, v in parse_qs(urlparse(self.path).query).items()}
+        kind = "hourly" if "hourly" in q else "current"
+        type(self).hits.append((kind, q["latitude"], q["longitude"], q.get("start_date")))
+        if type(self).fail:
+            self.send_error(503)
+            return
+        if kind == "hourly":
+            body = {"hourly": {
+                "time": [f"{q['start_date']}T{h:02d}:00" for h in range(24)],
+                "temperature_2m": [50.0 + h for h in range(24)],
+                "relative_humidity_2m": [60.0] * 24,
+                "wind_speed_10m": [10.0] * 24,
+                "wind_direction_10m": [247.0] * 24,
+                "wind_gusts_10m": [0.0] * 24,
+                "precipitation_probability": [0.0] * 24,
+                "precipitation": [0.0] * 24,
+            }}
+        else:
+            body = {"current": {"temperature_2m": 61.0, "relative_humidity_2m": 40.0,
+                                "wind_speed_10m": 4.0, "wind_direction_10m": 90.0,
+                                "wind_gusts_10m": 0.0, "precipitation": 0.0}}
+        data = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def stub():
+    _OpenMeteoStub.hits = []
+    _OpenMeteoStub.fail = False
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _OpenMeteoStub)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/v1/forecast", _OpenMeteoStub
+    server.shutdown()
+    server.server_close()
+
+
+def _inputs(tmp_path: Path) -> tuple[Path, Path]:
+    stadiums = tmp_path / "stadiums.csv"
+    pd.DataFrame({
+        "canonical_id": ["A", "B", "C"],
+        "venue_name": ["Park A", "Park B", "Park C"],
+        "lat": [30.1, 35.2, 40.3],
+        "lon": [-90.1, -95.2, -100.3],
+        "hp_bearing_deg": [67.0, 45.0, 90.0],
+        "elevation_ft": [0, 100, 6000],
+        "is_dome": [0, 0, 0],
+    }).to_csv(stadiums, index=False)
+    schedule = tmp_path / "schedule.csv"
+    pd.DataFrame({
+        "game_num": [0, 1, 2, 3, 4],
+        "home_cid": ["A", "A", "B", "C", "Z"],          # doubleheader at A; Z has no stadium
+        "start_local_hour": [13, 17, 22, None, 18],
+    }).to_csv(schedule, index=False)
+    return schedule, stadiums
+
+
+def _resolve(tmp_path: Path, client: WeatherClient) -> pd.DataFrame:
+    schedule, stadiums = _inputs(tmp_path)
+    return resolve_weather(schedule, stadium_csv=stadiums, park_factors_csv=tmp_path / "none.csv",
+                           date="2026-04-10", client=client)
+
+
+def test_one_concurrent_request_per_park_and_date(tmp_path: Path, stub) -> None:
+    url, server = stub
+    client = WeatherClient(cache_dir=tmp_path / "cache", base_url=url, workers=4)
+    df = _resolve(tmp_path, client)
+
+    assert sorted(server.hits) == [("current", "40.3", "-100.3", None),
+                                   ("hourly", "30.1", "-90.1", "2026-04-10"),
+                                   ("hourly", "35.2", "-95.2", "2026-04-10")]
+    by_game = df.set_index("game_num")
+    # Each game of the doubleheader averages its own hours of the shared forecast
+    assert by_game.loc[0, "temp_f"] == 64.0 and by_game.loc[1, "temp_f"] == 68.0
+    assert by_game.loc[2, "temp_f"] == 72.5                  # only hours 22 and 23 exist
+    assert by_game.loc[3, "weather_mode"] == "current" and by_game.loc[3, "temp_f"] == 61.0
+    assert by_game.loc[4, "weather_status"] == "missing_stadium"
+    assert (by_game.loc[[0, 1, 2], "weather_status"] == "ok_hourly").all()
+
+
+def test_disk_cache_ttls_and_stale_fallback(tmp_path: Path, stub) -> None:
+    url, server = stub
+    now = [1_000_000.0]
+
+    def client() -> WeatherClient:
+        return WeatherClient(cache_dir=tmp_path / "cache", base_url=url, clock=lambda: now[0])
+
+    first = _resolve(tmp_path, client())
+    assert len(server.hits) == 3
+
+    # A refresh inside both TTLs is served from disk
+    c = client()
+    pd.testing.assert_frame_equal(_resolve(tmp_path, c), first)
+    assert len(server.hits) == 3 and c.stats["disk_hits"] == 3
+
+    # Current conditions expire before forecasts do
+    now[0] += CURRENT_TTL_S + 1
+    _resolve(tmp_path, client())
+    assert [h[0] for h in server.hits[3:]] == ["current"]
+
+    # Past the forecast TTL with the API down: stale forecasts are still used
+    now[0] += FORECAST_TTL_S
+    server.fail = True
+    c = client()
+    pd.testing.assert_frame_equal(_resolve(tmp_path, c), first)
+    assert c.stats == {"requests": 0, "disk_hits": 0, "errors": 3}
+
+
+def test_stadiums_come_from_the_pipeline_context(tmp_path: Path, stub) -> None:
+    url, _ = stub
+    schedule, stadiums = _inputs(tmp_path)
+    client = WeatherClient(cache_dir=tmp_path / "cache", base_url=url)
+    ctx = PipelineContext(stadium_csv=stadiums)
+    via_ctx = resolve_weather(schedule, stadium_csv=tmp_path / "missing.csv",
+                              park_factors_csv=tmp_path / "none.csv",
+                              date="2026-04-10", client=client, ctx=ctx)
+    assert ctx.loaded() == ["stadiums"]
+    pd.testing.assert_frame_equal(via_ctx, _resolve(tmp_path, client))